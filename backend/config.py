@@ -56,6 +56,65 @@ class Config:
     API_HOST: str = os.getenv('API_HOST', '0.0.0.0')
     API_PORT: int = int(os.getenv('API_PORT', '8000'))
 
+    # Backend de Sheets: "google" (default) o "fake" (en memoria, sembrado con
+    # scripts/seed_load_test.py — solo para benchmarks y load tests offline)
+    SHEETS_BACKEND: str = os.getenv('SHEETS_BACKEND', 'google').lower()
+    FAKE_SHEETS_LATENCY_MS: float = float(os.getenv('FAKE_SHEETS_LATENCY_MS', '0'))
+    FAKE_SHEETS_QUOTA_PER_MINUTE: int = int(os.getenv('FAKE_SHEETS_QUOTA_PER_MINUTE', '0'))  # 0 = sin cuota
+    FAKE_SHEETS_ERROR_RATE: float = float(os.getenv('FAKE_SHEETS_ERROR_RATE', '0'))
+
+    # Cuota de Google Sheets por usuario (service account): token buckets del
+    # QuotaGovernor (backend/core/quota_governor.py). 0 = sin límite
+    SHEETS_QUOTA_READS_PER_MINUTE: int = int(os.getenv('SHEETS_QUOTA_READS_PER_MINUTE', '60'))
+    SHEETS_QUOTA_WRITES_PER_MINUTE: int = int(os.getenv('SHEETS_QUOTA_WRITES_PER_MINUTE', '60'))
+    SHEETS_QUOTA_MAX_WAIT_SECONDS: float = float(os.getenv('SHEETS_QUOTA_MAX_WAIT_SECONDS', '10'))
+
+    # Sondeo de cambios (modifiedTime de Drive) antes de releer una hoja con
+    # TTL vencido: si el libro no cambió se renueva el snapshot sin releer
+    SHEETS_CHANGE_PROBE_ENABLED: bool = os.getenv('SHEETS_CHANGE_PROBE_ENABLED', 'true').lower() == 'true'
+
+    # Lecturas puntuales (read_cell/locate_row) sin snapshot vigente: se pide
+    # solo el rango A1 y se cachea aparte por estos segundos
+    SHEETS_POINT_READ_TTL_SECONDS: int = int(os.getenv('SHEETS_POINT_READ_TTL_SECONDS', '5'))
+
+    # Instrumentación por request de llamadas a Sheets (Server-Timing + log):
+    # fracción de requests muestreados, 0 = apagado, 1 = todos
+    SHEETS_INSTRUMENTATION_SAMPLE_RATE: float = float(os.getenv('SHEETS_INSTRUMENTATION_SAMPLE_RATE', '0'))
+
+    # Outbox write-behind de eventos Metadata (backend/repositories/metadata_outbox.py).
+    # Vacío = escrituras síncronas. Debe apuntar a un volumen persistente.
+    METADATA_OUTBOX_PATH: str = os.getenv('METADATA_OUTBOX_PATH', '')
+    METADATA_OUTBOX_FLUSH_INTERVAL_SECONDS: float = float(os.getenv('METADATA_OUTBOX_FLUSH_INTERVAL_SECONDS', '1.0'))
+    METADATA_OUTBOX_FSYNC: bool = os.getenv('METADATA_OUTBOX_FSYNC', 'false').lower() == 'true'
+
+    # Estado compartido entre workers de uvicorn (backend/core/shared_store.py):
+    # invalidaciones, snapshots de hojas y cuota. Vacío = todo local al proceso.
+    # Debe ser un directorio local del host (ej: /dev/shm/zeues), no NFS.
+    SHARED_STATE_DIR: str = os.getenv('SHARED_STATE_DIR', '')
+
+    # Workers de uvicorn (Dockerfile: --workers ${WEB_CONCURRENCY}). El bus del
+    # stream SSE (backend/core/event_bus.py) es por proceso: con más de un
+    # worker /api/sse/stream no se monta y los clientes siguen con el polling.
+    WEB_CONCURRENCY: int = int(os.getenv('WEB_CONCURRENCY', '1'))
+
+    # Refresher de fondo de snapshots (backend/core/snapshot_refresher.py):
+    # renueva Operaciones / Uniones / Trabajadores+Roles antes de que venza
+    # su TTL para que los requests no lean de Sheets. Períodos en segundos.
+    SNAPSHOT_REFRESH_ENABLED: bool = os.getenv('SNAPSHOT_REFRESH_ENABLED', 'false').lower() == 'true'
+    SNAPSHOT_REFRESH_OPERACIONES_SECONDS: float = float(os.getenv('SNAPSHOT_REFRESH_OPERACIONES_SECONDS', '20'))
+    SNAPSHOT_REFRESH_SLOW_SECONDS: float = float(os.getenv('SNAPSHOT_REFRESH_SLOW_SECONDS', '120'))
+
+    # /api/spools/changes (backend/core/change_feed.py): diffs de Operaciones
+    # retenidos, y máximo de spools por respuesta antes de pedir resync completo
+    SPOOL_CHANGES_BUFFER_SIZE: int = int(os.getenv('SPOOL_CHANGES_BUFFER_SIZE', '256'))
+    SPOOL_CHANGES_MAX_SPOOLS: int = int(os.getenv('SPOOL_CHANGES_MAX_SPOOLS', '200'))
+
+    # /api/metrics: período del muestreo de atraso del event loop (0 = apagado)
+    EVENT_LOOP_LAG_INTERVAL_SECONDS: float = float(os.getenv('EVENT_LOOP_LAG_INTERVAL_SECONDS', '0.5'))
+
+    # Compresión de respuestas (brotli/gzip): bodies menores no se comprimen
+    COMPRESSION_MIN_BYTES: int = int(os.getenv('COMPRESSION_MIN_BYTES', '1024'))
+
     # CORS - Orígenes permitidos
     ALLOWED_ORIGINS: list[str] = [
         origin.strip()
@@ -154,10 +213,17 @@ class Config:
 
     @classmethod
     def get_scopes(cls) -> list[str]:
-        """Retorna los scopes necesarios para Google Sheets API."""
+        """
+        Retorna los scopes necesarios para Google Sheets API.
+
+        drive.metadata.readonly: el sondeo de cambios (modifiedTime vía Drive
+        files.get) necesita leer metadata de un spreadsheet que la service
+        account no creó; con solo drive.file Drive responde 404.
+        """
         return [
             'https://www.googleapis.com/auth/spreadsheets',
-            'https://www.googleapis.com/auth/drive.file'
+            'https://www.googleapis.com/auth/drive.file',
+            'https://www.googleapis.com/auth/drive.metadata.readonly'
         ]
 
 
@@ -0,0 +1,136 @@
+"""
+Feed de cambios por spool para `GET /api/spools/changes` (delta-sync).
+
+Las tablets refrescan su lista de spools cada 30s con `batch-status`,
+aunque no haya cambiado nada. El feed guarda en un ring buffer acotado los
+diffs por fila de Operaciones (`SheetsRepository.subscribe_snapshot_diffs`,
+ver backend/core/snapshot_diff.py) y responde qué TAG_SPOOL cambiaron desde
+una versión de snapshot que el cliente ya tiene.
+
+Versiones: son las de `SheetsRepository.snapshot_version` (por proceso).
+Cada diff va de `old_version` a `version`; como el differ compara siempre
+contra el último snapshot observado, los diffs forman una cadena continua.
+El feed puede responder desde `_floor` (la versión más antigua con
+historia completa) hasta la versión vigente; fuera de ese rango — buffer
+desbordado, reinicio del proceso, cambio de header — el cliente debe hacer
+un resync completo (`changes_since` devuelve None). `epoch` distingue
+procesos: una versión de otro proceso no es comparable.
+
+Usage:
+    feed = SpoolChangeFeed.for_repository(sheets_repo)
+    version = sheets_repo.snapshot_version("Operaciones")  # lee si hace falta
+    tags = feed.changes_since(since, version)   # None -> resync completo
+"""
+import logging
+import threading
+import uuid
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+from backend.config import config
+from backend.core.snapshot_diff import RowDiff
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _ChangeEntry:
+    old_version: int
+    version: int
+    tags: frozenset
+
+
+def _base_tag(key: str) -> Optional[str]:
+    """TAG_SPOOL de una clave del differ ("MK-1#2" -> "MK-1"; "@17" -> None)."""
+    if key.startswith("@"):
+        return None
+    tag, sep, occurrence = key.rpartition("#")
+    if sep and occurrence.isdigit():
+        return tag
+    return key
+
+
+class SpoolChangeFeed:
+    """Ring buffer de TAG_SPOOL cambiados por versión de snapshot de Operaciones."""
+
+    SHEET_NAME = config.HOJA_OPERACIONES_NOMBRE
+
+    # {sheets_repo: feed}
+    _registry: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+    _registry_lock = threading.Lock()
+
+    def __init__(self, capacity: Optional[int] = None):
+        self._lock = threading.Lock()
+        self._entries: deque = deque(maxlen=max(1, capacity or config.SPOOL_CHANGES_BUFFER_SIZE))
+        self._floor: Optional[int] = None
+        self._version: Optional[int] = None
+        self.epoch = uuid.uuid4().hex[:12]
+
+    @classmethod
+    def for_repository(cls, sheets_repo) -> "SpoolChangeFeed":
+        """Feed suscrito a los diffs de una instancia de SheetsRepository (lazy)."""
+        with cls._registry_lock:
+            feed = cls._registry.get(sheets_repo)
+            if feed is None:
+                feed = cls()
+                # El differ guarda el callback: el feed no referencia al repo
+                sheets_repo.subscribe_snapshot_diffs(feed.record)
+                cls._registry[sheets_repo] = feed
+            return feed
+
+    def record(self, diff: RowDiff) -> None:
+        """Callback del differ: registra los TAG_SPOOL tocados por `diff`."""
+        if diff.sheet != self.SHEET_NAME:
+            return
+        with self._lock:
+            if diff.header_changed or (self._version is not None and diff.old_version != self._version):
+                # Columnas distintas (o hueco en la cadena): historia anterior no sirve
+                self._entries.clear()
+                self._floor = diff.version if diff.header_changed else diff.old_version
+            elif self._floor is None:
+                self._floor = diff.old_version
+            self._version = diff.version
+
+            tags = set()
+            for keys in (diff.added, diff.removed, diff.changed):
+                for key in keys:
+                    tag = _base_tag(key)
+                    if tag:
+                        tags.add(tag)
+            if not tags or diff.header_changed:
+                return
+            if len(self._entries) == self._entries.maxlen:
+                # La entrada más antigua sale del buffer: sube el piso
+                self._floor = self._entries[0].version
+            self._entries.append(_ChangeEntry(diff.old_version, diff.version, frozenset(tags)))
+
+    def changes_since(self, since: int, current: int) -> Optional[set[str]]:
+        """
+        TAG_SPOOL cambiados (agregados, editados o eliminados) desde `since`.
+
+        Args:
+            since: Versión de snapshot que tiene el cliente
+            current: Versión vigente (`SheetsRepository.snapshot_version`)
+
+        Returns:
+            Conjunto de tags (vacío si no hubo cambios), o None si la
+            versión del cliente ya no se puede responder (resync completo)
+        """
+        if since == current:
+            return set()
+        with self._lock:
+            if (
+                self._floor is None
+                or self._version != current
+                or since < self._floor
+                or since > current
+            ):
+                return None
+            tags: set[str] = set()
+            for entry in reversed(self._entries):
+                if entry.version <= since:
+                    break
+                tags.update(entry.tags)
+            return tags
@@ -25,6 +25,8 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional
 
+from backend.core import metrics
+
 logger = logging.getLogger(__name__)
 
 
@@ -193,6 +195,7 @@ class ColumnMapCache:
             built_at_utc=datetime.now(timezone.utc),
         )
 
+        metrics.COLUMN_MAP_REBUILDS.inc(sheet=sheet_name)
         logger.info(
             f"Column map rebuilt for '{sheet_name}': "
             f"{len(column_map)} entries, {len(header_row)} cols in header"
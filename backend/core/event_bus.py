@@ -0,0 +1,216 @@
+"""
+Bus de eventos in-process para el stream SSE (/api/sse/stream).
+
+Los servicios de escritura (OccupationService, MetrologiaService,
+ReparacionService, NotasService) publican un evento por cada cambio
+exitoso en Sheets. Cada cliente SSE tiene una Subscription con su propia
+cola asyncio; `publish` es no bloqueante y seguro desde cualquier thread
+(los endpoints sync corren en el threadpool de FastAPI).
+
+Backpressure: si un suscriptor lento llena su cola, se cierra su
+suscripción en vez de frenar al publicador. El cliente reconecta con
+`Last-Event-ID` y recupera lo perdido desde el historial (ring buffer).
+
+Los ids arrancan en la hora de boot en microsegundos (epoch), así un id de
+un proceso anterior nunca cae dentro del rango del actual. Si el
+`Last-Event-ID` no se puede reproducir (más viejo que el historial, de otro
+proceso o de un id que este proceso no emitió) el suscriptor recibe primero
+un evento `RESYNC` con el id actual: el cliente debe recargar todo.
+
+El bus vive en un proceso: con varios workers de uvicorn
+(WEB_CONCURRENCY > 1) un cliente solo vería las escrituras atendidas por
+su worker, así que backend/main.py no monta /api/sse/stream.
+
+Usage:
+    from backend.core.event_bus import get_event_bus
+
+    get_event_bus().publish("INICIAR", "MK-123", ocupado_por="MR(93)")
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+RESYNC_EVENT = "RESYNC"
+
+
+@dataclass(frozen=True)
+class BusEvent:
+    """Cambio publicado en el bus (un evento SSE)."""
+    id: int
+    type: str
+    tag_spool: str
+    data: dict = field(default_factory=dict)
+    timestamp: str = ""
+
+    def to_payload(self) -> dict:
+        return {
+            "id": self.id,
+            "type": self.type,
+            "tag_spool": self.tag_spool,
+            "timestamp": self.timestamp,
+            **self.data,
+        }
+
+
+class SubscriptionClosed(Exception):
+    """La suscripción fue cerrada (desbordamiento o cierre explícito)."""
+
+
+_CLOSED = object()
+
+
+class Subscription:
+    """Cola de eventos de un cliente, ligada al event loop que la creó."""
+
+    def __init__(self, bus: "EventBus", loop: asyncio.AbstractEventLoop, max_queue: int):
+        self._bus = bus
+        self._loop = loop
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.closed = False
+
+    def _offer(self, event: BusEvent) -> None:
+        """Entrega un evento desde cualquier thread (llamado por el bus)."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._put(event)
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # Event loop cerrado: el cliente ya no existe
+            self.close()
+
+    def _put(self, event) -> None:
+        if self.closed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning("EventBus: slow subscriber dropped (queue full)")
+            self._close_with_sentinel()
+
+    def _close_with_sentinel(self) -> None:
+        self.close()
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(_CLOSED)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[BusEvent]:
+        """
+        Espera el próximo evento.
+
+        Returns:
+            El evento, o None si pasó `timeout` sin eventos (para heartbeats).
+
+        Raises:
+            SubscriptionClosed: si la suscripción fue cerrada por desbordamiento.
+        """
+        try:
+            item = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if item is _CLOSED:
+            raise SubscriptionClosed()
+        return item
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._bus._unsubscribe(self)
+
+
+class EventBus:
+    """Fan-out de eventos a suscriptores SSE, con historial para replay."""
+
+    def __init__(self, history_size: int = 500, max_queue: int = 100):
+        self._lock = threading.Lock()
+        self._subscribers: set[Subscription] = set()
+        self._history: deque[BusEvent] = deque(maxlen=history_size)
+        self._max_queue = max_queue
+        # Epoch de boot: ids crecientes también entre reinicios del proceso
+        self._next_id = time.time_ns() // 1000
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, event_type: str, tag_spool: str, **data) -> Optional[BusEvent]:
+        """
+        Publica un cambio. Nunca lanza: un fallo del bus no debe afectar la
+        escritura en Sheets que ya fue exitosa.
+        """
+        try:
+            with self._lock:
+                event = BusEvent(
+                    id=self._next_id,
+                    type=event_type,
+                    tag_spool=tag_spool,
+                    data=data,
+                    timestamp=datetime.now(timezone.utc).isoformat(),
+                )
+                self._next_id += 1
+                self._history.append(event)
+                subscribers = list(self._subscribers)
+
+            for subscription in subscribers:
+                subscription._offer(event)
+            return event
+        except Exception as e:
+            logger.error(f"EventBus: publish failed for {event_type} {tag_spool}: {e}", exc_info=True)
+            return None
+
+    def subscribe(self, last_event_id: Optional[int] = None) -> Subscription:
+        """
+        Registra un suscriptor en el event loop actual.
+
+        Con `last_event_id`, los eventos posteriores aún en el historial se
+        encolan de inmediato (reconexión sin pérdida). Si ese id está fuera
+        de `[id más viejo del historial - 1, último id]` no hay replay
+        posible y se encola un único evento RESYNC.
+        """
+        subscription = Subscription(self, asyncio.get_running_loop(), self._max_queue)
+        with self._lock:
+            self._subscribers.add(subscription)
+            if last_event_id is None:
+                backlog = []
+            elif self._can_replay(last_event_id):
+                backlog = [e for e in self._history if e.id > last_event_id]
+            else:
+                backlog = [BusEvent(
+                    id=self._next_id - 1,
+                    type=RESYNC_EVENT,
+                    tag_spool="",
+                    data={"last_event_id": last_event_id},
+                    timestamp=datetime.now(timezone.utc).isoformat(),
+                )]
+        for event in backlog:
+            subscription._put(event)
+        return subscription
+
+    def _can_replay(self, last_event_id: int) -> bool:
+        """True si el historial cubre todo lo posterior a `last_event_id` (con lock)."""
+        oldest = self._history[0].id if self._history else self._next_id
+        return oldest - 1 <= last_event_id <= self._next_id - 1
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+
+# Singleton global para uso en toda la aplicación
+_event_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    """Obtiene instancia global del bus de eventos (singleton pattern)."""
+    return _event_bus
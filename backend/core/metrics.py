@@ -0,0 +1,392 @@
+"""
+Métricas de proceso en formato de exposición de Prometheus (texto 0.0.4).
+
+Telemetría siempre encendida del hot path, expuesta en GET /api/metrics
+para que un scraper (Prometheus, Grafana Agent, Railway) la lea:
+
+- zeues_http_request_duration_seconds{method,route,status}: latencia por
+  ruta (template de FastAPI, no el path concreto → cardinalidad acotada).
+- zeues_sheets_call_duration_seconds{operation,kind,sheet}: cada llamada a
+  la API de Sheets (GovernedHTTPClient y FakeGspreadClient).
+- zeues_sheets_throttled_total{kind}: respuestas 429.
+- zeues_sheets_retries_total: reintentos (retry_on_sheets_error,
+  ConflictService, VersionDetectionService).
+- zeues_cache_lookups_total{key,result}: hits/misses de SimpleCache
+  (`worksheet:<hoja>`, workers) y del cache de respuestas.
+- zeues_column_map_rebuilds_total{sheet}: reconstrucciones de ColumnMapCache.
+- zeues_sheets_quota_wait_seconds{kind,priority}, zeues_sheets_quota_overflows_total{kind},
+  zeues_sheets_quota_queue_depth{kind}: QuotaGovernor.
+- zeues_event_loop_lag_seconds: atraso del event loop (ver `watch_event_loop_lag`).
+
+No depende de prometheus_client: un registro mínimo con un lock por métrica.
+Cada observación es un lookup en dict + bisect sobre buckets fijos (~1µs),
+barato para dejarlo siempre activo.
+
+Usage:
+    from backend.core import metrics
+    metrics.SHEETS_RETRIES.inc()
+    metrics.SHEETS_CALL_DURATION.observe(0.12, operation="values.get", kind="read", sheet="Operaciones")
+    text = metrics.get_metrics_registry().render()
+"""
+import asyncio
+import bisect
+import logging
+import math
+import threading
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Buckets en segundos: desde lecturas de cache (ms) hasta Sheets lento con backoff
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base: nombre, ayuda, labels y valores por combinación de labels."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: dict[tuple[str, ...], object] = {}
+
+    def _key(self, labels: dict) -> tuple[str, ...]:
+        try:
+            if len(labels) == len(self.labelnames):
+                return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError:
+            pass
+        raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        with self._lock:
+            items = sorted(self._values.items())
+            lines.extend(self._render_samples(items))
+        return lines
+
+    def _render_samples(self, items) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Counter(_Metric):
+    """Contador monótono."""
+
+    type_name = "counter"
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+
+class Gauge(_Metric):
+    """Valor instantáneo."""
+
+    type_name = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+
+class _HistogramValue:
+    __slots__ = ("buckets", "sum", "count")
+
+    def __init__(self, size: int):
+        self.buckets = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(_Metric):
+    """Histograma con buckets fijos (límites superiores inclusivos, como Prometheus)."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.bounds = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = _HistogramValue(len(self.bounds))
+            entry.buckets[index] += 1
+            entry.sum += value
+            entry.count += 1
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+            return entry.count if entry is not None else 0
+
+    def _render_samples(self, items) -> list[str]:
+        lines = []
+        for key, entry in items:
+            cumulative = 0
+            for bound, count in zip(self.bounds, entry.buckets):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(entry.sum)}")
+            lines.append(f"{self.name}_count{labels} {entry.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Conjunto de métricas de la app, en orden de registro."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} already registered with another shape")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Todas las métricas en formato de texto de Prometheus."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Pone en cero todas las series (tests)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+# Singleton global para uso en toda la aplicación
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Obtiene el registro global de métricas."""
+    return _registry
+
+
+# ----------------------------------------------------------------- métricas
+
+HTTP_REQUEST_DURATION = _registry.histogram(
+    "zeues_http_request_duration_seconds",
+    "Time to response start per route template.",
+    ("method", "route", "status"),
+)
+SHEETS_CALL_DURATION = _registry.histogram(
+    "zeues_sheets_call_duration_seconds",
+    "Google Sheets API call duration (excluding quota wait).",
+    ("operation", "kind", "sheet"),
+)
+SHEETS_THROTTLED = _registry.counter(
+    "zeues_sheets_throttled_total",
+    "Google Sheets API responses with HTTP 429.",
+    ("kind",),
+)
+SHEETS_CHANGE_PROBES = _registry.counter(
+    "zeues_sheets_change_probes_total",
+    "Change probes before a full worksheet refetch (unchanged/changed/error).",
+    ("sheet", "result"),
+)
+SHEETS_SHARED_SNAPSHOTS = _registry.counter(
+    "zeues_sheets_shared_snapshots_total",
+    "Worksheet snapshots adopted from another worker (reused/loaded).",
+    ("sheet", "result"),
+)
+SHEETS_POINT_READS = _registry.counter(
+    "zeues_sheets_point_reads_total",
+    "Single-range reads by source (snapshot/cached/fetched).",
+    ("sheet", "source"),
+)
+SHEETS_RETRIES = _registry.counter(
+    "zeues_sheets_retries_total",
+    "Retries of Google Sheets operations after an error.",
+)
+CACHE_LOOKUPS = _registry.counter(
+    "zeues_cache_lookups_total",
+    "Cache lookups by cache key and result (hit/miss).",
+    ("key", "result"),
+)
+COLUMN_MAP_REBUILDS = _registry.counter(
+    "zeues_column_map_rebuilds_total",
+    "ColumnMapCache rebuilds per sheet.",
+    ("sheet",),
+)
+QUOTA_WAIT = _registry.histogram(
+    "zeues_sheets_quota_wait_seconds",
+    "Time spent waiting for a QuotaGovernor token.",
+    ("kind", "priority"),
+)
+QUOTA_OVERFLOWS = _registry.counter(
+    "zeues_sheets_quota_overflows_total",
+    "Requests sent without a token after max_wait.",
+    ("kind",),
+)
+QUOTA_QUEUE_DEPTH = _registry.gauge(
+    "zeues_sheets_quota_queue_depth",
+    "Callers currently queued for a QuotaGovernor token.",
+    ("kind",),
+)
+EVENT_LOOP_LAG = _registry.histogram(
+    "zeues_event_loop_lag_seconds",
+    "Extra delay of a periodic asyncio.sleep (event loop blocked).",
+    buckets=LAG_BUCKETS,
+)
+EVENT_LOOP_LAG_LAST = _registry.gauge(
+    "zeues_event_loop_lag_last_seconds",
+    "Most recent event loop lag sample.",
+)
+
+
+def cache_key_label(key: str) -> str:
+    """Label acotado para una key de cache ("worksheet:Operaciones" se mantiene)."""
+    return key if len(key) <= 64 else key[:64]
+
+
+# ----------------------------------------------------------- event loop lag
+
+
+async def watch_event_loop_lag(interval: float = 0.5) -> None:
+    """
+    Mide cuánto se atrasa un `asyncio.sleep(interval)`: el atraso es el tiempo
+    que el loop estuvo bloqueado (gspread síncrono, serialización, ...).
+
+    Usage (startup):
+        task = asyncio.create_task(watch_event_loop_lag(0.5))
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lag = max(0.0, loop.time() - start - interval)
+        EVENT_LOOP_LAG.observe(lag)
+        EVENT_LOOP_LAG_LAST.set(lag)
+
+
+# --------------------------------------------------------------- middleware
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI: latencia hasta el inicio de la respuesta por ruta.
+
+    Se mide hasta `http.response.start` para que los streams SSE no
+    registren la duración de toda la conexión. Requests sin ruta (404)
+    quedan como route="unmatched" para no abrir una serie por path.
+
+    Usage:
+        app.add_middleware(MetricsMiddleware)
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        observed = False
+
+        def observe(status_code: int) -> None:
+            nonlocal observed
+            if observed:
+                return
+            observed = True
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - start,
+                method=scope["method"],
+                route=getattr(route, "path", None) or "unmatched",
+                status=str(status_code),
+            )
+
+        async def send_with_metrics(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                observe(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            observe(500)
@@ -0,0 +1,195 @@
+"""
+Vista materializada de spools ocupados, derivada de la hoja Operaciones.
+
+El dashboard (GET /api/dashboard/occupied) y "mis spools"
+(GET /api/spools/ocupados) solo necesitan las pocas filas con
+Ocupado_Por seteado, pero escaneaban Operaciones completo en cada
+request. Esta vista se construye una vez por snapshot (ver `SnapshotView`)
+y mantiene:
+
+- fila → OccupiedSpool (tag, worker, fecha, estado) para filas ocupadas
+- worker_id → filas ocupadas por ese trabajador
+- TAG_SPOOL → fila ocupada
+
+Las escrituras por nombre de columna de `SheetsRepository`
+(`batch_update_by_column_name`, `update_cell_by_column_name`) — que usan
+INICIAR, FINALIZAR, cancelar, REPARACION y el resto de las transiciones —
+parchean la vista con `apply_cell_updates`. Las escrituras por letra de
+columna la invalidan.
+"""
+import logging
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+from backend.config import config
+from backend.core.snapshot_view import SnapshotView
+from backend.utils.normalize import normalize_column_name as _normalize
+
+logger = logging.getLogger(__name__)
+
+
+_WORKER_ID_PATTERN = re.compile(r"\((\d+)\)")
+
+# Columnas que definen la ocupación, en el orden guardado por fila
+_FIELDS = ("TAG_SPOOL", "Ocupado_Por", "Fecha_Ocupacion", "Estado_Detalle")
+_NORMALIZED_FIELDS = {_normalize(name): pos for pos, name in enumerate(_FIELDS)}
+
+
+@dataclass(frozen=True)
+class OccupiedSpool:
+    """Ocupación vigente de una fila de Operaciones."""
+    row: int
+    tag_spool: str
+    ocupado_por: str
+    fecha_ocupacion: str
+    estado_detalle: str
+
+
+def _as_text(value) -> str:
+    if value is None:
+        return ""
+    return str(value).strip()
+
+
+class OccupancyView(SnapshotView):
+    """
+    Índice de ocupación de Operaciones: O(ocupados) por consulta.
+
+    Usage:
+        view = OccupancyView.for_repository(sheets_repo)
+        view.occupied()              # todas las ocupaciones, en orden de fila
+        view.rows_occupied_by(93)    # filas ocupadas por el trabajador 93
+    """
+
+    SHEET_NAME = config.HOJA_OPERACIONES_NOMBRE
+
+    def _clear_locked(self) -> None:
+        # fila -> [tag, ocupado_por, fecha_ocupacion, estado_detalle]
+        self._fields_by_row: dict[int, list[str]] = {}
+        self._occupied: dict[int, OccupiedSpool] = {}
+        self._rows_by_worker: dict[int, set[int]] = {}
+        self._row_by_tag: dict[str, int] = {}
+        self._indices: list[Optional[int]] = []
+
+    # ------------------------------------------------------------------ build
+
+    def _build_locked(self, rows: list, column_map: dict) -> None:
+        indices = [column_map.get(_normalize(name)) for name in _FIELDS]
+        if indices[0] is None or indices[1] is None:
+            # Esquema sin columnas v3.0: nada ocupado
+            logger.warning("OccupancyView: TAG_SPOOL/Ocupado_Por not found in Operaciones")
+            return
+
+        self._indices = indices
+        for row_idx, row in enumerate(rows[1:], start=2):
+            self._load_row(row_idx, row)
+            self._index_row(row_idx)
+
+        logger.info(
+            f"OccupancyView: built from {len(rows)} Operaciones rows "
+            f"({len(self._occupied)} occupied)"
+        )
+
+    def _load_row(self, row_idx: int, row: list) -> None:
+        self._fields_by_row[row_idx] = [
+            _as_text(row[idx]) if idx is not None and idx < len(row) else ""
+            for idx in self._indices
+        ]
+
+    def _update_rows_locked(self, rows: list, refresh: set[int], removed: set[int]) -> bool:
+        if not self._indices:
+            return False
+        for row_idx in removed:
+            self._unindex_row(row_idx)
+            self._fields_by_row.pop(row_idx, None)
+        for row_idx in sorted(refresh):
+            self._unindex_row(row_idx)
+            self._load_row(row_idx, rows[row_idx - 1])
+            self._index_row(row_idx)
+        return True
+
+    def _index_row(self, row_idx: int) -> None:
+        tag, ocupado_por, fecha, estado = self._fields_by_row[row_idx]
+        if not ocupado_por or not tag:
+            return
+        entry = OccupiedSpool(
+            row=row_idx,
+            tag_spool=tag,
+            ocupado_por=ocupado_por,
+            fecha_ocupacion=fecha,
+            estado_detalle=estado,
+        )
+        self._occupied[row_idx] = entry
+        self._row_by_tag.setdefault(tag, row_idx)
+        for worker_id in _WORKER_ID_PATTERN.findall(ocupado_por):
+            self._rows_by_worker.setdefault(int(worker_id), set()).add(row_idx)
+
+    def _unindex_row(self, row_idx: int) -> None:
+        entry = self._occupied.pop(row_idx, None)
+        if entry is None:
+            return
+        if self._row_by_tag.get(entry.tag_spool) == row_idx:
+            del self._row_by_tag[entry.tag_spool]
+            # Otra fila ocupada con el mismo TAG toma su lugar
+            for other in sorted(self._occupied):
+                if self._occupied[other].tag_spool == entry.tag_spool:
+                    self._row_by_tag[entry.tag_spool] = other
+                    break
+        for worker_id in _WORKER_ID_PATTERN.findall(entry.ocupado_por):
+            rows = self._rows_by_worker.get(int(worker_id))
+            if rows is not None:
+                rows.discard(row_idx)
+                if not rows:
+                    del self._rows_by_worker[int(worker_id)]
+
+    # ------------------------------------------------------------------ write-through
+
+    def apply_cell_updates(self, updates: list[dict]) -> None:
+        """
+        Parchea la vista con celdas recién escritas por nombre de columna.
+
+        Args:
+            updates: [{"row": 10, "column_name": "Ocupado_Por", "value": "MR(93)"}, ...]
+        """
+        with self._lock:
+            if self._source is None:
+                return
+            touched = set()
+            for update in updates:
+                pos = _NORMALIZED_FIELDS.get(_normalize(update["column_name"]))
+                if pos is None:
+                    continue
+                fields = self._fields_by_row.get(update["row"])
+                if fields is None:
+                    # Fila fuera del snapshot (ej: agregada después)
+                    self._reset_locked()
+                    return
+                fields[pos] = _as_text(update["value"])
+                touched.add(update["row"])
+            for row_idx in touched:
+                self._unindex_row(row_idx)
+                self._index_row(row_idx)
+            if touched:
+                self._touch_locked(touched)
+
+    # ------------------------------------------------------------------ queries
+
+    def occupied(self) -> list[OccupiedSpool]:
+        """Todas las ocupaciones vigentes, en orden de fila."""
+        with self._lock:
+            self._ensure_fresh_locked()
+            return [self._occupied[row] for row in sorted(self._occupied)]
+
+    def rows_occupied_by(self, worker_id: int) -> list[int]:
+        """Filas (1-based) cuyo Ocupado_Por contiene "(worker_id)"."""
+        with self._lock:
+            self._ensure_fresh_locked()
+            return sorted(self._rows_by_worker.get(worker_id, ()))
+
+    def occupant_of(self, tag_spool: str) -> Optional[OccupiedSpool]:
+        """Ocupación vigente de un spool, o None si está libre."""
+        with self._lock:
+            self._ensure_fresh_locked()
+            row = self._row_by_tag.get(tag_spool)
+            return self._occupied.get(row) if row is not None else None
@@ -0,0 +1,429 @@
+"""
+Gobernador de cuota de Google Sheets (token buckets lectura/escritura).
+
+La cuota de Sheets es ~60 requests/min por usuario (la service account), por
+separado para lecturas y escrituras. Hasta ahora la app sólo reaccionaba
+después de un 429 (retry_on_sheets_error, ConflictService.update_with_retry,
+tenacity en VersionDetectionService). Este módulo hace pasar cada request
+HTTP de gspread por un token bucket antes de salir:
+
+- Un bucket para lecturas y otro para escrituras (capacidad = cuota por
+  minuto, recarga continua).
+- Si el bucket está vacío, el caller espera en una cola con prioridad:
+  USER_WRITE (INICIAR/FINALIZAR confirmados) > INTERACTIVE > BACKGROUND
+  (polling y refrescos). Además BACKGROUND no consume la reserva del bucket
+  (`background_reserve`), así que un polling intenso no deja sin tokens a
+  la próxima confirmación de un trabajador.
+- Si la espera supera `max_wait`, la request sale igual (se cuenta como
+  overflow) y el backoff existente maneja un eventual 429.
+
+La prioridad viaja en un ContextVar: los routers la fijan con
+`Depends(sheets_priority(QuotaPriority.USER_WRITE))`; sin prioridad
+explícita, escrituras son USER_WRITE y lecturas INTERACTIVE.
+
+Usage:
+    governor = get_quota_governor()
+    governor.acquire("read")           # bloquea hasta tener token
+    governor.snapshot()                # métricas (profundidad de cola, esperas)
+
+Nota: gspread es síncrono. La espera en cola bloquea al thread que llama,
+así que solo ocurre fuera del event loop: los endpoints que tocan Sheets son
+`def` y corren en el threadpool de FastAPI, igual que el SnapshotRefresher.
+Los que llaman servicios `async` (INICIAR/FINALIZAR, reparación, ...) los
+corren con `run_in_worker_loop`, un loop privado del thread del threadpool
+que el governor trata como caller síncrono. Un caller en el thread del event
+loop principal nunca espera: toma un token si hay y si no sale igual
+(overflow, logueado), para no frenar a todos los demás requests.
+
+Con `SHARED_STATE_DIR` (varios workers de uvicorn) los tokens se comparten
+entre procesos (backend/core/shared_store.py); la cola de prioridad sigue
+siendo por proceso, la reserva de BACKGROUND aplica al bucket común.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, Callable, Coroutine, Iterator, Optional, TypeVar
+
+from gspread.exceptions import APIError
+from gspread.http_client import HTTPClient
+from gspread.urls import DRIVE_FILES_API_V3_URL
+from requests import Response
+
+from backend.config import config
+from backend.core import metrics
+from backend.core.shared_store import get_shared_store
+from backend.core.sheets_instrumentation import (
+    describe_request,
+    record_sheets_call,
+    record_sheets_throttled,
+    sheet_of_range,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+READ = "read"
+WRITE = "write"
+
+# Esperas más largas que esto quedan en el log (INFO)
+SLOW_WAIT_SECONDS = 1.0
+
+
+class QuotaPriority(IntEnum):
+    """Prioridad de un caller en la cola (menor = antes)."""
+    USER_WRITE = 0   # Confirmaciones de trabajadores (INICIAR, FINALIZAR, ...)
+    INTERACTIVE = 1  # Lecturas de pantallas
+    BACKGROUND = 2   # Polling y refrescos de fondo
+
+
+_current_priority: ContextVar[Optional[QuotaPriority]] = ContextVar(
+    "sheets_quota_priority", default=None
+)
+
+
+@contextmanager
+def quota_priority(priority: QuotaPriority) -> Iterator[None]:
+    """Fija la prioridad de las llamadas a Sheets dentro del bloque."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def sheets_priority(priority: QuotaPriority) -> Callable:
+    """
+    Dependencia FastAPI que fija la prioridad de cuota del request.
+
+    Usage:
+        @router.post("/finalizar", dependencies=[Depends(sheets_priority(QuotaPriority.USER_WRITE))])
+    """
+    async def dependency():
+        with quota_priority(priority):
+            yield
+
+    return dependency
+
+
+def current_priority(kind: str) -> QuotaPriority:
+    priority = _current_priority.get()
+    if priority is not None:
+        return priority
+    return QuotaPriority.USER_WRITE if kind == WRITE else QuotaPriority.INTERACTIVE
+
+
+_worker_loop = threading.local()
+
+
+def _on_event_loop() -> bool:
+    """True si el thread actual está corriendo el event loop del servidor."""
+    if getattr(_worker_loop, "active", False):
+        return False
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def run_in_worker_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Corre `coro` hasta terminar en un event loop propio del thread actual.
+
+    Para endpoints `def` que llaman servicios `async`: el loop es privado del
+    request, así que acquire() puede hacer esperar al thread en la cola igual
+    que a un caller síncrono. Falla (RuntimeError de asyncio.run) si se llama
+    desde el event loop del servidor.
+
+    Usage:
+        result = run_in_worker_loop(occupation_service.iniciar_spool(request))
+    """
+    previous = getattr(_worker_loop, "active", False)
+    _worker_loop.active = True
+    try:
+        return asyncio.run(coro)
+    finally:
+        _worker_loop.active = previous
+
+
+class _Bucket:
+    """Token bucket con cola de espera y métricas (protegido por el lock del governor)."""
+
+    def __init__(self, kind: str, per_minute: int, now: float):
+        self.kind = kind
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = now
+        self.waiters: list[tuple[int, int]] = []
+        # Métricas
+        self.acquired = {priority.name: 0 for priority in QuotaPriority}
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.max_queue_depth = 0
+        self.overflows = 0
+
+    def refill(self, now: float) -> None:
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def take(self, now: float, reserve: float) -> float:
+        """
+        Toma un token si alcanza sin tocar `reserve`.
+
+        Returns:
+            0.0 si tomó el token, si no los segundos hasta el próximo
+        """
+        self.refill(now)
+        if self.tokens - reserve >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 + reserve - self.tokens) / self.rate
+
+    def snapshot(self) -> dict:
+        return {
+            "per_minute": int(self.capacity),
+            "tokens": round(self.tokens, 2),
+            "queue_depth": len(self.waiters),
+            "max_queue_depth": self.max_queue_depth,
+            "acquired": dict(self.acquired),
+            "waits": self.waits,
+            "wait_seconds_total": round(self.wait_seconds, 3),
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+            "overflows": self.overflows,
+        }
+
+
+class _SharedBucket(_Bucket):
+    """
+    Bucket cuyos tokens viven en el SharedStore (un presupuesto para todos
+    los workers de uvicorn). Cola, prioridades y métricas siguen siendo
+    del proceso; `tokens` es solo la última lectura del estado compartido.
+    """
+
+    def __init__(self, kind: str, per_minute: int, now: float, store):
+        super().__init__(kind, per_minute, now)
+        self._store = store
+
+    def refill(self, now: float) -> None:
+        self.tokens = self._store.tokens(self.kind, self.capacity, self.rate, now)
+        self.updated = now
+
+    def take(self, now: float, reserve: float) -> float:
+        remaining = self._store.take_token(self.kind, self.capacity, self.rate, reserve, now)
+        self.updated = now
+        if remaining >= 0:
+            self.tokens = remaining
+            return 0.0
+        self.tokens = remaining + reserve + 1
+        return -remaining / self.rate
+
+
+class QuotaGovernor:
+    """
+    Token buckets de lectura/escritura con cola de prioridad.
+
+    Args:
+        reads_per_minute: Cuota de lecturas (<= 0 = sin límite)
+        writes_per_minute: Cuota de escrituras (<= 0 = sin límite)
+        max_wait: Segundos máximos de espera antes de dejar pasar la request
+        background_reserve: Fracción del bucket que BACKGROUND no puede usar
+        shared: SharedStore para compartir los tokens entre workers (None = por proceso)
+    """
+
+    def __init__(
+        self,
+        reads_per_minute: int,
+        writes_per_minute: int,
+        max_wait: float = 10.0,
+        background_reserve: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+        shared=None,
+    ):
+        self._clock = clock
+        self._max_wait = max_wait
+        self._background_reserve = background_reserve
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        now = clock()
+
+        def bucket(kind: str, per_minute: int) -> Optional[_Bucket]:
+            if per_minute <= 0:
+                return None
+            if shared is not None:
+                return _SharedBucket(kind, per_minute, now, shared)
+            return _Bucket(kind, per_minute, now)
+
+        self._buckets: dict[str, Optional[_Bucket]] = {
+            READ: bucket(READ, reads_per_minute),
+            WRITE: bucket(WRITE, writes_per_minute),
+        }
+
+    def acquire(self, kind: str, priority: Optional[QuotaPriority] = None) -> float:
+        """
+        Toma un token de `kind` ("read" o "write"), esperando si hace falta.
+
+        Desde el thread del event loop no espera nunca (ver nota del módulo).
+
+        Returns:
+            Segundos esperados (0.0 si había token)
+        """
+        bucket = self._buckets[kind]
+        if bucket is None:
+            return 0.0
+        if priority is None:
+            priority = current_priority(kind)
+        reserve = bucket.capacity * self._background_reserve if priority == QuotaPriority.BACKGROUND else 0.0
+        on_loop = _on_event_loop()
+        max_wait = 0.0 if on_loop else self._max_wait
+
+        with self._cond:
+            ticket = (int(priority), next(self._seq))
+            heapq.heappush(bucket.waiters, ticket)
+            bucket.max_queue_depth = max(bucket.max_queue_depth, len(bucket.waiters))
+            metrics.QUOTA_QUEUE_DEPTH.set(len(bucket.waiters), kind=kind)
+            start = self._clock()
+            overflow = slept = False
+            try:
+                while True:
+                    now = self._clock()
+                    # El head duerme lo justo para el próximo token; el resto
+                    # espera a que el head avise al salir
+                    head = on_loop or bucket.waiters[0] == ticket
+                    timeout = bucket.take(now, reserve) if head else max_wait
+                    if timeout == 0.0:
+                        break
+                    waited = now - start
+                    if waited >= max_wait:
+                        overflow = True
+                        break
+                    self._cond.wait(timeout=max(0.001, min(timeout, max_wait - waited)))
+                    slept = True
+            finally:
+                bucket.waiters.remove(ticket)
+                heapq.heapify(bucket.waiters)
+                metrics.QUOTA_QUEUE_DEPTH.set(len(bucket.waiters), kind=kind)
+                self._cond.notify_all()
+
+            waited = self._clock() - start if slept else 0.0
+            bucket.acquired[priority.name] += 1
+            if slept:
+                bucket.waits += 1
+                bucket.wait_seconds += waited
+                bucket.max_wait_seconds = max(bucket.max_wait_seconds, waited)
+            if overflow:
+                bucket.overflows += 1
+
+        metrics.QUOTA_WAIT.observe(waited, kind=kind, priority=priority.name)
+        if overflow:
+            metrics.QUOTA_OVERFLOWS.inc(kind=kind)
+        if overflow and on_loop:
+            # Último recurso: un endpoint `async def` llamó a gspread en el
+            # loop del servidor en vez de correr en el threadpool
+            logger.warning(
+                f"Sheets quota: {kind} bucket empty on the event loop ({priority.name}), "
+                f"sending request without queueing; run the route in the threadpool"
+            )
+        elif overflow:
+            logger.warning(
+                f"Sheets quota: {kind} bucket empty after {waited:.1f}s "
+                f"({priority.name}), sending request anyway"
+            )
+        elif waited >= SLOW_WAIT_SECONDS:
+            logger.info(f"Sheets quota: {priority.name} {kind} waited {waited:.2f}s for a token")
+        return waited
+
+    def snapshot(self) -> dict:
+        """Estado y métricas por bucket (para /api/health/diagnostic)."""
+        with self._cond:
+            now = self._clock()
+            result = {}
+            for kind, bucket in self._buckets.items():
+                if bucket is None:
+                    result[kind] = {"enabled": False}
+                    continue
+                bucket.refill(now)
+                result[kind] = {"enabled": True, **bucket.snapshot()}
+            return result
+
+
+def classify_request(method: str, endpoint: str) -> str:
+    """"read" o "write" para una request HTTP de la API de Sheets/Drive."""
+    if method.upper() == "GET":
+        return READ
+    # values:batchGetByDataFilter es POST pero cuenta como lectura
+    if ":batchGet" in endpoint:
+        return READ
+    return WRITE
+
+
+class GovernedHTTPClient(HTTPClient):
+    """
+    HTTPClient de gspread que pasa cada request por el QuotaGovernor.
+
+    Cada request queda en las métricas de /api/metrics (duración por
+    operación/hoja, 429s) y, con un request instrumentado activo
+    (backend/core/sheets_instrumentation.py), también rango, bytes y
+    espera de cuota.
+    """
+
+    def request(self, method: str, endpoint: str, *args, **kwargs) -> Response:
+        kind = classify_request(method, endpoint)
+        # Drive (modifiedTime del sondeo de cambios) no consume cuota de Sheets
+        drive = endpoint.startswith(DRIVE_FILES_API_V3_URL)
+        quota_wait = 0.0 if drive else get_quota_governor().acquire(kind)
+        start = time.perf_counter()
+        size = None
+        try:
+            response = super().request(method, endpoint, *args, **kwargs)
+            size = len(response.content)
+            return response
+        except APIError as e:
+            if e.code == 429:
+                record_sheets_throttled(kind)
+            raise
+        finally:
+            operation, range_name = describe_request(
+                method, endpoint, kwargs.get("params"), kwargs.get("json")
+            )
+            record_sheets_call(
+                operation, kind, sheet_of_range(range_name), time.perf_counter() - start,
+                quota_wait=quota_wait, range_name=range_name, size_bytes=size,
+            )
+
+
+# Singleton global para uso en toda la aplicación
+_governor: Optional[QuotaGovernor] = None
+_governor_lock = threading.Lock()
+
+
+def get_quota_governor() -> QuotaGovernor:
+    """Obtiene el governor global (creado con la cuota de config)."""
+    global _governor
+    if _governor is None:
+        with _governor_lock:
+            if _governor is None:
+                _governor = QuotaGovernor(
+                    reads_per_minute=config.SHEETS_QUOTA_READS_PER_MINUTE,
+                    writes_per_minute=config.SHEETS_QUOTA_WRITES_PER_MINUTE,
+                    max_wait=config.SHEETS_QUOTA_MAX_WAIT_SECONDS,
+                    shared=get_shared_store(),
+                )
+    return _governor
+
+
+def reset_quota_governor() -> None:
+    """Descarta el governor global (tests)."""
+    global _governor
+    with _governor_lock:
+        _governor = None
@@ -0,0 +1,268 @@
+"""
+Estado compartido entre procesos de uvicorn (`--workers N`) en el mismo host.
+
+Cada worker de uvicorn es un proceso con sus propios caches (SimpleCache,
+ColumnMapCache, vistas derivadas) y su propio QuotaGovernor: con N workers
+las lecturas a Sheets y el consumo de cuota se multiplican por N, y una
+escritura en un worker no invalida el cache de los demás (se pierde
+read-your-writes). Este módulo comparte, vía archivos en
+`config.SHARED_STATE_DIR` (idealmente tmpfs, ej. /dev/shm/zeues):
+
+- Generaciones por clave de cache (`generations.bin`, mmap de contadores
+  uint64): `bump(key)` es el mensaje de invalidación entre procesos; cada
+  SimpleCache compara la generación con la de su entrada local en cada
+  `get` (una lectura de 8 bytes en memoria compartida).
+- Snapshots de hojas publicados (`snapshots/`): un worker que lee una hoja
+  completa la publica (pickle, reemplazo atómico) junto a su digest, su
+  generación y su vencimiento; los demás la cargan en vez de ir a Sheets.
+  El metadata es un JSON chico, así un worker que ya tiene ese digest
+  renueva su copia sin deserializar las filas.
+- Token buckets de cuota (`bucket-<kind>.bin`): tokens y última recarga
+  bajo `flock`, para que todos los workers consuman un solo presupuesto.
+
+Claves distintas pueden caer en el mismo slot de generación (hash % slots):
+eso solo causa invalidaciones de más, nunca datos viejos. Los relojes son
+`time.monotonic()` (CLOCK_MONOTONIC, común a los procesos del host) para
+los buckets y `time.time()` para vencimientos publicados.
+
+Sin `SHARED_STATE_DIR` (default) todo sigue siendo local al proceso.
+
+Usage:
+    store = get_shared_store()             # None si está deshabilitado
+    store.bump("worksheet:Operaciones")    # invalidar en todos los workers
+    store.generation("worksheet:Operaciones")
+"""
+import fcntl
+import json
+import logging
+import mmap
+import os
+import pickle
+import re
+import struct
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from backend.config import config
+
+logger = logging.getLogger(__name__)
+
+GENERATION_SLOTS = 4096
+_U64 = struct.Struct("<Q")
+# tokens (float64), última recarga monotónica (float64), inicializado (uint64)
+_BUCKET = struct.Struct("<ddQ")
+
+
+@contextmanager
+def _flock(fd: int) -> Iterator[None]:
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def _map_file(path: str, size: int) -> tuple[int, mmap.mmap]:
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    with _flock(fd):
+        if os.fstat(fd).st_size < size:
+            os.ftruncate(fd, size)
+    return fd, mmap.mmap(fd, size)
+
+
+class SharedStore:
+    """
+    Generaciones, snapshots publicados y token buckets en un directorio compartido.
+
+    Args:
+        path: Directorio (se crea con permisos 0700; debe ser local al host)
+        slots: Cantidad de contadores de generación
+    """
+
+    def __init__(self, path: str, slots: int = GENERATION_SLOTS):
+        self.path = path
+        self._slots = slots
+        self._snapshot_dir = os.path.join(path, "snapshots")
+        os.makedirs(self._snapshot_dir, mode=0o700, exist_ok=True)
+        self._gen_fd, self._generations = _map_file(
+            os.path.join(path, "generations.bin"), slots * _U64.size
+        )
+        self._buckets: dict[str, tuple[int, mmap.mmap]] = {}
+        self._buckets_lock = threading.Lock()
+
+    # ------------------------------------------------------------ generaciones
+
+    def _offset(self, key: str) -> int:
+        return (zlib.crc32(key.encode()) % self._slots) * _U64.size
+
+    def generation(self, key: str) -> int:
+        """Generación vigente de `key` (cambia con cada `bump` de cualquier proceso)."""
+        return _U64.unpack_from(self._generations, self._offset(key))[0]
+
+    def bump(self, key: str) -> int:
+        """Invalida `key` en todos los procesos; devuelve la nueva generación."""
+        offset = self._offset(key)
+        with _flock(self._gen_fd):
+            value = _U64.unpack_from(self._generations, offset)[0] + 1
+            _U64.pack_into(self._generations, offset, value)
+        return value
+
+    # ------------------------------------------------------------ snapshots
+
+    def _snapshot_paths(self, key: str) -> tuple[str, str]:
+        name = re.sub(r"[^A-Za-z0-9_.-]", "_", key)
+        base = os.path.join(self._snapshot_dir, name)
+        return base + ".json", base + ".pkl"
+
+    def publish(
+        self,
+        key: str,
+        value: Any,
+        digest: str,
+        generation: int,
+        expires_at: float,
+        token: Optional[str] = None,
+    ) -> None:
+        """
+        Publica un snapshot leído con la generación `generation` (tomada antes de leer).
+
+        No publica si la clave fue invalidada mientras tanto. Si el snapshot
+        publicado ya tiene ese digest solo se renueva el metadata.
+
+        Args:
+            expires_at: Vencimiento (`time.time()`)
+            token: Token de cambios del origen (modifiedTime de Drive), opcional
+        """
+        if self.generation(key) != generation:
+            return
+        meta_path, data_path = self._snapshot_paths(key)
+        meta = {"generation": generation, "digest": digest, "expires_at": expires_at, "token": token}
+        try:
+            current = self._read_meta(meta_path)
+            if current is None or current.get("digest") != digest:
+                tmp = f"{data_path}.{os.getpid()}.tmp"
+                with open(tmp, "wb") as f:
+                    pickle.dump((digest, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, data_path)
+            tmp = f"{meta_path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(tmp, meta_path)
+        except OSError as e:
+            logger.warning(f"Shared snapshot publish failed for '{key}': {e}")
+
+    def published(self, key: str) -> Optional[dict]:
+        """
+        Metadata del snapshot publicado si sigue vigente (generación actual, no vencido).
+
+        Returns:
+            {"generation", "digest", "expires_at", "token"} o None
+        """
+        meta = self._read_meta(self._snapshot_paths(key)[0])
+        if meta is None:
+            return None
+        if meta.get("generation") != self.generation(key) or meta.get("expires_at", 0) <= time.time():
+            return None
+        return meta
+
+    def load(self, key: str, digest: str) -> Optional[Any]:
+        """Filas del snapshot publicado con `digest` (None si ya fue reemplazado)."""
+        try:
+            with open(self._snapshot_paths(key)[1], "rb") as f:
+                stored_digest, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError) as e:
+            logger.debug(f"Shared snapshot load failed for '{key}': {e}")
+            return None
+        return value if stored_digest == digest else None
+
+    @staticmethod
+    def _read_meta(path: str) -> Optional[dict]:
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    # ------------------------------------------------------------ roles
+
+    def try_lock(self, name: str) -> Optional[int]:
+        """
+        `flock` exclusivo no bloqueante de `<name>.lock` (un solo worker con el rol).
+
+        Returns:
+            fd a mantener abierto mientras dure el rol (cerrarlo lo libera),
+            o None si otro proceso lo tiene
+        """
+        fd = os.open(os.path.join(self.path, f"{name}.lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+        return fd
+
+    # ------------------------------------------------------------ token buckets
+
+    def _bucket(self, kind: str) -> tuple[int, mmap.mmap]:
+        with self._buckets_lock:
+            bucket = self._buckets.get(kind)
+            if bucket is None:
+                bucket = _map_file(os.path.join(self.path, f"bucket-{kind}.bin"), _BUCKET.size)
+                self._buckets[kind] = bucket
+            return bucket
+
+    def take_token(self, kind: str, capacity: float, rate: float, reserve: float, now: float) -> float:
+        """
+        Recarga el bucket compartido `kind` y toma un token si alcanza.
+
+        Args:
+            capacity: Tokens máximos (cuota por minuto)
+            rate: Tokens por segundo
+            reserve: Tokens que el caller no puede consumir (reserva de BACKGROUND)
+            now: `time.monotonic()`
+
+        Returns:
+            Tokens restantes; si es < 0 no se tomó token y faltan `-resultado`
+        """
+        fd, region = self._bucket(kind)
+        with _flock(fd):
+            tokens, updated, initialized = _BUCKET.unpack_from(region, 0)
+            if not initialized or updated > now:
+                # Bucket nuevo, o estado de antes de un reboot (otro reloj monotónico)
+                tokens, updated = capacity, now
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            available = tokens - reserve - 1
+            if available >= 0:
+                tokens -= 1
+            _BUCKET.pack_into(region, 0, tokens, now, 1)
+        return tokens if available >= 0 else available
+
+    def tokens(self, kind: str, capacity: float, rate: float, now: float) -> float:
+        """Tokens disponibles en el bucket compartido (sin tomar ninguno)."""
+        fd, region = self._bucket(kind)
+        with _flock(fd):
+            tokens, updated, initialized = _BUCKET.unpack_from(region, 0)
+        if not initialized or updated > now:
+            return capacity
+        return min(capacity, tokens + (now - updated) * rate)
+
+
+# Singleton global para uso en toda la aplicación
+_store: Optional[SharedStore] = None
+_store_lock = threading.Lock()
+
+
+def get_shared_store() -> Optional[SharedStore]:
+    """Store compartido, o None si `config.SHARED_STATE_DIR` no está configurado."""
+    global _store
+    if not config.SHARED_STATE_DIR:
+        return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SharedStore(config.SHARED_STATE_DIR)
+                logger.info(f"Shared state enabled at {config.SHARED_STATE_DIR} (pid {os.getpid()})")
+    return _store
@@ -0,0 +1,277 @@
+"""
+Contabilidad por request de llamadas a Google Sheets.
+
+Cada request muestreado lleva un `RequestSheetsStats` en un ContextVar
+(se propaga al threadpool de FastAPI y a las tasks hijas). Los puntos
+centrales de acceso a Sheets registran ahí lo que hacen:
+
+- GovernedHTTPClient (cliente gspread real) y FakeGspreadClient: cada
+  llamada a la API con operación, hoja, rango, bytes, duración y espera
+  de cuota.
+- SimpleCache.get: hits/misses de cache.
+- retry_on_sheets_error, ConflictService y VersionDetectionService:
+  reintentos.
+
+`SheetsInstrumentationMiddleware` abre el contexto para una fracción de
+los requests (`config.SHEETS_INSTRUMENTATION_SAMPLE_RATE`, 0 = apagado),
+agrega `Server-Timing` a la respuesta y deja una línea de resumen en el
+log. Sin contexto activo, cada `record_*` sólo actualiza las métricas
+siempre encendidas de /api/metrics (backend/core/metrics.py).
+
+Usage:
+    with sheets_instrumentation() as stats:
+        service.finalizar_spool(...)
+    assert stats.api_calls <= 2      # PERF-03 contra el backend real/fake
+"""
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+from urllib.parse import unquote, urlparse
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.core import metrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SheetsCall:
+    """Una llamada a la API de Sheets."""
+    operation: str
+    kind: str                      # "read" o "write"
+    sheet: Optional[str]
+    duration: float
+    quota_wait: float = 0.0
+    range: Optional[str] = None
+    bytes: Optional[int] = None
+
+
+class RequestSheetsStats:
+    """Llamadas, cache y reintentos de Sheets acumulados durante un request."""
+
+    def __init__(self):
+        self.calls: list[SheetsCall] = []
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def add_call(self, call: SheetsCall) -> None:
+        with self._lock:
+            self.calls.append(call)
+
+    def add_cache_lookup(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+
+    def add_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    @property
+    def api_calls(self) -> int:
+        return len(self.calls)
+
+    @property
+    def reads(self) -> int:
+        return sum(1 for call in self.calls if call.kind == "read")
+
+    @property
+    def writes(self) -> int:
+        return sum(1 for call in self.calls if call.kind == "write")
+
+    @property
+    def sheets_seconds(self) -> float:
+        return sum(call.duration for call in self.calls)
+
+    @property
+    def quota_wait_seconds(self) -> float:
+        return sum(call.quota_wait for call in self.calls)
+
+    def operations(self) -> Counter:
+        """Conteo por "operación:hoja" (ej: "values.batchUpdate:Operaciones")."""
+        return Counter(
+            f"{call.operation}:{call.sheet}" if call.sheet else call.operation
+            for call in self.calls
+        )
+
+    def server_timing(self) -> str:
+        """Valor del header Server-Timing (duraciones en ms)."""
+        return (
+            f'sheets;dur={self.sheets_seconds * 1000:.1f};'
+            f'desc="{self.api_calls} calls ({self.reads}r/{self.writes}w)", '
+            f'sheets-quota;dur={self.quota_wait_seconds * 1000:.1f}, '
+            f'sheets-cache;desc="hit={self.cache_hits} miss={self.cache_misses} retries={self.retries}"'
+        )
+
+    def summary(self) -> str:
+        ops = ", ".join(f"{op}x{count}" for op, count in sorted(self.operations().items()))
+        return (
+            f"calls={self.api_calls} (read={self.reads}, write={self.writes}) "
+            f"sheets={self.sheets_seconds * 1000:.1f}ms "
+            f"quota_wait={self.quota_wait_seconds * 1000:.1f}ms "
+            f"cache={self.cache_hits}hit/{self.cache_misses}miss retries={self.retries}"
+            + (f" | {ops}" if ops else "")
+        )
+
+
+_current_stats: ContextVar[Optional[RequestSheetsStats]] = ContextVar(
+    "sheets_request_stats", default=None
+)
+
+
+def current_stats() -> Optional[RequestSheetsStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def sheets_instrumentation() -> Iterator[RequestSheetsStats]:
+    """Registra las llamadas a Sheets del bloque en un RequestSheetsStats nuevo."""
+    stats = RequestSheetsStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def record_sheets_call(
+    operation: str,
+    kind: str,
+    sheet: Optional[str],
+    duration: float,
+    quota_wait: float = 0.0,
+    range_name: Optional[str] = None,
+    size_bytes: Optional[int] = None,
+) -> None:
+    metrics.SHEETS_CALL_DURATION.observe(duration, operation=operation, kind=kind, sheet=sheet or "")
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.add_call(SheetsCall(operation, kind, sheet, duration, quota_wait, range_name, size_bytes))
+
+
+def record_cache_lookup(hit: bool, key: str = "") -> None:
+    metrics.CACHE_LOOKUPS.inc(key=metrics.cache_key_label(key), result="hit" if hit else "miss")
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.add_cache_lookup(hit)
+
+
+def record_sheets_retry() -> None:
+    metrics.SHEETS_RETRIES.inc()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.add_retry()
+
+
+def record_sheets_throttled(kind: str) -> None:
+    """Un 429 de la API de Sheets (sólo métrica; el reintento se cuenta aparte)."""
+    metrics.SHEETS_THROTTLED.inc(kind=kind)
+
+
+def describe_request(method: str, endpoint: str, params=None, json=None) -> tuple[str, Optional[str]]:
+    """
+    (operación, rango) de una request HTTP de la API de Sheets.
+
+    Example:
+        >>> describe_request("GET", ".../spreadsheets/ID/values/Operaciones%21A1%3AB2")
+        ('values.get', 'Operaciones!A1:B2')
+        >>> describe_request("POST", ".../spreadsheets/ID/values/Metadata%21A1%3AK1:append")
+        ('values.append', 'Metadata!A1:K1')
+        >>> describe_request("POST", ".../spreadsheets/ID/values:batchUpdate",
+        ...                  json={"data": [{"range": "Uniones!A2"}]})
+        ('values.batchUpdate', 'Uniones!A2')
+    """
+    path = unquote(urlparse(endpoint).path)
+    _, _, tail = path.partition("/spreadsheets/")
+    rest = tail.split("/", 1)[1] if "/" in tail else ""
+    range_name = None
+    if not tail:
+        operation = f"drive.{method.lower()}"
+    elif not rest:
+        # spreadsheets/{id} o spreadsheets/{id}:batchUpdate
+        operation = "batchUpdate" if tail.endswith(":batchUpdate") else "spreadsheets.get"
+    elif rest.startswith("values:"):
+        operation = "values." + rest[len("values:"):]
+    elif rest.startswith("values/"):
+        range_name = rest[len("values/"):]
+        head, _, action = range_name.rpartition(":")
+        if action in ("append", "clear"):
+            range_name = head
+            operation = f"values.{action}"
+        else:
+            operation = "values.get" if method.upper() == "GET" else "values.update"
+    else:
+        operation = rest
+
+    if range_name is None:
+        ranges = (params or {}).get("ranges") if isinstance(params, dict) else None
+        if ranges is None and isinstance(json, dict):
+            data = json.get("data") or json.get("ranges")
+            if isinstance(data, list):
+                ranges = [item.get("range") if isinstance(item, dict) else item for item in data]
+        if ranges:
+            range_name = ranges if isinstance(ranges, str) else ",".join(str(r) for r in ranges if r)
+    return operation, range_name
+
+
+def sheet_of_range(range_name: Optional[str]) -> Optional[str]:
+    """Hoja del primer rango ("'Operaciones'!A1:B2" → "Operaciones")."""
+    if not range_name:
+        return None
+    first = range_name.split(",")[0]
+    sheet = first.split("!")[0] if "!" in first else first
+    return sheet.strip("'") or None
+
+
+class SheetsInstrumentationMiddleware:
+    """
+    Middleware ASGI: abre el contexto de instrumentación para requests muestreados.
+
+    Usage:
+        app.add_middleware(SheetsInstrumentationMiddleware, sample_rate=0.1)
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: float = 0.0):
+        self.app = app
+        self.sample_rate = sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.sample_rate <= 0 or (
+            self.sample_rate < 1 and random.random() >= self.sample_rate
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        with sheets_instrumentation() as stats:
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    headers = MutableHeaders(scope=message)
+                    total = (time.perf_counter() - start) * 1000
+                    headers.append("Server-Timing", f"{stats.server_timing()}, total;dur={total:.1f}")
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                elapsed = (time.perf_counter() - start) * 1000
+                logger.info(
+                    f"[sheets] {scope['method']} {scope['path']} -> {status_code} "
+                    f"{elapsed:.0f}ms | {stats.summary()}"
+                )
@@ -0,0 +1,230 @@
+"""
+Diff por fila entre snapshots consecutivos de una hoja (Operaciones, Uniones).
+
+Cada vez que `SheetsRepository.read_worksheet` trae una hoja de Sheets, el
+snapshot anterior se descartaba y todo lo derivado (OccupancyView,
+EligibilityIndex, WorkerLedger) se reconstruía desde cero, aunque solo
+hubiera cambiado una fila (ej: un supervisor editando en la UI de Sheets).
+
+`SnapshotDiffer` guarda, por hoja, un hash de cada fila indexado por su
+clave (TAG_SPOOL en Operaciones, ID en Uniones) y al llegar un snapshot
+nuevo produce un `RowDiff` con las claves agregadas, eliminadas y
+cambiadas, más las filas que se movieron de posición. Con eso:
+
+- las vistas derivadas (`SnapshotView._apply_diff_locked`) re-evalúan solo
+  las filas tocadas cuando las posiciones no cambiaron;
+- los suscriptores (`subscribe`) reciben el diff para mantener feeds de
+  cambios.
+
+Claves repetidas se distinguen por ocurrencia ("MK-1", "MK-1#2"); filas
+sin clave se identifican por posición ("@17").
+
+Usage:
+    differ = SnapshotDiffer({"Operaciones": "TAG_SPOOL"})
+    differ.observe("Operaciones", rows, version=1)         # primer snapshot: None
+    diff = differ.observe("Operaciones", new_rows, version=2, digest=new_digest)
+    diff.changed   # {"MK-1335-CW-25238-011": 42}  (clave -> fila 1-based)
+"""
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from backend.utils.normalize import normalize_column_name
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RowSnapshot:
+    """Hash por clave de fila de un snapshot."""
+    source: list
+    header: tuple
+    key_index: Optional[int]
+    # clave -> (fila 1-based, hash del contenido)
+    entries: dict[str, tuple[int, int]]
+    digest: Optional[str] = None
+    version: int = 0
+
+
+@dataclass
+class RowDiff:
+    """Diferencias entre dos snapshots de una hoja (filas 1-based)."""
+    sheet: str
+    version: int
+    old_source: list
+    new_source: list
+    header_changed: bool = False
+    old_version: int = 0                                        # versión del snapshot anterior
+    added: dict[str, int] = field(default_factory=dict)      # clave -> fila nueva
+    removed: dict[str, int] = field(default_factory=dict)    # clave -> fila anterior
+    changed: dict[str, int] = field(default_factory=dict)    # clave -> fila nueva
+    moved: dict[str, tuple[int, int]] = field(default_factory=dict)  # clave -> (anterior, nueva)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.header_changed or self.added or self.removed or self.changed or self.moved)
+
+    @property
+    def positions_stable(self) -> bool:
+        """True si cada fila conservada sigue en la misma posición (se puede parchear por fila)."""
+        return not self.header_changed and not self.moved
+
+    def touched_rows(self) -> set[int]:
+        """Filas del snapshot nuevo agregadas o cambiadas."""
+        return set(self.added.values()) | set(self.changed.values())
+
+    def removed_rows(self) -> set[int]:
+        """Filas del snapshot anterior que ya no existen."""
+        return set(self.removed.values())
+
+    def summary(self) -> str:
+        return (
+            f"+{len(self.added)} -{len(self.removed)} ~{len(self.changed)} "
+            f"moved={len(self.moved)}" + (" header" if self.header_changed else "")
+        )
+
+
+def _find_key_index(header: list, key_column: str) -> Optional[int]:
+    target = normalize_column_name(key_column)
+    for idx, name in enumerate(header):
+        if normalize_column_name(str(name)) == target:
+            return idx
+    return None
+
+
+def build_row_snapshot(rows: list, key_column: str) -> RowSnapshot:
+    """Hashea cada fila de datos (rows[1:]) por su clave."""
+    header = tuple(rows[0]) if rows else ()
+    key_index = _find_key_index(list(header), key_column)
+    entries: dict[str, tuple[int, int]] = {}
+    for row_number, row in enumerate(rows[1:], start=2):
+        key = ""
+        if key_index is not None and key_index < len(row):
+            key = str(row[key_index]).strip()
+        if not key:
+            key = f"@{row_number}"
+        elif key in entries:
+            occurrence = 2
+            while f"{key}#{occurrence}" in entries:
+                occurrence += 1
+            key = f"{key}#{occurrence}"
+        entries[key] = (row_number, hash(tuple(row)))
+    return RowSnapshot(source=rows, header=header, key_index=key_index, entries=entries)
+
+
+def diff_snapshots(sheet: str, old: RowSnapshot, new: RowSnapshot, version: int = 0) -> RowDiff:
+    """Compara dos snapshots por clave."""
+    diff = RowDiff(
+        sheet=sheet,
+        version=version,
+        old_source=old.source,
+        new_source=new.source,
+        header_changed=old.header != new.header,
+        old_version=old.version,
+    )
+    old_entries = old.entries
+    if old_entries is new.entries:
+        # Mismo digest: se reutilizaron los hashes
+        return diff
+    for key, (row_number, row_hash) in new.entries.items():
+        previous = old_entries.get(key)
+        if previous is None:
+            diff.added[key] = row_number
+            continue
+        if previous[1] != row_hash:
+            diff.changed[key] = row_number
+        if previous[0] != row_number:
+            diff.moved[key] = (previous[0], row_number)
+    for key, (row_number, _) in old_entries.items():
+        if key not in new.entries:
+            diff.removed[key] = row_number
+    return diff
+
+
+class SnapshotDiffer:
+    """
+    Último snapshot (hasheado) por hoja y diff contra el anterior.
+
+    Args:
+        key_columns: {nombre de hoja: columna clave}; otras hojas se ignoran
+    """
+
+    def __init__(self, key_columns: dict[str, str]):
+        self._key_columns = dict(key_columns)
+        self._lock = threading.Lock()
+        self._snapshots: dict[str, RowSnapshot] = {}
+        self._latest: dict[str, RowDiff] = {}
+        self._subscribers: list[Callable[[RowDiff], None]] = []
+
+    def tracks(self, sheet: str) -> bool:
+        return sheet in self._key_columns
+
+    def observe(
+        self,
+        sheet: str,
+        rows: list,
+        version: int = 0,
+        digest: Optional[str] = None,
+    ) -> Optional[RowDiff]:
+        """
+        Registra un snapshot recién leído y devuelve su diff contra el anterior.
+
+        Args:
+            sheet: Nombre de la hoja
+            rows: Filas leídas (incluye header)
+            version: Versión del snapshot (SimpleCache.version)
+            digest: Hash del contenido completo; si coincide con el del
+                    snapshot anterior se reutilizan sus hashes (diff vacío)
+
+        Returns:
+            RowDiff, o None si la hoja no se sigue o es su primer snapshot
+        """
+        key_column = self._key_columns.get(sheet)
+        if key_column is None or not rows:
+            return None
+
+        with self._lock:
+            previous = self._snapshots.get(sheet)
+            if previous is not None and digest is not None and previous.digest == digest:
+                snapshot = RowSnapshot(rows, previous.header, previous.key_index, previous.entries, digest)
+            else:
+                snapshot = build_row_snapshot(rows, key_column)
+                snapshot.digest = digest
+            snapshot.version = version
+            self._snapshots[sheet] = snapshot
+            if previous is None:
+                self._latest.pop(sheet, None)
+                return None
+            diff = diff_snapshots(sheet, previous, snapshot, version)
+            self._latest[sheet] = diff
+            subscribers = list(self._subscribers)
+
+        if not diff.is_empty:
+            logger.info(f"Snapshot diff '{sheet}' v{version}: {diff.summary()}")
+        for callback in subscribers:
+            try:
+                callback(diff)
+            except Exception as e:
+                logger.warning(f"Snapshot diff subscriber failed for '{sheet}': {e}")
+        return diff
+
+    def latest(self, sheet: str) -> Optional[RowDiff]:
+        """Diff del último snapshot observado de la hoja."""
+        with self._lock:
+            return self._latest.get(sheet)
+
+    def subscribe(self, callback: Callable[[RowDiff], None]) -> None:
+        """`callback(diff)` para cada snapshot nuevo (también los sin cambios)."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def reset(self, sheet: Optional[str] = None) -> None:
+        """Olvida los snapshots (todos o de una hoja)."""
+        with self._lock:
+            if sheet is None:
+                self._snapshots.clear()
+                self._latest.clear()
+            else:
+                self._snapshots.pop(sheet, None)
+                self._latest.pop(sheet, None)
@@ -0,0 +1,249 @@
+"""
+Refresher de fondo de snapshots de hojas (Operaciones, Uniones, Trabajadores+Roles).
+
+Sin refresher, la lectura a Sheets la paga el request que encuentra el
+cache vencido (`SheetsRepository.read_worksheet`): cada 60s algún trabajador
+espera un `get_all_values` de Operaciones. Con `config.SNAPSHOT_REFRESH_ENABLED`
+un thread dueño de las lecturas renueva cada snapshot ANTES de que venza su
+TTL (`refresh_worksheet`: sondeo de modifiedTime y relectura solo si el
+libro cambió). El snapshot nuevo es una lista nueva que reemplaza a la
+anterior en el cache de una sola asignación; los requests toman la
+referencia vigente y nunca ven un snapshot a medio armar.
+
+El calendario se adapta:
+- Escrituras: una escritura invalida la hoja; el job la relee tras
+  `MIN_GAP_SECONDS` (ráfagas de escrituras se juntan en una lectura), así el
+  request siguiente ya encuentra el snapshot con la escritura.
+- Cuota: con pocos tokens de lectura en el QuotaGovernor los períodos se
+  estiran (x2 bajo 25%, x4 bajo 10%); las lecturas del refresher van con
+  prioridad BACKGROUND y no tocan la reserva de las confirmaciones.
+- Errores: backoff exponencial acotado al período del job.
+
+Con varios workers de uvicorn (SHARED_STATE_DIR) solo el worker que toma el
+lock `snapshot-refresher` refresca; los demás adoptan los snapshots que
+publica (backend/core/shared_store.py).
+
+Usage:
+    refresher = start_snapshot_refresher()    # None si está deshabilitado
+    refresher.run_due()                      # un paso (tests)
+    shutdown_snapshot_refresher()
+"""
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from backend.config import config
+from backend.core import metrics
+from backend.core.quota_governor import QuotaPriority, get_quota_governor, quota_priority
+
+logger = logging.getLogger(__name__)
+
+# Espera mínima entre una invalidación y la relectura (junta ráfagas)
+MIN_GAP_SECONDS = 2.0
+TICK_SECONDS = 1.0
+# (fracción de tokens de lectura disponible, multiplicador del período)
+QUOTA_PRESSURE_STEPS = ((0.10, 4.0), (0.25, 2.0))
+
+SNAPSHOT_REFRESHES = metrics.get_metrics_registry().counter(
+    "zeues_snapshot_refreshes_total",
+    "Background snapshot refreshes by job and result (ok/error).",
+    ("job", "result"),
+)
+
+
+@dataclass
+class RefreshJob:
+    """Una hoja (o grupo de hojas) renovada en segundo plano."""
+    name: str
+    interval: float
+    refresh: Callable[[], object]
+    # True si el snapshot ya no está vigente (ej: una escritura lo invalidó)
+    is_stale: Callable[[], bool] = lambda: False
+    next_due: float = 0.0
+    last_run: float = float("-inf")
+    failures: int = 0
+
+
+def read_quota_left() -> Optional[float]:
+    """Fracción de tokens de lectura disponibles (None si no hay límite)."""
+    read = get_quota_governor().snapshot().get("read", {})
+    if not read.get("enabled"):
+        return None
+    return read["tokens"] / max(1, read["per_minute"])
+
+
+class SnapshotRefresher:
+    """
+    Calendario de RefreshJob ejecutado por un thread de fondo.
+
+    Args:
+        jobs: Jobs a renovar (corren en orden dentro de cada paso)
+        quota_left: Fracción de cuota de lectura disponible (None = sin límite)
+        clock: Reloj monotónico (tests)
+    """
+
+    def __init__(
+        self,
+        jobs: list[RefreshJob],
+        quota_left: Callable[[], Optional[float]] = read_quota_left,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.jobs = jobs
+        self._quota_left = quota_left
+        self._clock = clock
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _stretch(self) -> float:
+        try:
+            left = self._quota_left()
+        except Exception:
+            return 1.0
+        if left is None:
+            return 1.0
+        for threshold, factor in QUOTA_PRESSURE_STEPS:
+            if left < threshold:
+                return factor
+        return 1.0
+
+    def run_due(self) -> list[str]:
+        """
+        Corre los jobs vencidos o invalidados.
+
+        Returns:
+            Nombres de los jobs que corrieron
+        """
+        ran = []
+        for job in self.jobs:
+            now = self._clock()
+            due = now >= job.next_due
+            if not due and now - job.last_run >= MIN_GAP_SECONDS:
+                try:
+                    due = job.is_stale()
+                except Exception:
+                    due = False
+            if not due:
+                continue
+            ran.append(job.name)
+            job.last_run = now
+            try:
+                with quota_priority(QuotaPriority.BACKGROUND):
+                    job.refresh()
+            except Exception as e:
+                job.failures += 1
+                backoff = min(job.interval, MIN_GAP_SECONDS * 2 ** job.failures)
+                job.next_due = self._clock() + backoff
+                SNAPSHOT_REFRESHES.inc(job=job.name, result="error")
+                logger.warning(f"Snapshot refresh '{job.name}' failed (retry in {backoff:.0f}s): {e}")
+                continue
+            job.failures = 0
+            job.next_due = self._clock() + job.interval * self._stretch()
+            SNAPSHOT_REFRESHES.inc(job=job.name, result="ok")
+        return ran
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="snapshot-refresher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_due()
+            except Exception as e:  # nunca matar el thread
+                logger.error(f"Snapshot refresher step failed: {e}", exc_info=True)
+            self._stop.wait(TICK_SECONDS)
+
+
+def build_default_jobs(sheets_repo) -> list[RefreshJob]:
+    """Operaciones (rápido), Uniones y Trabajadores+Roles (lento)."""
+    from backend.services.worker_service import WorkerService
+
+    def sheet_job(sheet_name: str, interval: float, after: Callable[[], object] = lambda: None) -> RefreshJob:
+        # Versión del snapshot tras el último refresh: si avanzó, una
+        # escritura (de este u otro worker) invalidó la hoja
+        refreshed = {"version": None}
+
+        def refresh() -> None:
+            sheets_repo.refresh_worksheet(sheet_name)
+            after()
+            # Sin snapshot cacheado (una escritura cruzó la lectura y se
+            # descartó) el job sigue stale y relee tras MIN_GAP_SECONDS
+            cached = sheets_repo.peek_cached_worksheet(sheet_name) is not None
+            refreshed["version"] = sheets_repo.peek_snapshot_version(sheet_name) if cached else None
+
+        return RefreshJob(
+            name=sheet_name,
+            interval=interval,
+            refresh=refresh,
+            is_stale=lambda: sheets_repo.peek_snapshot_version(sheet_name) != refreshed["version"],
+        )
+
+    def refresh_workers() -> None:
+        # Roles no pasa por el cache de read_worksheet: se renueva con la lista parseada
+        WorkerService(sheets_repository=sheets_repo).refresh_workers()
+
+    return [
+        sheet_job(config.HOJA_OPERACIONES_NOMBRE, config.SNAPSHOT_REFRESH_OPERACIONES_SECONDS),
+        sheet_job("Uniones", config.SNAPSHOT_REFRESH_SLOW_SECONDS),
+        sheet_job(config.HOJA_TRABAJADORES_NOMBRE, config.SNAPSHOT_REFRESH_SLOW_SECONDS, after=refresh_workers),
+    ]
+
+
+# Singleton global para uso en toda la aplicación
+_refresher: Optional[SnapshotRefresher] = None
+_refresher_lock = threading.Lock()
+_refresher_lock_fd: Optional[int] = None
+
+
+def start_snapshot_refresher() -> Optional[SnapshotRefresher]:
+    """
+    Arranca el refresher global (startup de la app).
+
+    Returns:
+        El refresher, o None si está deshabilitado o lo corre otro worker
+    """
+    global _refresher, _refresher_lock_fd
+    if not config.SNAPSHOT_REFRESH_ENABLED:
+        return None
+    with _refresher_lock:
+        if _refresher is None:
+            from backend.core.dependency import get_sheets_repository
+            from backend.core.shared_store import get_shared_store
+
+            store = get_shared_store()
+            if store is not None:
+                _refresher_lock_fd = store.try_lock("snapshot-refresher")
+                if _refresher_lock_fd is None:
+                    logger.info(f"Snapshot refresher runs in another worker (pid {os.getpid()})")
+                    return None
+            _refresher = SnapshotRefresher(build_default_jobs(get_sheets_repository()))
+            _refresher.start()
+            logger.info(
+                f"Snapshot refresher started: {[(job.name, job.interval) for job in _refresher.jobs]}"
+            )
+    return _refresher
+
+
+def shutdown_snapshot_refresher(timeout: float = 5.0) -> None:
+    """Detiene el refresher global si existe (shutdown de la app y tests)."""
+    global _refresher, _refresher_lock_fd
+    with _refresher_lock:
+        refresher, _refresher = _refresher, None
+        lock_fd, _refresher_lock_fd = _refresher_lock_fd, None
+    if refresher is not None:
+        refresher.stop(timeout)
+    if lock_fd is not None:
+        os.close(lock_fd)  # libera el lock para otro worker
@@ -0,0 +1,202 @@
+"""
+Base para vistas derivadas de un snapshot de hoja (WorkerLedger, OccupancyView).
+
+Una vista se construye UNA vez por snapshot — la lista de filas cacheada
+por `SheetsRepository.read_worksheet` — y luego responde consultas sin
+volver a escanear la hoja.
+
+Frescura (`_ensure_fresh_locked`):
+- Si el cache de filas tiene un snapshot distinto al de la vista y el diff
+  por fila del repositorio (`SheetsRepository.snapshot_diff`, ver
+  backend/core/snapshot_diff.py) va del snapshot de la vista al nuevo, la
+  vista se actualiza solo en las filas tocadas (`_update_rows_locked`).
+- Si no, se reconstruye desde ese snapshot (CPU, cero llamadas a Sheets).
+- Si el cache fue invalidado por una escritura que la vista ya parcheó,
+  la vista sigue vigente hasta `TTL_SECONDS` desde su último cambio.
+- Si no hay snapshot ni vista vigente, se lee la hoja.
+
+Las subclases definen `SHEET_NAME`, `_clear_locked()` y
+`_build_locked(rows, column_map)`. Hay una instancia por (subclase,
+SheetsRepository), guardada en un WeakKeyDictionary; esto aísla los
+tests que usan repos mockeados.
+
+Escrituras: `SheetsRepository` entrega las celdas escritas por nombre de
+columna a `apply_cell_updates` de cada vista ya creada para esa hoja
+(ver `instances_for`). Por defecto eso invalida la vista; las subclases
+que pueden parchearse lo sobreescriben.
+"""
+import logging
+import threading
+import time
+import weakref
+from typing import Iterable, Optional
+
+from backend.core.snapshot_diff import RowDiff
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotView:
+    """Vista derivada de una hoja, reconstruida por snapshot y parcheable."""
+
+    SHEET_NAME = ""
+    TTL_SECONDS = 300
+
+    # {sheets_repo: {subclase: instancia}}
+    _registry: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+    _registry_lock = threading.Lock()
+
+    def __init__(self, sheets_repo):
+        self._sheets_repo = sheets_repo
+        self._lock = threading.Lock()
+        self._source: Optional[list] = None
+        self._loaded_at = 0.0
+        self._patched_rows: set[int] = set()
+        self._clear_locked()
+
+    # ------------------------------------------------------------------ registry
+
+    @classmethod
+    def for_repository(cls, sheets_repo):
+        """Vista asociada a una instancia de SheetsRepository (lazy)."""
+        with SnapshotView._registry_lock:
+            views = SnapshotView._registry.setdefault(sheets_repo, {})
+            view = views.get(cls)
+            if view is None:
+                view = cls(sheets_repo)
+                views[cls] = view
+            return view
+
+    @classmethod
+    def instances_for(cls, sheets_repo, sheet_name: str) -> list:
+        """Vistas ya creadas para este repositorio y hoja (no crea ninguna)."""
+        with SnapshotView._registry_lock:
+            views = SnapshotView._registry.get(sheets_repo)
+            if not views:
+                return []
+            return [view for view in views.values() if view.SHEET_NAME == sheet_name]
+
+    @classmethod
+    def clear_all(cls) -> None:
+        """Descarta todas las instancias de esta vista (para tests)."""
+        with SnapshotView._registry_lock:
+            for views in SnapshotView._registry.values():
+                views.pop(cls, None)
+
+    # ------------------------------------------------------------------ hooks
+
+    def _clear_locked(self) -> None:
+        raise NotImplementedError
+
+    def _build_locked(self, rows: list, column_map: dict) -> None:
+        raise NotImplementedError
+
+    def _update_rows_locked(self, rows: list, refresh: set[int], removed: set[int]) -> bool:
+        """
+        Actualiza la vista en el lugar para un snapshot con posiciones estables.
+
+        Args:
+            rows: Snapshot nuevo (incluye header)
+            refresh: Filas (1-based) agregadas, cambiadas o parcheadas desde el build
+            removed: Filas del snapshot anterior que ya no existen
+
+        Returns:
+            False si la vista no sabe actualizarse (se reconstruye)
+        """
+        return not refresh and not removed
+
+    # ------------------------------------------------------------------ state
+
+    def invalidate(self) -> None:
+        """Descarta la vista; la próxima consulta la reconstruye."""
+        with self._lock:
+            self._reset_locked()
+
+    def apply_cell_updates(self, updates: list[dict]) -> None:
+        """
+        Celdas recién escritas por nombre de columna.
+
+        Args:
+            updates: [{"row": 10, "column_name": "Ocupado_Por", "value": "MR(93)"}, ...]
+        """
+        self.invalidate()
+
+    def _reset_locked(self) -> None:
+        self._source = None
+        self._loaded_at = 0.0
+        # peek_snapshot_version del repo con la que la vista quedó al día
+        self._valid_version = None
+        # Filas parcheadas por escrituras desde el último snapshot
+        self._patched_rows: set[int] = set()
+        self._clear_locked()
+
+    def _touch_locked(self, rows: Iterable[int] = ()) -> None:
+        """Marca la vista como vigente tras parchear `rows`."""
+        self._loaded_at = time.monotonic()
+        self._valid_version = self._repo_version()
+        self._patched_rows.update(rows)
+
+    def _repo_version(self):
+        peek = getattr(self._sheets_repo, "peek_snapshot_version", None)
+        return peek(self.SHEET_NAME) if peek is not None else None
+
+    def _apply_diff_locked(self, rows: list) -> bool:
+        """Intenta pasar de `_source` a `rows` con el diff por fila del repositorio."""
+        snapshot_diff = getattr(self._sheets_repo, "snapshot_diff", None)
+        diff = snapshot_diff(self.SHEET_NAME) if snapshot_diff is not None else None
+        if not isinstance(diff, RowDiff) or diff.old_source is not self._source or diff.new_source is not rows:
+            return False
+        if not diff.positions_stable:
+            return False
+        # Las filas parcheadas se recalculan desde el snapshot real
+        refresh = diff.touched_rows() | {row for row in self._patched_rows if row <= len(rows)}
+        removed = diff.removed_rows() | {row for row in self._patched_rows if row > len(rows)}
+        try:
+            if not self._update_rows_locked(rows, refresh, removed):
+                return False
+        except Exception as e:
+            logger.warning(f"{type(self).__name__}: incremental update failed ({e}), rebuilding")
+            return False
+        self._source = rows
+        self._loaded_at = time.monotonic()
+        self._valid_version = self._repo_version()
+        self._patched_rows = set()
+        return True
+
+    def _rebuild_locked(self, rows: list) -> None:
+        from backend.core.column_map_cache import ColumnMapCache
+
+        self._reset_locked()
+        if rows and len(rows) >= 2:
+            column_map = ColumnMapCache.get_or_build(self.SHEET_NAME, self._sheets_repo)
+            try:
+                self._build_locked(rows, column_map)
+            except Exception:
+                self._clear_locked()
+                raise
+        self._source = rows
+        self._loaded_at = time.monotonic()
+        self._valid_version = self._repo_version()
+
+    def _ensure_fresh_locked(self) -> None:
+        cached = self._sheets_repo.peek_cached_worksheet(self.SHEET_NAME)
+        if not isinstance(cached, list):
+            cached = None
+
+        if cached is not None:
+            if cached is self._source:
+                return
+        elif (
+            self._source is not None
+            and time.monotonic() - self._loaded_at < self.TTL_SECONDS
+            and self._valid_version == self._repo_version()
+        ):
+            # Snapshot invalidado por una escritura ya parcheada en la vista
+            # (otra invalidación posterior, ej. de otro worker, cambia la versión)
+            return
+        else:
+            cached = self._sheets_repo.read_worksheet(self.SHEET_NAME)
+
+        if self._source is not None and self._apply_diff_locked(cached):
+            return
+        self._rebuild_locked(cached)
@@ -0,0 +1,293 @@
+"""
+Ledger de producción por trabajador y día, derivado de la hoja Uniones.
+
+"Mi Registro" (GET /api/registro/{worker_id}) necesita todas las uniones
+donde un trabajador aparece en ARM_WORKER o SOL_WORKER, filtradas por la
+fecha de término. Escanear Uniones completo en cada request (regex sobre
+dos columnas + conversión de fechas seriales por fila) escala con el
+tamaño de la hoja, no con el trabajo del trabajador.
+
+Estrategia: el ledger se construye UNA vez por snapshot de Uniones
+(la lista cacheada por `SheetsRepository.read_worksheet`) y queda
+indexado por (worker_id, fecha_fin DD-MM-YYYY). Cada consulta es un
+lookup de diccionario.
+
+Frescura: ver `SnapshotView`. `batch_update_arm_full` /
+`batch_update_sold_full` parchean las filas escritas vía
+`apply_row_updates`; otras escrituras en Uniones llaman `invalidate()`.
+"""
+import bisect
+import logging
+import re
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from backend.core.snapshot_view import SnapshotView
+from backend.utils.normalize import normalize_column_name as _normalize
+
+logger = logging.getLogger(__name__)
+
+
+_WORKER_ID_PATTERN = re.compile(r"\((\d+)\)")
+
+# Orden de emisión dentro de una fila: ARM antes que SOLD
+_OP_ORDER = {"ARM": 0, "SOLD": 1}
+
+# Clave de fecha para fecha_fin presente pero ilegible: nunca coincide con
+# un filtro DD-MM-YYYY y tampoco cuenta como trabajo en curso.
+_UNPARSABLE_DATE = ""
+
+
+def extract_worker_id(raw) -> Optional[int]:
+    """Extract numeric ID from worker string like 'MR(93)'."""
+    if raw is None or raw == "":
+        return None
+    match = _WORKER_ID_PATTERN.search(str(raw))
+    return int(match.group(1)) if match else None
+
+
+def extract_date_part(datetime_value) -> Optional[str]:
+    """
+    Extract DD-MM-YYYY from a string like 'DD-MM-YYYY HH:MM:SS' or
+    'DD-MM-YYYY', or convert an Excel serial date/datetime
+    (UNFORMATTED_VALUE) to its DD-MM-YYYY form.
+    """
+    if datetime_value is None or datetime_value == "":
+        return None
+    if isinstance(datetime_value, (int, float)) and not isinstance(datetime_value, bool):
+        try:
+            d = (datetime(1899, 12, 30) + timedelta(days=float(datetime_value))).date()
+            return d.strftime("%d-%m-%Y")
+        except (ValueError, OverflowError):
+            return None
+    return str(datetime_value).strip().split(" ")[0]
+
+
+def _parse_fecha(fecha: str) -> Optional[date]:
+    try:
+        return datetime.strptime(fecha, "%d-%m-%Y").date()
+    except (ValueError, TypeError):
+        return None
+
+
+class WorkerLedger(SnapshotView):
+    """
+    Índice (worker_id, fecha) → registros de uniones, con totales de PD.
+
+    Usage:
+        ledger = WorkerLedger.for_repository(sheets_repo)
+        records = ledger.get_records(93, "21-01-2026")
+        pd = ledger.pd_total(93, "21-01-2026")
+    """
+
+    SHEET_NAME = "Uniones"
+
+    def _clear_locked(self) -> None:
+        self._rows: list = []
+        self._column_idx: dict[str, Optional[int]] = {}
+        # worker_id -> {fecha_key -> [(row_idx, op_order, record)]}, ordenado
+        self._by_worker: dict[int, dict[Optional[str], list[tuple]]] = {}
+        # row_idx -> [(worker_id, fecha_key, entry)] para parchear filas
+        self._by_row: dict[int, list[tuple]] = {}
+        # (worker_id, fecha) -> PD terminadas ese día
+        self._pd_totals: dict[tuple[int, str], float] = {}
+
+    # ------------------------------------------------------------------ build
+
+    def _resolve_columns(self, column_map: dict) -> None:
+        names = (
+            "TAG_SPOOL", "N_UNION", "DN_UNION", "TIPO_UNION",
+            "ARM_WORKER", "SOL_WORKER",
+            "ARM_FECHA_INICIO", "ARM_FECHA_FIN",
+            "SOL_FECHA_INICIO", "SOL_FECHA_FIN",
+        )
+        self._column_idx = {name: column_map.get(_normalize(name)) for name in names}
+        required = ("TAG_SPOOL", "N_UNION", "ARM_WORKER", "SOL_WORKER")
+        if any(self._column_idx[name] is None for name in required):
+            raise ValueError(
+                "Required columns (TAG_SPOOL, N_UNION, ARM_WORKER, SOL_WORKER) "
+                "not found in Uniones sheet"
+            )
+
+    def _build_locked(self, rows: list, column_map: dict) -> None:
+        self._resolve_columns(column_map)
+        self._rows = list(rows)
+        for row_idx in range(2, len(self._rows) + 1):
+            self._index_row(row_idx)
+        logger.info(
+            f"WorkerLedger: built from {len(rows)} Uniones rows "
+            f"({len(self._by_worker)} workers)"
+        )
+
+    def _update_rows_locked(self, rows: list, refresh: set[int], removed: set[int]) -> bool:
+        for row_idx in removed | refresh:
+            self._unindex_row(row_idx)
+        self._rows = list(rows)
+        for row_idx in sorted(refresh):
+            self._index_row(row_idx)
+        return True
+
+    def _cell(self, row: list, name: str):
+        idx = self._column_idx.get(name)
+        if idx is None or idx >= len(row):
+            return ""
+        return row[idx]
+
+    def _text(self, row: list, name: str) -> str:
+        value = self._cell(row, name)
+        return str(value).strip() if value else ""
+
+    def _index_row(self, row_idx: int) -> None:
+        row = self._rows[row_idx - 1]
+        if not row or len(row) <= self._column_idx["TAG_SPOOL"]:
+            return
+
+        arm_worker_raw = self._text(row, "ARM_WORKER")
+        sol_worker_raw = self._text(row, "SOL_WORKER")
+        arm_id = extract_worker_id(arm_worker_raw)
+        sol_id = extract_worker_id(sol_worker_raw)
+        if arm_id is None and sol_id is None:
+            return
+
+        try:
+            n_union = int(self._text(row, "N_UNION"))
+        except (ValueError, TypeError):
+            logger.warning(f"WorkerLedger: failed to parse N_UNION at row {row_idx}")
+            return
+
+        dn_raw = self._text(row, "DN_UNION")
+        try:
+            dn_union = float(dn_raw) if dn_raw else None
+        except ValueError:
+            logger.warning(f"WorkerLedger: failed to parse DN_UNION at row {row_idx}")
+            dn_union = None
+
+        common = {
+            "tag_spool": self._text(row, "TAG_SPOOL"),
+            "n_union": n_union,
+            "dn_union": dn_union,
+            "tipo_union": self._text(row, "TIPO_UNION") or None,
+            "arm_worker": arm_worker_raw or None,
+            "sol_worker": sol_worker_raw or None,
+        }
+
+        for operacion, worker_id, inicio_col, fin_col in (
+            ("ARM", arm_id, "ARM_FECHA_INICIO", "ARM_FECHA_FIN"),
+            ("SOLD", sol_id, "SOL_FECHA_INICIO", "SOL_FECHA_FIN"),
+        ):
+            if worker_id is None:
+                continue
+            fin_text = self._text(row, fin_col)
+            if fin_text:
+                fecha_key = extract_date_part(self._cell(row, fin_col)) or _UNPARSABLE_DATE
+            else:
+                fecha_key = None
+            record = dict(
+                common,
+                operacion=operacion,
+                fecha_inicio=self._text(row, inicio_col) or None,
+                fecha_fin=fin_text or None,
+            )
+            entry = (row_idx, _OP_ORDER[operacion], record)
+            bucket = self._by_worker.setdefault(worker_id, {}).setdefault(fecha_key, [])
+            bisect.insort(bucket, entry)
+            self._by_row.setdefault(row_idx, []).append((worker_id, fecha_key, entry))
+            if fecha_key and dn_union:
+                key = (worker_id, fecha_key)
+                self._pd_totals[key] = self._pd_totals.get(key, 0.0) + dn_union
+
+    def _unindex_row(self, row_idx: int) -> None:
+        for worker_id, fecha_key, entry in self._by_row.pop(row_idx, []):
+            buckets = self._by_worker.get(worker_id, {})
+            bucket = buckets.get(fecha_key, [])
+            pos = bisect.bisect_left(bucket, entry[:2])
+            if pos < len(bucket) and bucket[pos][:2] == entry[:2]:
+                del bucket[pos]
+            if not bucket:
+                buckets.pop(fecha_key, None)
+            dn_union = entry[2]["dn_union"]
+            if fecha_key and dn_union:
+                key = (worker_id, fecha_key)
+                remaining = self._pd_totals.get(key, 0.0) - dn_union
+                if remaining > 1e-9:
+                    self._pd_totals[key] = remaining
+                else:
+                    self._pd_totals.pop(key, None)
+
+    # ------------------------------------------------------------------ write-through
+
+    def apply_row_updates(
+        self,
+        source_rows: list,
+        updates: dict[int, dict[int, object]],
+    ) -> None:
+        """
+        Parchea filas recién escritas en Sheets.
+
+        Args:
+            source_rows: Snapshot de Uniones que leyó la escritura
+            updates: {row_idx (1-based): {col_idx: valor escrito}}
+        """
+        with self._lock:
+            if self._source is None:
+                # Sin ledger construido: nada que mantener
+                return
+            if source_rows is not self._source:
+                # La escritura vio un snapshot más nuevo que el del ledger
+                self._rebuild_locked(source_rows)
+
+            for row_idx, cells in updates.items():
+                if row_idx < 2 or row_idx > len(self._rows):
+                    self._reset_locked()
+                    return
+                row = list(self._rows[row_idx - 1])
+                width = max(cells) + 1
+                if len(row) < width:
+                    row.extend([""] * (width - len(row)))
+                for col_idx, value in cells.items():
+                    row[col_idx] = value
+                self._rows[row_idx - 1] = row
+                self._unindex_row(row_idx)
+                self._index_row(row_idx)
+            self._touch_locked(updates)
+
+    # ------------------------------------------------------------------ queries
+
+    def get_records(self, worker_id: int, fecha: Optional[str] = None) -> list[dict]:
+        """
+        Registros de uniones de un trabajador, en orden de fila (ARM antes
+        que SOLD dentro de la misma fila).
+
+        Con `fecha`, incluye lo terminado ese día más el trabajo en curso
+        (fecha_fin vacía). Sin `fecha`, todo lo del trabajador.
+        """
+        with self._lock:
+            self._ensure_fresh_locked()
+            buckets = self._by_worker.get(worker_id)
+            if not buckets:
+                return []
+            if fecha:
+                selected = buckets.get(fecha, []) + buckets.get(None, [])
+            else:
+                selected = [entry for bucket in buckets.values() for entry in bucket]
+            selected.sort(key=lambda entry: entry[:2])
+            return [entry[2] for entry in selected]
+
+    def get_records_between(self, worker_id: int, desde: date, hasta: date) -> dict[str, list[dict]]:
+        """Registros terminados entre dos fechas (inclusive), agrupados por día."""
+        with self._lock:
+            self._ensure_fresh_locked()
+            result = {}
+            for fecha_key, bucket in self._by_worker.get(worker_id, {}).items():
+                if not fecha_key:
+                    continue
+                day = _parse_fecha(fecha_key)
+                if day is not None and desde <= day <= hasta:
+                    result[fecha_key] = [entry[2] for entry in bucket]
+            return dict(sorted(result.items(), key=lambda item: _parse_fecha(item[0])))
+
+    def pd_total(self, worker_id: int, fecha: str) -> float:
+        """Pulgadas-diámetro terminadas por el trabajador en la fecha."""
+        with self._lock:
+            self._ensure_fresh_locked()
+            return self._pd_totals.get((worker_id, fecha), 0.0)
@@ -24,6 +24,8 @@ Endpoints:
 Ver proyecto-backend-api.md para especificaciones completas de endpoints.
 """
 
+import asyncio
+
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -35,8 +37,13 @@ from backend.config import config
 from backend.exceptions import ZEUSException
 from backend.models.error import ErrorResponse
 from backend.utils.logger import setup_logger
+from backend.utils.compression import CompressionMiddleware
+from backend.core.sheets_instrumentation import SheetsInstrumentationMiddleware
+from backend.core.metrics import MetricsMiddleware, watch_event_loop_lag
 from backend.core.column_map_cache import ColumnMapCache
 from backend.core.dependency import get_sheets_repository
+from backend.repositories.metadata_outbox import get_metadata_outbox, shutdown_metadata_outbox
+from backend.core.snapshot_refresher import shutdown_snapshot_refresher, start_snapshot_refresher
 
 # FASE 2: Routers READ-ONLY implementados (health, workers, spools)
 from backend.routers import health, workers, spools
@@ -46,6 +53,7 @@ from backend.routers import actions
 from backend.routers import history
 # v3.0 Phase 4: Router DASHBOARD implementado (occupied spools for initial load)
 from backend.routers import dashboard_router
+from backend.routers import sse_router
 # v3.0 Phase 5: Router METROLOGIA implementado (instant binary inspection)
 from backend.routers import metrologia
 # v4.0 Phase 9: Router DIAGNOSTIC implementado (version detection diagnostics)
@@ -63,6 +71,7 @@ from backend.routers import notas as notas_router
 
 from backend.routers import supervisor_router
 from backend.routers import admin as admin_router
+from backend.routers import metrics_router
 
 # ============================================================================
 # INICIALIZACIÓN FASTAPI
@@ -125,10 +134,39 @@ app.add_middleware(
     allow_origins=config.ALLOWED_ORIGINS,  # Frontend URLs (local + production)
     allow_credentials=True,
     allow_methods=["GET", "POST", "OPTIONS"],
-    allow_headers=["*"]
+    allow_headers=["*"],
+    expose_headers=["ETag", "Server-Timing"]  # batch-status: el frontend reenvía el ETag en If-None-Match
+)
+
+
+# ============================================================================
+# MIDDLEWARE - COMPRESIÓN (brotli/gzip)
+# ============================================================================
+
+# Bodies pre-serializados (backend/utils/response_cache.py) llegan ya
+# comprimidos y el middleware los deja pasar
+app.add_middleware(CompressionMiddleware, minimum_size=config.COMPRESSION_MIN_BYTES)
+
+
+# ============================================================================
+# MIDDLEWARE - INSTRUMENTACIÓN DE SHEETS (Server-Timing)
+# ============================================================================
+
+# Agregado al final = capa más externa: cubre todo el request
+app.add_middleware(
+    SheetsInstrumentationMiddleware,
+    sample_rate=config.SHEETS_INSTRUMENTATION_SAMPLE_RATE,
 )
 
 
+# ============================================================================
+# MIDDLEWARE - MÉTRICAS (/api/metrics)
+# ============================================================================
+
+# Latencia por ruta, siempre activa (ver backend/core/metrics.py)
+app.add_middleware(MetricsMiddleware)
+
+
 # ============================================================================
 # EXCEPTION HANDLERS
 # ============================================================================
@@ -175,6 +213,7 @@ async def zeus_exception_handler(request: Request, exc: ZEUSException):
         "DEPENDENCIAS_NO_SATISFECHAS": status.HTTP_400_BAD_REQUEST,
         "OPERACION_NO_PENDIENTE": status.HTTP_400_BAD_REQUEST,
         "OPERACION_NO_INICIADA": status.HTTP_400_BAD_REQUEST,
+        "INVALID_STATE_TRANSITION": status.HTTP_400_BAD_REQUEST,
 
         # 403 FORBIDDEN (CRÍTICO - ownership violation)
         "NO_AUTORIZADO": status.HTTP_403_FORBIDDEN,
@@ -284,6 +323,10 @@ async def generic_exception_handler(request: Request, exc: Exception):
 # ============================================================================
 
 
+# Task de watch_event_loop_lag (una por proceso)
+_event_loop_lag_task = None
+
+
 @app.on_event("startup")
 async def startup_event():
     """
@@ -295,7 +338,12 @@ async def startup_event():
     - Log de configuración Google Sheets
     - Pre-warm ColumnMapCache para hojas críticas (v2.1)
     - Validar columnas críticas existen (fail-fast)
+    - Arrancar el muestreo de atraso del event loop (/api/metrics)
+    - Recuperar eventos pendientes del outbox de Metadata
+    - Arrancar el refresher de fondo de snapshots (tras validar el schema)
+    - Avisar si el stream SSE quedó deshabilitado por WEB_CONCURRENCY > 1
     """
+    global _event_loop_lag_task
     setup_logger()
     logging.info("✅ ZEUES API iniciada correctamente")
     logging.info(f"Environment: {config.ENVIRONMENT}")
@@ -303,6 +351,21 @@ async def startup_event():
     logging.info(f"CORS Origins: {config.ALLOWED_ORIGINS}")
     logging.info("API versioning enabled: v3.0 endpoints at /api/v3/, v4.0 endpoints at /api/v4/ (future)")
 
+    if config.WEB_CONCURRENCY > 1:
+        logging.warning(
+            f"⚠️  WEB_CONCURRENCY={config.WEB_CONCURRENCY}: /api/sse/stream deshabilitado "
+            "(el EventBus es por proceso); los clientes usan el polling de 30s"
+        )
+
+    if config.EVENT_LOOP_LAG_INTERVAL_SECONDS > 0 and _event_loop_lag_task is None:
+        _event_loop_lag_task = asyncio.create_task(
+            watch_event_loop_lag(config.EVENT_LOOP_LAG_INTERVAL_SECONDS)
+        )
+
+    # Outbox de Metadata: re-encola y empieza a enviar lo que quedó del proceso anterior
+    if get_metadata_outbox() is not None:
+        logging.info(f"Metadata outbox enabled: {config.METADATA_OUTBOX_PATH}")
+
     # Pre-warm ColumnMapCache for every sheet declared in the schema
     # registry. Build failures raise CriticalColumnDriftError, which we
     # surface as a hard RuntimeError so Railway marks the container
@@ -410,6 +473,10 @@ async def startup_event():
         logging.error(error_msg, exc_info=True)
         raise RuntimeError(error_msg) from e
 
+    # Refresher de snapshots: desde acá las lecturas a Sheets las hace el
+    # thread de fondo y los requests encuentran snapshots vigentes
+    start_snapshot_refresher()
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -420,8 +487,17 @@ async def shutdown_event():
     - Log de shutdown
     - Cerrar conexiones pendientes (futuro)
     - Flush de cache (futuro)
+    - Detener el muestreo de atraso del event loop
+    - Vaciar el outbox de Metadata (lo que quede sigue en el journal)
+    - Detener el refresher de snapshots
     """
+    global _event_loop_lag_task
     logging.info("🔴 ZEUES API shutting down...")
+    if _event_loop_lag_task is not None:
+        _event_loop_lag_task.cancel()
+        _event_loop_lag_task = None
+    shutdown_snapshot_refresher()
+    shutdown_metadata_outbox()
 
 
 # ============================================================================
@@ -445,6 +521,13 @@ app.include_router(history.router, prefix="/api", tags=["History"])
 # v3.0 Phase 4: Router DASHBOARD registrado (occupied spools for initial load)
 app.include_router(dashboard_router.router, tags=["Dashboard"])
 
+# Real-time stream of occupation/status changes (in-process EventBus). The bus
+# lives in one process: with several uvicorn workers a client would only see
+# the writes served by its own worker, so the stream is not mounted (clients
+# keep the 30s polling fallback).
+if config.WEB_CONCURRENCY <= 1:
+    app.include_router(sse_router.router, tags=["SSE"])
+
 # v3.0 Phase 5: Router METROLOGIA registrado (instant binary inspection)
 app.include_router(metrologia.router, prefix="/api/metrologia", tags=["Metrologia"])
 
@@ -469,6 +552,9 @@ app.include_router(supervisor_router.router, prefix="/api/supervisor", tags=["Su
 # Admin: manual override for column-cache invalidation (drift recovery).
 app.include_router(admin_router.router, prefix="/api", tags=["Admin"])
 
+# Métricas Prometheus (GET /api/metrics)
+app.include_router(metrics_router.router, prefix="/api", tags=["Metrics"])
+
 
 # ============================================================================
 # ROOT ENDPOINT
@@ -90,6 +90,9 @@ class EventoTipo(str, Enum):
     # operator-initiated data fix. Logged with worker_id=0, worker_nombre="SYSTEM_*"
     # so audit queries can distinguish manual admin actions from worker actions.
     SYSTEM_REMEDIATION = "SYSTEM_REMEDIATION"
+    # Supervisor changed Estado_Detalle BLOQUEADO → RECHAZADO by hand in Sheets
+    # (detected by EstadoDetalleService, logged with worker_id=0, "SYSTEM")
+    SUPERVISOR_OVERRIDE = "SUPERVISOR_OVERRIDE"
 
     # v5.1 Events (F-1 Notas por spool)
     NOTAS_ACTUALIZADA = "NOTAS_ACTUALIZADA"  # Worker or operator appended a note to a spool
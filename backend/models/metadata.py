@@ -28,6 +28,7 @@ class Accion(str, Enum):
 
     # System-level actions (admin scripts, not worker-initiated)
     REMEDIAR = "REMEDIAR"  # Data remediation applied by an admin script
+    OVERRIDE = "OVERRIDE"  # Supervisor override detected in Sheets (SUPERVISOR_OVERRIDE)
 
 
 class MetadataEvent(BaseModel):
@@ -182,7 +182,7 @@ class BatchTomarRequest(BaseModel):
     )
     operacion: ActionType = Field(
         ...,
-        description="Operación a realizar (ARM/SOLD/METROLOGIA)"
+        description="Operación a realizar (ARM/SOLD)"
     )
 
     @field_validator('tag_spools')
@@ -193,6 +193,18 @@ class BatchTomarRequest(BaseModel):
             raise ValueError("tag_spools no puede contener duplicados")
         return v
 
+    @field_validator('operacion')
+    @classmethod
+    def validate_operacion_bulk(cls, v):
+        """
+        Solo ARM/SOLD: el batch escribe un Estado_Detalle fijo por operación,
+        y en METROLOGIA/REPARACION eso pisaría el marcador de ciclo
+        ("RECHAZADO (Ciclo N/3)") que lee CycleCounterService.
+        """
+        if v not in (ActionType.ARM, ActionType.SOLD):
+            raise ValueError(f"batch TOMAR solo admite ARM o SOLD, no {v.value}")
+        return v
+
     model_config = ConfigDict(
         json_schema_extra={
             "examples": [
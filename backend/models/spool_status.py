@@ -401,3 +401,35 @@ class BatchStatusResponse(BaseModel):
             "El frontend puede mostrar un toast por cada entrada."
         ),
     )
+
+
+class SpoolChangesResponse(BaseModel):
+    """
+    Response for GET /api/spools/changes (delta-sync).
+
+    The client keeps `version` + `epoch` from the previous response and
+    sends them back as `since` + `epoch`. With `full_resync=false` it
+    applies `spools` (changed or added since its version) and drops the
+    tags in `removed` (tombstones: no longer in Operaciones). With
+    `full_resync=true` its version is too old (or from another server
+    process) and it must re-fetch its spools with batch-status.
+    """
+
+    version: int = Field(..., description="Versión vigente del snapshot de Operaciones")
+    epoch: str = Field(..., description="Identifica el proceso y la lista de trabajadores de `version`")
+    full_resync: bool = Field(
+        False,
+        description="True si el cliente debe re-descargar todo (batch-status)",
+    )
+    spools: list[SpoolStatus] = Field(
+        default_factory=list,
+        description="SpoolStatus de los spools cambiados o agregados desde `since`",
+    )
+    removed: list[str] = Field(
+        default_factory=list,
+        description="TAG_SPOOL eliminados de Operaciones desde `since`",
+    )
+    errors: list[BatchStatusError] = Field(
+        default_factory=list,
+        description="Errores por tag (datos malformados), igual que batch-status",
+    )
@@ -0,0 +1,528 @@
+"""
+Backend en memoria que imita el subconjunto de gspread que usa la app.
+
+Sirve para benchmarks y load tests offline: los repositorios (SheetsRepository,
+MetadataRepository, UnionRepository, RoleRepository, SupervisorRepository)
+corren su código real contra este cliente, sin un Sheet vivo ni mocks con
+`time.sleep`. Con `SHEETS_BACKEND=fake` la app completa usa este backend,
+sembrado con el dataset determinístico de scripts/seed_load_test.py.
+
+API cubierta (gspread 6.x):
+- Client: open_by_key
+- Spreadsheet: title, id, worksheet, worksheets, add_worksheet,
+  get_lastUpdateTime (modifiedTime de Drive: avanza con cada escritura)
+- Worksheet: get_all_values, get, batch_get, row_values, col_values,
+  update, update_cell, batch_update, append_row, append_rows,
+  delete_rows, batch_clear, row_count, col_count
+
+Semántica emulada:
+- Rangos A1 ("B7", "A2:D2", "A:A", "2:2", "A2:C", con o sin "Hoja!").
+- value_input_option: USER_ENTERED convierte "12"/"1.5"/"TRUE" a número o
+  bool (como Sheets); RAW guarda el valor tal cual.
+- value_render_option: FORMATTED_VALUE (default) devuelve strings;
+  UNFORMATTED_VALUE devuelve números y bools nativos. Las fechas se guardan
+  como texto (no se emulan seriales de fecha).
+- Lecturas recortan celdas y filas vacías al final; get_all_values rellena
+  a un rectángulo, igual que gspread.
+- append_* escribe después de la última fila con datos y devuelve
+  `updates.updatedRange` como la API.
+
+Costos y fallas (FakeSheetsLimits): latencia por llamada (con jitter),
+cuota por minuto separada para lecturas y escrituras (las llamadas a
+Drive, kind "drive", no consumen cuota de Sheets) y errores 429
+inyectados (tasa aleatoria con seed o `fail_next`). Los errores son
+`gspread.exceptions.APIError` reales, así que `retry_on_sheets_error` y el
+manejo de errores de los repositorios se ejercitan igual que en producción.
+Cada llamada exitosa queda en la instrumentación por request
+(backend/core/sheets_instrumentation.py) con su latencia simulada.
+
+Usage:
+    client = FakeGspreadClient(FakeSheetsLimits(read_latency=0.05))
+    client.add_spreadsheet("sheet-id", "STAGING", {"Operaciones": rows})
+    repo._client = client      # o SHEETS_BACKEND=fake para toda la app
+"""
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime, timedelta
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+import gspread
+from gspread.utils import a1_range_to_grid_range, rowcol_to_a1
+
+from backend.core.sheets_instrumentation import record_sheets_call, record_sheets_throttled
+
+logger = logging.getLogger(__name__)
+
+
+_INT_PATTERN = re.compile(r"^[+-]?\d+$")
+_FLOAT_PATTERN = re.compile(r"^[+-]?(\d+\.\d*|\.\d+|\d+)([eE][+-]?\d+)?$")
+
+_UNFORMATTED = "UNFORMATTED_VALUE"
+_MODIFIED_TIME_BASE = datetime(2026, 1, 1)
+_USER_ENTERED = "USER_ENTERED"
+
+
+@dataclass
+class FakeSheetsLimits:
+    """Latencia, cuota y fallas simuladas del backend fake."""
+    read_latency: float = 0.0       # segundos por llamada de lectura
+    write_latency: float = 0.0      # segundos por llamada de escritura
+    jitter: float = 0.0             # ± segundos aleatorios sobre la latencia
+    reads_per_minute: Optional[int] = None   # None = sin cuota
+    writes_per_minute: Optional[int] = None
+    error_rate: float = 0.0         # fracción de llamadas que fallan con 429
+    seed: int = 0
+
+
+class _FakeHTTPResponse:
+    """Lo mínimo que `gspread.exceptions.APIError` lee de una respuesta."""
+
+    def __init__(self, code: int, message: str, status: str):
+        self.status_code = code
+        self._payload = {"error": {"code": code, "message": message, "status": status}}
+        self.text = json.dumps(self._payload)
+
+    def json(self) -> dict:
+        return self._payload
+
+
+def _api_error(code: int, message: str, status: str) -> gspread.exceptions.APIError:
+    return gspread.exceptions.APIError(_FakeHTTPResponse(code, message, status))
+
+
+# ---------------------------------------------------------------------------
+# Conversión de valores
+# ---------------------------------------------------------------------------
+
+def _parse_input(value: Any, value_input_option: Optional[str]) -> Any:
+    """Valor almacenado para una celda escrita (USER_ENTERED vs RAW)."""
+    if value is None:
+        return ""
+    if str(value_input_option or "") != _USER_ENTERED or not isinstance(value, str):
+        return value
+    text = value.strip()
+    if text.startswith("'"):
+        return value[1:]  # apóstrofe fuerza texto
+    if _INT_PATTERN.match(text):
+        return int(text)
+    if _FLOAT_PATTERN.match(text):
+        return float(text)
+    if text.upper() in ("TRUE", "FALSE"):
+        return text.upper() == "TRUE"
+    return value
+
+
+def _render(value: Any, value_render_option: Optional[str]) -> Any:
+    """Valor devuelto por una lectura según value_render_option."""
+    if str(value_render_option or "") == _UNFORMATTED:
+        return value
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _trim(rows: list[list]) -> list[list]:
+    """Quita celdas vacías al final de cada fila y filas vacías al final."""
+    trimmed = []
+    for row in rows:
+        end = len(row)
+        while end and row[end - 1] == "":
+            end -= 1
+        trimmed.append(row[:end])
+    while trimmed and not trimmed[-1]:
+        trimmed.pop()
+    return trimmed
+
+
+def _parse_range(range_name: str) -> tuple[int, Optional[int], int, Optional[int]]:
+    """
+    Rango A1 → (fila_ini, fila_fin, col_ini, col_fin), 0-based, fin exclusivo.
+
+    Un fin None significa "hasta el final de la hoja".
+    """
+    if "!" in range_name:
+        range_name = range_name.split("!", 1)[1]
+    grid = a1_range_to_grid_range(range_name.replace("$", ""))
+    return (
+        grid.get("startRowIndex", 0),
+        grid.get("endRowIndex"),
+        grid.get("startColumnIndex", 0),
+        grid.get("endColumnIndex"),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Worksheet / Spreadsheet / Client
+# ---------------------------------------------------------------------------
+
+class FakeWorksheet:
+    """Hoja en memoria; cada método público cuenta como una llamada a la API."""
+
+    def __init__(self, client: "FakeGspreadClient", spreadsheet: "FakeSpreadsheet",
+                 title: str, sheet_id: int, rows: Optional[list[list]] = None,
+                 row_count: int = 1000, col_count: int = 26):
+        self._client = client
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.id = sheet_id
+        self._cells: list[list] = [list(r) for r in (rows or [])]
+        self._row_count = max(row_count, len(self._cells))
+        self._col_count = max([col_count] + [len(r) for r in self._cells])
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<FakeWorksheet '{self.title}' id:{self.id}>"
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count
+
+    @property
+    def col_count(self) -> int:
+        return self._col_count
+
+    # ------------------------------------------------------------------ helpers
+
+    def _set_cell(self, row: int, col: int, value: Any) -> None:
+        while len(self._cells) <= row:
+            self._cells.append([])
+        cells = self._cells[row]
+        if len(cells) <= col:
+            cells.extend([""] * (col + 1 - len(cells)))
+        cells[col] = value
+        self._row_count = max(self._row_count, row + 1)
+        self._col_count = max(self._col_count, col + 1)
+
+    def _read_range(self, range_name: Optional[str], render: Optional[str]) -> list[list]:
+        if range_name is None:
+            r0, r1, c0, c1 = 0, None, 0, None
+        else:
+            r0, r1, c0, c1 = _parse_range(range_name)
+        r1 = len(self._cells) if r1 is None else min(r1, len(self._cells))
+        block = []
+        for row in self._cells[r0:r1]:
+            end = len(row) if c1 is None else min(c1, len(row))
+            block.append([_render(v, render) if v != "" else "" for v in row[c0:end]])
+        return _trim(block)
+
+    def _write_block(self, top: int, left: int, values: Iterable[Iterable[Any]],
+                     value_input_option: Optional[str]) -> tuple[int, int]:
+        rows = [list(r) for r in values]
+        self.spreadsheet._touch()
+        for i, row in enumerate(rows):
+            for j, value in enumerate(row):
+                self._set_cell(top + i, left + j, _parse_input(value, value_input_option))
+        width = max((len(r) for r in rows), default=0)
+        return len(rows), width
+
+    def _last_data_row(self) -> int:
+        """Índice 0-based siguiente a la última fila con algún dato."""
+        return len(_trim([list(r) for r in self._cells]))
+
+    # ------------------------------------------------------------------ reads
+
+    def get_all_values(self, value_render_option=None, **kwargs) -> list[list]:
+        self._client._api_call("read", "get_all_values", self.title)
+        with self._lock:
+            values = self._read_range(None, value_render_option)
+        width = max((len(r) for r in values), default=0)
+        return [r + [""] * (width - len(r)) for r in values]
+
+    def get(self, range_name: Optional[str] = None, value_render_option=None, **kwargs) -> list[list]:
+        self._client._api_call("read", "get", self.title)
+        with self._lock:
+            return self._read_range(range_name, value_render_option)
+
+    def batch_get(self, ranges: Iterable[str], value_render_option=None, **kwargs) -> list[list[list]]:
+        self._client._api_call("read", "batch_get", self.title)
+        with self._lock:
+            return [self._read_range(r, value_render_option) for r in ranges]
+
+    def row_values(self, row: int, value_render_option=None, **kwargs) -> list:
+        self._client._api_call("read", "row_values", self.title)
+        with self._lock:
+            values = self._read_range(f"{row}:{row}", value_render_option)
+        return values[0] if values else []
+
+    def col_values(self, col: int, value_render_option=None) -> list:
+        self._client._api_call("read", "col_values", self.title)
+        letter = rowcol_to_a1(1, col)[:-1]
+        with self._lock:
+            values = self._read_range(f"{letter}:{letter}", value_render_option)
+        return [r[0] if r else "" for r in values]
+
+    # ------------------------------------------------------------------ writes
+
+    def update(self, values=None, range_name: Optional[str] = None, raw: bool = True,
+               value_input_option=None, **kwargs) -> dict:
+        # Firma legacy update("A1", [[v]]) todavía usada en el repo
+        if isinstance(values, str) and not isinstance(range_name, str):
+            values, range_name = range_name, values
+        if value_input_option is None:
+            value_input_option = "RAW" if raw else _USER_ENTERED
+        self._client._api_call("write", "update", self.title)
+        r0, _, c0, _ = _parse_range(range_name or "A1")
+        with self._lock:
+            n_rows, n_cols = self._write_block(r0, c0, values or [], value_input_option)
+        return {
+            "spreadsheetId": self.spreadsheet.id,
+            "updatedRange": f"{self.title}!{rowcol_to_a1(r0 + 1, c0 + 1)}",
+            "updatedRows": n_rows,
+            "updatedColumns": n_cols,
+        }
+
+    def update_cell(self, row: int, col: int, value: Any) -> dict:
+        return self.update([[value]], rowcol_to_a1(row, col), value_input_option=_USER_ENTERED)
+
+    def batch_update(self, data: list[dict], raw: bool = True, value_input_option=None, **kwargs) -> dict:
+        if value_input_option is None:
+            value_input_option = "RAW" if raw else _USER_ENTERED
+        self._client._api_call("write", "batch_update", self.title)
+        with self._lock:
+            for item in data:
+                r0, _, c0, _ = _parse_range(item["range"])
+                self._write_block(r0, c0, item["values"], value_input_option)
+        return {"spreadsheetId": self.spreadsheet.id, "totalUpdatedRanges": len(data)}
+
+    def append_row(self, values: list, value_input_option="RAW", **kwargs) -> dict:
+        return self._append([values], value_input_option, "append_row")
+
+    def append_rows(self, values: list[list], value_input_option="RAW", **kwargs) -> dict:
+        return self._append(values, value_input_option, "append_rows")
+
+    def _append(self, values: list[list], value_input_option, method: str) -> dict:
+        self._client._api_call("write", method, self.title)
+        with self._lock:
+            top = self._last_data_row()
+            n_rows, n_cols = self._write_block(top, 0, values, value_input_option)
+        end = rowcol_to_a1(top + n_rows, max(n_cols, 1))
+        return {
+            "spreadsheetId": self.spreadsheet.id,
+            "updates": {
+                "updatedRange": f"{self.title}!A{top + 1}:{end}",
+                "updatedRows": n_rows,
+            },
+        }
+
+    def delete_rows(self, start_index: int, end_index: Optional[int] = None) -> dict:
+        self._client._api_call("write", "delete_rows", self.title)
+        end_index = start_index if end_index is None else end_index
+        with self._lock:
+            self.spreadsheet._touch()
+            del self._cells[start_index - 1:end_index]
+            self._row_count = max(self._row_count - (end_index - start_index + 1), 1)
+        return {"spreadsheetId": self.spreadsheet.id}
+
+    def batch_clear(self, ranges: Iterable[str]) -> dict:
+        self._client._api_call("write", "batch_clear", self.title)
+        with self._lock:
+            self.spreadsheet._touch()
+            for range_name in ranges:
+                r0, r1, c0, c1 = _parse_range(range_name)
+                r1 = len(self._cells) if r1 is None else min(r1, len(self._cells))
+                for row in self._cells[r0:r1]:
+                    end = len(row) if c1 is None else min(c1, len(row))
+                    for col in range(c0, end):
+                        row[col] = ""
+        return {"spreadsheetId": self.spreadsheet.id}
+
+
+class FakeSpreadsheet:
+    """Libro en memoria con hojas FakeWorksheet."""
+
+    def __init__(self, client: "FakeGspreadClient", key: str, title: str):
+        self._client = client
+        self.id = key
+        self.title = title
+        self._worksheets: dict[str, FakeWorksheet] = {}
+        self._revision = 0
+
+    def _touch(self) -> None:
+        self._revision += 1
+
+    def get_lastUpdateTime(self) -> str:
+        """modifiedTime de Drive (RFC 3339); cambia con cada escritura del libro."""
+        self._client._api_call("drive", "get_lastUpdateTime")
+        modified = _MODIFIED_TIME_BASE + timedelta(milliseconds=self._revision)
+        return modified.strftime("%Y-%m-%dT%H:%M:%S.") + f"{modified.microsecond // 1000:03d}Z"
+
+    def worksheet(self, title: str) -> FakeWorksheet:
+        self._client._api_call("read", "worksheet", title)
+        try:
+            return self._worksheets[title]
+        except KeyError:
+            raise gspread.exceptions.WorksheetNotFound(title)
+
+    def worksheets(self) -> list[FakeWorksheet]:
+        self._client._api_call("read", "worksheets")
+        return list(self._worksheets.values())
+
+    def add_worksheet(self, title: str, rows: int = 1000, cols: int = 26, **kwargs) -> FakeWorksheet:
+        self._client._api_call("write", "add_worksheet")
+        return self.seed_worksheet(title, [], row_count=rows, col_count=cols)
+
+    def seed_worksheet(self, title: str, rows: list[list], row_count: int = 1000,
+                       col_count: int = 26) -> FakeWorksheet:
+        """Crea o reemplaza una hoja con `rows` (sin contar llamadas a la API)."""
+        worksheet = FakeWorksheet(
+            self._client, self, title, len(self._worksheets),
+            rows=rows, row_count=row_count, col_count=col_count,
+        )
+        self._worksheets[title] = worksheet
+        self._touch()
+        return worksheet
+
+
+class FakeGspreadClient:
+    """
+    Cliente gspread en memoria con latencia, cuota y 429 configurables.
+
+    Con `governor` (QuotaGovernor), cada llamada toma antes su token, como
+    lo hace GovernedHTTPClient con el cliente real.
+
+    Attributes:
+        calls: Counter por método ("get_all_values", "batch_update", ...)
+               más "read", "write", "drive" y "throttled".
+    """
+
+    def __init__(self, limits: Optional[FakeSheetsLimits] = None, governor=None):
+        self.limits = limits or FakeSheetsLimits()
+        self.governor = governor
+        self.calls: Counter = Counter()
+        self._spreadsheets: dict[str, FakeSpreadsheet] = {}
+        self._windows: dict[str, deque] = {"read": deque(), "write": deque()}
+        self._forced_failures: deque = deque()
+        self._random = random.Random(self.limits.seed)
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------ gspread API
+
+    def open_by_key(self, key: str) -> FakeSpreadsheet:
+        self._api_call("read", "open_by_key")
+        try:
+            return self._spreadsheets[key]
+        except KeyError:
+            raise gspread.exceptions.SpreadsheetNotFound(key)
+
+    # ------------------------------------------------------------------ setup
+
+    def add_spreadsheet(self, key: str, title: str,
+                        sheets: Optional[dict[str, list[list]]] = None) -> FakeSpreadsheet:
+        """Registra un libro con hojas pre-cargadas ({nombre: filas con header})."""
+        spreadsheet = FakeSpreadsheet(self, key, title)
+        for name, rows in (sheets or {}).items():
+            spreadsheet.seed_worksheet(name, rows)
+        self._spreadsheets[key] = spreadsheet
+        return spreadsheet
+
+    def fail_next(self, count: int = 1, code: int = 429) -> None:
+        """Las próximas `count` llamadas fallan con `code` (default 429)."""
+        with self._lock:
+            self._forced_failures.extend([code] * count)
+
+    def reset_calls(self) -> None:
+        with self._lock:
+            self.calls.clear()
+
+    # ------------------------------------------------------------------ costos
+
+    def _api_call(self, kind: str, method: str, sheet: Optional[str] = None) -> None:
+        """Registra una llamada; aplica fallas inyectadas, cuota y latencia."""
+        governed = kind in self._windows   # "drive" no pasa por la cuota de Sheets
+        quota_wait = self.governor.acquire(kind) if self.governor is not None and governed else 0.0
+        limits = self.limits
+        with self._lock:
+            if self._forced_failures:
+                code = self._forced_failures.popleft()
+                self.calls["throttled"] += 1
+                if code == 429:
+                    record_sheets_throttled(kind)
+                raise _api_error(code, f"Injected error on {method}", "RESOURCE_EXHAUSTED"
+                                 if code == 429 else "INTERNAL")
+            if limits.error_rate and self._random.random() < limits.error_rate:
+                self.calls["throttled"] += 1
+                record_sheets_throttled(kind)
+                raise _api_error(429, f"Injected 429 on {method}", "RESOURCE_EXHAUSTED")
+
+            quota = limits.reads_per_minute if kind == "read" else limits.writes_per_minute
+            if quota is not None and governed:
+                window = self._windows[kind]
+                now = time.monotonic()
+                while window and now - window[0] >= 60.0:
+                    window.popleft()
+                if len(window) >= quota:
+                    self.calls["throttled"] += 1
+                    record_sheets_throttled(kind)
+                    raise _api_error(
+                        429,
+                        f"Quota exceeded for quota metric '{kind.capitalize()} requests' "
+                        f"and limit '{kind.capitalize()} requests per minute per user'",
+                        "RESOURCE_EXHAUSTED",
+                    )
+                window.append(now)
+
+            self.calls[kind] += 1
+            self.calls[method] += 1
+            latency = limits.write_latency if kind == "write" else limits.read_latency
+            if limits.jitter:
+                latency = max(latency + self._random.uniform(-limits.jitter, limits.jitter), 0.0)
+
+        if latency > 0:
+            time.sleep(latency)
+        record_sheets_call(method, kind, sheet, latency, quota_wait=quota_wait)
+
+
+# ---------------------------------------------------------------------------
+# Dataset de load test
+# ---------------------------------------------------------------------------
+
+def build_load_test_client(sheet_id: str, limits: Optional[FakeSheetsLimits] = None,
+                           seed: int = 42, audit_sheet_id: Optional[str] = None,
+                           governor=None) -> FakeGspreadClient:
+    """
+    Cliente fake con el dataset determinístico de scripts/seed_load_test.py.
+
+    Hojas: Operaciones (200 spools), Uniones, Metadata, Trabajadores, Roles.
+    Con `audit_sheet_id`, además el libro de auditoría (Lista, Audit,
+    Snapshots_Legacy) vacío, para que el startup valide su esquema.
+
+    Args:
+        sheet_id: Key bajo la que se registra el libro (config.GOOGLE_SHEET_ID)
+        limits: Latencia/cuota/fallas simuladas
+        seed: Seed del dataset (42 = el mismo que staging)
+        audit_sheet_id: Key del libro de auditoría (config.GOOGLE_AUDIT_SHEET_ID)
+        governor: QuotaGovernor por el que pasan las llamadas (opcional)
+    """
+    from backend.repositories.supervisor_repository import SupervisorRepository
+    from scripts import seed_load_test as seed_data
+
+    op_rows, union_rows, metadata_rows = seed_data.build_dataset(seed=seed)
+    trabajadores, roles = seed_data.build_worker_rows()
+
+    client = FakeGspreadClient(limits, governor=governor)
+    client.add_spreadsheet(sheet_id, "ZEUES LOAD-TEST (fake)", {
+        "Operaciones": [seed_data.OPERACIONES_HEADERS] + op_rows,
+        "Uniones": [seed_data.UNIONES_HEADERS] + union_rows,
+        "Metadata": [seed_data.METADATA_HEADERS] + metadata_rows,
+        "Trabajadores": [seed_data.TRABAJADORES_HEADERS] + trabajadores,
+        "Roles": [seed_data.ROLES_HEADERS] + roles,
+    })
+    if audit_sheet_id is not None:
+        audit = client._spreadsheets.get(audit_sheet_id) or client.add_spreadsheet(
+            audit_sheet_id, "ZEUES AUDIT (fake)"
+        )
+        for name, headers in SupervisorRepository.EXPECTED_HEADERS.items():
+            audit.seed_worksheet(name, [list(headers)])
+    logger.info(
+        f"FakeGspreadClient seeded: {len(op_rows)} spools, {len(union_rows)} unions, "
+        f"{len(trabajadores)} workers (seed={seed})"
+    )
+    return client
@@ -0,0 +1,442 @@
+"""
+Outbox durable (write-behind) para eventos de la hoja Metadata.
+
+`MetadataRepository.append_event` / `batch_log_events` hacían un
+`append_row(s)` a Sheets dentro de INICIAR, FINALIZAR, metrología,
+REPARACION y notas: un round-trip más en la latencia del usuario, y si
+fallaba el evento se perdía (solo quedaba un log "CRITICAL").
+
+Con `config.METADATA_OUTBOX_PATH` configurado, los eventos pasan por aquí:
+
+- `enqueue()` escribe cada evento como una línea JSON en un journal
+  append-only (flush al SO; fsync opcional) y vuelve en microsegundos.
+- Un thread de fondo junta los eventos pendientes y los escribe con
+  `append_rows` en chunks de `MetadataRepository.CHUNK_SIZE`; al confirmar
+  un chunk agrega una línea `ack` con sus IDs al journal.
+- Entrega at-least-once, con `MetadataEvent.id` como clave: al arrancar se
+  re-encolan los eventos del journal sin `ack`; antes del primer envío de
+  esos eventos recuperados se leen los IDs ya escritos en Metadata (crash
+  entre `append_rows` y `ack`) para no duplicarlos. Lo mismo tras un
+  `append_rows` fallido: pudo haber escrito antes de fallar.
+- Un rechazo permanente de Sheets (4xx que no sea cuota ni credenciales,
+  ej: fila inválida o límite de celdas) no traba la cola: el chunk se parte
+  hasta aislar las filas rechazadas, que van a `<path>.dead` (una línea
+  JSON por evento, métrica `zeues_metadata_outbox_dead_letters_total`) y se
+  confirman para que el resto siga saliendo.
+- Mientras no se escriben, `pending_events()` permite que las lecturas de
+  Metadata vean sus propias escrituras.
+
+El journal se compacta (se reescribe solo con lo pendiente) cuando queda
+vacío de pendientes o acumula muchos `ack`.
+
+Sin path configurado (default) no hay outbox y las escrituras siguen siendo
+síncronas. El journal debe vivir en un volumen persistente y lo usa un solo
+proceso: con varios workers de uvicorn el primero que toma el `flock` de
+`<path>.lock` es dueño del outbox y los demás escriben síncronamente.
+
+Usage:
+    outbox = get_metadata_outbox()       # None si está deshabilitado
+    if outbox is not None:
+        outbox.enqueue([event], [sanitize_row_for_sheets(event.to_sheets_row())])
+"""
+import fcntl
+import json
+import logging
+import os
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+from gspread.exceptions import APIError
+
+from backend.config import config
+from backend.core import metrics
+from backend.models.metadata import MetadataEvent
+
+logger = logging.getLogger(__name__)
+
+# Compactar el journal tras esta cantidad de acks (aunque queden pendientes)
+COMPACT_AFTER_ACKS = 1000
+MAX_BACKOFF_SECONDS = 60.0
+# 4xx que sí se reintentan: cuota, timeout y credenciales/permisos (afectan a
+# todas las filas por igual, no a una fila inválida)
+RETRYABLE_CLIENT_ERRORS = (401, 403, 408, 429)
+
+OUTBOX_PENDING = metrics.get_metrics_registry().gauge(
+    "zeues_metadata_outbox_pending",
+    "Metadata events journaled but not yet written to Sheets.",
+)
+OUTBOX_FLUSHED = metrics.get_metrics_registry().counter(
+    "zeues_metadata_outbox_flushed_total",
+    "Metadata events written to Sheets by the outbox flusher.",
+)
+OUTBOX_FLUSH_ERRORS = metrics.get_metrics_registry().counter(
+    "zeues_metadata_outbox_flush_errors_total",
+    "Failed outbox flush attempts (retried with backoff).",
+)
+OUTBOX_DEAD_LETTERS = metrics.get_metrics_registry().counter(
+    "zeues_metadata_outbox_dead_letters_total",
+    "Metadata events rejected permanently by Sheets and moved to the dead-letter file.",
+)
+
+
+def _is_permanent(error: Exception) -> bool:
+    """True si Sheets rechazó la escritura y reintentarla no la arregla."""
+    return (
+        isinstance(error, APIError)
+        and 400 <= error.code < 500
+        and error.code not in RETRYABLE_CLIENT_ERRORS
+    )
+
+
+class _PendingEvent:
+    __slots__ = ("event", "row", "recovered")
+
+    def __init__(self, event: MetadataEvent, row: list[str], recovered: bool = False):
+        self.event = event
+        self.row = row
+        self.recovered = recovered
+
+
+class MetadataOutbox:
+    """
+    Journal local + flusher de fondo para eventos de Metadata.
+
+    Args:
+        path: Archivo del journal (se crea si no existe)
+        write_rows: Escribe filas en Metadata (un chunk, una llamada append_rows)
+        existing_ids: Devuelve los IDs ya presentes en Metadata (dedupe al recuperar
+            o tras un `write_rows` fallido)
+        chunk_size: Máximo de filas por llamada a `write_rows`
+        flush_interval: Segundos que el flusher espera para juntar eventos
+        fsync: Si True, fsync del journal en cada enqueue (sobrevive cortes de energía)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        write_rows: Callable[[list[list[str]]], None],
+        existing_ids: Optional[Callable[[], set[str]]] = None,
+        chunk_size: int = 900,
+        flush_interval: float = 1.0,
+        fsync: bool = False,
+    ):
+        self.path = path
+        self._write_rows = write_rows
+        self._existing_ids = existing_ids
+        self._chunk_size = chunk_size
+        self._flush_interval = flush_interval
+        self._fsync = fsync
+        self._cond = threading.Condition()
+        self._journal_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: dict[str, _PendingEvent] = {}
+        self._acks_since_compact = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._recover()
+        self._journal = open(path, "a", encoding="utf-8")
+
+    # ------------------------------------------------------------- journal
+
+    def _recover(self) -> None:
+        """Re-encola los eventos del journal sin ack y lo compacta."""
+        if not os.path.exists(self.path):
+            return
+        events: dict[str, _PendingEvent] = {}
+        with open(self.path, encoding="utf-8") as journal:
+            for line_number, line in enumerate(journal, start=1):
+                try:
+                    record = json.loads(line)
+                    if "ack" in record:
+                        for event_id in record["ack"]:
+                            events.pop(event_id, None)
+                    else:
+                        event = MetadataEvent.model_validate(record["event"])
+                        events[event.id] = _PendingEvent(event, record["row"], recovered=True)
+                except (ValueError, KeyError, TypeError) as e:
+                    # Línea truncada por un crash a mitad de escritura
+                    logger.warning(f"Metadata outbox: skipping journal line {line_number}: {e}")
+        self._pending = events
+        self._compact()
+        OUTBOX_PENDING.set(len(self._pending))
+        if events:
+            logger.warning(f"Metadata outbox: recovered {len(events)} unflushed event(s) from {self.path}")
+
+    def _append_journal(self, records: Iterable[dict]) -> None:
+        data = "".join(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n" for record in records)
+        with self._journal_lock:
+            self._journal.write(data)
+            self._journal.flush()
+            if self._fsync:
+                os.fsync(self._journal.fileno())
+
+    def _compact(self) -> None:
+        """Reescribe el journal solo con los pendientes (caller sin _journal abierto o con _journal_lock)."""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as tmp:
+            for pending in self._pending.values():
+                tmp.write(json.dumps(self._event_record(pending), ensure_ascii=False, separators=(",", ":")) + "\n")
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_path, self.path)
+        self._acks_since_compact = 0
+
+    @staticmethod
+    def _event_record(pending: _PendingEvent) -> dict:
+        return {"event": pending.event.model_dump(mode="json"), "row": pending.row}
+
+    # ---------------------------------------------------------------- API
+
+    def enqueue(self, events: list[MetadataEvent], rows: list[list[str]]) -> None:
+        """
+        Registra eventos en el journal y despierta al flusher.
+
+        Args:
+            events: Eventos a escribir
+            rows: Filas ya sanitizadas para Sheets (mismo orden que `events`)
+        """
+        entries = [_PendingEvent(event, row) for event, row in zip(events, rows)]
+        with self._cond:
+            self._append_journal(self._event_record(entry) for entry in entries)
+            for entry in entries:
+                self._pending[entry.event.id] = entry
+            OUTBOX_PENDING.set(len(self._pending))
+            self._cond.notify_all()
+        self.start()
+
+    def pending_events(self) -> list[MetadataEvent]:
+        """Eventos aún no confirmados en Sheets (en orden de llegada)."""
+        with self._cond:
+            return [entry.event for entry in self._pending.values()]
+
+    def pending_count(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """
+        Escribe un chunk de pendientes (llamado por el flusher; también en tests).
+
+        Returns:
+            Eventos confirmados en esta llamada
+
+        Raises:
+            Exception: La de `write_rows` / `existing_ids`; los eventos siguen pendientes
+        """
+        with self._flush_lock:
+            return self._flush_locked()
+
+    def _flush_locked(self) -> int:
+        with self._cond:
+            batch = list(self._pending.values())[:self._chunk_size]
+        if not batch:
+            return 0
+
+        already_written: set[str] = set()
+        if self._existing_ids is not None and any(entry.recovered for entry in batch):
+            already_written = self._existing_ids()
+        to_write = [entry for entry in batch if entry.event.id not in already_written]
+        rejected: list[tuple[_PendingEvent, str]] = []
+        if to_write:
+            try:
+                rejected = self._write_isolating(to_write)
+            except Exception:
+                # append_rows pudo escribir antes de fallar (timeout, 5xx tras
+                # commit): el reintento verifica la columna ID como en recovery
+                for entry in to_write:
+                    entry.recovered = True
+                raise
+        if rejected:
+            self._dead_letter(rejected)
+
+        ids = [entry.event.id for entry in batch]
+        with self._cond:
+            with self._journal_lock:
+                self._journal.write(json.dumps({"ack": ids}, separators=(",", ":")) + "\n")
+                self._journal.flush()
+                for event_id in ids:
+                    self._pending.pop(event_id, None)
+                self._acks_since_compact += len(ids)
+                if not self._pending or self._acks_since_compact >= COMPACT_AFTER_ACKS:
+                    self._journal.close()
+                    self._compact()
+                    self._journal = open(self.path, "a", encoding="utf-8")
+            OUTBOX_PENDING.set(len(self._pending))
+            self._cond.notify_all()
+
+        written = len(to_write) - len(rejected)
+        OUTBOX_FLUSHED.inc(written)
+        logger.info(
+            f"Metadata outbox: flushed {written} event(s)"
+            + (f", {len(batch) - len(to_write)} already in sheet" if len(to_write) < len(batch) else "")
+            + (f", {len(rejected)} dead-lettered" if rejected else "")
+        )
+        return len(batch)
+
+    def _write_isolating(self, entries: list[_PendingEvent]) -> list[tuple[_PendingEvent, str]]:
+        """
+        Escribe `entries`; ante un rechazo permanente parte el chunk en
+        mitades hasta aislar las filas rechazadas.
+
+        Returns:
+            (entrada, error) de cada fila rechazada
+
+        Raises:
+            Exception: Errores transitorios de `write_rows` (el flusher reintenta)
+        """
+        try:
+            self._write_rows([entry.row for entry in entries])
+            return []
+        except Exception as e:
+            if not _is_permanent(e):
+                raise
+            if len(entries) == 1:
+                return [(entries[0], str(e))]
+        middle = len(entries) // 2
+        return self._write_isolating(entries[:middle]) + self._write_isolating(entries[middle:])
+
+    def _dead_letter(self, rejected: list[tuple[_PendingEvent, str]]) -> None:
+        """Guarda en `<path>.dead` los eventos que Sheets rechazó (se confirman igual)."""
+        with open(f"{self.path}.dead", "a", encoding="utf-8") as dead:
+            for entry, error in rejected:
+                record = {**self._event_record(entry), "error": error}
+                dead.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+            dead.flush()
+            os.fsync(dead.fileno())
+        OUTBOX_DEAD_LETTERS.inc(len(rejected))
+        logger.error(
+            f"Metadata outbox: {len(rejected)} event(s) rejected by Sheets moved to {self.path}.dead: "
+            + ", ".join(entry.event.id for entry, _ in rejected)
+        )
+
+    # ------------------------------------------------------------ flusher
+
+    def start(self) -> None:
+        """Arranca el thread flusher (idempotente)."""
+        with self._cond:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="metadata-outbox", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        backoff = self._flush_interval
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopping:
+                    self._cond.wait()
+                if self._stopping and not self._pending:
+                    return
+            # Pequeña espera para juntar los eventos de varios requests en un append_rows
+            time.sleep(self._flush_interval)
+            try:
+                while self.flush():
+                    pass
+                backoff = self._flush_interval
+            except Exception as e:
+                OUTBOX_FLUSH_ERRORS.inc()
+                logger.warning(
+                    f"Metadata outbox: flush failed ({self.pending_count()} pending), "
+                    f"retrying in {backoff:.0f}s: {e}"
+                )
+                with self._cond:
+                    if self._stopping:
+                        return
+                    self._cond.wait(timeout=backoff)
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Intenta vaciar la cola y detiene el flusher (shutdown)."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._pending and self._thread is not None and self._thread.is_alive():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(timeout=remaining)
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=max(0.0, deadline - time.monotonic()))
+        if self.pending_count():
+            logger.warning(
+                f"Metadata outbox: stopping with {self.pending_count()} pending event(s); "
+                f"they stay in {self.path} for the next start"
+            )
+
+    def close(self) -> None:
+        with self._journal_lock:
+            self._journal.close()
+
+
+# Singleton global para uso en toda la aplicación
+_outbox: Optional[MetadataOutbox] = None
+_outbox_lock = threading.Lock()
+# flock del journal (un solo worker de uvicorn es dueño del outbox)
+_outbox_lock_fd: Optional[int] = None
+_outbox_owned_elsewhere = False
+
+
+def get_metadata_outbox() -> Optional[MetadataOutbox]:
+    """Outbox global, o None si `config.METADATA_OUTBOX_PATH` no está configurado."""
+    global _outbox, _outbox_lock_fd, _outbox_owned_elsewhere
+    if not config.METADATA_OUTBOX_PATH or _outbox_owned_elsewhere:
+        return None
+    if _outbox is None:
+        with _outbox_lock:
+            if _outbox is None and not _outbox_owned_elsewhere:
+                _outbox_lock_fd = _lock_journal(config.METADATA_OUTBOX_PATH)
+                if _outbox_lock_fd is None:
+                    _outbox_owned_elsewhere = True
+                    logger.info(
+                        f"Metadata outbox owned by another worker (pid {os.getpid()}): "
+                        "writing Metadata events synchronously"
+                    )
+                    return None
+                # Lazy imports: metadata_repository importa este módulo
+                from backend.core.dependency import get_sheets_repository
+                from backend.repositories.metadata_repository import MetadataRepository
+
+                writer = MetadataRepository(get_sheets_repository(), use_outbox=False)
+                _outbox = MetadataOutbox(
+                    path=config.METADATA_OUTBOX_PATH,
+                    write_rows=writer.append_rows,
+                    existing_ids=writer.get_event_ids,
+                    chunk_size=MetadataRepository.CHUNK_SIZE,
+                    flush_interval=config.METADATA_OUTBOX_FLUSH_INTERVAL_SECONDS,
+                    fsync=config.METADATA_OUTBOX_FSYNC,
+                )
+                if _outbox.pending_count():
+                    _outbox.start()
+    return _outbox
+
+
+def _lock_journal(path: str) -> Optional[int]:
+    """`flock` exclusivo no bloqueante de `<path>.lock`; None si otro proceso lo tiene."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    fd = os.open(f"{path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def shutdown_metadata_outbox(timeout: float = 10.0) -> None:
+    """Vacía y detiene el outbox global si existe (shutdown de la app y tests)."""
+    global _outbox, _outbox_lock_fd, _outbox_owned_elsewhere
+    with _outbox_lock:
+        outbox, _outbox = _outbox, None
+        lock_fd, _outbox_lock_fd = _outbox_lock_fd, None
+        _outbox_owned_elsewhere = False
+    if outbox is not None:
+        outbox.stop(timeout)
+        outbox.close()
+    if lock_fd is not None:
+        os.close(lock_fd)  # libera el flock
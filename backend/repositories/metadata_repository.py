@@ -5,7 +5,7 @@ Maneja escritura append-only de eventos y lectura para reconstrucción de estado
 """
 import gspread
 import logging
-from typing import Optional
+from typing import Iterable, Optional
 from functools import wraps
 import time
 from datetime import date, datetime
@@ -16,6 +16,8 @@ from backend.models.metadata import MetadataEvent, EventoTipo, Accion
 from backend.exceptions import SheetsConnectionError, SheetsUpdateError
 from backend.repositories.sheets_repository import SheetsRepository
 from backend.core.column_map_cache import ColumnMapCache
+from backend.core.sheets_instrumentation import record_sheets_retry
+from backend.repositories.metadata_outbox import get_metadata_outbox
 from backend.utils.sanitize import sanitize_row_for_sheets
 
 
@@ -47,6 +49,7 @@ def retry_on_sheets_error(max_retries: int = 3, backoff_seconds: float = 1.0):
                         f"Sheets API error on attempt {attempt + 1}/{max_retries}. "
                         f"Retrying in {wait_time}s... Error: {str(e)}"
                     )
+                    record_sheets_retry()
                     time.sleep(wait_time)
 
             # Fallback (no debería llegar aquí)
@@ -69,21 +72,27 @@ class MetadataRepository:
     - Todos los eventos son inmutables (no se modifican ni eliminan)
     - El estado actual se reconstruye consultando el log de eventos
     - La hoja Operaciones es READ-ONLY (solo fuente de datos base)
+
+    Con outbox (config.METADATA_OUTBOX_PATH) las escrituras se encolan en un
+    journal local y las escribe un thread de fondo (ver metadata_outbox.py);
+    las lecturas incluyen los eventos aún pendientes.
     """
 
     # v4.0: Safe chunk size for Google Sheets batch append
     CHUNK_SIZE = 900
 
-    def __init__(self, sheets_repo: SheetsRepository):
+    def __init__(self, sheets_repo: SheetsRepository, use_outbox: bool = True):
         """
         Inicializa el repositorio de Metadata.
 
         Args:
             sheets_repo: Instancia de SheetsRepository para acceso a Google Sheets
+            use_outbox: False para escribir siempre directo a Sheets (el propio flusher)
         """
         self.logger = logging.getLogger(__name__)
         self.sheets_repo = sheets_repo
         self._worksheet: Optional[gspread.Worksheet] = None
+        self._outbox = get_metadata_outbox() if use_outbox else None
 
     def _get_column_map(self) -> dict[str, int]:
         """
@@ -137,6 +146,11 @@ class MetadataRepository:
         Raises:
             SheetsUpdateError: Si falla la escritura
         """
+        if self._outbox is not None:
+            self._outbox.enqueue([event], [sanitize_row_for_sheets(event.to_sheets_row())])
+            self.logger.info(f"Evento encolado en outbox: {event.evento_tipo} - Spool: {event.tag_spool} - ID={event.id}")
+            return
+
         try:
             worksheet = self._get_worksheet()
             row_data = sanitize_row_for_sheets(event.to_sheets_row())
@@ -176,6 +190,7 @@ class MetadataRepository:
             SheetsConnectionError: Si falla la lectura
         """
         try:
+            pending = self._pending_events()  # antes de leer la hoja
             worksheet = self._get_worksheet()
             all_values = worksheet.get_all_values()
 
@@ -197,6 +212,7 @@ class MetadataRepository:
 
             # Ordenar por timestamp (ascendente)
             events.sort(key=lambda e: e.timestamp)
+            events = self._with_pending(events, pending, tag_spool)
 
             self.logger.info(f"Encontrados {len(events)} eventos para spool: {tag_spool}")
             return events
@@ -222,6 +238,7 @@ class MetadataRepository:
         """
         self.logger.info("[METADATA DEBUG] === ENTERING get_all_events ===")
         try:
+            pending = self._pending_events()  # antes de leer la hoja
             self.logger.info("[METADATA DEBUG] Getting worksheet...")
             worksheet = self._get_worksheet()
             self.logger.info(f"[METADATA DEBUG] ✅ Got worksheet: {config.HOJA_METADATA_NOMBRE}")
@@ -254,6 +271,7 @@ class MetadataRepository:
             # Ordenar por timestamp (ascendente)
             self.logger.info("[METADATA DEBUG] Sorting events by timestamp...")
             events.sort(key=lambda e: e.timestamp)
+            events = self._with_pending(events, pending)
             self.logger.info("[METADATA DEBUG] ✅ Events sorted")
 
             self.logger.info(f"[BATCH] Loaded {len(events)} total events from Metadata")
@@ -277,6 +295,59 @@ class MetadataRepository:
                 details=f"{type(e).__name__}: {str(e)}"
             )
 
+    @retry_on_sheets_error(max_retries=3, backoff_seconds=1.0)
+    def get_latest_events(self, tag_spools: Iterable[str]) -> dict[str, MetadataEvent]:
+        """
+        Último evento de cada spool con una sola lectura de Metadata.
+
+        Equivale a `get_events_by_spool(tag)[-1]` por cada tag, pero solo
+        parsea las filas de los tags pedidos.
+
+        Args:
+            tag_spools: Códigos de spool
+
+        Returns:
+            dict tag_spool -> último MetadataEvent (sin entrada si no tiene eventos)
+
+        Raises:
+            SheetsConnectionError: Si falla la lectura
+        """
+        wanted = set(tag_spools)
+        if not wanted:
+            return {}
+        try:
+            pending = self._pending_events()  # antes de leer la hoja
+            all_values = self._get_worksheet().get_all_values()
+            column_map = self._get_column_map()
+            tag_spool_idx = self._get_tag_spool_index(column_map)
+
+            latest: dict[str, MetadataEvent] = {}
+
+            def keep(event: MetadataEvent) -> None:
+                # >= : con timestamps iguales gana la fila posterior (sort estable)
+                current = latest.get(event.tag_spool)
+                if current is None or event.timestamp >= current.timestamp:
+                    latest[event.tag_spool] = event
+
+            for row in all_values[1:]:
+                if len(row) >= 9 and row[tag_spool_idx] in wanted:
+                    try:
+                        keep(MetadataEvent.from_sheets_row(row, column_map=column_map))
+                    except Exception as e:
+                        self.logger.warning(f"Error al parsear evento: {e}, row={row}")
+            for event in pending:
+                if event.tag_spool in wanted:
+                    keep(event)
+
+            self.logger.info(f"Último evento de {len(latest)}/{len(wanted)} spools (una lectura)")
+            return latest
+
+        except gspread.exceptions.APIError as e:
+            raise SheetsConnectionError(
+                f"Error al leer últimos eventos de {len(wanted)} spools",
+                details=str(e)
+            )
+
     @retry_on_sheets_error(max_retries=3, backoff_seconds=1.0)
     def get_latest_event(self, tag_spool: str, evento_tipo: Optional[EventoTipo] = None) -> Optional[MetadataEvent]:
         """
@@ -458,6 +529,11 @@ class MetadataRepository:
             self.logger.info("Empty events list, skipping batch log")
             return
 
+        if self._outbox is not None:
+            self._outbox.enqueue(events, [sanitize_row_for_sheets(event.to_sheets_row()) for event in events])
+            self.logger.info(f"Queued {len(events)} events in Metadata outbox")
+            return
+
         try:
             worksheet = self._get_worksheet()
 
@@ -495,6 +571,52 @@ class MetadataRepository:
                 details=str(e)
             )
 
+    def append_rows(self, rows: list[list[str]]) -> None:
+        """
+        Escribe filas ya sanitizadas con un solo `append_rows` (flusher del outbox).
+
+        Raises:
+            gspread.exceptions.APIError: Si falla la escritura (el outbox reintenta)
+        """
+        self._get_worksheet().append_rows(rows, value_input_option='USER_ENTERED')
+
+    def get_event_ids(self) -> set[str]:
+        """
+        IDs de los eventos ya escritos en Metadata (una lectura de la columna ID).
+
+        Usado por el outbox para no duplicar eventos recuperados del journal.
+        """
+        column_map = self._get_column_map()
+        id_col = column_map.get("id", 0) + 1
+        return set(self._get_worksheet().col_values(id_col)[1:])
+
+    def _pending_events(self) -> list[MetadataEvent]:
+        """
+        Eventos del outbox aún no escritos (read-your-writes).
+
+        Se toman ANTES de leer la hoja: si el flusher escribe y confirma un
+        evento entre medio, igual aparece en la lectura de la hoja.
+        """
+        return [] if self._outbox is None else self._outbox.pending_events()
+
+    def _with_pending(
+        self,
+        events: list[MetadataEvent],
+        pending: list[MetadataEvent],
+        tag_spool: Optional[str] = None,
+    ) -> list[MetadataEvent]:
+        """Agrega los eventos pendientes (`_pending_events`) a los leídos, sin duplicar IDs."""
+        pending = [
+            event for event in pending
+            if tag_spool is None or event.tag_spool == tag_spool
+        ]
+        if not pending:
+            return events
+        seen = {event.id for event in events}
+        merged = events + [event for event in pending if event.id not in seen]
+        merged.sort(key=lambda e: e.timestamp)
+        return merged
+
     def build_union_events(
         self,
         tag_spool: str,
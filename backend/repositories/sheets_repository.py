@@ -4,16 +4,23 @@ Repositorio para acceso a Google Sheets usando gspread.
 Maneja toda la comunicación con la API de Google Sheets,
 incluyendo autenticación, lectura y escritura de datos.
 """
+import hashlib
 import gspread
 from google.oauth2.service_account import Credentials
 from pydantic import ValidationError
-from typing import Optional
+from typing import Iterable, Optional
 from datetime import datetime, date
 import logging
 from functools import wraps
+import threading
 import time
+from dataclasses import dataclass
 
 from backend.config import config
+from backend.core import metrics
+from backend.core.quota_governor import GovernedHTTPClient, get_quota_governor
+from backend.core.sheets_instrumentation import record_sheets_retry
+from backend.core.snapshot_diff import RowDiff, SnapshotDiffer
 from backend.utils.date_formatter import format_datetime_for_sheets
 from backend.exceptions import (
     SheetsConnectionError,
@@ -54,6 +61,7 @@ def retry_on_sheets_error(max_retries: int = 3, backoff_seconds: float = 1.0):
                         f"Sheets API error on attempt {attempt + 1}/{max_retries}. "
                         f"Retrying in {wait_time}s... Error: {str(e)}"
                     )
+                    record_sheets_retry()
                     time.sleep(wait_time)
 
             # Fallback (no debería llegar aquí)
@@ -63,6 +71,15 @@ def retry_on_sheets_error(max_retries: int = 3, backoff_seconds: float = 1.0):
     return decorator
 
 
+@dataclass
+class _WorksheetLease:
+    """Snapshot de una hoja renovable sin releerla si el libro no cambió."""
+    rows: list
+    digest: str
+    version: int                 # SimpleCache.version al cachearlo
+    token: Optional[str] = None  # modifiedTime de Drive tomado ANTES de leer
+
+
 class SheetsRepository:
     """
     Repositorio para operaciones CRUD en Google Sheets.
@@ -87,8 +104,20 @@ class SheetsRepository:
         self.logger = logging.getLogger(__name__)
         self._client: Optional[gspread.Client] = None
         self._spreadsheets: dict[str, gspread.Spreadsheet] = {}
+        # Requests y el SnapshotRefresher abren el cliente/libros desde varios threads
+        self._open_lock = threading.Lock()
         self._cache = get_cache()  # Cache singleton para reducir API calls
+        # Store entre workers de uvicorn (None = un solo proceso), ver shared_store.py
+        self._shared = self._cache.shared
         self._compatibility_mode = compatibility_mode  # v2.1 or v3.0
+        # Diff por fila entre re-lecturas (ver backend/core/snapshot_diff.py)
+        self._snapshot_differ = SnapshotDiffer({
+            config.HOJA_OPERACIONES_NOMBRE: "TAG_SPOOL",
+            "Uniones": "ID",
+        })
+        # Último snapshot leído por hoja + modifiedTime de Drive previo a leerlo
+        self._leases: dict[str, _WorksheetLease] = {}
+        self._change_probe_enabled = config.SHEETS_CHANGE_PROBE_ENABLED
 
     def _get_client(self) -> gspread.Client:
         """
@@ -100,6 +129,10 @@ class SheetsRepository:
         Raises:
             SheetsConnectionError: Si falla la autenticación
         """
+        if not self._client and config.SHEETS_BACKEND == "fake":
+            self._client = self._build_fake_client()
+            return self._client
+
         if not self._client:
             try:
                 self.logger.info("Autenticando con Service Account...")
@@ -118,8 +151,9 @@ class SheetsRepository:
                     scopes=config.get_scopes()
                 )
 
-                # Autorizar cliente gspread
-                self._client = gspread.authorize(creds)
+                # Autorizar cliente gspread; cada request HTTP pasa por el
+                # QuotaGovernor (token buckets de lectura/escritura)
+                self._client = gspread.authorize(creds, http_client=GovernedHTTPClient)
 
                 self.logger.info("✅ Cliente gspread autenticado exitosamente")
 
@@ -134,6 +168,33 @@ class SheetsRepository:
 
         return self._client
 
+    @staticmethod
+    def _build_fake_client():
+        """
+        Cliente en memoria para SHEETS_BACKEND=fake (load tests offline).
+
+        Sembrado con el dataset de scripts/seed_load_test.py; latencia, cuota
+        y tasa de 429 vienen de FAKE_SHEETS_* (ver backend/repositories/fake_gspread.py).
+        """
+        from backend.repositories.fake_gspread import FakeSheetsLimits, build_load_test_client
+
+        latency = config.FAKE_SHEETS_LATENCY_MS / 1000
+        quota = config.FAKE_SHEETS_QUOTA_PER_MINUTE or None
+        limits = FakeSheetsLimits(
+            read_latency=latency,
+            write_latency=latency,
+            reads_per_minute=quota,
+            writes_per_minute=quota,
+            error_rate=config.FAKE_SHEETS_ERROR_RATE,
+        )
+        logging.getLogger(__name__).warning(
+            "⚠️  SHEETS_BACKEND=fake: usando Google Sheets en memoria (dataset de load test)"
+        )
+        return build_load_test_client(
+            config.GOOGLE_SHEET_ID, limits, audit_sheet_id=config.GOOGLE_AUDIT_SHEET_ID,
+            governor=get_quota_governor(),
+        )
+
     def open_spreadsheet(self, sheet_id: str) -> gspread.Spreadsheet:
         """
         Abre un spreadsheet por ID (cached).
@@ -155,23 +216,26 @@ class SheetsRepository:
         if sheet_id in self._spreadsheets:
             return self._spreadsheets[sheet_id]
 
-        try:
-            client = self._get_client()
-            spreadsheet = client.open_by_key(sheet_id)
-            self._spreadsheets[sheet_id] = spreadsheet
-            self.logger.info(f"✅ Spreadsheet abierto: {spreadsheet.title} ({sheet_id})")
-            return spreadsheet
+        with self._open_lock:
+            if sheet_id in self._spreadsheets:
+                return self._spreadsheets[sheet_id]
+            try:
+                client = self._get_client()
+                spreadsheet = client.open_by_key(sheet_id)
+                self._spreadsheets[sheet_id] = spreadsheet
+                self.logger.info(f"✅ Spreadsheet abierto: {spreadsheet.title} ({sheet_id})")
+                return spreadsheet
 
-        except gspread.exceptions.SpreadsheetNotFound:
-            raise SheetsConnectionError(
-                "Spreadsheet no encontrado",
-                details=f"ID: {sheet_id}"
-            )
-        except Exception as e:
-            raise SheetsConnectionError(
-                "Error abriendo spreadsheet",
-                details=str(e)
-            )
+            except gspread.exceptions.SpreadsheetNotFound:
+                raise SheetsConnectionError(
+                    "Spreadsheet no encontrado",
+                    details=f"ID: {sheet_id}"
+                )
+            except Exception as e:
+                raise SheetsConnectionError(
+                    "Error abriendo spreadsheet",
+                    details=str(e)
+                )
 
     def _get_spreadsheet(self) -> gspread.Spreadsheet:
         """
@@ -189,7 +253,9 @@ class SheetsRepository:
         Lee una hoja completa de Google Sheets con cache.
 
         Verifica cache primero. Si hay cache hit, retorna datos cacheados.
-        Si cache miss, lee de Sheets y cachea con TTL apropiado.
+        Si el TTL venció sin escrituras de por medio, sondea el modifiedTime
+        del libro (`_probe_change_token`) y, si no cambió, renueva el mismo
+        snapshot. Si no, lee de Sheets y cachea con TTL apropiado.
 
         Args:
             sheet_name: Nombre de la hoja (ej: "Operaciones", "Trabajadores")
@@ -214,7 +280,61 @@ class SheetsRepository:
             self._maybe_refresh_column_map(sheet_name, cached_data[0])
             return cached_data
 
-        # Cache miss - leer de Google Sheets
+        return self._fetch_worksheet(sheet_name, cache_key)
+
+    def refresh_worksheet(self, sheet_name: str) -> list[list]:
+        """
+        Renueva el snapshot de una hoja aunque siga vigente en cache.
+
+        Usado por el refresher de fondo (backend/core/snapshot_refresher.py)
+        para que los requests encuentren siempre un snapshot vigente: sondea
+        el modifiedTime y relee solo si el libro cambió. Sin reintentos (el
+        refresher tiene su propio backoff) y sin adoptar snapshots publicados
+        por otros workers (el refresher es quien los publica).
+
+        Raises:
+            SheetsConnectionError: Si falla la lectura
+        """
+        return self._fetch_worksheet(sheet_name, f"worksheet:{sheet_name}", refresh=True)
+
+    def _fetch_worksheet(self, sheet_name: str, cache_key: str, refresh: bool = False) -> list[list]:
+        # Cache miss. Si el TTL solo venció (ninguna escritura invalidó la
+        # hoja) y el libro no cambió desde ese snapshot, se renueva el mismo
+        # snapshot: un sondeo a Drive en vez de get_all_values completo.
+        ttl = self._worksheet_ttl(sheet_name)
+        # Generación compartida previa a leer: si otro worker escribe durante
+        # la lectura, el snapshot no se publica y se descarta en el próximo get
+        generation = self._shared.generation(cache_key) if self._shared is not None else None
+        # Idem en el proceso: una escritura (o su invalidación) durante la
+        # lectura avanza la versión y las filas leídas no se cachean
+        version_before = self._cache.version(cache_key)
+        if generation is not None and not refresh:
+            published = self._load_published_worksheet(sheet_name, cache_key)
+            if published is not None:
+                return published
+
+        token = None
+        lease = self._leases.get(sheet_name)
+        renewable = lease is not None and lease.version == self._cache.version(cache_key)
+        if renewable or refresh:
+            # El refresher sondea también antes de releer en frío: así el
+            # snapshot queda con token y el próximo refresh puede renovarlo
+            token = self._probe_change_token(sheet_name)
+        if renewable:
+            if token is not None and token == lease.token and self._cache.set_if_version(
+                cache_key, lease.version, lease.rows,
+                ttl_seconds=ttl, digest=lease.digest, generation=generation,
+            ) is not None:
+                metrics.SHEETS_CHANGE_PROBES.inc(sheet=sheet_name, result="unchanged")
+                self._maybe_refresh_column_map(sheet_name, lease.rows[0])
+                self._publish_worksheet(cache_key, lease, generation, ttl)
+                self.logger.info(f"✅ Sin cambios en '{sheet_name}': snapshot renovado por {ttl}s")
+                return lease.rows
+            metrics.SHEETS_CHANGE_PROBES.inc(
+                sheet=sheet_name, result="error" if token is None else "changed"
+            )
+
+        # Leer de Google Sheets
         try:
             spreadsheet = self._get_spreadsheet()
             worksheet = spreadsheet.worksheet(sheet_name)
@@ -240,21 +360,22 @@ class SheetsRepository:
             # caching the rows so the column-map and row data stay aligned.
             self._maybe_refresh_column_map(sheet_name, all_values[0])
 
-            # Cachear con TTL según tipo de hoja
-            # Trabajadores y Uniones cambian poco → TTL largo (300s).
-            # Uniones moved to 300s after PROD incident 2026-05-08: rapid
-            # modal navigation (INICIAR → Uniones) burst-spiked Sheets reads
-            # past the 300/min/user quota and triggered HTTP 429 → 503 toasts
-            # ("Error del servidor"). At single-user scale, 5 minutes of
-            # staleness is harmless — Matías operates sequentially.
-            # Operaciones cambian frecuente → TTL corto (60s).
-            long_ttl_sheets = {
-                config.HOJA_TRABAJADORES_NOMBRE,
-                "Uniones",  # config has no constant for this; literal name
-            }
-            ttl = 300 if sheet_name in long_ttl_sheets else 60
-
-            self._cache.set(cache_key, all_values, ttl_seconds=ttl)
+            # Digest del contenido: un re-fetch idéntico no cambia la versión
+            # del snapshot (ETags de endpoints de lectura, ver snapshot_version)
+            digest = hashlib.blake2b(repr(all_values).encode(), digest_size=16).hexdigest()
+            version = self._cache.set_if_version(
+                cache_key, version_before, all_values,
+                ttl_seconds=ttl, digest=digest, generation=generation,
+            )
+            if version is None:
+                # Escritura concurrente (ej: request mientras lee el refresher):
+                # estas filas pueden ser previas a ella, no se cachean ni publican
+                self.logger.info(f"⚠️  '{sheet_name}' cambió durante la lectura: snapshot descartado")
+                return all_values
+            lease = _WorksheetLease(all_values, digest, version, token)
+            self._leases[sheet_name] = lease
+            self._snapshot_differ.observe(sheet_name, all_values, version=version, digest=digest)
+            self._publish_worksheet(cache_key, lease, generation, ttl)
 
             self.logger.info(
                 f"✅ Leídas {len(all_values)} filas de '{sheet_name}' "
@@ -273,6 +394,155 @@ class SheetsRepository:
                 details=str(e)
             )
 
+    def _load_published_worksheet(self, sheet_name: str, cache_key: str) -> Optional[list[list]]:
+        """
+        Adopta el snapshot que otro worker publicó en el store compartido.
+
+        Si el digest coincide con el snapshot local se reutilizan las mismas
+        filas (las vistas derivadas no se reconstruyen); si no, se cargan
+        del store sin ir a Sheets.
+
+        Returns:
+            Las filas, o None si no hay snapshot publicado vigente
+        """
+        shared = self._shared
+        meta = shared.published(cache_key)
+        if meta is None:
+            return None
+        lease = self._leases.get(sheet_name)
+        if lease is not None and lease.digest == meta["digest"]:
+            rows = lease.rows
+        else:
+            rows = shared.load(cache_key, meta["digest"])
+            if not rows:
+                return None
+        remaining = int(meta["expires_at"] - time.time())
+        if remaining <= 0:
+            return None
+
+        self._maybe_refresh_column_map(sheet_name, rows[0])
+        self._cache.set(
+            cache_key, rows, ttl_seconds=remaining,
+            digest=meta["digest"], generation=meta["generation"],
+        )
+        version = self._cache.version(cache_key)
+        self._leases[sheet_name] = _WorksheetLease(rows, meta["digest"], version, meta.get("token"))
+        self._snapshot_differ.observe(sheet_name, rows, version=version, digest=meta["digest"])
+        reused = lease is not None and lease.rows is rows
+        metrics.SHEETS_SHARED_SNAPSHOTS.inc(sheet=sheet_name, result="reused" if reused else "loaded")
+        self.logger.info(f"✅ Snapshot compartido de '{sheet_name}' ({len(rows)} filas, vigente {remaining}s)")
+        return rows
+
+    def _publish_worksheet(
+        self, cache_key: str, lease: _WorksheetLease, generation: Optional[int], ttl: int
+    ) -> None:
+        """Publica el snapshot para los demás workers (no-op sin store compartido)."""
+        if generation is None:
+            return
+        self._shared.publish(
+            cache_key, lease.rows, lease.digest, generation, time.time() + ttl, token=lease.token
+        )
+
+    @staticmethod
+    def _worksheet_ttl(sheet_name: str) -> int:
+        """
+        TTL del snapshot de una hoja.
+
+        Trabajadores y Uniones cambian poco → TTL largo (300s).
+        Uniones moved to 300s after PROD incident 2026-05-08: rapid
+        modal navigation (INICIAR → Uniones) burst-spiked Sheets reads
+        past the 300/min/user quota and triggered HTTP 429 → 503 toasts
+        ("Error del servidor"). At single-user scale, 5 minutes of
+        staleness is harmless — Matías operates sequentially.
+        Operaciones cambian frecuente → TTL corto (60s).
+        """
+        long_ttl_sheets = {
+            config.HOJA_TRABAJADORES_NOMBRE,
+            "Uniones",  # config has no constant for this; literal name
+        }
+        return 300 if sheet_name in long_ttl_sheets else 60
+
+    def _probe_change_token(self, sheet_name: str) -> Optional[str]:
+        """
+        modifiedTime del spreadsheet según Drive (cambia con cualquier edición,
+        también las hechas a mano en la UI de Sheets).
+
+        Returns:
+            El token, o None si el sondeo falló (se relee la hoja completa).
+            Sin permiso de Drive (403/404) el sondeo se apaga para el proceso.
+        """
+        if not self._change_probe_enabled:
+            return None
+        try:
+            return str(self._get_spreadsheet().get_lastUpdateTime())
+        except gspread.exceptions.APIError as e:
+            if e.code in (403, 404):
+                self._change_probe_enabled = False
+                self.logger.warning(
+                    f"Sondeo de cambios desactivado: Drive respondió {e.code} ({e})"
+                )
+            else:
+                self.logger.debug(f"Sondeo de cambios falló para '{sheet_name}': {e}")
+        except Exception as e:
+            self.logger.debug(f"Sondeo de cambios falló para '{sheet_name}': {e}")
+        return None
+
+    def peek_cached_worksheet(self, sheet_name: str) -> Optional[list[list]]:
+        """
+        Retorna las filas cacheadas de una hoja sin ir a Google Sheets.
+
+        Usado por vistas derivadas (ej: WorkerLedger) para saber si el
+        snapshot cambió sin gatillar una lectura en cache miss.
+
+        Returns:
+            La lista de filas cacheada, o None si no hay snapshot vigente.
+        """
+        cached_data = self._cache.get(f"worksheet:{sheet_name}")
+        if cached_data is not None and len(cached_data) > 0:
+            return cached_data
+        return None
+
+    def peek_snapshot_version(self, sheet_name: str) -> int:
+        """
+        Versión del snapshot de una hoja sin leerla (ver `snapshot_version`).
+
+        Avanza con cada invalidación, también las de otros workers; las vistas
+        derivadas la usan para saber si una escritura que no parchearon (o de
+        otro proceso) dejó su estado viejo.
+        """
+        return self._cache.version(f"worksheet:{sheet_name}")
+
+    def snapshot_version(self, sheet_name: str) -> int:
+        """
+        Versión monotónica del snapshot vigente de una hoja.
+
+        Cambia cuando una escritura invalida la hoja o cuando un re-fetch trae
+        contenido distinto. Si no hay snapshot cacheado se lee la hoja, para
+        que la versión refleje cambios hechos fuera de la app.
+
+        Returns:
+            int: versión (usada para derivar ETags, ver backend/utils/etag.py)
+
+        Raises:
+            SheetsConnectionError: Si falla la lectura
+        """
+        if self.peek_cached_worksheet(sheet_name) is None:
+            self.read_worksheet(sheet_name)
+        return self._cache.version(f"worksheet:{sheet_name}")
+
+    def snapshot_diff(self, sheet_name: str) -> Optional[RowDiff]:
+        """
+        Diff por fila entre el snapshot vigente de la hoja y el anterior.
+
+        Solo para hojas seguidas (Operaciones por TAG_SPOOL, Uniones por ID);
+        None si la hoja no se sigue o solo se leyó una vez.
+        """
+        return self._snapshot_differ.latest(sheet_name)
+
+    def subscribe_snapshot_diffs(self, callback) -> None:
+        """Registra `callback(diff: RowDiff)` para cada re-lectura de una hoja seguida."""
+        self._snapshot_differ.subscribe(callback)
+
     def _maybe_refresh_column_map(self, sheet_name: str, header_row: list[str]) -> None:
         """
         Hand the freshly-observed header to ColumnMapCache. If the hash
@@ -377,6 +647,7 @@ class SheetsRepository:
             )
 
             self.logger.info(f"✅ Actualizada celda {column_letter}{row} = {safe_value} en '{sheet_name}'")
+            self._sync_derived_views(sheet_name)
 
         except Exception as e:
             raise SheetsUpdateError(
@@ -436,6 +707,7 @@ class SheetsRepository:
             # Invalidar cache para forzar re-lectura en próximo acceso
             cache_key = f"worksheet:{sheet_name}"
             self._cache.invalidate(cache_key)
+            self._sync_derived_views(sheet_name)
 
         except Exception as e:
             raise SheetsUpdateError(
@@ -516,6 +788,10 @@ class SheetsRepository:
             # Without cache invalidation, subsequent reads (like PAUSAR hydration) get stale data
             cache_key = f"worksheet:{sheet_name}"
             self._cache.invalidate(cache_key)
+            self._sync_derived_views(
+                sheet_name,
+                [{"row": row, "column_name": column_name, "value": value}],
+            )
 
         except ValueError:
             raise
@@ -600,6 +876,7 @@ class SheetsRepository:
             # Invalidar cache para forzar re-lectura
             cache_key = f"worksheet:{sheet_name}"
             self._cache.invalidate(cache_key)
+            self._sync_derived_views(sheet_name, updates)
 
         except ValueError:
             raise
@@ -609,6 +886,26 @@ class SheetsRepository:
                 updates={"count": len(updates), "updates": updates, "error": str(e)}
             )
 
+    def _sync_derived_views(self, sheet_name: str, updates: Optional[list[dict]] = None) -> None:
+        """
+        Mantiene las vistas derivadas de la hoja (OccupancyView, EligibilityIndex)
+        tras una escritura.
+
+        Con `updates` por nombre de columna cada vista se parchea; sin ellos
+        (escrituras por letra de columna) se invalida. Nunca propaga errores:
+        la escritura en Sheets ya fue exitosa.
+        """
+        from backend.core.snapshot_view import SnapshotView
+        for view in SnapshotView.instances_for(self, sheet_name):
+            try:
+                if updates is None:
+                    view.invalidate()
+                else:
+                    view.apply_cell_updates(updates)
+            except Exception as e:
+                self.logger.warning(f"{type(view).__name__} sync failed, invalidating: {e}")
+                view.invalidate()
+
     @staticmethod
     def _index_to_column_letter(index: int) -> str:
         """
@@ -705,6 +1002,8 @@ class SheetsRepository:
         """
         Lee el valor de la columna Ocupado_Por para una fila (v3.0).
 
+        Lectura puntual (`read_cell`): sin snapshot vigente no se relee la hoja.
+
         Args:
             sheet_name: Nombre de la hoja
             row: Número de fila (1-indexed)
@@ -715,29 +1014,14 @@ class SheetsRepository:
         if self._compatibility_mode == "v2.1":
             return None
 
-        all_rows = self.read_worksheet(sheet_name)
-        if row >= len(all_rows):
-            return None
-
-        from backend.core.column_map_cache import ColumnMapCache
-        column_map = ColumnMapCache.get_or_build(sheet_name, self)
-
-        normalize = normalize_column_name
-
-        idx = column_map.get(normalize("Ocupado_Por"))
-        if idx is None or idx >= len(all_rows[row]):
-            return None
-
-        value = all_rows[row][idx]
-        if value is None or value == "":
-            return None
-        s = str(value).strip()
-        return s if s else None
+        return self.read_cell(sheet_name, row, "Ocupado_Por")
 
     def get_fecha_ocupacion(self, sheet_name: str, row: int) -> Optional[str]:
         """
         Lee el valor de la columna Fecha_Ocupacion para una fila (v3.0).
 
+        Lectura puntual (`read_cell`): sin snapshot vigente no se relee la hoja.
+
         Args:
             sheet_name: Nombre de la hoja
             row: Número de fila (1-indexed)
@@ -748,24 +1032,7 @@ class SheetsRepository:
         if self._compatibility_mode == "v2.1":
             return None
 
-        all_rows = self.read_worksheet(sheet_name)
-        if row >= len(all_rows):
-            return None
-
-        from backend.core.column_map_cache import ColumnMapCache
-        column_map = ColumnMapCache.get_or_build(sheet_name, self)
-
-        normalize = normalize_column_name
-
-        idx = column_map.get(normalize("Fecha_Ocupacion"))
-        if idx is None or idx >= len(all_rows[row]):
-            return None
-
-        value = all_rows[row][idx]
-        if value is None or value == "":
-            return None
-        s = str(value).strip()
-        return s if s else None
+        return self.read_cell(sheet_name, row, "Fecha_Ocupacion")
 
     def get_version(self, sheet_name: str, row: int) -> int:
         """
@@ -791,6 +1058,9 @@ class SheetsRepository:
         need to inspect Estado_Detalle (or similar) without instantiating a full
         Spool model.
 
+        Reads through the worksheet snapshot (a cache miss loads the whole sheet);
+        read-modify-write paths that only need the cell use `read_cell`.
+
         Row convention: 1-indexed in Sheets terms (row 1 = header, row 2 = first data
         row). Matches what find_row_by_column_value returns and what
         batch_update_by_column_name expects.
@@ -823,6 +1093,104 @@ class SheetsRepository:
         stripped = str(value).strip()
         return stripped if stripped else None
 
+    # =========================================================================
+    # Point reads (una celda / una columna sin cargar la hoja completa)
+    # =========================================================================
+
+    def read_cell(self, sheet_name: str, row: int, column_name: str) -> Optional[str]:
+        """
+        Lee una celda para read-modify-write (Notas, Ocupado_Por, ...).
+
+        Con snapshot vigente de la hoja se lee de él, sin llamadas a Sheets.
+        Sin snapshot se pide solo el rango A1 de la celda (`_point_read`) en
+        vez de get_all_values de toda la hoja.
+
+        Args:
+            sheet_name: Nombre de la hoja
+            row: Número de fila (1-indexed, como find_row_by_column_value)
+            column_name: Nombre de columna (ej: "Notas")
+
+        Returns:
+            Valor sin espacios, o None si la fila/columna no existe o la celda está vacía
+
+        Raises:
+            SheetsConnectionError: Si falla la lectura
+        """
+        from backend.core.column_map_cache import ColumnMapCache
+        column_map = ColumnMapCache.get_or_build(sheet_name, self)
+        col_idx = column_map.get(normalize_column_name(column_name))
+        if col_idx is None or row < 1:
+            return None
+
+        all_rows = self.peek_cached_worksheet(sheet_name)
+        if all_rows is not None:
+            metrics.SHEETS_POINT_READS.inc(sheet=sheet_name, source="snapshot")
+            cells = all_rows[row - 1:row]
+            value = cells[0][col_idx] if cells and col_idx < len(cells[0]) else None
+        else:
+            values = self._point_read(sheet_name, f"{self._index_to_column_letter(col_idx)}{row}")
+            value = values[0][0] if values and values[0] else None
+
+        if value is None:
+            return None
+        stripped = str(value).strip()
+        return stripped if stripped else None
+
+    def locate_row(self, sheet_name: str, column_letter: str, value: str) -> Optional[int]:
+        """
+        Como `find_row_by_column_value`, pero sin snapshot vigente lee solo la
+        columna buscada (ej: "G:G" para TAG_SPOOL) en vez de la hoja completa.
+
+        Returns:
+            Número de fila (1-indexed) o None si no se encuentra
+
+        Raises:
+            SheetsConnectionError: Si falla la lectura
+        """
+        if self.peek_cached_worksheet(sheet_name) is not None:
+            metrics.SHEETS_POINT_READS.inc(sheet=sheet_name, source="snapshot")
+            return self.find_row_by_column_value(sheet_name, column_letter, value)
+
+        column = self._point_read(sheet_name, f"{column_letter}:{column_letter}")
+        for row_index, cells in enumerate(column[1:], start=2):
+            if cells and str(cells[0]) == value:
+                return row_index
+        return None
+
+    @retry_on_sheets_error(max_retries=3, backoff_seconds=1.0)
+    def _point_read(self, sheet_name: str, a1_range: str) -> list[list]:
+        """
+        Lee un rango A1 con cache corto propio (SHEETS_POINT_READ_TTL_SECONDS).
+
+        La entrada guarda la versión del snapshot de la hoja tomada antes de
+        leer: cualquier escritura (de este u otro worker) la avanza y la
+        entrada deja de servir, aunque su TTL no haya vencido.
+        """
+        cache_key = f"point:{sheet_name}:{a1_range}"
+        version = self._cache.version(f"worksheet:{sheet_name}")
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] == version:
+            metrics.SHEETS_POINT_READS.inc(sheet=sheet_name, source="cached")
+            return cached[1]
+
+        try:
+            worksheet = self._get_spreadsheet().worksheet(sheet_name)
+            values = worksheet.get(
+                a1_range, value_render_option=gspread.utils.ValueRenderOption.unformatted
+            )
+        except gspread.exceptions.APIError:
+            raise
+        except Exception as e:
+            raise SheetsConnectionError(
+                f"Error leyendo rango {a1_range} de '{sheet_name}'",
+                details=str(e)
+            )
+        values = [list(cells) for cells in values]
+        self._cache.set(cache_key, (version, values), ttl_seconds=config.SHEETS_POINT_READ_TTL_SECONDS)
+        metrics.SHEETS_POINT_READS.inc(sheet=sheet_name, source="fetched")
+        self.logger.debug(f"Lectura puntual {a1_range} de '{sheet_name}'")
+        return values
+
     def set_ocupado_por(
         self,
         sheet_name: str,
@@ -1199,6 +1567,45 @@ class SheetsRepository:
             )
             raise SpoolDataCorruptError(tag_spool, str(e)) from e
 
+    def get_estado_detalle_by_tag(self, tag_spools: Iterable[str]) -> dict[str, Optional[str]]:
+        """
+        Estado_Detalle actual de varios spools desde un solo snapshot de Operaciones.
+
+        Para chequeos masivos (ej: EstadoDetalleService.check_spools_for_overrides)
+        que con get_spool_by_tag harían una búsqueda y un parseo por spool.
+
+        Args:
+            tag_spools: TAGs a consultar
+
+        Returns:
+            dict tag_spool -> Estado_Detalle (None si la celda está vacía o en modo
+            v2.1). Los TAGs que no están en la hoja no aparecen.
+
+        Raises:
+            SheetsConnectionError: Si falla la lectura
+        """
+        from backend.core.column_map_cache import ColumnMapCache
+
+        wanted = set(tag_spools)
+        all_rows = self.read_worksheet(config.HOJA_OPERACIONES_NOMBRE)
+        column_map = ColumnMapCache.get_or_build(config.HOJA_OPERACIONES_NOMBRE, self)
+        tag_idx = self._column_letter_to_index(
+            self.get_tag_spool_column_letter(config.HOJA_OPERACIONES_NOMBRE)
+        )
+        estado_idx = column_map.get(normalize_column_name("Estado_Detalle"))
+        if self._compatibility_mode == "v2.1":
+            estado_idx = None
+
+        estados: dict[str, Optional[str]] = {}
+        for row in all_rows[1:]:
+            tag = row[tag_idx] if tag_idx < len(row) else None
+            if tag not in wanted or tag in estados:
+                continue
+            value = row[estado_idx] if estado_idx is not None and estado_idx < len(row) else None
+            value = str(value).strip() if value is not None else ""
+            estados[tag] = value or None
+        return estados
+
     def get_spools_for_metrologia(self) -> list['Spool']:
         """
         Get spools ready for metrología inspection.
@@ -2,8 +2,11 @@
 Repositorio para el spreadsheet de auditoría del supervisor (ZEUES_App_Audit).
 
 Tres tabs:
-- Lista: mutable, una fila por TAG_SPOOL que Matías está siguiendo.
-- Audit: append-only, eventos de UI deduplicados por ID.
+- Lista: mutable, una fila por TAG_SPOOL que Matías está siguiendo. Las
+  posiciones {tag: fila} viven en un índice en memoria — ver _ListaIndex.
+- Audit: append-only, eventos de UI deduplicados por ID. Se lee de forma
+  incremental (solo la cola nueva) sobre un índice en memoria ordenado por
+  timestamp — ver _AuditIndex.
 - Snapshots_Legacy: append-only, dumps verbatim de localStorage para Capa 0.
 
 Acceso vía sheets_repo.open_spreadsheet(config.GOOGLE_AUDIT_SHEET_ID) — NO usar
@@ -11,7 +14,12 @@ SheetsRepository.read_worksheet(), que está hardcoded al sheet de operaciones
 y comparte un cache global keyed solo por nombre de tab (sería ambiguo si
 ambos libros tuvieran tabs con el mismo nombre).
 """
+import base64
+import bisect
 import logging
+import re
+import threading
+import time
 from datetime import datetime
 from typing import Optional
 
@@ -26,6 +34,7 @@ from backend.models.supervisor import (
 )
 from backend.repositories.metadata_repository import retry_on_sheets_error
 from backend.repositories.sheets_repository import SheetsRepository
+from backend.utils.cache import get_cache
 from backend.utils.sanitize import sanitize_row_for_sheets
 
 
@@ -39,6 +48,148 @@ def _col_letter(idx0: int) -> str:
     return s
 
 
+# ─── Audit index (cache incremental de la tab Audit) ──────────────────────────
+
+
+def encode_audit_cursor(event: AuditEvent) -> str:
+    """
+    Cursor opaco para paginar Audit: (timestamp, id) del último evento entregado.
+
+    Se codifica en base64 urlsafe para que el frontend lo trate como token
+    y no intente parsearlo.
+    """
+    raw = f"{event.timestamp.isoformat()}|{event.id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_audit_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Inverso de encode_audit_cursor.
+
+    Raises:
+        ValueError: Si el cursor no es válido (el router lo traduce a HTTP 400).
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        ts_raw, event_id = raw.split("|", 1)
+        ts = datetime.fromisoformat(ts_raw)
+    except Exception:
+        raise ValueError("cursor inválido")
+    if ts.tzinfo is None or not event_id:
+        raise ValueError("cursor inválido")
+    return ts, event_id
+
+
+class _AuditIndex:
+    """
+    Copia en memoria de la tab Audit, ordenada por (timestamp, id).
+
+    Audit es append-only, así que basta recordar cuántas filas de la hoja ya
+    se consumieron (`rows_consumed`, incluye header) para pedir solo la cola
+    nueva. `anchor_id` es el valor de la columna A en la última fila
+    consumida: la siguiente lectura de cola empieza en esa misma fila y, si
+    ya no contiene ese ID (alguien borró u ordenó filas a mano), el índice
+    se reconstruye completo.
+
+    Los timestamps los genera el cliente y pueden llegar desordenados entre
+    sesiones, por eso se inserta con bisect en vez de append ciego.
+    """
+
+    def __init__(self):
+        self.rows_consumed = 0
+        self.anchor_id: Optional[str] = None
+        self.keys: list[tuple[datetime, str]] = []
+        self.events: list[AuditEvent] = []
+
+    def reset(self) -> None:
+        self.rows_consumed = 0
+        self.anchor_id = None
+        self.keys = []
+        self.events = []
+
+    def add(self, event: AuditEvent) -> None:
+        key = (event.timestamp, event.id)
+        if not self.keys or key >= self.keys[-1]:
+            self.keys.append(key)
+            self.events.append(event)
+            return
+        pos = bisect.bisect_right(self.keys, key)
+        self.keys.insert(pos, key)
+        self.events.insert(pos, event)
+
+    def slice_after(
+        self,
+        lower: tuple[datetime, str],
+        limit: Optional[int],
+        inclusive: bool,
+    ) -> list[AuditEvent]:
+        """Eventos con key >= lower (o > lower si no es inclusive), en orden."""
+        if inclusive:
+            start = bisect.bisect_left(self.keys, lower)
+        else:
+            start = bisect.bisect_right(self.keys, lower)
+        end = len(self.events) if limit is None else start + limit
+        return self.events[start:end]
+
+
+# ─── Lista index (cache {tag: fila} de la tab Lista) ───────────────────────
+
+
+_UPDATED_RANGE_ROW = re.compile(r"![A-Z]+(\d+)")
+
+
+def _row_from_append_response(response) -> Optional[int]:
+    """
+    Fila donde aterrizó un append_row, según `updates.updatedRange`
+    (ej. "Lista!A7:D7" → 7). None si la respuesta no trae el dato.
+    """
+    if not isinstance(response, dict):
+        return None
+    updated_range = (response.get("updates") or {}).get("updatedRange") or ""
+    match = _UPDATED_RANGE_ROW.search(updated_range)
+    return int(match.group(1)) if match else None
+
+
+class _ListaIndex:
+    """
+    Copia en memoria de la tab Lista: {tag: fila} + los TrackedSpool parseados.
+
+    Se carga con un solo get_all_values y luego se mantiene con cada
+    mutación (append, update, delete con corrimiento de filas), así que
+    upsert/remove cuestan una sola llamada de escritura y GET /list ninguna.
+
+    Vigencia: el índice guarda la versión de `lista:{audit_sheet_id}` en
+    SimpleCache con la que se cargó. Cada mutación la invalida, y con
+    SHARED_STATE_DIR eso avanza la generación compartida: una escritura de
+    otro worker hace que este recargue el índice en la próxima operación.
+    Las ediciones a mano se detectan de forma barata: cada append_row
+    devuelve la fila donde aterrizó (si no es `last_row + 1` el índice se
+    descarta) y, cuando la tag NO está en el índice, se lee la columna A una
+    vez antes de concluir que falta (`_resolve_row`). Además vive a lo más
+    LISTA_INDEX_TTL_SECONDS.
+    """
+
+    def __init__(self):
+        self.row_of: dict[str, int] = {}
+        self.spools: dict[str, TrackedSpool] = {}  # orden = orden de filas
+        self.last_row = 1  # header
+        self.loaded_at = time.monotonic()
+        self.version = 0  # SimpleCache.version de la key de Lista al cargar
+
+    def put(self, spool: TrackedSpool, row: int) -> None:
+        self.row_of[spool.tag_spool] = row
+        self.spools[spool.tag_spool] = spool
+        self.last_row = max(self.last_row, row)
+
+    def delete(self, tag_spool: str) -> None:
+        row = self.row_of.pop(tag_spool)
+        self.spools.pop(tag_spool, None)
+        for tag, r in self.row_of.items():
+            if r > row:
+                self.row_of[tag] = r - 1
+        self.last_row -= 1
+
+
 class SupervisorRepository:
     """
     Repositorio para el spreadsheet ZEUES_App_Audit.
@@ -51,6 +202,16 @@ class SupervisorRepository:
 
     CHUNK_SIZE = 900  # gspread safe append_rows chunk size
 
+    # Índice incremental de Audit, compartido entre instancias (el repo se
+    # crea por request). Keyed por audit sheet id para no mezclar libros.
+    _audit_indexes: dict[str, _AuditIndex] = {}
+    _audit_lock = threading.Lock()
+
+    # Índice de Lista ({tag: fila}); misma idea, keyed por audit sheet id.
+    LISTA_INDEX_TTL_SECONDS = 300
+    _lista_indexes: dict[str, _ListaIndex] = {}
+    _lista_lock = threading.RLock()
+
     EXPECTED_HEADERS: dict[str, list[str]] = {
         config.HOJA_AUDIT_LISTA_NOMBRE: [
             "TAG_SPOOL", "Added_At", "Updated_At", "Notes",
@@ -69,6 +230,14 @@ class SupervisorRepository:
         self.sheets_repo = sheets_repo
         self._worksheets: dict[str, gspread.Worksheet] = {}
 
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Descarta los índices en memoria (usado en tests)."""
+        with cls._audit_lock:
+            cls._audit_indexes.clear()
+        with cls._lista_lock:
+            cls._lista_indexes.clear()
+
     # ─── Worksheet access ────────────────────────────────────────────────
 
     def _get_ws(self, name: str) -> gspread.Worksheet:
@@ -87,11 +256,23 @@ class SupervisorRepository:
 
     # ─── Lista (mutable: upsert + delete) ────────────────────────────────
 
-    @retry_on_sheets_error(max_retries=3, backoff_seconds=1.0)
-    def list_tracked_spools(self) -> list[TrackedSpool]:
+    def _lista_index(self) -> _ListaIndex:
         """
-        Lee toda la tab Lista. Tolera errores de parseo por fila.
+        Devuelve el índice de Lista vigente, cargándolo si no existe o expiró.
+
+        Caller MUST hold _lista_lock.
         """
+        key = config.GOOGLE_AUDIT_SHEET_ID
+        index = self._lista_indexes.get(key)
+        # Versión previa a leer: una escritura concurrente deja el índice viejo
+        version = get_cache().version(self._lista_version_key())
+        if (
+            index is not None
+            and index.version == version
+            and time.monotonic() - index.loaded_at < self.LISTA_INDEX_TTL_SECONDS
+        ):
+            return index
+
         ws = self._get_ws(config.HOJA_AUDIT_LISTA_NOMBRE)
         try:
             all_values = ws.get_all_values()
@@ -101,45 +282,112 @@ class SupervisorRepository:
                 details=str(e),
             )
 
-        if len(all_values) <= 1:
-            return []
-
-        out: list[TrackedSpool] = []
+        index = _ListaIndex()
+        index.version = version
+        index.last_row = max(len(all_values), 1)
         for row_idx, row in enumerate(all_values[1:], start=2):
             if not row or not row[0].strip():
                 continue  # fila vacía → ignorar
+            tag = row[0].strip()
+            # Primera ocurrencia gana (mismo criterio que la búsqueda lineal).
+            index.row_of.setdefault(tag, row_idx)
             try:
-                out.append(TrackedSpool.from_sheets_row(row))
+                index.spools.setdefault(tag, TrackedSpool.from_sheets_row(row))
             except Exception as e:
                 self.logger.warning(
                     f"Lista row {row_idx} no parsea: {e}; row={row}"
                 )
                 continue
 
-        return out
+        self._lista_indexes[key] = index
+        self.logger.info(
+            f"Lista: índice cargado ({len(index.row_of)} tags, "
+            f"{index.last_row} filas)"
+        )
+        return index
 
-    @retry_on_sheets_error(max_retries=3, backoff_seconds=1.0)
-    def find_tracked_row(self, tag_spool: str) -> Optional[int]:
+    def _drop_lista_index(self, reason: str) -> None:
+        """Descarta el índice de Lista; la próxima operación lo recarga."""
+        with self._lista_lock:
+            self._lista_indexes.pop(config.GOOGLE_AUDIT_SHEET_ID, None)
+        self.logger.warning(f"Lista: índice descartado ({reason})")
+
+    @staticmethod
+    def _lista_version_key() -> str:
+        return f"lista:{config.GOOGLE_AUDIT_SHEET_ID}"
+
+    def _lista_written(self, index: _ListaIndex) -> None:
         """
-        Devuelve el número de fila 1-indexed del TAG_SPOOL en Lista, o None.
+        Publica una mutación de Lista: avanza la versión (y la generación
+        compartida, para los demás workers) y el índice local, ya
+        actualizado por el caller, queda vigente con la versión nueva.
 
-        Usa col_values(1) — una sola columna, evita leer todo el libro.
+        Caller MUST hold _lista_lock.
         """
-        ws = self._get_ws(config.HOJA_AUDIT_LISTA_NOMBRE)
+        cache = get_cache()
+        cache.invalidate(self._lista_version_key())
+        index.version = cache.version(self._lista_version_key())
+
+    def _resolve_row(self, ws: gspread.Worksheet, tag_spool: str) -> tuple[_ListaIndex, Optional[int]]:
+        """
+        Fila de la tag en Lista.
+
+        Si la tag está en el índice vigente se usa sin leer la hoja. Si no
+        está, antes de concluir que falta (append en upsert, no-op en
+        remove) se lee la columna A una vez: si la tag aparece o la cantidad
+        de filas no coincide con el índice, la tab cambió por fuera y el
+        índice se recarga.
+
+        Caller MUST hold _lista_lock.
+
+        Returns:
+            (índice vigente, fila o None si la tag no está en Lista)
+
+        Raises:
+            SheetsConnectionError: Si falla la lectura
+        """
+        index = self._lista_index()
+        row = index.row_of.get(tag_spool)
+        if row is not None:
+            return index, row
         try:
-            col = ws.col_values(1)  # column A = TAG_SPOOL
+            column = ws.col_values(1)
         except gspread.exceptions.APIError as e:
             raise SheetsConnectionError(
-                "Error leyendo columna TAG_SPOOL en Lista",
+                "Error leyendo columna A de Lista",
                 details=str(e),
             )
+        present = any(str(value).strip() == tag_spool for value in column[1:])
+        if not present and max(len(column), 1) == index.last_row:
+            return index, None
+        self._drop_lista_index(
+            f"columna A ({len(column)} filas) no coincide con el índice "
+            f"({index.last_row} filas)"
+        )
+        index = self._lista_index()
+        return index, index.row_of.get(tag_spool)
 
-        # col[0] es el header; buscar a partir de fila 2.
-        target = tag_spool.strip()
-        for idx, value in enumerate(col[1:], start=2):
-            if value.strip() == target:
-                return idx
-        return None
+    @retry_on_sheets_error(max_retries=3, backoff_seconds=1.0)
+    def list_tracked_spools(self) -> list[TrackedSpool]:
+        """
+        Lista completa, servida desde el índice en memoria.
+
+        Solo lee la tab (get_all_values) si el índice no existe o expiró.
+        Tolera errores de parseo por fila.
+        """
+        with self._lista_lock:
+            return list(self._lista_index().spools.values())
+
+    @retry_on_sheets_error(max_retries=3, backoff_seconds=1.0)
+    def find_tracked_row(self, tag_spool: str) -> Optional[int]:
+        """
+        Devuelve el número de fila 1-indexed del TAG_SPOOL en Lista, o None.
+
+        Lookup O(1) sobre el índice {tag: fila}; no pega al API si el
+        índice está vigente.
+        """
+        with self._lista_lock:
+            return self._lista_index().row_of.get(tag_spool.strip())
 
     @retry_on_sheets_error(max_retries=3, backoff_seconds=1.0)
     def upsert_tracked_spool(self, spool: TrackedSpool) -> TrackedSpool:
@@ -150,34 +398,56 @@ class SupervisorRepository:
         - Si la tag ya existe → actualiza A:D de esa fila (single API call).
         - Si no existe → append_row al final.
 
+        La fila se resuelve con el índice en memoria (`_resolve_row`): un
+        update no lee la hoja; un append lee antes la columna A para no
+        duplicar una tag agregada por otro worker o a mano.
+
         Returns el TrackedSpool tal como quedó persistido.
         """
         row_data = sanitize_row_for_sheets(spool.to_sheets_row())
         ws = self._get_ws(config.HOJA_AUDIT_LISTA_NOMBRE)
 
-        existing_row = self.find_tracked_row(spool.tag_spool)
+        with self._lista_lock:
+            index, existing_row = self._resolve_row(ws, spool.tag_spool.strip())
 
-        try:
-            if existing_row is not None:
-                # Update A{row}:D{row} — 4 columnas en un solo call.
-                end_col = _col_letter(len(row_data) - 1)  # "D" para 4 cols
-                cell_range = f"A{existing_row}:{end_col}{existing_row}"
-                ws.update(
-                    range_name=cell_range,
-                    values=[row_data],
-                    value_input_option="USER_ENTERED",
-                )
-                self.logger.info(
-                    f"Lista: actualizada fila {existing_row} para {spool.tag_spool}"
+            try:
+                if existing_row is not None:
+                    # Update A{row}:D{row} — 4 columnas en un solo call.
+                    end_col = _col_letter(len(row_data) - 1)  # "D" para 4 cols
+                    cell_range = f"A{existing_row}:{end_col}{existing_row}"
+                    ws.update(
+                        range_name=cell_range,
+                        values=[row_data],
+                        value_input_option="USER_ENTERED",
+                    )
+                    index.put(spool, existing_row)
+                    self._lista_written(index)
+                    self.logger.info(
+                        f"Lista: actualizada fila {existing_row} para {spool.tag_spool}"
+                    )
+                else:
+                    response = ws.append_row(
+                        row_data, value_input_option="USER_ENTERED"
+                    )
+                    expected_row = index.last_row + 1
+                    landed_row = _row_from_append_response(response)
+                    if landed_row is not None and landed_row != expected_row:
+                        # La tab cambió por fuera: el append quedó bien, pero
+                        # el índice ya no describe la hoja.
+                        self._drop_lista_index(
+                            f"append aterrizó en fila {landed_row}, "
+                            f"esperada {expected_row}"
+                        )
+                    else:
+                        index.put(spool, expected_row)
+                    self._lista_written(index)
+                    self.logger.info(f"Lista: append nuevo TAG {spool.tag_spool}")
+            except gspread.exceptions.APIError as e:
+                self._drop_lista_index("error de escritura")
+                raise SheetsUpdateError(
+                    f"Error escribiendo Lista para {spool.tag_spool}",
+                    details=str(e),
                 )
-            else:
-                ws.append_row(row_data, value_input_option="USER_ENTERED")
-                self.logger.info(f"Lista: append nuevo TAG {spool.tag_spool}")
-        except gspread.exceptions.APIError as e:
-            raise SheetsUpdateError(
-                f"Error escribiendo Lista para {spool.tag_spool}",
-                details=str(e),
-            )
 
         return spool
 
@@ -186,24 +456,33 @@ class SupervisorRepository:
         """
         Borra la fila de un TAG_SPOOL en Lista. Idempotente.
 
+        La fila sale del índice (`_resolve_row`; si la tag no está, se
+        confirma su ausencia con la columna A); tras borrar, corre una fila
+        hacia arriba a todas las tags que estaban debajo en el índice.
+
         Returns:
             True si se borró una fila, False si la tag no existía.
         """
-        row_num = self.find_tracked_row(tag_spool)
-        if row_num is None:
-            self.logger.info(
-                f"Lista: remove no-op, TAG {tag_spool} no encontrado"
-            )
-            return False
-
+        clean_tag = tag_spool.strip()
         ws = self._get_ws(config.HOJA_AUDIT_LISTA_NOMBRE)
-        try:
-            ws.delete_rows(row_num)
-        except gspread.exceptions.APIError as e:
-            raise SheetsUpdateError(
-                f"Error borrando fila Lista para {tag_spool}",
-                details=str(e),
-            )
+        with self._lista_lock:
+            index, row_num = self._resolve_row(ws, clean_tag)
+            if row_num is None:
+                self.logger.info(
+                    f"Lista: remove no-op, TAG {tag_spool} no encontrado"
+                )
+                return False
+
+            try:
+                ws.delete_rows(row_num)
+            except gspread.exceptions.APIError as e:
+                self._drop_lista_index("error de escritura")
+                raise SheetsUpdateError(
+                    f"Error borrando fila Lista para {tag_spool}",
+                    details=str(e),
+                )
+            index.delete(clean_tag)
+            self._lista_written(index)
 
         self.logger.info(f"Lista: borrada fila {row_num} para {tag_spool}")
         return True
@@ -270,14 +549,60 @@ class SupervisorRepository:
         )
         return len(new_events)
 
-    @retry_on_sheets_error(max_retries=3, backoff_seconds=1.0)
-    def get_audit_events_since(self, since: datetime) -> list[AuditEvent]:
+    def _ingest_audit_rows(
+        self, index: _AuditIndex, rows: list[list[str]], first_row: int
+    ) -> None:
+        """Parsea filas de Audit (tolerante por fila) y las agrega al índice."""
+        for row_idx, row in enumerate(rows, start=first_row):
+            if not row or not row[0].strip():
+                continue
+            try:
+                index.add(AuditEvent.from_sheets_row(row))
+            except Exception as e:
+                self.logger.warning(
+                    f"Audit row {row_idx} no parsea: {e}"
+                )
+        if rows:
+            last = rows[-1]
+            index.anchor_id = last[0] if last else ""
+            index.rows_consumed = first_row - 1 + len(rows)
+
+    def _refresh_audit_index(self) -> _AuditIndex:
         """
-        Lee tab Audit y filtra eventos con timestamp >= since.
-        Tolera errores de parseo por fila.
+        Sincroniza el índice con la hoja leyendo solo la cola nueva.
+
+        Primera vez (o tras detectar que la cola se movió): get_all_values.
+        Después: un solo get_values desde la última fila consumida, que sirve
+        a la vez de ancla de validación y de lectura incremental.
+
+        Caller MUST hold _audit_lock.
         """
         ws = self._get_ws(config.HOJA_AUDIT_EVENTS_NOMBRE)
+        index = self._audit_indexes.setdefault(
+            config.GOOGLE_AUDIT_SHEET_ID, _AuditIndex()
+        )
+        last_col = _col_letter(
+            len(self.EXPECTED_HEADERS[config.HOJA_AUDIT_EVENTS_NOMBRE]) - 1
+        )
+
         try:
+            if index.rows_consumed > 0:
+                start = index.rows_consumed
+                tail = ws.get_values(f"A{start}:{last_col}")
+                first_cell = tail[0][0] if tail and tail[0] else None
+                if first_cell == index.anchor_id:
+                    self._ingest_audit_rows(index, tail[1:], first_row=start + 1)
+                    self.logger.debug(
+                        f"Audit: {len(tail) - 1} filas nuevas desde fila {start}"
+                    )
+                    return index
+
+                self.logger.warning(
+                    f"Audit: ancla en fila {start} cambió "
+                    f"({index.anchor_id!r} → {first_cell!r}); reconstruyendo índice"
+                )
+
+            index.reset()
             all_values = ws.get_all_values()
         except gspread.exceptions.APIError as e:
             raise SheetsConnectionError(
@@ -285,26 +610,66 @@ class SupervisorRepository:
                 details=str(e),
             )
 
-        if len(all_values) <= 1:
-            return []
+        if all_values:
+            index.rows_consumed = 1
+            index.anchor_id = all_values[0][0] if all_values[0] else ""
+            self._ingest_audit_rows(index, all_values[1:], first_row=2)
+        self.logger.info(
+            f"Audit: índice reconstruido ({len(index.events)} eventos, "
+            f"{index.rows_consumed} filas)"
+        )
+        return index
 
-        events: list[AuditEvent] = []
-        for row_idx, row in enumerate(all_values[1:], start=2):
-            if not row or not row[0].strip():
-                continue
-            try:
-                evt = AuditEvent.from_sheets_row(row)
-            except Exception as e:
-                self.logger.warning(
-                    f"Audit row {row_idx} no parsea: {e}"
-                )
-                continue
-            if evt.timestamp >= since:
-                events.append(evt)
+    def get_audit_events_since(self, since: datetime) -> list[AuditEvent]:
+        """
+        Eventos de Audit con timestamp >= since, ordenados por timestamp.
 
-        events.sort(key=lambda e: e.timestamp)
+        Lee solo las filas nuevas desde la última consulta y busca el corte
+        con bisect sobre el índice en memoria.
+        """
+        events, _ = self.get_audit_page(since)
         return events
 
+    @retry_on_sheets_error(max_retries=3, backoff_seconds=1.0)
+    def get_audit_page(
+        self,
+        since: datetime,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[AuditEvent], Optional[str]]:
+        """
+        Página de eventos de Audit con timestamp >= since.
+
+        Args:
+            since: Cota inferior de timestamp (inclusive).
+            limit: Máximo de eventos a devolver (None = todos).
+            cursor: Token devuelto por la página anterior; continúa
+                    estrictamente después del último evento entregado.
+
+        Returns:
+            (events, next_cursor) — next_cursor es None si no quedan eventos.
+
+        Raises:
+            ValueError: Si el cursor es inválido.
+        """
+        lower = (since, "")
+        inclusive = True
+        if cursor is not None:
+            after = decode_audit_cursor(cursor)
+            if after > lower:
+                lower, inclusive = after, False
+
+        with self._audit_lock:
+            index = self._refresh_audit_index()
+            page = index.slice_after(
+                lower, None if limit is None else limit + 1, inclusive
+            )
+
+        if limit is not None and len(page) > limit:
+            page = page[:limit]
+            return page, encode_audit_cursor(page[-1])
+        return page, None
+
     # ─── Snapshots_Legacy (append-only, dedup por snapshot_id) ───────────
 
     @retry_on_sheets_error(max_retries=3, backoff_seconds=1.0)
@@ -4,7 +4,6 @@ Repositorio para operaciones en la hoja Uniones (union-level tracking).
 v4.0: Union-level CRUD operations with dynamic column mapping.
 """
 import logging
-import re
 import uuid
 from typing import Optional, Literal
 from datetime import datetime, timedelta
@@ -12,6 +11,7 @@ from datetime import datetime, timedelta
 from backend.models.union import Union
 from backend.repositories.sheets_repository import SheetsRepository, retry_on_sheets_error
 from backend.core.column_map_cache import ColumnMapCache
+from backend.core.worker_ledger import WorkerLedger
 from backend.utils.cache import get_cache
 from backend.utils.date_formatter import now_chile, format_datetime_for_sheets
 from backend.utils.normalize import normalize_column_name as _normalize
@@ -84,6 +84,10 @@ class UnionRepository:
                 )
         return self._worksheet
 
+    def _ledger(self) -> WorkerLedger:
+        """Ledger (worker_id, fecha) derivado del snapshot de Uniones."""
+        return WorkerLedger.for_repository(self.sheets_repo)
+
     def get_by_ot(self, ot: str) -> list[Union]:
         """
         Query all unions for a given work order using OT as foreign key.
@@ -771,6 +775,7 @@ class UnionRepository:
             _execute_batch()
             ColumnMapCache.invalidate(self._sheet_name)
             get_cache().invalidate(f"worksheet:{self._sheet_name}")
+            self._ledger().invalidate()
 
             updated_count = len(union_id_to_row)
             self.logger.info(f"✅ batch_update_arm: {updated_count} unions updated for TAG_SPOOL {tag_spool}")
@@ -886,6 +891,7 @@ class UnionRepository:
             _execute_batch()
             ColumnMapCache.invalidate(self._sheet_name)
             get_cache().invalidate(f"worksheet:{self._sheet_name}")
+            self._ledger().invalidate()
 
             updated_count = len(union_id_to_row)
             self.logger.info(f"✅ batch_update_sold: {updated_count} unions updated for TAG_SPOOL {tag_spool}")
@@ -1143,6 +1149,18 @@ class UnionRepository:
             ColumnMapCache.invalidate(self._sheet_name)
             get_cache().invalidate(f"worksheet:{self._sheet_name}")
 
+            self._ledger().apply_row_updates(
+                all_rows,
+                {
+                    row_num: {
+                        arm_worker_col_idx: safe_worker,
+                        arm_fecha_inicio_col_idx: formatted_timestamp_inicio,
+                        arm_fecha_fin_col_idx: formatted_timestamp_fin,
+                    }
+                    for row_num in union_id_to_row.values()
+                },
+            )
+
             updated_count = len(union_id_to_row)
             self.logger.info(f"✅ batch_update_arm_full: {updated_count} unions updated for TAG_SPOOL {tag_spool} (INICIO={formatted_timestamp_inicio}, FIN={formatted_timestamp_fin})")
             return updated_count
@@ -1277,6 +1295,18 @@ class UnionRepository:
             ColumnMapCache.invalidate(self._sheet_name)
             get_cache().invalidate(f"worksheet:{self._sheet_name}")
 
+            self._ledger().apply_row_updates(
+                all_rows,
+                {
+                    row_num: {
+                        sol_worker_col_idx: safe_worker,
+                        sol_fecha_inicio_col_idx: formatted_timestamp_inicio,
+                        sol_fecha_fin_col_idx: formatted_timestamp_fin,
+                    }
+                    for row_num in union_id_to_row.values()
+                },
+            )
+
             updated_count = len(union_id_to_row)
             self.logger.info(f"✅ batch_update_sold_full: {updated_count} unions updated for TAG_SPOOL {tag_spool} (INICIO={formatted_timestamp_inicio}, FIN={formatted_timestamp_fin})")
             return updated_count
@@ -1433,6 +1463,7 @@ class UnionRepository:
             _execute_append()
             ColumnMapCache.invalidate(self._sheet_name)
             get_cache().invalidate(f"worksheet:{self._sheet_name}")
+            self._ledger().invalidate()
 
             self.logger.info(f"create_unions_batch: {len(rows_to_append)} unions created for {tag_spool}")
             return len(rows_to_append)
@@ -1514,6 +1545,7 @@ class UnionRepository:
                 _execute_batch()
                 ColumnMapCache.invalidate(self._sheet_name)
                 get_cache().invalidate(f"worksheet:{self._sheet_name}")
+                self._ledger().invalidate()
 
             self.logger.info(f"update_unions_batch: {updated} unions updated for {tag_spool}")
             return updated
@@ -1610,6 +1642,7 @@ class UnionRepository:
             if deleted_count > 0:
                 ColumnMapCache.invalidate(self._sheet_name)
                 get_cache().invalidate(f"worksheet:{self._sheet_name}")
+                self._ledger().invalidate()
 
             self.logger.info(f"delete_unions_without_work: {deleted_count} unions deleted for {tag_spool}")
             return deleted_count
@@ -1645,6 +1678,10 @@ class UnionRepository:
             worksheet.update(cell_address, [[total]], value_input_option='RAW')
 
             get_cache().invalidate(f"worksheet:{config.HOJA_OPERACIONES_NOMBRE}")
+            self.sheets_repo._sync_derived_views(
+                config.HOJA_OPERACIONES_NOMBRE,
+                [{"row": row_num, "column_name": "Total_Uniones", "value": total}]
+            )
             self.logger.info(f"update_total_uniones: {tag_spool} → {total}")
         except Exception as e:
             self.logger.error(f"Failed to update Total_Uniones for {tag_spool}: {e}", exc_info=True)
@@ -1699,194 +1736,20 @@ class UnionRepository:
 
         A single row can match TWICE if the same worker did both ARM and SOLD.
 
+        Served from WorkerLedger: the Uniones snapshot is indexed once by
+        (worker_id, fecha_fin) instead of being scanned on every request.
+
         Args:
             worker_id: Numeric worker ID to match (e.g. 93)
-            fecha: Optional date filter (DD-MM-YYYY) applied to fecha_fin
+            fecha: Optional date filter (DD-MM-YYYY) applied to fecha_fin.
+                   Unfinished work (empty fecha_fin) is included when set.
 
         Returns:
             list[dict]: Each dict has tag_spool, n_union, dn_union, tipo_union,
                         operacion, fecha_inicio, fecha_fin, arm_worker, sol_worker
         """
-        _WORKER_ID_PATTERN = re.compile(r"\((\d+)\)")
-
-        def extract_worker_id(raw) -> Optional[int]:
-            """Extract numeric ID from worker string like 'MR(93)'."""
-            if raw is None or raw == "":
-                return None
-            match = _WORKER_ID_PATTERN.search(str(raw))
-            return int(match.group(1)) if match else None
-
-        def extract_date_part(datetime_value) -> Optional[str]:
-            """
-            Extract DD-MM-YYYY from a string like 'DD-MM-YYYY HH:MM:SS' or
-            'DD-MM-YYYY', or convert an Excel serial date/datetime
-            (UNFORMATTED_VALUE) to its DD-MM-YYYY form.
-            """
-            if datetime_value is None or datetime_value == "":
-                return None
-            if isinstance(datetime_value, (int, float)) and not isinstance(datetime_value, bool):
-                try:
-                    d = (datetime(1899, 12, 30) + timedelta(days=float(datetime_value))).date()
-                    return d.strftime("%d-%m-%Y")
-                except (ValueError, OverflowError):
-                    return None
-            return str(datetime_value).strip().split(" ")[0]
-
         try:
-            all_rows = self.sheets_repo.read_worksheet(self._sheet_name)
-
-            if not all_rows or len(all_rows) < 2:
-                return []
-
-            column_map = ColumnMapCache.get_or_build(self._sheet_name, self.sheets_repo)
-
-            # Resolve all needed column indices dynamically
-            tag_col_idx = column_map.get(_normalize("TAG_SPOOL"))
-            n_union_col_idx = column_map.get(_normalize("N_UNION"))
-            dn_union_col_idx = column_map.get(_normalize("DN_UNION"))
-            tipo_union_col_idx = column_map.get(_normalize("TIPO_UNION"))
-            arm_worker_col_idx = column_map.get(_normalize("ARM_WORKER"))
-            sol_worker_col_idx = column_map.get(_normalize("SOL_WORKER"))
-            arm_inicio_col_idx = column_map.get(_normalize("ARM_FECHA_INICIO"))
-            arm_fin_col_idx = column_map.get(_normalize("ARM_FECHA_FIN"))
-            sol_inicio_col_idx = column_map.get(_normalize("SOL_FECHA_INICIO"))
-            sol_fin_col_idx = column_map.get(_normalize("SOL_FECHA_FIN"))
-
-            required = [tag_col_idx, n_union_col_idx, arm_worker_col_idx, sol_worker_col_idx]
-            if any(idx is None for idx in required):
-                raise ValueError(
-                    "Required columns (TAG_SPOOL, N_UNION, ARM_WORKER, SOL_WORKER) "
-                    "not found in Uniones sheet"
-                )
-
-            def get_val(row: list, idx: Optional[int]) -> str:
-                if idx is None or idx >= len(row):
-                    return ""
-                return str(row[idx]).strip() if row[idx] else ""
-
-            results = []
-
-            for row_data in all_rows[1:]:  # Skip header
-                if not row_data or len(row_data) <= tag_col_idx:
-                    continue
-
-                arm_worker_raw = get_val(row_data, arm_worker_col_idx)
-                sol_worker_raw = get_val(row_data, sol_worker_col_idx)
-
-                arm_id = extract_worker_id(arm_worker_raw)
-                sol_id = extract_worker_id(sol_worker_raw)
-
-                matched_arm = arm_id == worker_id
-                matched_sol = sol_id == worker_id
-
-                if not matched_arm and not matched_sol:
-                    continue
-
-                # Parse common fields
-                tag_spool = get_val(row_data, tag_col_idx)
-                try:
-                    n_union = int(get_val(row_data, n_union_col_idx))
-                except (ValueError, TypeError):
-                    self.logger.warning(f"Failed to parse N_UNION for worker {worker_id}")
-                    continue
-
-                dn_raw = get_val(row_data, dn_union_col_idx)
-                dn_union = float(dn_raw) if dn_raw else None
-                tipo_union = get_val(row_data, tipo_union_col_idx) or None
-
-                arm_inicio = get_val(row_data, arm_inicio_col_idx)
-                arm_fin = get_val(row_data, arm_fin_col_idx)
-                sol_inicio = get_val(row_data, sol_inicio_col_idx)
-                sol_fin = get_val(row_data, sol_fin_col_idx)
-
-                # Emit one record per matching operation
-                if matched_arm:
-                    fecha_fin_val = arm_fin
-                    if fecha and fecha_fin_val:
-                        date_part = extract_date_part(fecha_fin_val)
-                        if date_part != fecha:
-                            pass  # Skip: date doesn't match
-                        else:
-                            results.append({
-                                "tag_spool": tag_spool,
-                                "n_union": n_union,
-                                "dn_union": dn_union,
-                                "tipo_union": tipo_union,
-                                "operacion": "ARM",
-                                "fecha_inicio": arm_inicio or None,
-                                "fecha_fin": arm_fin or None,
-                                "arm_worker": arm_worker_raw or None,
-                                "sol_worker": sol_worker_raw or None,
-                            })
-                    elif not fecha:
-                        results.append({
-                            "tag_spool": tag_spool,
-                            "n_union": n_union,
-                            "dn_union": dn_union,
-                            "tipo_union": tipo_union,
-                            "operacion": "ARM",
-                            "fecha_inicio": arm_inicio or None,
-                            "fecha_fin": arm_fin or None,
-                            "arm_worker": arm_worker_raw or None,
-                            "sol_worker": sol_worker_raw or None,
-                        })
-                    elif fecha and not fecha_fin_val:
-                        # Unfinished work: include when date filter is active (active/in-progress work)
-                        results.append({
-                            "tag_spool": tag_spool,
-                            "n_union": n_union,
-                            "dn_union": dn_union,
-                            "tipo_union": tipo_union,
-                            "operacion": "ARM",
-                            "fecha_inicio": arm_inicio or None,
-                            "fecha_fin": None,
-                            "arm_worker": arm_worker_raw or None,
-                            "sol_worker": sol_worker_raw or None,
-                        })
-
-                if matched_sol:
-                    fecha_fin_val = sol_fin
-                    if fecha and fecha_fin_val:
-                        date_part = extract_date_part(fecha_fin_val)
-                        if date_part != fecha:
-                            pass  # Skip: date doesn't match
-                        else:
-                            results.append({
-                                "tag_spool": tag_spool,
-                                "n_union": n_union,
-                                "dn_union": dn_union,
-                                "tipo_union": tipo_union,
-                                "operacion": "SOLD",
-                                "fecha_inicio": sol_inicio or None,
-                                "fecha_fin": sol_fin or None,
-                                "arm_worker": arm_worker_raw or None,
-                                "sol_worker": sol_worker_raw or None,
-                            })
-                    elif not fecha:
-                        results.append({
-                            "tag_spool": tag_spool,
-                            "n_union": n_union,
-                            "dn_union": dn_union,
-                            "tipo_union": tipo_union,
-                            "operacion": "SOLD",
-                            "fecha_inicio": sol_inicio or None,
-                            "fecha_fin": sol_fin or None,
-                            "arm_worker": arm_worker_raw or None,
-                            "sol_worker": sol_worker_raw or None,
-                        })
-                    elif fecha and not fecha_fin_val:
-                        # Unfinished work: include when date filter is active (active/in-progress work)
-                        results.append({
-                            "tag_spool": tag_spool,
-                            "n_union": n_union,
-                            "dn_union": dn_union,
-                            "tipo_union": tipo_union,
-                            "operacion": "SOLD",
-                            "fecha_inicio": sol_inicio or None,
-                            "fecha_fin": None,
-                            "arm_worker": arm_worker_raw or None,
-                            "sol_worker": sol_worker_raw or None,
-                        })
+            results = self._ledger().get_records(worker_id, fecha)
 
             self.logger.info(
                 f"get_by_worker_id: Found {len(results)} records for worker {worker_id}"
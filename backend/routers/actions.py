@@ -8,6 +8,7 @@ v4.0 uses /api/v4/occupation/iniciar and /api/v4/occupation/finalizar instead.
 
 from fastapi import APIRouter, Depends, status
 from backend.core.dependency import get_reparacion_service, get_worker_service
+from backend.core.quota_governor import run_in_worker_loop
 from backend.services.reparacion_service import ReparacionService
 from backend.services.worker_service import WorkerService
 from backend.models.action import ReparacionRequest
@@ -23,7 +24,7 @@ router = APIRouter()
 # ============================================================================
 
 @router.post("/tomar-reparacion", response_model=dict, status_code=status.HTTP_200_OK)
-async def tomar_reparacion(
+def tomar_reparacion(
     request: ReparacionRequest,
     reparacion_service: ReparacionService = Depends(get_reparacion_service),
     worker_service: WorkerService = Depends(get_worker_service),
@@ -80,18 +81,18 @@ async def tomar_reparacion(
     if not worker:
         raise WorkerNoEncontradoError(str(request.worker_id))
 
-    result = await reparacion_service.tomar_reparacion(
+    result = run_in_worker_loop(reparacion_service.tomar_reparacion(
         tag_spool=request.tag_spool,
         worker_id=request.worker_id,
         worker_nombre=worker.nombre_completo,
-    )
+    ))
 
     logger.info(f"Reparacion tomada: {request.tag_spool} by {worker.nombre_completo}")
     return result
 
 
 @router.post("/pausar-reparacion", response_model=dict, status_code=status.HTTP_200_OK)
-async def pausar_reparacion(
+def pausar_reparacion(
     request: ReparacionRequest,
     reparacion_service: ReparacionService = Depends(get_reparacion_service)
 ):
@@ -131,17 +132,17 @@ async def pausar_reparacion(
     """
     logger.info(f"POST /api/pausar-reparacion - worker_id={request.worker_id}, tag_spool={request.tag_spool}")
 
-    result = await reparacion_service.pausar_reparacion(
+    result = run_in_worker_loop(reparacion_service.pausar_reparacion(
         tag_spool=request.tag_spool,
         worker_id=request.worker_id
-    )
+    ))
 
     logger.info(f"Reparacion pausada: {request.tag_spool}")
     return result
 
 
 @router.post("/completar-reparacion", response_model=dict, status_code=status.HTTP_200_OK)
-async def completar_reparacion(
+def completar_reparacion(
     request: ReparacionRequest,
     reparacion_service: ReparacionService = Depends(get_reparacion_service),
     worker_service: WorkerService = Depends(get_worker_service),
@@ -187,18 +188,18 @@ async def completar_reparacion(
     if not worker:
         raise WorkerNoEncontradoError(str(request.worker_id))
 
-    result = await reparacion_service.completar_reparacion(
+    result = run_in_worker_loop(reparacion_service.completar_reparacion(
         tag_spool=request.tag_spool,
         worker_id=request.worker_id,
         worker_nombre=worker.nombre_completo,
-    )
+    ))
 
     logger.info(f"Reparacion completada: {request.tag_spool} -> PENDIENTE_METROLOGIA")
     return result
 
 
 @router.post("/cancelar-reparacion", response_model=dict, status_code=status.HTTP_200_OK)
-async def cancelar_reparacion(
+def cancelar_reparacion(
     request: ReparacionRequest,
     reparacion_service: ReparacionService = Depends(get_reparacion_service)
 ):
@@ -236,10 +237,10 @@ async def cancelar_reparacion(
     """
     logger.info(f"POST /api/cancelar-reparacion - worker_id={request.worker_id}, tag_spool={request.tag_spool}")
 
-    result = await reparacion_service.cancelar_reparacion(
+    result = run_in_worker_loop(reparacion_service.cancelar_reparacion(
         tag_spool=request.tag_spool,
         worker_id=request.worker_id
-    )
+    ))
 
     logger.info(f"Reparacion cancelada: {request.tag_spool}")
     return result
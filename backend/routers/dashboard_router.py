@@ -8,13 +8,16 @@ v3.0 Phase 4: Dashboard visibility infrastructure.
 """
 
 import logging
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 from pydantic import BaseModel
 
 from backend.repositories.sheets_repository import SheetsRepository
 from backend.core.dependency import get_sheets_repository
+from backend.core.occupancy_view import OccupancyView
+from backend.core.quota_governor import QuotaPriority, sheets_priority
 from backend.config import config
+from backend.utils.etag import etag_matches, not_modified, set_etag, snapshot_etag
 
 logger = logging.getLogger(__name__)
 
@@ -46,19 +49,29 @@ class OccupiedSpoolResponse(BaseModel):
     - fecha_ocupacion: Date when occupation started (ISO format)
 
     Results sorted by fecha_ocupacion DESC (newest first).
-    """
+
+    Supports `If-None-Match`: returns 304 while the Operaciones snapshot
+    version is unchanged.
+    """,
+    # Polling del dashboard: no compite por cuota con las confirmaciones.
+    # `def` (threadpool): la espera por cuota no frena el event loop
+    dependencies=[Depends(sheets_priority(QuotaPriority.BACKGROUND))],
 )
-async def get_occupied_spools(
+def get_occupied_spools(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     sheets_repo: SheetsRepository = Depends(get_sheets_repository)
 ) -> List[OccupiedSpoolResponse]:
     """
     Get list of currently occupied spools.
 
-    Queries Operaciones sheet for spools where Ocupado_Por is not empty,
-    returning complete occupation details for dashboard display.
+    Served from OccupancyView (rows of Operaciones where Ocupado_Por is not
+    empty), returning complete occupation details for dashboard display.
 
     Args:
-        sheets_repo: SheetsRepository for reading Operaciones sheet
+        response: Response (for the ETag header)
+        if_none_match: ETag of the client's last response
+        sheets_repo: SheetsRepository backing the occupancy view
 
     Returns:
         List of OccupiedSpoolResponse with occupation details
@@ -69,66 +82,33 @@ async def get_occupied_spools(
     try:
         logger.info("Dashboard: Fetching occupied spools")
 
-        # Read Operaciones sheet (returns list[list] directly)
-        all_data = sheets_repo.read_worksheet(config.HOJA_OPERACIONES_NOMBRE)
-
-        if not all_data or len(all_data) < 2:
-            logger.warning("Dashboard: No data in Operaciones sheet")
-            return []
-
-        # First row is headers
-        headers = all_data[0]
-
-        # Build column index mapping
-        # v3.0 columns (Ocupado_Por, Fecha_Ocupacion, Estado_Detalle) may not exist in v2.1 schema
-        # Return empty list gracefully if columns missing (backwards compatibility)
-        try:
-            tag_spool_idx = headers.index("TAG_SPOOL")
-            ocupado_por_idx = headers.index("Ocupado_Por")
-            fecha_ocupacion_idx = headers.index("Fecha_Ocupacion")
-            estado_detalle_idx = headers.index("Estado_Detalle")
-        except ValueError as e:
-            # v3.0 columns don't exist yet (sheet still on v2.1 schema)
-            logger.warning(f"Dashboard: v3.0 columns not found (sheet may be v2.1 schema): {e}")
-            logger.info("Dashboard: Returning empty list (no occupied spools on v2.1 schema)")
-            return []
-
-        # Parse occupied spools (rows where Ocupado_Por is not empty)
-        occupied_spools = []
-
-        for row in all_data[1:]:  # Skip header row
-            # Check if row has enough columns
-            if len(row) <= max(tag_spool_idx, ocupado_por_idx, fecha_ocupacion_idx, estado_detalle_idx):
-                continue
-
-            ocupado_por = row[ocupado_por_idx].strip() if ocupado_por_idx < len(row) else ""
-
-            # Filter: only include occupied spools
-            if not ocupado_por:
-                continue
-
-            tag_spool = row[tag_spool_idx].strip() if tag_spool_idx < len(row) else ""
-            fecha_ocupacion = row[fecha_ocupacion_idx].strip() if fecha_ocupacion_idx < len(row) else ""
-            estado_detalle = row[estado_detalle_idx].strip() if estado_detalle_idx < len(row) else ""
-
-            # Skip if tag_spool is empty (invalid row)
-            if not tag_spool:
-                continue
-
-            occupied_spools.append(
-                OccupiedSpoolResponse(
-                    tag_spool=tag_spool,
-                    worker_nombre=ocupado_por,
-                    estado_detalle=estado_detalle if estado_detalle else "Ocupado",
-                    fecha_ocupacion=fecha_ocupacion if fecha_ocupacion else "N/A"
-                )
+        etag = snapshot_etag(
+            "dashboard/occupied",
+            sheets_repo.snapshot_version(config.HOJA_OPERACIONES_NOMBRE),
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        # Materialized view: built once per Operaciones snapshot and patched
+        # by occupation writes, so this is O(occupied) instead of O(sheet)
+        occupied = OccupancyView.for_repository(sheets_repo).occupied()
+
+        occupied_spools = [
+            OccupiedSpoolResponse(
+                tag_spool=entry.tag_spool,
+                worker_nombre=entry.ocupado_por,
+                estado_detalle=entry.estado_detalle if entry.estado_detalle else "Ocupado",
+                fecha_ocupacion=entry.fecha_ocupacion if entry.fecha_ocupacion else "N/A"
             )
+            for entry in occupied
+        ]
 
         # Sort by fecha_ocupacion DESC (newest first)
         # For simple sort, reverse list (assumes chronological insertion)
         occupied_spools.reverse()
 
         logger.info(f"Dashboard: Found {len(occupied_spools)} occupied spools")
+        set_etag(response, etag)
         return occupied_spools
 
     except HTTPException:
@@ -14,6 +14,8 @@ from fastapi import APIRouter, Depends, status
 from datetime import datetime
 
 from backend.core.dependency import get_sheets_repository
+from backend.core.quota_governor import get_quota_governor
+from backend.repositories.metadata_outbox import get_metadata_outbox
 from backend.repositories.sheets_repository import SheetsRepository
 from backend.config import config
 import logging
@@ -23,6 +25,13 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _metadata_outbox_status() -> dict:
+    outbox = get_metadata_outbox()
+    if outbox is None:
+        return {"enabled": False}
+    return {"enabled": True, "path": outbox.path, "pending": outbox.pending_count()}
+
+
 @router.get("/health", status_code=status.HTTP_200_OK)
 async def health_check(
     sheets_repo: SheetsRepository = Depends(get_sheets_repository)
@@ -122,6 +131,7 @@ async def diagnostic_check(
     - Lista de hojas disponibles en el spreadsheet
     - Si la hoja "Roles" existe
     - Cuántos roles hay en la hoja "Roles"
+    - Estado de la cuota de Sheets (tokens, cola y esperas del QuotaGovernor)
 
     Este endpoint es temporal y solo debe usarse para debugging.
     """
@@ -135,7 +145,9 @@ async def diagnostic_check(
             "operaciones": config.HOJA_OPERACIONES_NOMBRE,
             "trabajadores": config.HOJA_TRABAJADORES_NOMBRE,
             "metadata": config.HOJA_METADATA_NOMBRE,
-        }
+        },
+        "sheets_quota": get_quota_governor().snapshot(),
+        "metadata_outbox": _metadata_outbox_status(),
     }
 
     # Intentar listar hojas disponibles
@@ -12,6 +12,7 @@ from typing import Annotated
 from backend.services.history_service import HistoryService
 from backend.models.history import HistoryResponse
 from backend.core.dependency import get_history_service
+from backend.core.quota_governor import run_in_worker_loop
 from backend.exceptions import SpoolNoEncontradoError
 
 logger = logging.getLogger(__name__)
@@ -62,7 +63,7 @@ router = APIRouter()
         }
     }
 )
-async def get_occupation_history(
+def get_occupation_history(
     tag_spool: str,
     history_service: Annotated[HistoryService, Depends(get_history_service)]
 ) -> HistoryResponse:
@@ -82,7 +83,7 @@ async def get_occupation_history(
     logger.info(f"[HISTORY] GET /api/history/{tag_spool}")
 
     try:
-        history = await history_service.get_occupation_history(tag_spool)
+        history = run_in_worker_loop(history_service.get_occupation_history(tag_spool))
     except SpoolNoEncontradoError:
         raise HTTPException(
             status_code=404,
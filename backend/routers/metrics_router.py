@@ -0,0 +1,27 @@
+"""
+Metrics Router - Telemetría del hot path en formato Prometheus.
+
+Endpoints:
+- GET /api/metrics - Métricas de proceso (texto de exposición 0.0.4)
+
+Ver backend/core/metrics.py para la lista de métricas.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from backend.core.metrics import CONTENT_TYPE, get_metrics_registry
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    """
+    Métricas de la app para un scraper Prometheus.
+
+    Incluye latencia por ruta, llamadas a Sheets por operación/hoja, 429s,
+    reintentos, hits/misses de cache, rebuilds de ColumnMapCache, esperas
+    del QuotaGovernor y atraso del event loop.
+    """
+    return PlainTextResponse(get_metrics_registry().render(), media_type=CONTENT_TYPE)
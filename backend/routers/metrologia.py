@@ -10,6 +10,7 @@ Key endpoint:
 
 from fastapi import APIRouter, Depends, status
 from backend.core.dependency import get_metrologia_service, get_worker_service
+from backend.core.quota_governor import run_in_worker_loop
 from backend.services.metrologia_service import MetrologiaService
 from backend.services.worker_service import WorkerService
 from backend.models.metrologia import (
@@ -32,7 +33,7 @@ router = APIRouter()
 
 
 @router.post("/completar", response_model=CompletarMetrologiaResponse, status_code=status.HTTP_200_OK)
-async def completar_metrologia(
+def completar_metrologia(
     request: CompletarMetrologiaRequest,
     metrologia_service: MetrologiaService = Depends(get_metrologia_service),
     worker_service: WorkerService = Depends(get_worker_service)
@@ -125,12 +126,12 @@ async def completar_metrologia(
     # Delegate to MetrologiaService (orchestrator)
     # All validations performed in MetrologiaService
     # Exceptions propagate automatically to exception handler
-    result = await metrologia_service.completar(
+    result = run_in_worker_loop(metrologia_service.completar(
         tag_spool=request.tag_spool,
         worker_id=request.worker_id,
         worker_nombre=worker_nombre,
         resultado=request.resultado.value
-    )
+    ))
 
     # Build Estado_Detalle display string
     estado_builder = EstadoDetalleBuilder()
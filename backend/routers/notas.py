@@ -58,7 +58,7 @@ class NotaAppendResponse(BaseModel):
     response_model=NotaReadResponse,
     status_code=status.HTTP_200_OK,
 )
-async def get_notas(
+def get_notas(
     tag_spool: str,
     notas_service: NotasService = Depends(get_notas_service),
 ):
@@ -79,7 +79,7 @@ async def get_notas(
     response_model=NotaAppendResponse,
     status_code=status.HTTP_200_OK,
 )
-async def append_nota(
+def append_nota(
     tag_spool: str,
     request: NotaAppendRequest,
     notas_service: NotasService = Depends(get_notas_service),
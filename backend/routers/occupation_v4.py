@@ -33,6 +33,7 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException
 from typing import Annotated
 
+from backend.core.quota_governor import QuotaPriority, sheets_priority, run_in_worker_loop
 from backend.core.dependency import (
     get_occupation_service_v4,
     get_sheets_repository,
@@ -62,8 +63,12 @@ router = APIRouter(
 )
 
 
-@router.post("/iniciar", response_model=OccupationResponse)
-async def iniciar_v4(
+@router.post(
+    "/iniciar",
+    response_model=OccupationResponse,
+    dependencies=[Depends(sheets_priority(QuotaPriority.USER_WRITE))],
+)
+def iniciar_v4(
     request: IniciarRequest,
     occupation_service: Annotated[OccupationService, Depends(get_occupation_service_v4)],
     sheets_repo: Annotated[SheetsRepository, Depends(get_sheets_repository)]
@@ -161,7 +166,7 @@ async def iniciar_v4(
         # - Ocupado_Por + Fecha_Ocupacion + Estado_Detalle writes
         # - INICIAR_SPOOL metadata event logging
         # - Automatic retry on transient errors (3 attempts)
-        result = await occupation_service.iniciar_spool(request)
+        result = run_in_worker_loop(occupation_service.iniciar_spool(request))
 
         logger.info(
             f"✅ INICIAR successful: {tag_spool} occupied by {request.worker_nombre}"
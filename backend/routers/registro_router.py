@@ -31,7 +31,7 @@ router = APIRouter()
 
 
 @router.get("/registro/{worker_id}", response_model=RegistroResponse)
-async def get_registro(
+def get_registro(
     worker_id: int,
     fecha: Optional[str] = Query(
         None,
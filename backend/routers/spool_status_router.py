@@ -4,6 +4,8 @@ Spool Status Router — v5.0 single-page frontend endpoints.
 Provides:
   - GET  /api/spool/{tag}/status   — SpoolStatus for an individual spool
   - POST /api/spools/batch-status  — SpoolStatus for a list of spool tags
+  - GET  /api/spools/changes       — SpoolStatus of spools changed since a
+                                     snapshot version (delta-sync)
 
 Both endpoints compute operacion_actual, estado_trabajo, ciclo_rep from the
 Estado_Detalle string via parse_estado_detalle(). Reads use the cached
@@ -14,11 +16,13 @@ Reference:
 - Research: 00-RESEARCH.md Pattern 1
 """
 import logging
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 
+from backend.core.change_feed import SpoolChangeFeed
 from backend.core.dependency import get_sheets_repository, get_worker_service
+from backend.core.quota_governor import QuotaPriority, sheets_priority
 from backend.repositories.sheets_repository import SheetsRepository
 from backend.services.worker_service import WorkerService
 from backend.models.spool_status import (
@@ -26,14 +30,59 @@ from backend.models.spool_status import (
     BatchStatusRequest,
     BatchStatusResponse,
     BatchStatusError,
+    SpoolChangesResponse,
 )
 from backend.exceptions import SheetsConnectionError, SpoolDataCorruptError
+from backend.utils.etag import etag_matches, not_modified, set_etag, snapshot_etag
+from backend.config import config
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+def _resolve_statuses(
+    sheets_repo: SheetsRepository,
+    tags: list[str],
+    workers_map: dict[int, str],
+) -> tuple[list[SpoolStatus], list[BatchStatusError], list[str]]:
+    """
+    SpoolStatus por tag, errores por tag y tags inexistentes.
+
+    B-001/B-002: a tag that exists in the sheet but fails to parse is
+    surfaced as a per-tag SPOOL_DATA_CORRUPT error so the frontend can
+    show a toast instead of silently dropping the card from the list
+    (which used to look like "el spool desapareció").
+    """
+    results: list[SpoolStatus] = []
+    errors: list[BatchStatusError] = []
+    missing: list[str] = []
+    for tag in tags:
+        try:
+            spool = sheets_repo.get_spool_by_tag(tag)
+        except SpoolDataCorruptError as e:
+            logger.warning(
+                f"spool-status: SPOOL_DATA_CORRUPT for {tag!r}: "
+                f"{e.data.get('validation_detail')}"
+            )
+            errors.append(
+                BatchStatusError(
+                    tag_spool=tag,
+                    error_code="SPOOL_DATA_CORRUPT",
+                    message=(
+                        f"El spool '{tag}' tiene datos malformados. "
+                        f"Contacta soporte."
+                    ),
+                )
+            )
+            continue
+        if spool is None:
+            missing.append(tag)
+        else:
+            results.append(SpoolStatus.from_spool(spool, workers=workers_map))
+    return results, errors, missing
+
+
 @router.get(
     "/spool/{tag}/status",
     response_model=SpoolStatus,
@@ -45,7 +94,7 @@ router = APIRouter()
     ),
     tags=["spool-status"],
 )
-async def get_spool_status(
+def get_spool_status(
     tag: str,
     sheets_repo: Annotated[SheetsRepository, Depends(get_sheets_repository)],
     worker_service: Annotated[WorkerService, Depends(get_worker_service)],
@@ -120,63 +169,60 @@ async def get_spool_status(
     description=(
         "Accepts a list of spool tags (1–100) and returns SpoolStatus for each "
         "found spool. Tags not found are silently omitted. "
-        "Cache-efficient: all tag lookups share the same 60 s SheetsRepository cache."
+        "Cache-efficient: all tag lookups share the same 60 s SheetsRepository cache. "
+        "Supports If-None-Match: returns 304 while the tags, the Operaciones "
+        "snapshot and the worker list are unchanged."
     ),
     tags=["spool-status"],
+    # Polling de las tablets: no compite por cuota con las confirmaciones.
+    # `def` (threadpool): la espera por cuota no frena el event loop
+    dependencies=[Depends(sheets_priority(QuotaPriority.BACKGROUND))],
 )
-async def batch_spool_status(
+def batch_spool_status(
     request: BatchStatusRequest,
+    response: Response,
     sheets_repo: Annotated[SheetsRepository, Depends(get_sheets_repository)],
     worker_service: Annotated[WorkerService, Depends(get_worker_service)],
+    if_none_match: Annotated[Optional[str], Header()] = None,
 ) -> BatchStatusResponse:
     """
     Fetch multiple spools by tag and return their computed SpoolStatus objects.
 
+    This POST is a read (the body only carries the tag list), so it honours
+    If-None-Match like the GET endpoints: the ETag covers the requested
+    tags plus the Operaciones and worker-list versions.
+
     Args:
         request: BatchStatusRequest with tags list (1-100 tags).
+        response: Response (for the ETag header).
         sheets_repo: Injected SheetsRepository (singleton, cached).
         worker_service: Injected WorkerService for resolving worker names.
+        if_none_match: ETag of the client's last response for these tags.
 
     Returns:
         BatchStatusResponse with found spools and total count.
     """
     try:
+        etag = snapshot_etag(
+            "spools/batch-status",
+            sheets_repo.snapshot_version(config.HOJA_OPERACIONES_NOMBRE),
+            worker_service.list_version(),
+            *request.tags,
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
         # Build workers lookup once for all spools: {id: "Nombre Apellido"}
         all_workers = worker_service.get_all_active_workers()
         workers_map = {w.id: f"{w.nombre} {w.apellido}" for w in all_workers}
 
-        results: list[SpoolStatus] = []
-        errors: list[BatchStatusError] = []
-        for tag in request.tags:
-            try:
-                spool = sheets_repo.get_spool_by_tag(tag)
-            except SpoolDataCorruptError as e:
-                # B-001/B-002: surface per-tag corruption so the frontend
-                # can show a toast instead of silently dropping the card
-                # from the list (which used to look like "el spool
-                # desapareció").
-                logger.warning(
-                    f"batch-status: SPOOL_DATA_CORRUPT for {tag!r}: "
-                    f"{e.data.get('validation_detail')}"
-                )
-                errors.append(
-                    BatchStatusError(
-                        tag_spool=tag,
-                        error_code="SPOOL_DATA_CORRUPT",
-                        message=(
-                            f"El spool '{tag}' tiene datos malformados. "
-                            f"Contacta soporte."
-                        ),
-                    )
-                )
-                continue
-            if spool is not None:
-                results.append(SpoolStatus.from_spool(spool, workers=workers_map))
+        results, errors, _ = _resolve_statuses(sheets_repo, request.tags, workers_map)
 
         logger.debug(
             f"batch-status: requested={len(request.tags)} "
             f"found={len(results)} errors={len(errors)}"
         )
+        set_etag(response, etag)
         return BatchStatusResponse(
             spools=results, total=len(results), errors=errors
         )
@@ -193,3 +239,85 @@ async def batch_spool_status(
             status_code=503,
             detail={"error": "SERVICE_ERROR", "message": "Error al obtener estado de spools. Intenta nuevamente."},
         )
+
+
+@router.get(
+    "/spools/changes",
+    response_model=SpoolChangesResponse,
+    summary="Spools changed since a snapshot version",
+    description=(
+        "Delta-sync for polling clients: returns SpoolStatus for the spools "
+        "whose Operaciones rows changed since `since`, plus tombstones for "
+        "removed tags. Returns `full_resync=true` when `since`/`epoch` can no "
+        "longer be answered from the server's change buffer."
+    ),
+    tags=["spool-status"],
+    # `def` (threadpool): la espera por cuota no frena el event loop
+    dependencies=[Depends(sheets_priority(QuotaPriority.BACKGROUND))],
+)
+def get_spool_changes(
+    sheets_repo: Annotated[SheetsRepository, Depends(get_sheets_repository)],
+    worker_service: Annotated[WorkerService, Depends(get_worker_service)],
+    since: Annotated[Optional[int], Query(ge=0, description="`version` de la última respuesta")] = None,
+    epoch: Annotated[Optional[str], Query(description="`epoch` de la última respuesta")] = None,
+) -> SpoolChangesResponse:
+    """
+    Spools changed since the client's snapshot version.
+
+    Backed by SpoolChangeFeed (backend/core/change_feed.py), a bounded ring
+    buffer of per-row Operaciones diffs. `epoch` changes when the server
+    process restarts or the worker list changes (display names in
+    SpoolStatus), so a cursor from either is answered with a full resync.
+    Without `since` the endpoint only hands out the current cursor.
+
+    Args:
+        sheets_repo: Injected SheetsRepository (singleton, cached).
+        worker_service: Injected WorkerService for resolving worker names.
+        since: `version` of the client's previous response.
+        epoch: `epoch` of the client's previous response.
+
+    Returns:
+        SpoolChangesResponse with the current cursor and the delta.
+    """
+    try:
+        feed = SpoolChangeFeed.for_repository(sheets_repo)
+        # Lee Operaciones si el cache expiró: el diff entra al feed antes de consultar
+        version = sheets_repo.snapshot_version(config.HOJA_OPERACIONES_NOMBRE)
+        current_epoch = f"{feed.epoch}.{worker_service.list_version()}"
+
+        tags = None
+        if since is not None and epoch == current_epoch:
+            tags = feed.changes_since(since, version)
+        if tags is None or len(tags) > config.SPOOL_CHANGES_MAX_SPOOLS:
+            return SpoolChangesResponse(version=version, epoch=current_epoch, full_resync=True)
+        if not tags:
+            return SpoolChangesResponse(version=version, epoch=current_epoch)
+
+        all_workers = worker_service.get_all_active_workers()
+        workers_map = {w.id: f"{w.nombre} {w.apellido}" for w in all_workers}
+        results, errors, removed = _resolve_statuses(sheets_repo, sorted(tags), workers_map)
+
+        logger.debug(
+            f"spools/changes: since={since} version={version} "
+            f"changed={len(results)} removed={len(removed)} errors={len(errors)}"
+        )
+        return SpoolChangesResponse(
+            version=version,
+            epoch=current_epoch,
+            spools=results,
+            removed=removed,
+            errors=errors,
+        )
+
+    except SheetsConnectionError:
+        logger.error("Sheets connection error in get_spool_changes", exc_info=True)
+        raise HTTPException(
+            status_code=503,
+            detail={"error": "SERVICE_ERROR", "message": "Error al obtener cambios de spools. Intenta nuevamente."},
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error in get_spool_changes: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=503,
+            detail={"error": "SERVICE_ERROR", "message": "Error al obtener cambios de spools. Intenta nuevamente."},
+        )
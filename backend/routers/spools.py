@@ -10,7 +10,9 @@ Endpoints:
 - GET /api/spools/reparacion - Spools RECHAZADO/BLOQUEADO para reparación
 """
 
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Query, HTTPException, Response, status
 
 from backend.core.dependency import get_spool_service_v2, get_sheets_repository
 from backend.services.spool_service_v2 import SpoolServiceV2
@@ -19,6 +21,9 @@ from backend.repositories.sheets_repository import SheetsRepository
 from backend.models.spool import SpoolListResponse
 from backend.models.enums import ActionType
 from backend.exceptions import SheetsConnectionError
+from backend.utils.etag import etag_matches, not_modified, set_etag, snapshot_etag
+from backend.utils.response_cache import cached_json_response, get_response_cache
+from backend.config import config
 import logging
 
 logger = logging.getLogger(__name__)
@@ -32,8 +37,9 @@ def get_cycle_counter_service() -> CycleCounterService:
 
 
 @router.get("/spools/iniciar", response_model=SpoolListResponse, status_code=status.HTTP_200_OK)
-async def get_spools_para_iniciar(
+def get_spools_para_iniciar(
     operacion: str = Query(..., description="Tipo de operación (ARM, SOLD, METROLOGIA o REPARACION)"),
+    if_none_match: Optional[str] = Header(None),
     spool_service_v2: SpoolServiceV2 = Depends(get_spool_service_v2)
 ):
     """
@@ -57,9 +63,15 @@ async def get_spools_para_iniciar(
     - Filtros configurables centralizados (FilterRegistry)
     - Resistente a cambios de estructura en spreadsheet
 
+    ETag: derivado de la versión del snapshot de Operaciones; con
+    `If-None-Match` vigente responde 304 sin recalcular ni serializar.
+    El body JSON se cachea por ETag (ver backend/utils/response_cache.py):
+    requests repetidos dentro del mismo snapshot no re-serializan.
+
     Args:
         operacion: Tipo de operación a iniciar ("ARM", "SOLD", "METROLOGIA" o "REPARACION").
                    Query param obligatorio.
+        if_none_match: ETag de la última respuesta recibida por el cliente.
         spool_service_v2: Servicio de spools V2 (inyectado automáticamente).
 
     Returns:
@@ -106,6 +118,17 @@ async def get_spools_para_iniciar(
 
     # Obtener spools elegibles para iniciar usando V2
     try:
+        etag = snapshot_etag(
+            "spools/iniciar",
+            action_type.value,
+            spool_service_v2.sheets_repository.snapshot_version(config.HOJA_OPERACIONES_NOMBRE),
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        cached = get_response_cache().get(etag)
+        if cached is not None:
+            return cached_json_response(cached, etag)
+
         if action_type == ActionType.ARM:
             spools = spool_service_v2.get_spools_disponibles_para_iniciar_arm()
             filtro = "ARM - Fecha_Materiales llena Y Armador vacío"
@@ -138,18 +161,21 @@ async def get_spools_para_iniciar(
 
     logger.info(f"Found {len(spools)} spools eligible to start {operacion}")
 
-    # Construir response
-    return SpoolListResponse(
+    # Construir response (serializada una vez por snapshot)
+    cached = get_response_cache().put(etag, SpoolListResponse(
         spools=spools,
         total=len(spools),
         filtro_aplicado=filtro
-    )
+    ))
+    return cached_json_response(cached, etag)
 
 
 @router.get("/spools/ocupados", response_model=SpoolListResponse, status_code=status.HTTP_200_OK)
-async def get_spools_ocupados(
+def get_spools_ocupados(
+    response: Response,
     operacion: str = Query(..., description="Tipo de operación (ARM, SOLD, REPARACION)"),
     worker_id: int = Query(..., description="ID del trabajador"),
+    if_none_match: Optional[str] = Header(None),
     spool_service_v2: SpoolServiceV2 = Depends(get_spool_service_v2)
 ):
     """
@@ -164,11 +190,16 @@ async def get_spools_ocupados(
     - v3.0: Spools ocupados con TOMAR (PAUSAR/COMPLETAR workflow)
     - v4.0: Spools ocupados con INICIAR (FINALIZAR workflow)
 
+    ETag: derivado de la versión del snapshot de Operaciones (304 con
+    `If-None-Match` vigente).
+
     Args:
+        response: Response (para el header ETag).
         operacion: Tipo de operación ("ARM", "SOLD", o "REPARACION").
                    Query param obligatorio (usado para logging).
         worker_id: ID numérico del trabajador.
                    Query param obligatorio.
+        if_none_match: ETag de la última respuesta recibida por el cliente.
         spool_service_v2: Servicio de spools V2 (inyectado automáticamente).
 
     Returns:
@@ -214,6 +245,15 @@ async def get_spools_ocupados(
 
     # Obtener spools ocupados por el trabajador (método unificado)
     try:
+        etag = snapshot_etag(
+            "spools/ocupados",
+            operacion_upper,
+            worker_id,
+            spool_service_v2.sheets_repository.snapshot_version(config.HOJA_OPERACIONES_NOMBRE),
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
         spools = spool_service_v2.get_spools_ocupados_por_worker(worker_id, operacion_upper)
     except SheetsConnectionError:
         logger.error(f"Sheets connection error fetching occupied spools for worker {worker_id}", exc_info=True)
@@ -232,6 +272,8 @@ async def get_spools_ocupados(
 
     logger.info(f"Found {len(spools)} occupied spools for {operacion_upper} by worker_id={worker_id}")
 
+    set_etag(response, etag)
+
     # Construir response
     return SpoolListResponse(
         spools=spools,
@@ -241,7 +283,7 @@ async def get_spools_ocupados(
 
 
 @router.get("/spools/reparacion", response_model=dict, status_code=status.HTTP_200_OK)
-async def get_spools_reparacion(
+def get_spools_reparacion(
     sheets_repo: SheetsRepository = Depends(get_sheets_repository),
     cycle_counter: CycleCounterService = Depends(get_cycle_counter_service)
 ):
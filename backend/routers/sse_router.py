@@ -0,0 +1,104 @@
+"""
+SSE Router - Real-time stream of occupation and status changes.
+
+Provides GET /api/sse/stream, fed by the in-process EventBus. Write services
+(occupation, metrología, reparación, notas) publish one event per successful
+Sheets write, so clients no longer need to re-poll the dashboard or
+/api/spools/batch-status to see changes.
+
+Wire format (text/event-stream):
+    id: 42
+    event: INICIAR
+    data: {"id": 42, "type": "INICIAR", "tag_spool": "MK-123", ...}
+
+Clients reconnecting with the standard `Last-Event-ID` header receive the
+events they missed while they are still in the bus history. When they are
+not (history overflowed, or the id comes from a previous process) the
+stream starts with a single `RESYNC` event and the client must refetch.
+
+The EventBus is per-process, so this router is only mounted when uvicorn
+runs a single worker (config.WEB_CONCURRENCY <= 1); with more workers the
+endpoint returns 404 and clients rely on polling.
+"""
+import json
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Header, Request
+from fastapi.responses import StreamingResponse
+
+from backend.core.event_bus import BusEvent, SubscriptionClosed, get_event_bus
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Keep-alive comment interval; proxies (Railway) cut idle connections
+HEARTBEAT_SECONDS = 15.0
+
+# Reconnect delay suggested to EventSource clients (ms)
+RETRY_MS = 3000
+
+
+def format_sse(event: BusEvent) -> str:
+    """Serialize a bus event as one SSE message."""
+    data = json.dumps(event.to_payload(), ensure_ascii=False, default=str)
+    return f"id: {event.id}\nevent: {event.type}\ndata: {data}\n\n"
+
+
+def _parse_last_event_id(raw: Optional[str]) -> Optional[int]:
+    if not raw:
+        return None
+    try:
+        return int(raw)
+    except ValueError:
+        return None
+
+
+@router.get(
+    "/api/sse/stream",
+    summary="Stream occupation and status changes (SSE)",
+    response_class=StreamingResponse,
+)
+async def sse_stream(
+    request: Request,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    """
+    Open a Server-Sent Events stream of spool changes.
+
+    Args:
+        request: Incoming request (used to detect client disconnects)
+        last_event_id: Standard EventSource reconnect header
+
+    Returns:
+        StreamingResponse with media type text/event-stream
+    """
+    subscription = get_event_bus().subscribe(_parse_last_event_id(last_event_id))
+    logger.info(f"SSE: client connected ({get_event_bus().subscriber_count} subscribers)")
+
+    async def event_source():
+        try:
+            yield f"retry: {RETRY_MS}\n\n"
+            while True:
+                if await request.is_disconnected():
+                    break
+                event = await subscription.get(timeout=HEARTBEAT_SECONDS)
+                if event is None:
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_sse(event)
+        except SubscriptionClosed:
+            logger.warning("SSE: subscription closed by backpressure, client will reconnect")
+        finally:
+            subscription.close()
+            logger.info(f"SSE: client disconnected ({get_event_bus().subscriber_count} subscribers)")
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -6,7 +6,8 @@ Endpoints (montados con prefix /api/supervisor):
 - POST /list/add          — agrega un TAG_SPOOL a la lista (upsert idempotente)
 - POST /list/remove       — quita un TAG_SPOOL de la lista
 - POST /audit/batch       — append batched UI events (max 100/request)
-- GET  /audit?since=ISO   — read audit events desde un timestamp (debug)
+- GET  /audit?since=ISO   — read audit events desde un timestamp (paginable
+                            con limit + cursor)
 - POST /legacy-snapshot   — Capa 0: dump verbatim de localStorage durante migración
 
 Single-user (Matías). No auth — mismo threat model que el resto de ZEUES.
@@ -20,6 +21,7 @@ Errores:
 """
 import logging
 from datetime import datetime
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
@@ -69,6 +71,7 @@ class AuditBatchResponse(BaseModel):
 
 class AuditListResponse(BaseModel):
     events: list[AuditEvent]
+    next_cursor: Optional[str] = None  # None → no hay más páginas
 
 
 class LegacySnapshotResponse(BaseModel):
@@ -80,7 +83,7 @@ class LegacySnapshotResponse(BaseModel):
 
 
 @router.get("/list", response_model=TrackedSpoolListResponse)
-async def get_list(
+def get_list(
     svc: SupervisorService = Depends(get_supervisor_service),
 ):
     """Lista actual de spools que Matías está siguiendo."""
@@ -89,7 +92,7 @@ async def get_list(
 
 
 @router.post("/list/add", response_model=ListMutateResponse)
-async def add_to_list(
+def add_to_list(
     req: ListAddRequest,
     svc: SupervisorService = Depends(get_supervisor_service),
 ):
@@ -111,7 +114,7 @@ async def add_to_list(
 
 
 @router.post("/list/remove", response_model=ListRemoveResponse)
-async def remove_from_list(
+def remove_from_list(
     req: ListRemoveRequest,
     svc: SupervisorService = Depends(get_supervisor_service),
 ):
@@ -133,7 +136,7 @@ async def remove_from_list(
 
 
 @router.post("/audit/batch", response_model=AuditBatchResponse)
-async def audit_batch(
+def audit_batch(
     batch: AuditEventBatch,
     svc: SupervisorService = Depends(get_supervisor_service),
 ):
@@ -151,21 +154,46 @@ async def audit_batch(
 
 
 @router.get("/audit", response_model=AuditListResponse)
-async def get_audit(
+def get_audit(
     since: datetime = Query(
         ...,
         description="ISO 8601 timestamp; devuelve eventos con timestamp >= since",
     ),
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        le=1000,
+        description="Máximo de eventos por página; sin limit devuelve todos",
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description="next_cursor de la página anterior",
+    ),
     svc: SupervisorService = Depends(get_supervisor_service),
 ):
-    """Endpoint de debug — lee eventos desde un timestamp dado."""
-    logger.info(f"GET /api/supervisor/audit since={since.isoformat()}")
-    events = svc.get_audit_since(since)
-    return AuditListResponse(events=events)
+    """
+    Lee eventos desde un timestamp dado, ordenados por timestamp.
+
+    Con `limit` (y luego `cursor`) pagina: la respuesta trae `next_cursor`
+    mientras queden eventos.
+    """
+    logger.info(
+        f"GET /api/supervisor/audit since={since.isoformat()} "
+        f"limit={limit} cursor={'yes' if cursor else 'no'}"
+    )
+    if limit is None and cursor is None:
+        events = svc.get_audit_since(since)
+        return AuditListResponse(events=events)
+
+    try:
+        events, next_cursor = svc.get_audit_page(since, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return AuditListResponse(events=events, next_cursor=next_cursor)
 
 
 @router.post("/legacy-snapshot", response_model=LegacySnapshotResponse)
-async def legacy_snapshot(
+def legacy_snapshot(
     snapshot: LegacySnapshot,
     svc: SupervisorService = Depends(get_supervisor_service),
 ):
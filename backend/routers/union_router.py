@@ -28,6 +28,7 @@ from backend.repositories.union_repository import UnionRepository
 from backend.repositories.sheets_repository import SheetsRepository
 from backend.services.occupation_service import OccupationService
 from backend.services.worker_service import WorkerService
+from backend.core.quota_governor import QuotaPriority, sheets_priority, run_in_worker_loop
 from backend.core.dependency import (
     get_union_repository,
     get_sheets_repository,
@@ -43,7 +44,7 @@ router = APIRouter()
 
 
 @router.get("/uniones/{tag}/disponibles", response_model=DisponiblesResponse)
-async def get_disponibles(
+def get_disponibles(
     tag: str,
     operacion: str = Query(..., pattern="^(ARM|SOLD)$"),
     union_repo: UnionRepository = Depends(get_union_repository),
@@ -130,7 +131,7 @@ async def get_disponibles(
 
 
 @router.get("/uniones/{tag}/metricas", response_model=MetricasResponse)
-async def get_metricas(
+def get_metricas(
     tag: str,
     union_repo: UnionRepository = Depends(get_union_repository),
     sheets_repo: SheetsRepository = Depends(get_sheets_repository)
@@ -214,8 +215,12 @@ async def get_metricas(
         )
 
 
-@router.post("/occupation/finalizar", response_model=FinalizarResponseV4)
-async def finalizar_v4(
+@router.post(
+    "/occupation/finalizar",
+    response_model=FinalizarResponseV4,
+    dependencies=[Depends(sheets_priority(QuotaPriority.USER_WRITE))],
+)
+def finalizar_v4(
     request: FinalizarRequestV4,
     sheets_repo: SheetsRepository = Depends(get_sheets_repository),
     worker_service: WorkerService = Depends(get_worker_service),
@@ -353,7 +358,7 @@ async def finalizar_v4(
         # - Metadata event logging (UNION_ARM_REGISTRADA / UNION_SOLD_REGISTRADA)
         # - Metrología auto-trigger (if all work complete)
         # - Automatic retry on transient errors (3 attempts)
-        result = await occupation_service.finalizar_spool(finalizar_request)
+        result = run_in_worker_loop(occupation_service.finalizar_spool(finalizar_request))
 
         # Extract metrics from result
         action = result.action_taken or "UNKNOWN"
@@ -478,7 +483,7 @@ async def finalizar_v4(
 
 
 @router.get("/uniones/{tag}/todas", response_model=GetAllUnionsResponse)
-async def get_todas_uniones(
+def get_todas_uniones(
     tag: str,
     union_repo: UnionRepository = Depends(get_union_repository),
 ):
@@ -524,7 +529,7 @@ async def get_todas_uniones(
 
 
 @router.post("/uniones/guardar", response_model=SaveUnionsResponse)
-async def guardar_uniones(
+def guardar_uniones(
     request: SaveUnionsRequest,
     union_repo: UnionRepository = Depends(get_union_repository),
     sheets_repo: SheetsRepository = Depends(get_sheets_repository),
@@ -8,11 +8,15 @@ Endpoints:
 - GET /api/workers - Lista trabajadores activos
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
 
 from backend.core.dependency import get_worker_service
 from backend.services.worker_service import WorkerService
 from backend.models.worker import WorkerListResponse
+from backend.utils.etag import etag_matches, not_modified, snapshot_etag
+from backend.utils.response_cache import cached_json_response, get_response_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -21,7 +25,8 @@ router = APIRouter()
 
 
 @router.get("/workers", response_model=WorkerListResponse, status_code=status.HTTP_200_OK)
-async def get_workers(
+def get_workers(
+    if_none_match: Optional[str] = Header(None),
     worker_service: WorkerService = Depends(get_worker_service)
 ):
     """
@@ -34,7 +39,12 @@ async def get_workers(
     El filtrado de trabajadores activos se realiza en WorkerService, no en
     el router. Esto mantiene la separación de responsabilidades.
 
+    ETag: derivado de la versión de la lista de trabajadores cacheada; con
+    `If-None-Match` vigente responde 304 sin body. El body JSON se cachea
+    por ETag, así requests repetidos no re-serializan la lista.
+
     Args:
+        if_none_match: ETag de la última respuesta recibida por el cliente.
         worker_service: Servicio de trabajadores (inyectado automáticamente).
 
     Returns:
@@ -88,6 +98,13 @@ async def get_workers(
 
     # Obtener trabajadores activos del servicio
     try:
+        etag = snapshot_etag("workers", worker_service.list_version())
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        cached = get_response_cache().get(etag)
+        if cached is not None:
+            return cached_json_response(cached, etag)
+
         workers = worker_service.get_all_active_workers()
     except Exception as e:
         logger.error(f"Error loading workers: {e}", exc_info=True)
@@ -98,8 +115,9 @@ async def get_workers(
 
     logger.info(f"Found {len(workers)} active workers")
 
-    # Construir response
-    return WorkerListResponse(
+    # Construir response (serializada una vez por versión de la lista)
+    cached = get_response_cache().put(etag, WorkerListResponse(
         workers=workers,
         total=len(workers)
-    )
+    ))
+    return cached_json_response(cached, etag)
@@ -12,6 +12,7 @@ import asyncio
 import time
 from typing import Optional, Dict
 
+from backend.core.sheets_instrumentation import record_sheets_retry
 from backend.models.conflict import RetryConfig
 from backend.exceptions import SheetsUpdateError
 from backend.repositories.sheets_repository import SheetsRepository
@@ -122,6 +123,7 @@ class ConflictService:
                     f"Transient error on {tag_spool} (attempt {attempt + 1}/{config.max_attempts}). "
                     f"Retrying in {delay:.2f}s..."
                 )
+                record_sheets_retry()
                 await asyncio.sleep(delay)
 
         # Should not reach here
@@ -8,16 +8,25 @@ Phase 6 feature:
 - Detects when a BLOQUEADO spool is manually changed to RECHAZADO
 - Logs SUPERVISOR_OVERRIDE event to audit trail
 - Called during spool fetch operations to maintain audit trail
+- Batch checks read Operaciones and Metadata once and log all overrides
+  in one append (check_spools_for_overrides)
 """
 
 import logging
 import json
+import uuid
 from typing import Optional
 
-from backend.utils.date_formatter import format_datetime_for_sheets, now_chile, today_chile
+from backend.utils.date_formatter import (
+    format_date_for_sheets,
+    format_datetime_for_sheets,
+    now_chile,
+    today_chile,
+)
 from backend.repositories.sheets_repository import SheetsRepository
 from backend.repositories.metadata_repository import MetadataRepository
 from backend.models.enums import EventoTipo
+from backend.models.metadata import Accion, MetadataEvent
 
 logger = logging.getLogger(__name__)
 
@@ -101,13 +110,7 @@ class EstadoDetalleService:
                 return None
 
             # Step 3: Check for BLOQUEADO → RECHAZADO transition
-            is_override = (
-                "BLOQUEADO" in last_estado and
-                "RECHAZADO" in current_estado and
-                "BLOQUEADO" not in current_estado
-            )
-
-            if not is_override:
+            if not self._is_override(last_estado, current_estado):
                 # Normal transition, no override detected
                 return None
 
@@ -115,12 +118,7 @@ class EstadoDetalleService:
 
             # Step 4: Log SUPERVISOR_OVERRIDE event
             try:
-                metadata_json = json.dumps({
-                    "previous_estado": last_estado,
-                    "new_estado": current_estado,
-                    "detection_timestamp": format_datetime_for_sheets(now_chile()),
-                    "override_type": "BLOQUEADO_TO_RECHAZADO"
-                })
+                metadata_json = self._override_metadata_json(last_estado, current_estado)
 
                 event_id = self.metadata_repo.log_event(
                     evento_tipo="SUPERVISOR_OVERRIDE",
@@ -160,6 +158,24 @@ class EstadoDetalleService:
             logger.error(f"Error during override detection for {tag_spool}: {e}")
             return None
 
+    @staticmethod
+    def _is_override(last_estado: str, current_estado: str) -> bool:
+        """BLOQUEADO in the last recorded event, RECHAZADO (not BLOQUEADO) in Sheets now."""
+        return (
+            "BLOQUEADO" in last_estado and
+            "RECHAZADO" in current_estado and
+            "BLOQUEADO" not in current_estado
+        )
+
+    @staticmethod
+    def _override_metadata_json(last_estado: str, current_estado: str) -> str:
+        return json.dumps({
+            "previous_estado": last_estado,
+            "new_estado": current_estado,
+            "detection_timestamp": format_datetime_for_sheets(now_chile()),
+            "override_type": "BLOQUEADO_TO_RECHAZADO"
+        })
+
     def _extract_estado_from_metadata(self, event) -> str:
         """
         Extract Estado_Detalle from metadata event.
@@ -209,22 +225,88 @@ class EstadoDetalleService:
 
         Useful for periodic auditing or during spool list fetch operations.
 
+        Flow (independent of the number of spools):
+        1. Current Estado_Detalle of every tag from one Operaciones snapshot
+        2. Last metadata event of every tag from one Metadata read
+        3. Evaluate BLOQUEADO → RECHAZADO in memory
+        4. Log every SUPERVISOR_OVERRIDE event with a single batch append
+
         Args:
             tag_spools: List of spool identifiers to check
 
         Returns:
-            list[dict]: List of override detection results (only includes detected overrides)
+            list[dict]: List of override detection results (only includes detected overrides),
+            same shape as detect_supervisor_override
+
+        Raises:
+            None - Best-effort detection, logs warnings on failures
         """
-        overrides = []
+        tags = list(dict.fromkeys(tag_spools))
+        if not tags:
+            return []
 
-        for tag_spool in tag_spools:
-            result = self.detect_supervisor_override(tag_spool)
-            if result and result.get("detected"):
-                overrides.append(result)
+        try:
+            estados = self.sheets_repo.get_estado_detalle_by_tag(tags)
+            last_events = self.metadata_repo.get_latest_events(tags)
+        except Exception as e:
+            logger.error(f"Error loading Estado_Detalle/Metadata for override batch of {len(tags)} spools: {e}")
+            return []
 
-        if overrides:
-            logger.info(f"Found {len(overrides)} supervisor overrides in batch of {len(tag_spools)} spools")
-        else:
-            logger.debug(f"No supervisor overrides detected in batch of {len(tag_spools)} spools")
+        overrides = []
+        for tag_spool in tags:
+            if tag_spool not in estados:
+                logger.warning(f"Spool {tag_spool} not found for override detection")
+                continue
+            last_event = last_events.get(tag_spool)
+            if last_event is None:
+                continue
+
+            last_estado = self._extract_estado_from_metadata(last_event)
+            current_estado = estados[tag_spool] or ""
+            if self._is_override(last_estado, current_estado):
+                logger.info(f"🚨 Supervisor override detected: {tag_spool} changed from BLOQUEADO to RECHAZADO")
+                overrides.append({
+                    "detected": True,
+                    "tag_spool": tag_spool,
+                    "previous_estado": last_estado,
+                    "current_estado": current_estado,
+                    "event_id": None
+                })
+
+        if not overrides:
+            logger.debug(f"No supervisor overrides detected in batch of {len(tags)} spools")
+            return []
+
+        fecha_operacion = format_date_for_sheets(today_chile())
+        events = [
+            MetadataEvent(
+                id=str(uuid.uuid4()),
+                timestamp=now_chile(),
+                evento_tipo=EventoTipo.SUPERVISOR_OVERRIDE,
+                tag_spool=override["tag_spool"],
+                worker_id=0,
+                worker_nombre="SYSTEM",
+                operacion="REPARACION",
+                accion=Accion.OVERRIDE,
+                fecha_operacion=fecha_operacion,
+                metadata_json=self._override_metadata_json(
+                    override["previous_estado"], override["current_estado"]
+                )
+            )
+            for override in overrides
+        ]
+        try:
+            self.metadata_repo.batch_log_events(events)
+            for override, event in zip(overrides, events):
+                override["event_id"] = event.id
+        except Exception as e:
+            logger.error(
+                f"CRITICAL: Metadata audit trail logging failed for {len(events)} overrides: {e}",
+                exc_info=True
+            )
+            # Return detection results even if logging fails
+            for override in overrides:
+                override["error"] = str(e)
 
+        logger.info(f"Found {len(overrides)} supervisor overrides in batch of {len(tags)} spools")
         return overrides
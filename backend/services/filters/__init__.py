@@ -18,6 +18,7 @@ Ejemplo de uso:
 
 from .base import SpoolFilter, FilterResult
 from .registry import FilterRegistry
+from .eligibility import EligibilityIndex
 from .common_filters import (
     PrerequisiteFilter,
     OcupacionFilter,
@@ -31,6 +32,7 @@ __all__ = [
     'SpoolFilter',
     'FilterResult',
     'FilterRegistry',
+    'EligibilityIndex',
     'PrerequisiteFilter',
     'OcupacionFilter',
     'CompletionFilter',
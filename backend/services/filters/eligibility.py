@@ -0,0 +1,193 @@
+"""
+Índice de elegibilidad por snapshot de Operaciones (v3.0 Occupation-Based).
+
+GET /api/spools/iniciar (ARM/SOLD/METROLOGIA/REPARACION) es el endpoint más
+consultado por las tablets. Antes cada request re-parseaba todas las filas
+y corría la cadena de filtros de FilterRegistry (dos veces para los spools
+rechazados, solo para logging).
+
+EligibilityIndex evalúa TODAS las cadenas (operación, acción) de
+FilterRegistry UNA vez por snapshot (ver `SnapshotView`) y guarda, por
+cadena, el conjunto de filas elegibles. Una consulta es una lectura del
+conjunto (y de la lista resultante, memoizada).
+
+Las escrituras por nombre de columna de `SheetsRepository` parchean la
+fila afectada (`apply_cell_updates`): se re-parsea esa fila y se
+re-evalúan sus cadenas, sin volver a leer la hoja. Al re-leer la hoja solo
+se re-evalúan las filas que cambiaron (`_update_rows_locked`).
+"""
+import logging
+from typing import Callable, Optional
+
+from backend.config import config
+from backend.core.snapshot_view import SnapshotView
+from backend.models.spool import Spool
+from backend.utils.normalize import normalize_column_name as _normalize
+from .registry import FilterRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class EligibilityIndex(SnapshotView):
+    """
+    Filas elegibles por cadena de filtros (operación, acción).
+
+    Usage:
+        index = EligibilityIndex.for_repository(sheets_repo)
+        spools = index.eligible("ARM", "INICIAR", parser=service.parse_spool_row)
+    """
+
+    SHEET_NAME = config.HOJA_OPERACIONES_NOMBRE
+
+    # Igual al TTL del cache de Operaciones: columnas con fórmula
+    # (Uniones_*_Completadas) cambian sin escrituras en Operaciones.
+    TTL_SECONDS = 60
+
+    def __init__(self, sheets_repo):
+        self._parser: Optional[Callable[[list], Spool]] = None
+        super().__init__(sheets_repo)
+
+    def _clear_locked(self) -> None:
+        self._column_map: dict = {}
+        self._rows: dict[int, list] = {}
+        self._spools: dict[int, Spool] = {}
+        self._chains = {key: FilterRegistry.get_filters(*key) for key in FilterRegistry.combinations()}
+        self._eligible: dict[tuple, set[int]] = {key: set() for key in self._chains}
+        # (operación, acción) -> lista deduplicada, en orden de fila
+        self._results: dict[tuple, list[Spool]] = {}
+
+    # ------------------------------------------------------------------ build
+
+    def _build_locked(self, rows: list, column_map: dict) -> None:
+        self._column_map = column_map
+        skipped = 0
+        for row_idx, row in enumerate(rows[1:], start=2):
+            self._rows[row_idx] = list(row)
+            if not self._evaluate_row(row_idx):
+                skipped += 1
+
+        logger.info(
+            f"EligibilityIndex: built from {len(rows)} Operaciones rows "
+            f"({skipped} skipped) - "
+            + ", ".join(f"{op} {action}={len(self._eligible[(op, action)])}"
+                        for op, action in self._chains if action == "INICIAR")
+        )
+
+    def _update_rows_locked(self, rows: list, refresh: set[int], removed: set[int]) -> bool:
+        if self._parser is None:
+            return False
+        for row_idx in removed:
+            self._rows.pop(row_idx, None)
+            self._spools.pop(row_idx, None)
+            for eligible in self._eligible.values():
+                eligible.discard(row_idx)
+        for row_idx in refresh:
+            self._rows[row_idx] = list(rows[row_idx - 1])
+            self._evaluate_row(row_idx)
+        if refresh or removed:
+            self._results.clear()
+        return True
+
+    def _evaluate_row(self, row_idx: int) -> bool:
+        """Re-parsea una fila y la re-evalúa contra cada cadena. False si no es un spool."""
+        self._spools.pop(row_idx, None)
+        for rows in self._eligible.values():
+            rows.discard(row_idx)
+
+        try:
+            spool = self._parser(self._rows[row_idx])
+        except ValueError as e:
+            logger.debug(f"EligibilityIndex: skipping row {row_idx}: {e}")
+            return False
+
+        self._spools[row_idx] = spool
+        for key, filters in self._chains.items():
+            if self._passes(spool, key, filters):
+                self._eligible[key].add(row_idx)
+        return True
+
+    @staticmethod
+    def _passes(spool: Spool, key: tuple, filters: list) -> bool:
+        # Una sola pasada por filtro; el motivo del rechazo se loggea aquí mismo
+        for filter_obj in filters:
+            result = filter_obj.apply(spool)
+            if not result.passed:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"[FilterRegistry] Spool {spool.tag_spool} RECHAZADO para {key[0]} {key[1]}: "
+                        f"{filter_obj.name} - {result.reason}"
+                    )
+                return False
+        return True
+
+    # ------------------------------------------------------------------ write-through
+
+    def apply_cell_updates(self, updates: list[dict]) -> None:
+        """
+        Parchea las filas con celdas recién escritas y re-evalúa sus cadenas.
+
+        Args:
+            updates: [{"row": 10, "column_name": "Ocupado_Por", "value": "MR(93)"}, ...]
+        """
+        with self._lock:
+            if self._source is None:
+                return
+            touched = set()
+            for update in updates:
+                col_idx = self._column_map.get(_normalize(update["column_name"]))
+                if col_idx is None:
+                    continue
+                row = self._rows.get(update["row"])
+                if row is None:
+                    # Fila fuera del snapshot (ej: agregada después)
+                    self._reset_locked()
+                    return
+                if col_idx >= len(row):
+                    row.extend([""] * (col_idx + 1 - len(row)))
+                row[col_idx] = update["value"]
+                touched.add(update["row"])
+            for row_idx in touched:
+                self._evaluate_row(row_idx)
+            if touched:
+                self._results.clear()
+                self._touch_locked(touched)
+
+    # ------------------------------------------------------------------ queries
+
+    def eligible(self, operation: str, action: str, parser: Callable[[list], Spool]) -> list[Spool]:
+        """
+        Spools que pasan todos los filtros de (operación, acción), deduplicados
+        por TAG_SPOOL (primera fila) y en orden de fila.
+
+        Args:
+            operation: "ARM", "SOLD", "METROLOGIA", "REPARACION"
+            action: "INICIAR", "FINALIZAR"
+            parser: fila → Spool (SpoolServiceV2.parse_spool_row); ValueError = fila inválida
+
+        Raises:
+            ValueError: Si la combinación (operación, acción) no está soportada
+        """
+        FilterRegistry.get_filters(operation, action)  # valida la combinación
+        key = (operation.upper(), action.upper())
+
+        with self._lock:
+            self._parser = parser
+            self._ensure_fresh_locked()
+            result = self._results.get(key)
+            if result is None:
+                seen_tags = set()
+                result = []
+                for row_idx in sorted(self._eligible[key]):
+                    spool = self._spools[row_idx]
+                    if spool.tag_spool in seen_tags:
+                        continue
+                    seen_tags.add(spool.tag_spool)
+                    result.append(spool)
+                duplicates = len(self._eligible[key]) - len(result)
+                if duplicates:
+                    logger.warning(
+                        f"[FilterRegistry] Deduplicated {len(self._eligible[key])} -> {len(result)} spools "
+                        f"({duplicates} duplicates removed)"
+                    )
+                self._results[key] = result
+            return list(result)
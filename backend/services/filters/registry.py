@@ -246,6 +246,16 @@ class FilterRegistry:
                 f"Combinaciones válidas: {list(cls._FILTER_MAP.keys())}"
             )
 
+    @classmethod
+    def combinations(cls) -> List[Tuple[str, str]]:
+        """
+        Todas las combinaciones (operación, acción) configuradas.
+
+        Usado por EligibilityIndex para evaluar cada cadena de filtros una vez
+        por snapshot de Operaciones.
+        """
+        return list(cls._FILTER_MAP.keys())
+
     @classmethod
     def get_filters_for_operation(cls, operation: str) -> List[SpoolFilter]:
         """
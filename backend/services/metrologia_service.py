@@ -16,13 +16,14 @@ from datetime import date, datetime
 from typing import Literal
 
 from backend.utils.date_formatter import format_datetime_for_sheets, format_date_for_sheets, now_chile
-from backend.domain.state_machines.metrologia_machine import MetrologiaStateMachine
+from backend.services.state_machines import transition_engine
 from backend.services.validation_service import ValidationService
 from backend.services.cycle_counter_service import CycleCounterService
 from backend.repositories.sheets_repository import SheetsRepository
 from backend.repositories.metadata_repository import MetadataRepository
 from backend.exceptions import SpoolNoEncontradoError
 from backend.services.metadata_event_builder import MetadataEventBuilder
+from backend.core.event_bus import get_event_bus
 
 logger = logging.getLogger(__name__)
 
@@ -36,8 +37,7 @@ class MetrologiaService:
     - State machine transitions (aprobar/rechazar)
     - Fecha_QC_Metrologia column updates
     - Metadata event logging
-
-    Single-user mode: No SSE event publishing needed.
+    - SSE event publishing (EventBus) for the dashboard stream
     """
 
     def __init__(
@@ -74,11 +74,11 @@ class MetrologiaService:
 
         Flow:
         1. Fetch spool and validate prerequisites
-        2. Instantiate state machine
-        3. Trigger aprobar/rechazar transition based on resultado
-        4. Update Fecha_QC_Metrologia via state machine callback
-        5. Log metadata event with resultado
-        6. Publish SSE event for dashboard
+        2. Evaluate aprobar/rechazar transition based on resultado
+           (APROBADO resets the reparación cycle, RECHAZADO increments it)
+        3. Write Fecha_QC_Metrologia / Estado_Detalle in one batch
+        4. Log metadata event with resultado
+        5. Publish SSE event for dashboard
 
         Args:
             tag_spool: Spool identifier
@@ -107,24 +107,21 @@ class MetrologiaService:
 
         self.validation_service.validar_puede_completar_metrologia(spool, worker_id)
 
-        # Step 2: Instantiate state machine
-        metrologia_machine = MetrologiaStateMachine(
-            tag_spool=tag_spool,
-            sheets_repo=self.sheets_repo,
-            metadata_repo=self.metadata_repo,
+        # Step 2-3: Evaluate aprobar/rechazar from the validated PENDIENTE state
+        # and write its cells in one batch
+        fecha_operacion = date.today()
+        metrologia = transition_engine.fire(
+            transition_engine.METROLOGIA,
+            spool,
+            "aprobar" if resultado == "APROBADO" else "rechazar",
+            state="pendiente",
+            fecha_operacion=fecha_operacion,
             cycle_counter=self.cycle_counter
         )
+        transition_engine.apply_writes(self.sheets_repo, tag_spool, metrologia.writes)
+        logger.info(f"METROLOGIA {resultado}: {tag_spool}")
 
-        # Step 3: Trigger state transition based on resultado
-        fecha_operacion = date.today()
-        if resultado == "APROBADO":
-            metrologia_machine.aprobar(fecha_operacion=fecha_operacion)
-            logger.info(f"METROLOGIA APROBADO: {tag_spool}")
-        else:  # RECHAZADO
-            metrologia_machine.rechazar(fecha_operacion=fecha_operacion)
-            logger.info(f"METROLOGIA RECHAZADO: {tag_spool}")
-
-        # Step 4: Log metadata event (Fecha_QC_Metrologia already updated by state machine)
+        # Step 4: Log metadata event (Fecha_QC_Metrologia already written)
         try:
             event = (
                 MetadataEventBuilder()
@@ -132,7 +129,7 @@ class MetrologiaService:
                 .with_operacion("METROLOGIA")
                 .with_metadata({
                     "resultado": resultado,
-                    "state": metrologia_machine.get_state_id()
+                    "state": metrologia.target
                 })
                 .build()
             )
@@ -143,6 +140,17 @@ class MetrologiaService:
                 exc_info=True
             )
 
+        # Step 5: Publish SSE event for dashboard
+        get_event_bus().publish(
+            "METROLOGIA",
+            tag_spool,
+            worker_id=worker_id,
+            worker_nombre=worker_nombre,
+            operacion="METROLOGIA",
+            resultado=resultado,
+            state=metrologia.target
+        )
+
         logger.info(f"✅ MetrologiaService.completar: {tag_spool} -> {resultado}")
         return {
             "success": True,
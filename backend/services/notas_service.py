@@ -16,6 +16,7 @@ import logging
 from typing import Optional
 
 from backend.config import config
+from backend.core.event_bus import get_event_bus
 from backend.exceptions import SpoolNoEncontradoError, WorkerNoEncontradoError
 from backend.repositories.metadata_repository import MetadataRepository
 from backend.repositories.sheets_repository import SheetsRepository
@@ -56,7 +57,7 @@ class NotasService:
         # _find_spool_row raises SpoolNoEncontradoError if the tag is not found,
         # so we don't need a separate get_spool_by_tag existence check.
         row_num = self._find_spool_row(tag_spool)
-        current = self.sheets_repository.get_cell_value(
+        current = self.sheets_repository.read_cell(
             sheet_name=config.HOJA_OPERACIONES_NOMBRE,
             row=row_num,
             column_name=self.NOTAS_COLUMN,
@@ -109,8 +110,9 @@ class NotasService:
         # so we don't need a separate get_spool_by_tag existence check.
         row_num = self._find_spool_row(tag_spool)
 
-        # Read current content and append new entry
-        current = self.sheets_repository.get_cell_value(
+        # Read current content and append new entry (point read: a snapshot
+        # miss fetches only this cell, not the whole Operaciones sheet)
+        current = self.sheets_repository.read_cell(
             sheet_name=config.HOJA_OPERACIONES_NOMBRE,
             row=row_num,
             column_name=self.NOTAS_COLUMN,
@@ -148,6 +150,15 @@ class NotasService:
                 exc_info=True,
             )
 
+        get_event_bus().publish(
+            "NOTA",
+            tag_spool,
+            worker_id=audit_worker_id,
+            worker_nombre=audit_worker_nombre,
+            operacion="NOTAS",
+            nota=new_entry,
+        )
+
         logger.info(
             f"✅ Nota agregada a {tag_spool} por {audit_worker_nombre}: "
             f"{len(clean_text)} caracteres"
@@ -170,7 +181,7 @@ class NotasService:
         column_letter = self.sheets_repository._index_to_column_letter(
             column_map[tag_key]
         )
-        row_num: Optional[int] = self.sheets_repository.find_row_by_column_value(
+        row_num: Optional[int] = self.sheets_repository.locate_row(
             sheet_name=config.HOJA_OPERACIONES_NOMBRE,
             column_letter=column_letter,
             value=tag_spool,
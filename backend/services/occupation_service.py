@@ -14,11 +14,13 @@ Orchestrates:
 
 import logging
 import json
+import uuid
 from typing import Optional
 from datetime import datetime
 
 from backend.utils.date_formatter import format_date_for_sheets, format_datetime_for_sheets, today_chile, now_chile
 from backend.utils.cache import get_cache
+from backend.core.event_bus import get_event_bus
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -43,6 +45,7 @@ from backend.models.occupation import (
     FinalizarRequest
 )
 from backend.models.enums import EventoTipo
+from backend.models.metadata import MetadataEvent, Accion
 from backend.services.metadata_event_builder import MetadataEventBuilder, build_metadata_event
 
 # SOLD_REQUIRED_TYPES: Union types that require SOLD operation (imported from union_service)
@@ -103,7 +106,30 @@ class OccupationService:
         self.worker_service = worker_service
         logger.info("OccupationService initialized (single-user mode)")
 
-    async def tomar(self, request: TomarRequest) -> OccupationResponse:
+    def _publish_change(
+        self,
+        event_type: str,
+        tag_spool: str,
+        worker_id: int,
+        worker_nombre: Optional[str],
+        operacion: str,
+        **changes
+    ) -> None:
+        """Publica el cambio en el EventBus (stream SSE) tras una escritura exitosa."""
+        get_event_bus().publish(
+            event_type,
+            tag_spool,
+            worker_id=worker_id,
+            worker_nombre=worker_nombre,
+            operacion=operacion,
+            **changes
+        )
+
+    async def tomar(
+        self,
+        request: TomarRequest,
+        extra_updates: Optional[dict] = None
+    ) -> OccupationResponse:
         """
         Take a spool (mark as occupied in Sheets).
 
@@ -118,6 +144,8 @@ class OccupationService:
 
         Args:
             request: TOMAR request with tag_spool, worker_id, worker_nombre, operacion
+            extra_updates: Other {column_name: value} changes of this request
+                (state transition cells, Estado_Detalle), written in the same batch
 
         Returns:
             OccupationResponse with success status and message
@@ -170,6 +198,8 @@ class OccupationService:
                     "Ocupado_Por": sanitize_for_sheets(worker_nombre),
                     "Fecha_Ocupacion": fecha_ocupacion_str
                 }
+                if extra_updates:
+                    updates_dict.update(extra_updates)
 
                 new_version = await self.conflict_service.update_with_retry(
                     tag_spool=tag_spool,
@@ -208,6 +238,11 @@ class OccupationService:
                     exc_info=True
                 )
 
+            self._publish_change(
+                "TOMAR", tag_spool, worker_id, worker_nombre, operacion,
+                ocupado_por=worker_nombre, fecha_ocupacion=fecha_ocupacion_str
+            )
+
             # Step 5: Return success
             message = f"Spool {tag_spool} tomado por {worker_nombre}"
             logger.info(f"✅ TOMAR completed successfully: {message}")
@@ -224,7 +259,11 @@ class OccupationService:
             logger.error(f"❌ TOMAR operation failed: {e}")
             raise
 
-    async def pausar(self, request: PausarRequest) -> OccupationResponse:
+    async def pausar(
+        self,
+        request: PausarRequest,
+        extra_updates: Optional[dict] = None
+    ) -> OccupationResponse:
         """
         Pause work on a spool (mark as partially complete and clear occupation).
 
@@ -239,6 +278,8 @@ class OccupationService:
 
         Args:
             request: PAUSAR request with tag_spool, worker_id, worker_nombre
+            extra_updates: Other {column_name: value} changes of this request,
+                written in the same batch
 
         Returns:
             OccupationResponse with success status and message
@@ -281,6 +322,8 @@ class OccupationService:
                     "Ocupado_Por": "",
                     "Fecha_Ocupacion": ""
                 }
+                if extra_updates:
+                    updates_dict.update(extra_updates)
 
                 new_version = await self.conflict_service.update_with_retry(
                     tag_spool=tag_spool,
@@ -319,6 +362,11 @@ class OccupationService:
                     exc_info=True
                 )
 
+            self._publish_change(
+                "PAUSAR", tag_spool, worker_id, worker_nombre, operacion,
+                ocupado_por=None, estado=estado_pausado
+            )
+
             # Step 4: Return success
             message = f"Trabajo pausado en {tag_spool}"
             logger.info(f"✅ PAUSAR completed successfully: {message}")
@@ -335,7 +383,11 @@ class OccupationService:
             logger.error(f"❌ PAUSAR operation failed: {e}")
             raise
 
-    async def completar(self, request: CompletarRequest) -> OccupationResponse:
+    async def completar(
+        self,
+        request: CompletarRequest,
+        extra_updates: Optional[dict] = None
+    ) -> OccupationResponse:
         """
         Complete work on a spool (mark operation complete and clear occupation).
 
@@ -350,6 +402,8 @@ class OccupationService:
 
         Args:
             request: COMPLETAR request with tag_spool, worker_id, worker_nombre, fecha_operacion
+            extra_updates: Other {column_name: value} changes of this request,
+                written in the same batch
 
         Returns:
             OccupationResponse with success status and message
@@ -400,6 +454,8 @@ class OccupationService:
                     "Ocupado_Por": "",  # Clear occupation
                     "Fecha_Ocupacion": ""
                 }
+                if extra_updates:
+                    updates_dict.update(extra_updates)
 
                 new_version = await self.conflict_service.update_with_retry(
                     tag_spool=tag_spool,
@@ -445,6 +501,11 @@ class OccupationService:
                 # Continue operation but log prominently - metadata writes should be investigated
                 # Note: In future, consider making this a hard failure if regulatory compliance requires it
 
+            self._publish_change(
+                "COMPLETAR", tag_spool, worker_id, worker_nombre, operacion,
+                ocupado_por=None, fecha_operacion=fecha_str
+            )
+
             # Step 5: Return success
             message = f"Operación completada en {tag_spool}"
             logger.info(f"✅ COMPLETAR completed successfully: {message}")
@@ -465,8 +526,16 @@ class OccupationService:
         """
         Take multiple spools in batch (up to 50).
 
-        Processes each spool independently, collecting success/failure for each.
-        Returns detailed results showing which spools succeeded and which failed.
+        Bulk flow (constant number of Sheets calls, independent of batch size):
+        1. Resolve every TAG from ONE Operaciones snapshot
+        2. Validate existence, Fecha_Materiales and occupancy in memory
+        3. Write Ocupado_Por/Fecha_Ocupacion/Estado_Detalle for all valid spools
+           in ONE values batchUpdate
+        4. Log all TOMAR_SPOOL events with ONE batch_log_events append
+
+        Each spool still gets its own success/failure entry in the response.
+        Only ARM/SOLD (validated by BatchTomarRequest): METROLOGIA/REPARACION
+        keep their own per-spool flows, which maintain the cycle marker.
 
         Args:
             request: Batch TOMAR request with tag_spools list
@@ -477,58 +546,128 @@ class OccupationService:
         tag_spools = request.tag_spools
         worker_id = request.worker_id
         worker_nombre = request.worker_nombre
-        operacion = request.operacion
+        operacion = request.operacion.value
 
         logger.info(
             f"BATCH_TOMAR started: {len(tag_spools)} spools by worker {worker_id} "
-            f"for {operacion.value}"
+            f"for {operacion}"
         )
 
-        results = []
-        succeeded = 0
-        failed = 0
+        # tag -> OccupationResponse (se arma en el orden del request al final)
+        outcomes: dict[str, OccupationResponse] = {}
 
-        for tag_spool in tag_spools:
-            try:
-                # Create individual TomarRequest for this spool
-                tomar_req = TomarRequest(
-                    tag_spool=tag_spool,
-                    worker_id=worker_id,
-                    worker_nombre=worker_nombre,
-                    operacion=operacion
+        # Step 1-2: Resolver filas y validar en memoria
+        try:
+            rows_by_tag = self._resolve_batch_rows(tag_spools)
+        except Exception as e:
+            logger.error(f"❌ BATCH_TOMAR snapshot read failed: {e}")
+            rows_by_tag = {}
+            for tag_spool in tag_spools:
+                outcomes[tag_spool] = OccupationResponse(
+                    success=False, tag_spool=tag_spool, message=f"Error: {str(e)}"
                 )
 
-                # Attempt to take this spool
-                response = await self.tomar(tomar_req)
-
-                results.append(response)
-                succeeded += 1
-
-                logger.info(f"✅ Batch item {succeeded}/{len(tag_spools)}: {tag_spool} succeeded")
-
-            except SpoolOccupiedError as e:
-                # Spool already occupied - collect error but continue with others
-                results.append(
-                    OccupationResponse(
-                        success=False,
+        accepted: list[tuple[str, int]] = []
+        for tag_spool in tag_spools:
+            if tag_spool in outcomes:
+                continue
+            resolved = rows_by_tag.get(tag_spool)
+            try:
+                if resolved is None:
+                    raise SpoolNoEncontradoError(tag_spool)
+                row_num, fecha_materiales, ocupado_por = resolved
+                if not fecha_materiales:
+                    raise DependenciasNoSatisfechasError(
+                        tag_spool=tag_spool,
+                        operacion=operacion,
+                        dependencia_faltante="Fecha_Materiales",
+                        detalle="El spool debe tener materiales registrados antes de ocuparlo"
+                    )
+                if ocupado_por and ocupado_por != "DISPONIBLE":
+                    raise SpoolOccupiedError(
                         tag_spool=tag_spool,
-                        message=f"Spool ya ocupado: {e.message}"
+                        owner_id=worker_id,
+                        owner_name=ocupado_por
                     )
+                accepted.append((tag_spool, row_num))
+            except SpoolOccupiedError as e:
+                outcomes[tag_spool] = OccupationResponse(
+                    success=False,
+                    tag_spool=tag_spool,
+                    message=f"Spool ya ocupado: {e.message}"
+                )
+                logger.warning(f"⚠️ Batch item failed: {tag_spool} - {e.message}")
+            except (SpoolNoEncontradoError, DependenciasNoSatisfechasError) as e:
+                outcomes[tag_spool] = OccupationResponse(
+                    success=False,
+                    tag_spool=tag_spool,
+                    message=f"Error: {e.message}"
                 )
-                failed += 1
                 logger.warning(f"⚠️ Batch item failed: {tag_spool} - {e.message}")
 
+        # Step 3: Una sola escritura para todos los spools válidos
+        fecha_ocupacion_str = format_datetime_for_sheets(now_chile())
+        estado_detalle = self._build_estado_detalle(worker_nombre, operacion)
+        if accepted:
+            sanitized_worker = sanitize_for_sheets(worker_nombre)
+            batch_updates = []
+            for _, row_num in accepted:
+                batch_updates.extend([
+                    {"row": row_num, "column_name": "Ocupado_Por", "value": sanitized_worker},
+                    {"row": row_num, "column_name": "Fecha_Ocupacion", "value": fecha_ocupacion_str},
+                    {"row": row_num, "column_name": "Estado_Detalle", "value": estado_detalle},
+                ])
+            try:
+                from backend.config import config
+                self.sheets_repository.batch_update_by_column_name(
+                    sheet_name=config.HOJA_OPERACIONES_NOMBRE,
+                    updates=batch_updates
+                )
+                logger.info(
+                    f"Sheets updated: {len(accepted)} spools occupied by {worker_nombre} "
+                    f"on {fecha_ocupacion_str} (1 batchUpdate)"
+                )
             except Exception as e:
-                # Other errors - collect and continue
-                results.append(
-                    OccupationResponse(
+                logger.error(f"❌ BATCH_TOMAR Sheets update failed: {e}")
+                for tag_spool, _ in accepted:
+                    outcomes[tag_spool] = OccupationResponse(
                         success=False,
                         tag_spool=tag_spool,
-                        message=f"Error: {str(e)}"
+                        message=f"Error: Failed to update occupation in Sheets: {e}"
                     )
+                accepted = []
+
+        # Step 4: Un solo append a Metadata (audit trail - MANDATORY)
+        if accepted:
+            try:
+                events = [
+                    self._build_tomar_event(tag_spool, worker_id, worker_nombre, operacion, fecha_ocupacion_str)
+                    for tag_spool, _ in accepted
+                ]
+                self.metadata_repository.batch_log_events(events)
+                logger.info(f"✅ Metadata logged: {len(events)} TOMAR_SPOOL events (1 append)")
+            except Exception as e:
+                logger.error(
+                    f"❌ CRITICAL: Batch metadata logging failed for {len(accepted)} spools: {e}",
+                    exc_info=True
                 )
-                failed += 1
-                logger.warning(f"⚠️ Batch item failed: {tag_spool} - {e}")
+
+        for tag_spool, _ in accepted:
+            self._publish_change(
+                "TOMAR", tag_spool, worker_id, worker_nombre, operacion,
+                ocupado_por=worker_nombre,
+                fecha_ocupacion=fecha_ocupacion_str,
+                estado_detalle=estado_detalle
+            )
+            outcomes[tag_spool] = OccupationResponse(
+                success=True,
+                tag_spool=tag_spool,
+                message=f"Spool {tag_spool} tomado por {worker_nombre}"
+            )
+
+        results = [outcomes[tag_spool] for tag_spool in tag_spools]
+        succeeded = sum(1 for r in results if r.success)
+        failed = len(results) - succeeded
 
         # Create summary message
         total = len(tag_spools)
@@ -546,6 +685,112 @@ class OccupationService:
             details=results
         )
 
+    def _resolve_batch_rows(self, tag_spools: list[str]) -> dict[str, tuple]:
+        """
+        Resuelve varios TAGs contra UN snapshot de Operaciones.
+
+        Returns:
+            {tag: (row_num 1-based, fecha_materiales, ocupado_por)} para los TAGs
+            encontrados (primera fila que coincide, igual que find_row_by_column_value)
+        """
+        from backend.core.column_map_cache import ColumnMapCache
+        from backend.config import config
+        from backend.services.sheets_service import SheetsService
+
+        all_rows = self.sheets_repository.read_worksheet(config.HOJA_OPERACIONES_NOMBRE)
+        column_map = ColumnMapCache.get_or_build(config.HOJA_OPERACIONES_NOMBRE, self.sheets_repository)
+
+        def col(*names: str) -> Optional[int]:
+            for name in names:
+                idx = column_map.get(normalize_column_name(name))
+                if idx is not None:
+                    return idx
+            return None
+
+        tag_idx = col("TAG_SPOOL", "SPLIT", "tag_spool")
+        if tag_idx is None:
+            raise ValueError(
+                f"TAG_SPOOL column not found in column map for sheet. "
+                f"Available columns: {list(column_map.keys())[:15]}"
+            )
+        materiales_idx = col("Fecha_Materiales")
+        ocupado_idx = col("Ocupado_Por")
+
+        def cell(row: list, idx: Optional[int]):
+            if idx is None or idx >= len(row):
+                return None
+            value = row[idx]
+            if isinstance(value, str):
+                value = value.strip()
+            return value if value not in (None, "") else None
+
+        pending = set(tag_spools)
+        resolved: dict[str, tuple] = {}
+        for row_num, row in enumerate(all_rows[1:], start=2):
+            if tag_idx >= len(row) or row[tag_idx] not in pending:
+                continue
+            tag = row[tag_idx]
+            pending.discard(tag)
+            resolved[tag] = (
+                row_num,
+                SheetsService.parse_date(cell(row, materiales_idx)),
+                cell(row, ocupado_idx),
+            )
+            if not pending:
+                break
+        return resolved
+
+    @staticmethod
+    def _build_estado_detalle(worker_nombre: str, operacion: str) -> str:
+        """Estado_Detalle al ocupar un spool (estados fijos según operación)."""
+        from backend.services.estado_detalle_builder import EstadoDetalleBuilder
+
+        if operacion == "ARM":
+            arm_state = "en_progreso"
+            sold_state = "pendiente"
+        elif operacion == "SOLD":
+            arm_state = "completado"
+            sold_state = "en_progreso"
+        else:  # METROLOGIA, REPARACION, etc.
+            arm_state = "completado"
+            sold_state = "completado"
+
+        return EstadoDetalleBuilder().build(
+            ocupado_por=worker_nombre,
+            arm_state=arm_state,
+            sold_state=sold_state,
+            operacion_actual=operacion
+        )
+
+    @staticmethod
+    def _build_tomar_event(
+        tag_spool: str,
+        worker_id: int,
+        worker_nombre: str,
+        operacion: str,
+        fecha_ocupacion_str: str
+    ) -> MetadataEvent:
+        """Evento TOMAR_SPOOL como MetadataEvent (para batch_log_events)."""
+        fields = (
+            MetadataEventBuilder()
+            .for_tomar(tag_spool, worker_id, worker_nombre)
+            .with_operacion(operacion)
+            .with_metadata({"fecha_ocupacion": fecha_ocupacion_str})
+            .build()
+        )
+        return MetadataEvent(
+            id=str(uuid.uuid4()),
+            timestamp=now_chile(),
+            evento_tipo=EventoTipo(fields["evento_tipo"]),
+            tag_spool=fields["tag_spool"],
+            worker_id=fields["worker_id"],
+            worker_nombre=fields["worker_nombre"],
+            operacion=fields["operacion"],
+            accion=Accion(fields["accion"]),
+            fecha_operacion=fields["fecha_operacion"],
+            metadata_json=fields["metadata_json"]
+        )
+
     async def iniciar_spool(self, request: IniciarRequest) -> OccupationResponse:
         """
         Iniciar trabajo en un spool (P5 Confirmation workflow).
@@ -670,27 +915,8 @@ class OccupationService:
             # If race condition occurs, last-write-wins (LWW)
             # Error detected when P4 re-reads and spool disappears from available list
 
-            # Step 4: Build Estado_Detalle with EstadoDetalleBuilder
-            from backend.services.estado_detalle_builder import EstadoDetalleBuilder
-
-            # Hardcoded states based on operacion
-            if operacion == "ARM":
-                arm_state = "en_progreso"
-                sold_state = "pendiente"
-            elif operacion == "SOLD":
-                arm_state = "completado"
-                sold_state = "en_progreso"
-            else:  # METROLOGIA, REPARACION, etc.
-                arm_state = "completado"
-                sold_state = "completado"
-
-            builder = EstadoDetalleBuilder()
-            estado_detalle = builder.build(
-                ocupado_por=worker_nombre,
-                arm_state=arm_state,
-                sold_state=sold_state,
-                operacion_actual=operacion
-            )
+            # Step 4: Build Estado_Detalle with EstadoDetalleBuilder (hardcoded states)
+            estado_detalle = self._build_estado_detalle(worker_nombre, operacion)
 
             logger.info(f"Estado_Detalle built: '{estado_detalle}'")
 
@@ -795,6 +1021,13 @@ class OccupationService:
                 # Flag for response — audit trail gap needs investigation
                 metadata_failed = True
 
+            self._publish_change(
+                "INICIAR", tag_spool, worker_id, worker_nombre, operacion,
+                ocupado_por=worker_nombre,
+                fecha_ocupacion=fecha_ocupacion_str,
+                estado_detalle=estado_detalle
+            )
+
             # Step 7: Return success
             message = f"Spool {tag_spool} iniciado por {worker_nombre}" + (" ⚠️ metadata pendiente" if metadata_failed else "")
             logger.info(f"✅ [P5 INICIAR] Completed successfully: {message}")
@@ -1111,6 +1344,20 @@ class OccupationService:
             ValueError: If race condition (union became unavailable)
             SheetsUpdateError: If Sheets write fails
         """
+        response = await self._finalizar_spool(request)
+        if response.success:
+            self._publish_change(
+                "FINALIZAR", response.tag_spool, request.worker_id,
+                request.worker_nombre, request.operacion.value,
+                ocupado_por=None,
+                action_taken=response.action_taken,
+                unions_processed=response.unions_processed,
+                new_state=response.new_state
+            )
+        return response
+
+    async def _finalizar_spool(self, request: FinalizarRequest) -> OccupationResponse:
+        """Implementación de finalizar_spool (ver docstring público)."""
         tag_spool = request.tag_spool
         worker_id = request.worker_id
         worker_nombre = request.worker_nombre
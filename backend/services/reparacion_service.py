@@ -14,15 +14,17 @@ v3.0 Phase 6 feature:
 
 import logging
 from datetime import date, datetime
+from typing import Optional
 
 from backend.utils.date_formatter import format_datetime_for_sheets, format_date_for_sheets, now_chile, today_chile
-from backend.services.state_machines.reparacion_state_machine import REPARACIONStateMachine
+from backend.services.state_machines import transition_engine
 from backend.services.validation_service import ValidationService
 from backend.services.cycle_counter_service import CycleCounterService
 from backend.repositories.sheets_repository import SheetsRepository
 from backend.repositories.metadata_repository import MetadataRepository
 from backend.exceptions import SpoolNoEncontradoError
 from backend.services.metadata_event_builder import MetadataEventBuilder
+from backend.core.event_bus import get_event_bus
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +62,39 @@ class ReparacionService:
         self.metadata_repo = metadata_repository
         logger.info("ReparacionService initialized with cycle tracking (single-user mode)")
 
+    def _transition(
+        self,
+        spool,
+        event: str,
+        state: str,
+        worker_nombre: Optional[str] = None,
+        cycle: Optional[int] = None
+    ) -> transition_engine.TransitionResult:
+        """
+        Evaluate a REPARACION transition and write Ocupado_Por/Fecha_Ocupacion/Estado_Detalle.
+
+        Args:
+            spool: Spool record read for this request
+            event: tomar, pausar, completar or cancelar
+            state: Source state (rechazado, en_reparacion, reparacion_pausada)
+            worker_nombre: Worker taking the spool (tomar)
+            cycle: Current cycle, already extracted from Estado_Detalle
+
+        Returns:
+            TransitionResult with the values written
+        """
+        result = transition_engine.fire(
+            transition_engine.REPARACION,
+            spool,
+            event,
+            state=state,
+            worker_nombre=worker_nombre,
+            cycle_counter=self.cycle_counter,
+            cycle=cycle
+        )
+        transition_engine.apply_writes(self.sheets_repo, spool.tag_spool, result.writes)
+        return result
+
     async def tomar_reparacion(
         self,
         tag_spool: str,
@@ -73,8 +108,8 @@ class ReparacionService:
         1. Fetch spool and validate can TOMAR (RECHAZADO, not BLOQUEADO, not occupied)
         2. Extract cycle count from Estado_Detalle
         3. Check not BLOQUEADO (cycle < 3)
-        4. Instantiate state machine and trigger TOMAR transition
-        5. Update Ocupado_Por, Fecha_Ocupacion, Estado_Detalle via state machine callback
+        4. Trigger TOMAR transition
+        5. Update Ocupado_Por, Fecha_Ocupacion, Estado_Detalle via transition writes
         6. Log metadata event
         7. Publish SSE event for dashboard
 
@@ -110,29 +145,17 @@ class ReparacionService:
             from backend.exceptions import SpoolBloqueadoError
             raise SpoolBloqueadoError(tag_spool)
 
-        # Step 4: Instantiate state machine hydrated to current state
-        # (python-statemachine 2.5.0 async engine ignores direct assignment
-        # to .current_state — must pass start_value to the constructor and
-        # call activate_initial_state() before triggering transitions).
+        # Step 4: Trigger TOMAR from RECHAZADO or REPARACION_PAUSADA (resume)
         if spool.estado_detalle and "REPARACION_PAUSADA" in spool.estado_detalle:
             start_state = "reparacion_pausada"
         else:
             start_state = "rechazado"
-
-        reparacion_machine = REPARACIONStateMachine(
-            tag_spool=tag_spool,
-            sheets_repo=self.sheets_repo,
-            metadata_repo=self.metadata_repo,
-            cycle_counter=self.cycle_counter,
-            start_value=start_state,
+        reparacion = self._transition(
+            spool, "tomar", state=start_state, worker_nombre=worker_nombre, cycle=current_cycle
         )
-        await reparacion_machine.activate_initial_state()
+        logger.info(f"REPARACION TOMAR: {tag_spool} -> {reparacion.target}")
 
-        # Trigger TOMAR transition
-        await reparacion_machine.tomar(worker_id=worker_id, worker_nombre=worker_nombre)
-        logger.info(f"REPARACION TOMAR: {tag_spool} -> {reparacion_machine.current_state.id}")
-
-        # Step 5: Log metadata event (Ocupado_Por/Fecha_Ocupacion/Estado_Detalle already updated by state machine)
+        # Step 5: Log metadata event (Ocupado_Por/Fecha_Ocupacion/Estado_Detalle already written)
         try:
             event = (
                 MetadataEventBuilder()
@@ -141,7 +164,7 @@ class ReparacionService:
                 .with_metadata({
                     "cycle": current_cycle,
                     "max_cycles": self.cycle_counter.MAX_CYCLES,
-                    "state": reparacion_machine.get_state_id()
+                    "state": reparacion.target
                 })
                 .build()
             )
@@ -152,11 +175,17 @@ class ReparacionService:
                 exc_info=True
             )
 
-        # Step 6: Build estado_detalle for SSE event
-        estado_detalle = self.cycle_counter.build_reparacion_estado(
-            "en_reparacion",
-            current_cycle,
-            worker_nombre
+        # Step 6: SSE event with the Estado_Detalle just written
+        estado_detalle = reparacion.value("Estado_Detalle")
+
+        get_event_bus().publish(
+            "TOMAR_REPARACION",
+            tag_spool,
+            worker_id=worker_id,
+            operacion="REPARACION",
+            estado_detalle=estado_detalle,
+            ocupado_por=worker_nombre,
+            cycle=current_cycle
         )
 
         logger.info(f"✅ ReparacionService.tomar_reparacion: {tag_spool}")
@@ -179,8 +208,8 @@ class ReparacionService:
 
         Flow:
         1. Fetch spool and validate ownership
-        2. Instantiate state machine and trigger PAUSAR transition
-        3. Clear Ocupado_Por, Fecha_Ocupacion, update Estado_Detalle via state machine callback
+        2. Trigger PAUSAR transition
+        3. Clear Ocupado_Por, Fecha_Ocupacion, update Estado_Detalle via transition writes
         4. Log metadata event
         5. Publish SSE event for dashboard
 
@@ -210,23 +239,13 @@ class ReparacionService:
                 f"Spool {tag_spool} no está ocupado por este trabajador"
             )
 
-        # Step 2: Instantiate state machine hydrated to EN_REPARACION
-        reparacion_machine = REPARACIONStateMachine(
-            tag_spool=tag_spool,
-            sheets_repo=self.sheets_repo,
-            metadata_repo=self.metadata_repo,
-            cycle_counter=self.cycle_counter,
-            start_value="en_reparacion",
-        )
-        await reparacion_machine.activate_initial_state()
-
-        # Trigger PAUSAR transition
-        await reparacion_machine.pausar()
-        logger.info(f"REPARACION PAUSAR: {tag_spool} -> {reparacion_machine.current_state.id}")
-
-        # Step 3: Extract cycle count for metadata
+        # Step 2: Extract cycle count (Estado_Detalle and metadata)
         current_cycle = self.cycle_counter.extract_cycle_count(spool.estado_detalle or "")
 
+        # Step 3: Trigger PAUSAR from EN_REPARACION
+        reparacion = self._transition(spool, "pausar", state="en_reparacion", cycle=current_cycle)
+        logger.info(f"REPARACION PAUSAR: {tag_spool} -> {reparacion.target}")
+
         # Step 4: Log metadata event
         try:
             event = (
@@ -236,7 +255,7 @@ class ReparacionService:
                 .with_metadata({
                     "cycle": current_cycle,
                     "max_cycles": self.cycle_counter.MAX_CYCLES,
-                    "state": reparacion_machine.get_state_id()
+                    "state": reparacion.target
                 })
                 .build()
             )
@@ -247,10 +266,16 @@ class ReparacionService:
                 exc_info=True
             )
 
-        # Step 5: Build estado_detalle for SSE event
-        estado_detalle = self.cycle_counter.build_reparacion_estado(
-            "reparacion_pausada",
-            current_cycle
+        # Step 5: SSE event with the Estado_Detalle just written
+        estado_detalle = reparacion.value("Estado_Detalle")
+
+        get_event_bus().publish(
+            "PAUSAR_REPARACION",
+            tag_spool,
+            worker_id=worker_id,
+            operacion="REPARACION",
+            estado_detalle=estado_detalle,
+            ocupado_por=None
         )
 
         logger.info(f"✅ ReparacionService.pausar_reparacion: {tag_spool}")
@@ -272,8 +297,8 @@ class ReparacionService:
 
         Flow:
         1. Fetch spool and validate ownership
-        2. Instantiate state machine and trigger COMPLETAR transition
-        3. Clear Ocupado_Por, Fecha_Ocupacion, set Estado_Detalle=PENDIENTE_METROLOGIA via state machine
+        2. Trigger COMPLETAR transition
+        3. Clear Ocupado_Por, Fecha_Ocupacion, set Estado_Detalle=PENDIENTE_METROLOGIA via transition writes
         4. Log metadata event
         5. Publish SSE event for dashboard
 
@@ -308,23 +333,13 @@ class ReparacionService:
                 operacion="REPARACION"
             )
 
-        # Step 2: Instantiate state machine hydrated to EN_REPARACION
-        reparacion_machine = REPARACIONStateMachine(
-            tag_spool=tag_spool,
-            sheets_repo=self.sheets_repo,
-            metadata_repo=self.metadata_repo,
-            cycle_counter=self.cycle_counter,
-            start_value="en_reparacion",
-        )
-        await reparacion_machine.activate_initial_state()
-
-        # Trigger COMPLETAR transition
-        await reparacion_machine.completar()
-        logger.info(f"REPARACION COMPLETAR: {tag_spool} -> {reparacion_machine.current_state.id}")
-
-        # Step 3: Extract cycle count for metadata
+        # Step 2: Extract cycle count for metadata
         current_cycle = self.cycle_counter.extract_cycle_count(spool.estado_detalle or "")
 
+        # Step 3: Trigger COMPLETAR from EN_REPARACION
+        reparacion = self._transition(spool, "completar", state="en_reparacion", cycle=current_cycle)
+        logger.info(f"REPARACION COMPLETAR: {tag_spool} -> {reparacion.target}")
+
         # Step 4: Log metadata event
         try:
             event = (
@@ -334,7 +349,7 @@ class ReparacionService:
                 .with_metadata({
                     "cycle": current_cycle,
                     "max_cycles": self.cycle_counter.MAX_CYCLES,
-                    "state": reparacion_machine.get_state_id(),
+                    "state": reparacion.target,
                     "next_state": "PENDIENTE_METROLOGIA"
                 })
                 .build()
@@ -346,8 +361,18 @@ class ReparacionService:
                 exc_info=True
             )
 
-        # Step 5: Build estado_detalle for SSE event
-        estado_detalle = "PENDIENTE_METROLOGIA"
+        # Step 5: SSE event with the Estado_Detalle just written
+        estado_detalle = reparacion.value("Estado_Detalle")
+
+        get_event_bus().publish(
+            "COMPLETAR_REPARACION",
+            tag_spool,
+            worker_id=worker_id,
+            operacion="REPARACION",
+            estado_detalle=estado_detalle,
+            ocupado_por=None,
+            cycle=current_cycle
+        )
 
         logger.info(f"✅ ReparacionService.completar_reparacion: {tag_spool} -> PENDIENTE_METROLOGIA")
         return {
@@ -368,8 +393,8 @@ class ReparacionService:
 
         Flow:
         1. Fetch spool and validate can CANCELAR (EN_REPARACION or REPARACION_PAUSADA)
-        2. Instantiate state machine and trigger CANCELAR transition
-        3. Clear Ocupado_Por, Fecha_Ocupacion, restore RECHAZADO estado via state machine callback
+        2. Trigger CANCELAR transition
+        3. Clear Ocupado_Por, Fecha_Ocupacion, restore RECHAZADO estado via transition writes
         4. Log metadata event
         5. Publish SSE event for dashboard
 
@@ -394,27 +419,16 @@ class ReparacionService:
         worker_nombre = spool.ocupado_por or ""
         self.validation_service.validar_puede_cancelar_reparacion(spool, worker_nombre, worker_id)
 
-        # Step 2: Instantiate state machine hydrated to current state
+        # Step 2: Extract cycle count (restored in RECHAZADO estado and metadata)
+        current_cycle = self.cycle_counter.extract_cycle_count(spool.estado_detalle or "")
+
+        # Step 3: Trigger CANCELAR from EN_REPARACION or REPARACION_PAUSADA
         if spool.estado_detalle and "REPARACION_PAUSADA" in spool.estado_detalle:
             start_state = "reparacion_pausada"
         else:
             start_state = "en_reparacion"
-
-        reparacion_machine = REPARACIONStateMachine(
-            tag_spool=tag_spool,
-            sheets_repo=self.sheets_repo,
-            metadata_repo=self.metadata_repo,
-            cycle_counter=self.cycle_counter,
-            start_value=start_state,
-        )
-        await reparacion_machine.activate_initial_state()
-
-        # Trigger CANCELAR transition
-        await reparacion_machine.cancelar()
-        logger.info(f"REPARACION CANCELAR: {tag_spool} -> {reparacion_machine.current_state.id}")
-
-        # Step 3: Extract cycle count for metadata
-        current_cycle = self.cycle_counter.extract_cycle_count(spool.estado_detalle or "")
+        reparacion = self._transition(spool, "cancelar", state=start_state, cycle=current_cycle)
+        logger.info(f"REPARACION CANCELAR: {tag_spool} -> {reparacion.target}")
 
         # Step 4: Log metadata event
         try:
@@ -425,7 +439,7 @@ class ReparacionService:
                 .with_metadata({
                     "cycle": current_cycle,
                     "max_cycles": self.cycle_counter.MAX_CYCLES,
-                    "state": reparacion_machine.get_state_id()
+                    "state": reparacion.target
                 })
                 .build()
             )
@@ -436,8 +450,17 @@ class ReparacionService:
                 exc_info=True
             )
 
-        # Step 5: Build estado_detalle for SSE event
-        estado_detalle = self.cycle_counter.build_rechazado_estado(current_cycle)
+        # Step 5: SSE event with the Estado_Detalle just written
+        estado_detalle = reparacion.value("Estado_Detalle")
+
+        get_event_bus().publish(
+            "CANCELAR_REPARACION",
+            tag_spool,
+            worker_id=worker_id,
+            operacion="REPARACION",
+            estado_detalle=estado_detalle,
+            ocupado_por=None
+        )
 
         logger.info(f"✅ ReparacionService.cancelar_reparacion: {tag_spool} -> RECHAZADO")
         return {
@@ -25,6 +25,7 @@ from typing import Optional
 from backend.repositories.sheets_repository import SheetsRepository
 from backend.services.sheets_service import SheetsService
 from backend.core.column_map_cache import ColumnMapCache
+from backend.core.occupancy_view import OccupancyView
 from backend.models.spool import Spool
 from backend.models.enums import ActionStatus
 from backend.config import config
@@ -501,7 +502,14 @@ class SpoolServiceV2:
         all_rows = self.sheets_repository.read_worksheet(config.HOJA_OPERACIONES_NOMBRE)
         spools_ocupados = []
 
-        for row_idx, row in enumerate(all_rows[1:], start=2):
+        # OccupancyView se alinea con el snapshot recién leído: solo se
+        # parsean las filas ocupadas por el trabajador, no la hoja completa
+        occupied_rows = OccupancyView.for_repository(self.sheets_repository).rows_occupied_by(worker_id)
+
+        for row_idx in occupied_rows:
+            if row_idx > len(all_rows):
+                continue
+            row = all_rows[row_idx - 1]
             try:
                 spool = self.parse_spool_row(row)
 
@@ -600,7 +608,7 @@ class SpoolServiceV2:
             >>> service.get_spools_disponibles("METROLOGIA", "INICIAR")
             [Spool(tag_spool="TAG-001", ...), Spool(tag_spool="TAG-002", ...)]
         """
-        from backend.services.filters import FilterRegistry
+        from backend.services.filters import FilterRegistry, EligibilityIndex
 
         logger.info(f"[FilterRegistry] Retrieving spools disponibles for {operation} {action}")
 
@@ -611,49 +619,11 @@ class SpoolServiceV2:
             logger.error(f"Invalid operation/action combination: {operation}/{action}")
             raise
 
-        # Leer todas las filas de Operaciones
-        all_rows = self.sheets_repository.read_worksheet(config.HOJA_OPERACIONES_NOMBRE)
-        spools_disponibles = []
-
-        # Aplicar filtros a cada spool
-        for row_idx, row in enumerate(all_rows[1:], start=2):
-            try:
-                spool = self.parse_spool_row(row)
-
-                # Verificar si el spool pasa TODOS los filtros
-                if FilterRegistry.passes_all_filters(spool, filters):
-                    spools_disponibles.append(spool)
-                    logger.debug(
-                        f"[FilterRegistry] Spool {spool.tag_spool} ELEGIBLE para {operation} {action}"
-                    )
-                else:
-                    # Log de por qué el spool NO pasa (solo en debug)
-                    for filter_obj in filters:
-                        result = filter_obj.apply(spool)
-                        if not result.passed:
-                            logger.debug(
-                                f"[FilterRegistry] Spool {spool.tag_spool} RECHAZADO: "
-                                f"{filter_obj.name} - {result.reason}"
-                            )
-                            break  # Solo loggear el primer filtro que falla
-
-            except ValueError as e:
-                logger.warning(f"Skipping invalid row {row_idx}: {str(e)}")
-                continue
-
-        # Deduplicar por TAG_SPOOL (Google Sheets puede tener filas duplicadas)
-        seen_tags = set()
-        unique_spools = []
-        for spool in spools_disponibles:
-            if spool.tag_spool not in seen_tags:
-                seen_tags.add(spool.tag_spool)
-                unique_spools.append(spool)
-
-        if len(unique_spools) < len(spools_disponibles):
-            logger.warning(
-                f"[FilterRegistry] Deduplicated {len(spools_disponibles)} -> {len(unique_spools)} spools "
-                f"({len(spools_disponibles) - len(unique_spools)} duplicates removed)"
-            )
+        # Cadenas evaluadas una vez por snapshot de Operaciones (incremental en
+        # escrituras); incluye la deduplicación por TAG_SPOOL
+        unique_spools = EligibilityIndex.for_repository(self.sheets_repository).eligible(
+            operation, action, parser=self.parse_spool_row
+        )
 
         logger.info(
             f"[FilterRegistry] Found {len(unique_spools)} spools for {operation} {action} "
@@ -6,6 +6,10 @@ Each operation has its own state machine:
 - REPARACION: 4 states (RECHAZADO → EN_REPARACION → REPARACION_PAUSADA → PENDIENTE_METROLOGIA)
 
 State machines coordinate with OccupationService and update Estado_Detalle.
+
+Services evaluate transitions with transition_engine (precompiled tables,
+pure functions over a Spool, writes returned instead of applied in
+callbacks); the classes below remain the reference definition.
 """
 
 from backend.services.state_machines.arm_state_machine import ARMStateMachine
@@ -0,0 +1,445 @@
+"""
+Table-driven transition engine for ARM, SOLD, REPARACION and METROLOGIA.
+
+The python-statemachine classes in this package are instantiated on every
+TOMAR/PAUSAR/COMPLETAR: per-instance engine setup, `activate_initial_state()`
+and a manual `current_state` override to hydrate from Sheets, then
+`on_enter_*` callbacks that look up the spool row and write cells one at a
+time (ARM/SOLD) or re-read Estado_Detalle through the repository
+(REPARACION/METROLOGIA).
+
+This engine keeps the same states, transitions, guards and callbacks as
+tables compiled once at import, evaluated as pure functions over a `Spool`:
+
+- `hydrate(machine, spool)` derives the current state from Sheets columns
+- `fire(machine, spool, event, ...)` checks the transition table, runs the
+  guard and returns a `TransitionResult` with the cell writes the entered
+  state requires. No I/O: the caller applies them (`apply_writes`, one
+  batch update).
+
+The python-statemachine classes remain the reference definition; the tables
+are checked against them in tests/unit/test_transition_engine.py and
+benchmarked in tests/performance/test_transition_engine_benchmark.py.
+
+Usage:
+    state = hydrate("ARM", spool)                                 # "pausado"
+    result = fire("ARM", spool, "reanudar", worker_nombre="MR(93)")
+    apply_writes(sheets_repo, spool.tag_spool, result.writes)
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable, Optional
+
+from backend.config import config
+from backend.exceptions import DependenciasNoSatisfechasError, InvalidStateTransitionError
+
+logger = logging.getLogger(__name__)
+
+ARM = "ARM"
+SOLD = "SOLD"
+REPARACION = "REPARACION"
+METROLOGIA = "METROLOGIA"
+
+
+@dataclass(frozen=True)
+class TransitionContext:
+    """Inputs available to guards and on-enter callbacks."""
+    spool: object
+    source: str
+    target: str
+    worker_nombre: Optional[str] = None
+    fecha_operacion: Optional[date] = None
+    cycle_counter: object = None
+    # Ciclo de reparación ya calculado por el caller (evita re-parsear Estado_Detalle)
+    cycle: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class TransitionResult:
+    """
+    Outcome of a transition.
+
+    Attributes:
+        writes: Cell writes for the Operaciones row, in the format of
+            `batch_update_by_column_name` without "row":
+            [{"column_name": "Armador", "value": "MR(93)"}, ...]
+    """
+    machine: str
+    event: str
+    source: str
+    target: str
+    writes: list = field(default_factory=list)
+
+    def value(self, column_name: str, default=None):
+        """Value written to `column_name` by this transition (default if none)."""
+        for write in self.writes:
+            if write["column_name"] == column_name:
+                return write["value"]
+        return default
+
+
+@dataclass(frozen=True)
+class _Machine:
+    states: tuple
+    initial: str
+    transitions: dict  # (source, event) -> target
+    hydrate: Callable[[object], str]
+    guards: dict = field(default_factory=dict)  # event -> fn(ctx), raises
+    on_enter: dict = field(default_factory=dict)  # target -> fn(ctx) -> writes
+
+
+def _fecha(value: Optional[date]) -> str:
+    fecha = value if value else date.today()
+    # DD-MM-YYYY, mismo formato que los datos existentes
+    return fecha.strftime("%d-%m-%Y") if hasattr(fecha, "strftime") else str(fecha)
+
+
+def _write(column_name: str, value) -> dict:
+    return {"column_name": column_name, "value": value}
+
+
+def _reparacion_cycle(ctx: TransitionContext) -> int:
+    if ctx.cycle is not None:
+        return ctx.cycle
+    if ctx.cycle_counter is None:
+        return 0
+    return ctx.cycle_counter.extract_cycle_count(ctx.spool.estado_detalle or "")
+
+
+# ---------------------------------------------------------------- ARM / SOLD
+
+_OPERATION_STATES = ("pendiente", "en_progreso", "pausado", "completado")
+
+_OPERATION_TRANSITIONS = {
+    ("pendiente", "iniciar"): "en_progreso",
+    ("en_progreso", "pausar"): "pausado",
+    ("pausado", "reanudar"): "en_progreso",
+    ("en_progreso", "completar"): "completado",
+    ("en_progreso", "cancelar"): "pendiente",
+    ("pausado", "cancelar"): "pendiente",
+}
+
+
+def _operation_hydrator(operacion: str, worker_attr: str, fecha_attr: str) -> Callable[[object], str]:
+    def hydrate_operation(spool) -> str:
+        if getattr(spool, fecha_attr):
+            return "completado"
+        if getattr(spool, worker_attr):
+            # Trabajador asignado: en progreso si está ocupado, si no pausado
+            return "en_progreso" if spool.ocupado_por else "pausado"
+        if spool.ocupado_por:
+            # TOMAR previo falló a mitad (Ocupado_Por escrito, trabajador no):
+            # EN_PROGRESO permite recuperar vía PAUSAR
+            logger.warning(
+                f"⚠️ INCONSISTENT STATE DETECTED: {spool.tag_spool} has "
+                f"Ocupado_Por='{spool.ocupado_por}' but {worker_attr}=None. "
+                f"Hydrating {operacion} to EN_PROGRESO to allow recovery via PAUSAR."
+            )
+            return "en_progreso"
+        return "pendiente"
+
+    return hydrate_operation
+
+
+def _operation_callbacks(worker_column: str, fecha_column: str) -> dict:
+    def on_enter_en_progreso(ctx: TransitionContext) -> list:
+        # Reanudar conserva el trabajador original
+        if not ctx.worker_nombre or ctx.source == "pausado":
+            return []
+        return [_write(worker_column, ctx.worker_nombre)]
+
+    def on_enter_completado(ctx: TransitionContext) -> list:
+        return [_write(fecha_column, _fecha(ctx.fecha_operacion))]
+
+    def on_enter_pendiente(ctx: TransitionContext) -> list:
+        # CANCELAR desde en_progreso/pausado
+        return [_write(worker_column, "")]
+
+    return {
+        "en_progreso": on_enter_en_progreso,
+        "completado": on_enter_completado,
+        "pendiente": on_enter_pendiente,
+    }
+
+
+def _guard_arm_initiated(ctx: TransitionContext) -> None:
+    if ctx.spool.armador is None:
+        raise DependenciasNoSatisfechasError(
+            tag_spool=ctx.spool.tag_spool,
+            operacion="SOLD",
+            dependencia_faltante="ARM iniciado",
+            detalle="SOLD no puede iniciarse sin ARM iniciado"
+        )
+
+
+# ---------------------------------------------------------------- REPARACION
+
+def _hydrate_reparacion(spool) -> str:
+    estado = spool.estado_detalle or ""
+    if "REPARACION_PAUSADA" in estado:
+        return "reparacion_pausada"
+    if "EN_REPARACION" in estado:
+        return "en_reparacion"
+    return "rechazado"
+
+
+def _clear_occupation(estado_detalle: str) -> list:
+    return [
+        _write("Ocupado_Por", ""),
+        _write("Fecha_Ocupacion", ""),
+        _write("Estado_Detalle", estado_detalle),
+    ]
+
+
+def _on_enter_en_reparacion(ctx: TransitionContext) -> list:
+    if not ctx.worker_nombre:
+        return []
+    if ctx.cycle_counter is not None:
+        estado = ctx.cycle_counter.build_reparacion_estado("en_reparacion", _reparacion_cycle(ctx), ctx.worker_nombre)
+    else:
+        estado = f"EN_REPARACION - Ocupado: {ctx.worker_nombre}"
+    return [
+        _write("Ocupado_Por", ctx.worker_nombre),
+        _write("Fecha_Ocupacion", _fecha(None)),
+        _write("Estado_Detalle", estado),
+    ]
+
+
+def _on_enter_reparacion_pausada(ctx: TransitionContext) -> list:
+    if ctx.cycle_counter is not None:
+        return _clear_occupation(ctx.cycle_counter.build_reparacion_estado("reparacion_pausada", _reparacion_cycle(ctx)))
+    return _clear_occupation("REPARACION_PAUSADA")
+
+
+def _on_enter_pendiente_metrologia(ctx: TransitionContext) -> list:
+    # El ciclo se conserva hasta la próxima decisión de metrología
+    return _clear_occupation("PENDIENTE_METROLOGIA")
+
+
+def _on_enter_rechazado_reparacion(ctx: TransitionContext) -> list:
+    if ctx.cycle_counter is not None:
+        return _clear_occupation(ctx.cycle_counter.build_rechazado_estado(_reparacion_cycle(ctx)))
+    return _clear_occupation("RECHAZADO - Pendiente reparación")
+
+
+# ---------------------------------------------------------------- METROLOGIA
+
+def _hydrate_metrologia(spool) -> str:
+    return "aprobado" if spool.fecha_qc_metrologia else "pendiente"
+
+
+def _on_enter_aprobado(ctx: TransitionContext) -> list:
+    # Aprobar corta la racha de rechazos
+    estado = ctx.cycle_counter.reset_cycle() if ctx.cycle_counter is not None else "METROLOGIA APROBADO ✓"
+    return [
+        _write("Fecha_QC_Metrología", _fecha(ctx.fecha_operacion)),
+        _write("Estado_Detalle", estado),
+    ]
+
+
+def _on_enter_rechazado_metrologia(ctx: TransitionContext) -> list:
+    # Solo Estado_Detalle: Fecha_QC_Metrología es fecha de aprobación
+    if ctx.cycle_counter is None:
+        return [_write("Estado_Detalle", "METROLOGIA RECHAZADO - Pendiente reparación")]
+    counter = ctx.cycle_counter
+    current = ctx.cycle if ctx.cycle is not None else counter.extract_cycle_count(ctx.spool.estado_detalle or "")
+    # BLOQUEADO al llegar al límite, si no RECHAZADO con el ciclo nuevo
+    return [_write("Estado_Detalle", counter.build_rechazado_estado(counter.increment_cycle(current)))]
+
+
+# ---------------------------------------------------------------- tables
+
+def _compile(machine: _Machine) -> _Machine:
+    for (source, event), target in machine.transitions.items():
+        if source not in machine.states or target not in machine.states:
+            raise ValueError(f"Transition {source} --{event}--> {target} uses an unknown state")
+    for state in machine.on_enter:
+        if state not in machine.states:
+            raise ValueError(f"Callback for unknown state '{state}'")
+    return machine
+
+
+MACHINES: dict[str, _Machine] = {
+    ARM: _compile(_Machine(
+        states=_OPERATION_STATES,
+        initial="pendiente",
+        transitions=_OPERATION_TRANSITIONS,
+        hydrate=_operation_hydrator(ARM, "armador", "fecha_armado"),
+        on_enter=_operation_callbacks("Armador", "Fecha_Armado"),
+    )),
+    SOLD: _compile(_Machine(
+        states=_OPERATION_STATES,
+        initial="pendiente",
+        transitions=_OPERATION_TRANSITIONS,
+        hydrate=_operation_hydrator(SOLD, "soldador", "fecha_soldadura"),
+        guards={"iniciar": _guard_arm_initiated},
+        on_enter=_operation_callbacks("Soldador", "Fecha_Soldadura"),
+    )),
+    REPARACION: _compile(_Machine(
+        states=("rechazado", "en_reparacion", "reparacion_pausada", "pendiente_metrologia"),
+        initial="rechazado",
+        transitions={
+            ("rechazado", "tomar"): "en_reparacion",
+            ("reparacion_pausada", "tomar"): "en_reparacion",
+            ("en_reparacion", "pausar"): "reparacion_pausada",
+            ("en_reparacion", "completar"): "pendiente_metrologia",
+            ("en_reparacion", "cancelar"): "rechazado",
+            ("reparacion_pausada", "cancelar"): "rechazado",
+        },
+        hydrate=_hydrate_reparacion,
+        on_enter={
+            "en_reparacion": _on_enter_en_reparacion,
+            "reparacion_pausada": _on_enter_reparacion_pausada,
+            "pendiente_metrologia": _on_enter_pendiente_metrologia,
+            "rechazado": _on_enter_rechazado_reparacion,
+        },
+    )),
+    METROLOGIA: _compile(_Machine(
+        states=("pendiente", "aprobado", "rechazado"),
+        initial="pendiente",
+        transitions={
+            ("pendiente", "aprobar"): "aprobado",
+            ("pendiente", "rechazar"): "rechazado",
+        },
+        hydrate=_hydrate_metrologia,
+        on_enter={
+            "aprobado": _on_enter_aprobado,
+            "rechazado": _on_enter_rechazado_metrologia,
+        },
+    )),
+}
+
+
+def hydrate(machine: str, spool) -> str:
+    """
+    Current state of `machine` for a spool, derived from its Sheets columns.
+
+    Hydration (ARM shown; SOLD uses Soldador/Fecha_Soldadura):
+    - Fecha_Armado → completado
+    - Armador and Ocupado_Por → en_progreso; Armador only → pausado
+    - Ocupado_Por only → en_progreso (partially-failed TOMAR, recoverable via PAUSAR)
+    - otherwise → pendiente
+    """
+    return MACHINES[machine].hydrate(spool)
+
+
+def fire(
+    machine: str,
+    spool,
+    event: str,
+    *,
+    state: Optional[str] = None,
+    worker_nombre: Optional[str] = None,
+    fecha_operacion: Optional[date] = None,
+    cycle_counter=None,
+    cycle: Optional[int] = None,
+) -> TransitionResult:
+    """
+    Evaluate `event` for a spool without touching Sheets.
+
+    Args:
+        machine: ARM, SOLD, REPARACION or METROLOGIA
+        spool: Spool record (source for hydration, guards and cycle count)
+        event: Transition name (iniciar, pausar, tomar, aprobar, ...)
+        state: Source state; hydrated from `spool` when None
+        worker_nombre: Worker for iniciar/tomar writes
+        fecha_operacion: Date for completion writes (defaults to today)
+        cycle_counter: CycleCounterService (REPARACION/METROLOGIA Estado_Detalle)
+        cycle: Reparación cycle already extracted by the caller
+
+    Returns:
+        TransitionResult with the target state and the cell writes
+
+    Raises:
+        InvalidStateTransitionError: If `event` is not allowed from the source state
+        DependenciasNoSatisfechasError: If a guard fails (SOLD iniciar without ARM)
+    """
+    spec = MACHINES[machine]
+    source = state if state is not None else spec.hydrate(spool)
+    target = spec.transitions.get((source, event))
+    if target is None:
+        raise InvalidStateTransitionError(
+            f"Cannot {event} {machine} from state '{source}'",
+            tag_spool=spool.tag_spool,
+            current_state=source,
+            attempted_transition=event
+        )
+
+    ctx = TransitionContext(
+        spool=spool,
+        source=source,
+        target=target,
+        worker_nombre=worker_nombre,
+        fecha_operacion=fecha_operacion,
+        cycle_counter=cycle_counter,
+        cycle=cycle,
+    )
+    guard = spec.guards.get(event)
+    if guard is not None:
+        guard(ctx)
+    on_enter = spec.on_enter.get(target)
+    writes = on_enter(ctx) if on_enter is not None else []
+    return TransitionResult(machine=machine, event=event, source=source, target=target, writes=writes)
+
+
+class WriteSet:
+    """
+    Cell changes of one request for one spool row, flushed in a single batch.
+
+    Transitions add their writes and the caller adds its own columns
+    (Estado_Detalle, Ocupado_Por, ...); a later value for the same column
+    replaces the earlier one.
+
+    Usage:
+        write_set = WriteSet()
+        write_set.add(fire("ARM", spool, "iniciar", worker_nombre="MR(93)"))
+        write_set.set("Estado_Detalle", estado)
+        await conflict_service.update_with_retry(tag, write_set.as_dict(), "TOMAR")
+    """
+
+    def __init__(self):
+        self._values: dict = {}
+
+    def add(self, result: TransitionResult) -> TransitionResult:
+        for write in result.writes:
+            self._values[write["column_name"]] = write["value"]
+        return result
+
+    def set(self, column_name: str, value) -> None:
+        self._values[column_name] = value
+
+    def as_dict(self) -> dict:
+        """{column_name: value}, the format of ConflictService.update_with_retry."""
+        return dict(self._values)
+
+    def writes(self) -> list:
+        return [_write(column_name, value) for column_name, value in self._values.items()]
+
+    def __bool__(self) -> bool:
+        return bool(self._values)
+
+
+def apply_writes(sheets_repo, tag_spool: str, writes: list) -> bool:
+    """
+    Apply a transition's writes to the spool row in one batch update.
+
+    Returns:
+        False if the spool row was not found (nothing written), True otherwise
+    """
+    if not writes:
+        return True
+    tag_col_letter = sheets_repo.get_tag_spool_column_letter(config.HOJA_OPERACIONES_NOMBRE)
+    row_num = sheets_repo.find_row_by_column_value(
+        sheet_name=config.HOJA_OPERACIONES_NOMBRE,
+        column_letter=tag_col_letter,
+        value=tag_spool
+    )
+    if not row_num:
+        return False
+    sheets_repo.batch_update_by_column_name(
+        sheet_name=config.HOJA_OPERACIONES_NOMBRE,
+        updates=[{"row": row_num, **write} for write in writes]
+    )
+    return True
@@ -5,9 +5,12 @@ Coordinates ARM and SOLD state machines with OccupationService, implementing
 hydration logic to sync with current Sheets state.
 
 v3.0 state management:
-- Separate state machines per operation (ARM/SOLD)
+- Separate state machines per operation (ARM/SOLD), evaluated by the
+  table-driven transition_engine (pure functions, writes applied in one batch)
 - Hydration from Sheets columns (Armador/Soldador/Fecha_*)
 - Estado_Detalle updates via EstadoDetalleBuilder
+- One Sheets batch per request: transition cells and Estado_Detalle are
+  collected in a WriteSet and written with Ocupado_Por by OccupationService
 - Integration with OccupationService (single-user mode)
 """
 
@@ -15,8 +18,7 @@ import logging
 from typing import Optional
 from datetime import date
 
-from backend.services.state_machines.arm_state_machine import ARMStateMachine
-from backend.services.state_machines.sold_state_machine import SOLDStateMachine
+from backend.services.state_machines import transition_engine
 from backend.services.occupation_service import OccupationService
 from backend.services.estado_detalle_builder import EstadoDetalleBuilder
 from backend.repositories.sheets_repository import SheetsRepository
@@ -67,11 +69,12 @@ class StateService:
         TOMAR operation with state machine coordination.
 
         Flow:
-        1. Delegate to OccupationService (Ocupado_Por update)
-        2. Fetch current spool state from Sheets
-        3. Hydrate state machines from current Sheets state
-        4. Trigger state transition (iniciar) based on operation
-        5. Update Estado_Detalle with new combined state
+        1. Fetch current spool state from Sheets
+        2. Hydrate ARM/SOLD states (before Ocupado_Por is written)
+        3. Evaluate the transition (iniciar or reanudar) into the request's WriteSet
+        4. Add Estado_Detalle with the new combined state
+        5. Delegate to OccupationService: Ocupado_Por, Fecha_Ocupacion and the
+           WriteSet go to Sheets in one batch
 
         Args:
             request: TOMAR request with tag_spool, worker_id, worker_nombre, operacion
@@ -83,6 +86,7 @@ class StateService:
             SpoolNoEncontradoError: If spool doesn't exist
             SpoolOccupiedError: If spool already locked
             DependenciasNoSatisfechasError: If operation dependencies not met
+            InvalidStateTransitionError: If the operation is already completed
         """
         tag_spool = request.tag_spool
         operacion = request.operacion
@@ -91,178 +95,40 @@ class StateService:
             f"StateService.tomar: {tag_spool} by {request.worker_nombre} for {operacion.value}"
         )
 
-        # Step 1: Delegate to OccupationService (Ocupado_Por update)
-        response = await self.occupation_service.tomar(request)
-
-        try:
-            # Step 2: Fetch current spool state
-            spool = self.sheets_repo.get_spool_by_tag(tag_spool)
-            if not spool:
-                raise SpoolNoEncontradoError(tag_spool)
+        # Step 1: Fetch current spool state
+        spool = self.sheets_repo.get_spool_by_tag(tag_spool)
+        if not spool:
+            raise SpoolNoEncontradoError(tag_spool)
 
-            # Step 3: Hydrate state machines
-            arm_machine = await self._hydrate_arm_machine(spool)
-            sold_machine = await self._hydrate_sold_machine(spool)
-
-            # Step 4: Trigger state transition (iniciar or reanudar based on current state)
-            if operacion == ActionType.ARM:
-                current_arm_state = arm_machine.get_state_id()
-
-                if current_arm_state == "pausado":
-                    # Resume paused work
-                    await arm_machine.reanudar(worker_nombre=request.worker_nombre)
-                    logger.info(f"ARM state: pausado → en_progreso for {tag_spool} (resumed by {request.worker_nombre})")
-
-                elif current_arm_state == "pendiente":
-                    # Start new work
-                    await arm_machine.iniciar(
-                        worker_nombre=request.worker_nombre,
-                        fecha_operacion=date.today()
-                    )
-                    logger.info(f"ARM state: pendiente → en_progreso for {tag_spool} (started by {request.worker_nombre})")
-
-                elif current_arm_state == "en_progreso":
-                    # Edge case: Machine hydrated to EN_PROGRESO because Ocupado_Por is set but
-                    # Armador is not (from previous partial TOMAR failure OR normal TOMAR intermediate state).
-                    # Solution: Manually write Armador since we can't call iniciar from EN_PROGRESO.
-                    logger.warning(
-                        f"ARM already en_progreso for {tag_spool} (Ocupado_Por set, Armador=None). "
-                        f"Manually writing Armador to complete state."
-                    )
-                    # Manually write Armador to complete the TOMAR operation
-                    from backend.services.conflict_service import ConflictService
-                    conflict_service = self.occupation_service.conflict_service
-                    await conflict_service.update_with_retry(
-                        tag_spool=tag_spool,
-                        updates={"Armador": request.worker_nombre},
-                        operation="TOMAR_EDGE_CASE_FIX"
-                    )
-                    logger.info(f"✅ ARM edge case resolved: Armador written for {tag_spool}")
-
-                elif current_arm_state == "completado":
-                    # Cannot restart completed work
-                    raise InvalidStateTransitionError(
-                        f"Cannot TOMAR ARM - operation already completed",
-                        tag_spool=tag_spool,
-                        current_state=current_arm_state,
-                        attempted_transition="iniciar"
-                    )
-
-                else:
-                    # Unknown state - should never happen
-                    logger.error(f"Unknown ARM state '{current_arm_state}' for {tag_spool}")
-                    raise InvalidStateTransitionError(
-                        f"Unknown ARM state '{current_arm_state}'",
-                        tag_spool=tag_spool,
-                        current_state=current_arm_state,
-                        attempted_transition="iniciar"
-                    )
-
-            elif operacion == ActionType.SOLD:
-                current_sold_state = sold_machine.get_state_id()
-
-                if current_sold_state == "pausado":
-                    # Resume paused work
-                    await sold_machine.reanudar(worker_nombre=request.worker_nombre)
-                    logger.info(f"SOLD state: pausado → en_progreso for {tag_spool} (resumed by {request.worker_nombre})")
-
-                elif current_sold_state == "pendiente":
-                    # Start new work (will validate ARM dependency)
-                    await sold_machine.iniciar(
-                        worker_nombre=request.worker_nombre,
-                        fecha_operacion=date.today()
-                    )
-                    logger.info(f"SOLD state: pendiente → en_progreso for {tag_spool} (started by {request.worker_nombre})")
-
-                elif current_sold_state == "en_progreso":
-                    # Edge case: Machine hydrated to EN_PROGRESO because Ocupado_Por is set but
-                    # Soldador is not (from previous partial TOMAR failure OR normal TOMAR intermediate state).
-                    # Solution: Manually write Soldador since we can't call iniciar from EN_PROGRESO.
-                    logger.warning(
-                        f"SOLD already en_progreso for {tag_spool} (Ocupado_Por set, Soldador=None). "
-                        f"Manually writing Soldador to complete state."
-                    )
-                    # Manually write Soldador to complete the TOMAR operation
-                    from backend.services.conflict_service import ConflictService
-                    conflict_service = self.occupation_service.conflict_service
-                    await conflict_service.update_with_retry(
-                        tag_spool=tag_spool,
-                        updates={"Soldador": request.worker_nombre},
-                        operation="TOMAR_EDGE_CASE_FIX"
-                    )
-                    logger.info(f"✅ SOLD edge case resolved: Soldador written for {tag_spool}")
-
-                elif current_sold_state == "completado":
-                    # Cannot restart completed work
-                    raise InvalidStateTransitionError(
-                        f"Cannot TOMAR SOLD - operation already completed",
-                        tag_spool=tag_spool,
-                        current_state=current_sold_state,
-                        attempted_transition="iniciar"
-                    )
-
-                else:
-                    # Unknown state - should never happen
-                    logger.error(f"Unknown SOLD state '{current_sold_state}' for {tag_spool}")
-                    raise InvalidStateTransitionError(
-                        f"Unknown SOLD state '{current_sold_state}'",
-                        tag_spool=tag_spool,
-                        current_state=current_sold_state,
-                        attempted_transition="iniciar"
-                    )
-
-            # Step 5: Update Estado_Detalle
-            self._update_estado_detalle(
-                tag_spool=tag_spool,
-                ocupado_por=request.worker_nombre,
-                arm_state=arm_machine.get_state_id(),
-                sold_state=sold_machine.get_state_id(),
-                operacion_actual=operacion.value
-            )
+        # Step 2: Hydrate ARM/SOLD states from Sheets columns
+        arm_state = transition_engine.hydrate(transition_engine.ARM, spool)
+        sold_state = transition_engine.hydrate(transition_engine.SOLD, spool)
 
-            logger.info(f"✅ StateService.tomar completed for {tag_spool}")
-            return response
+        # Step 3: Evaluate transition (iniciar or reanudar based on current state)
+        write_set = transition_engine.WriteSet()
 
-        except Exception as e:
-            # CRITICAL: State machine transition failed after OccupationService wrote Ocupado_Por
-            # We must rollback: clear Ocupado_Por
-            logger.error(
-                f"❌ CRITICAL: State machine transition failed for {tag_spool}, rolling back occupation: {e}",
-                exc_info=True
+        if operacion == ActionType.ARM:
+            arm_state = self._tomar_transition(
+                write_set, spool, transition_engine.ARM, arm_state, "Armador", request.worker_nombre
+            )
+        elif operacion == ActionType.SOLD:
+            sold_state = self._tomar_transition(
+                write_set, spool, transition_engine.SOLD, sold_state, "Soldador", request.worker_nombre
             )
 
-            try:
-                # Rollback: Clear Ocupado_Por and Fecha_Ocupacion
-                from backend.services.conflict_service import ConflictService
-                from backend.repositories.metadata_repository import MetadataRepository
-
-                # Use existing conflict_service from occupation_service
-                conflict_service = self.occupation_service.conflict_service
-
-                await conflict_service.update_with_retry(
-                    tag_spool=tag_spool,
-                    updates={
-                        "Ocupado_Por": "",
-                        "Fecha_Ocupacion": ""
-                    },
-                    operation="ROLLBACK_TOMAR"
-                )
-
-                # The critical part is clearing Ocupado_Por so the spool appears available in Sheets.
-                logger.info(
-                    f"✅ Rollback successful: cleared Ocupado_Por for {tag_spool}."
-                )
+        # Step 4: Estado_Detalle goes in the same batch
+        write_set.set("Estado_Detalle", self.estado_builder.build(
+            ocupado_por=request.worker_nombre,
+            arm_state=arm_state,
+            sold_state=sold_state,
+            operacion_actual=operacion.value
+        ))
 
-            except Exception as rollback_error:
-                logger.error(
-                    f"❌ CRITICAL: Rollback failed for {tag_spool}: {rollback_error}. "
-                    f"Spool may be in inconsistent state (has Ocupado_Por but no Armador/Soldador). "
-                    f"Manual intervention may be required.",
-                    exc_info=True
-                )
+        # Step 5: Delegate to OccupationService (single batchUpdate with version check)
+        response = await self.occupation_service.tomar(request, extra_updates=write_set.as_dict())
 
-            # Re-raise original exception to fail the TOMAR request
-            raise
+        logger.info(f"✅ StateService.tomar completed for {tag_spool}")
+        return response
 
     async def pausar(self, request: PausarRequest) -> OccupationResponse:
         """
@@ -270,9 +136,10 @@ class StateService:
 
         Flow:
         1. Fetch spool and hydrate state machines
-        2. Trigger pausar transition on state machine (en_progreso → pausado)
-        3. Delegate to OccupationService (verify lock + release occupation)
-        4. Update Estado_Detalle with pausado state
+        2. Evaluate pausar transition (en_progreso → pausado) into the WriteSet
+        3. Add Estado_Detalle with pausado state
+        4. Delegate to OccupationService (verify lock + release occupation),
+           writing the WriteSet in the same batch
 
         Args:
             request: PAUSAR request with tag_spool, worker_id, worker_nombre, operacion
@@ -296,15 +163,15 @@ class StateService:
         if not spool:
             raise SpoolNoEncontradoError(tag_spool)
 
-        arm_machine = await self._hydrate_arm_machine(spool)
-        sold_machine = await self._hydrate_sold_machine(spool)
+        arm_state, sold_state = self._hydrate_releasing(spool, operacion)
+
+        # Step 2: Evaluate pausar transition
+        write_set = transition_engine.WriteSet()
 
-        # Step 2: Trigger pausar transition BEFORE clearing occupation
-        # This ensures state machine is in "pausado" state when EstadoDetalleBuilder reads it
         if operacion == ActionType.ARM:
-            current_arm_state = arm_machine.get_state_id()
+            current_arm_state = arm_state
 
-            # Defensive validation - state machine will also validate, but this provides clearer error
+            # Defensive validation - the engine also validates, but this provides clearer error
             if current_arm_state != "en_progreso":
                 raise InvalidStateTransitionError(
                     f"Cannot PAUSAR ARM from state '{current_arm_state}'. "
@@ -314,11 +181,13 @@ class StateService:
                     attempted_transition="pausar"
                 )
 
-            await arm_machine.pausar()
+            arm_state = write_set.add(transition_engine.fire(
+                transition_engine.ARM, spool, "pausar", state=current_arm_state
+            )).target
             logger.info(f"ARM state: en_progreso → pausado for {tag_spool}")
 
         elif operacion == ActionType.SOLD:
-            current_sold_state = sold_machine.get_state_id()
+            current_sold_state = sold_state
 
             if current_sold_state != "en_progreso":
                 raise InvalidStateTransitionError(
@@ -329,19 +198,20 @@ class StateService:
                     attempted_transition="pausar"
                 )
 
-            await sold_machine.pausar()
+            sold_state = write_set.add(transition_engine.fire(
+                transition_engine.SOLD, spool, "pausar", state=current_sold_state
+            )).target
             logger.info(f"SOLD state: en_progreso → pausado for {tag_spool}")
 
-        # Step 3: Delegate to OccupationService (clears Ocupado_Por, releases lock)
-        response = await self.occupation_service.pausar(request)
+        # Step 3: Estado_Detalle with pausado state (occupation cleared)
+        write_set.set("Estado_Detalle", self.estado_builder.build(
+            ocupado_por=None,
+            arm_state=arm_state,
+            sold_state=sold_state
+        ))
 
-        # Step 4: Update Estado_Detalle with pausado state
-        self._update_estado_detalle(
-            tag_spool=tag_spool,
-            ocupado_por=None,  # Occupation cleared
-            arm_state=arm_machine.get_state_id(),  # Now "pausado" for ARM operation
-            sold_state=sold_machine.get_state_id()  # Now "pausado" for SOLD operation
-        )
+        # Step 4: Delegate to OccupationService (clears Ocupado_Por, releases lock)
+        response = await self.occupation_service.pausar(request, extra_updates=write_set.as_dict())
 
         logger.info(f"✅ StateService.pausar completed for {tag_spool}")
         return response
@@ -351,10 +221,11 @@ class StateService:
         COMPLETAR operation with state machine coordination.
 
         Flow:
-        1. Delegate to OccupationService (verify lock + update fecha + release)
-        2. Hydrate state machines
-        3. Trigger completar transition
-        4. Update Estado_Detalle
+        1. Fetch spool and hydrate state machines
+        2. Evaluate completar transition into the WriteSet
+        3. Add Estado_Detalle
+        4. Delegate to OccupationService (verify lock + update fecha + release),
+           writing the WriteSet in the same batch
 
         Args:
             request: COMPLETAR request with tag_spool, worker_id, worker_nombre, fecha_operacion
@@ -363,6 +234,8 @@ class StateService:
             OccupationResponse with success status and message
 
         Raises:
+            SpoolNoEncontradoError: If spool doesn't exist
+            InvalidStateTransitionError: If current state is not en_progreso
             NoAutorizadoError: If worker doesn't own the lock
             LockExpiredError: If lock no longer exists
         """
@@ -371,241 +244,136 @@ class StateService:
 
         logger.info(f"StateService.completar: {tag_spool} by {request.worker_nombre}")
 
-        # Delegate to OccupationService
-        response = await self.occupation_service.completar(request)
-
-        # Fetch current spool state after OccupationService writes
+        # Fetch spool and hydrate BEFORE OccupationService clears Ocupado_Por
         spool = self.sheets_repo.get_spool_by_tag(tag_spool)
         if not spool:
             raise SpoolNoEncontradoError(tag_spool)
 
-        # Hydrate state machines
-        arm_machine = await self._hydrate_arm_machine(spool)
-        sold_machine = await self._hydrate_sold_machine(spool)
+        arm_state, sold_state = self._hydrate_releasing(spool, operacion)
+
+        # Evaluate completar transition based on operation
+        write_set = transition_engine.WriteSet()
 
-        # Trigger completar transition based on operation (await for async callbacks)
         if operacion == ActionType.ARM:
-            await arm_machine.completar(
-                worker_nombre=request.worker_nombre,
-                fecha_operacion=request.fecha_operacion
-            )
-            logger.info(f"ARM state machine transitioned to {arm_machine.get_state_id()}")
+            arm_state = write_set.add(transition_engine.fire(
+                transition_engine.ARM, spool, "completar", state=arm_state,
+                worker_nombre=request.worker_nombre, fecha_operacion=request.fecha_operacion
+            )).target
+            logger.info(f"ARM state transitioned to {arm_state}")
         elif operacion == ActionType.SOLD:
-            await sold_machine.completar(
-                worker_nombre=request.worker_nombre,
-                fecha_operacion=request.fecha_operacion
-            )
-            logger.info(f"SOLD state machine transitioned to {sold_machine.get_state_id()}")
+            sold_state = write_set.add(transition_engine.fire(
+                transition_engine.SOLD, spool, "completar", state=sold_state,
+                worker_nombre=request.worker_nombre, fecha_operacion=request.fecha_operacion
+            )).target
+            logger.info(f"SOLD state transitioned to {sold_state}")
+
+        # Estado_Detalle - available again since operation completed
+        write_set.set("Estado_Detalle", self.estado_builder.build(
+            ocupado_por=None,
+            arm_state=arm_state,
+            sold_state=sold_state
+        ))
 
-        # Build new estado_detalle after state machine transition
-        nuevo_estado_detalle = self.estado_builder.build(
-            ocupado_por=None,  # Clear occupation after completion
-            arm_state=arm_machine.get_state_id(),
-            sold_state=sold_machine.get_state_id()
-        )
-
-        # Update Estado_Detalle - now available since operation completed
-        self._update_estado_detalle(
-            tag_spool=tag_spool,
-            ocupado_por=None,  # Clear occupation after completion
-            arm_state=arm_machine.get_state_id(),
-            sold_state=sold_machine.get_state_id()
-        )
+        response = await self.occupation_service.completar(request, extra_updates=write_set.as_dict())
 
         logger.info(f"✅ StateService.completar completed for {tag_spool}")
         return response
 
-    async def _hydrate_arm_machine(self, spool) -> ARMStateMachine:
+    def _hydrate_releasing(self, spool, operacion: ActionType) -> tuple:
         """
-        Create ARM state machine and set it to match Sheets state.
-
-        Hydration logic:
-        - If Fecha_Armado exists → COMPLETADO state
-        - Else if Armador exists AND Ocupado_Por is null → PAUSADO state
-        - Else if Armador exists AND Ocupado_Por exists → EN_PROGRESO state
-        - Else → PENDIENTE state (initial)
-
-        ⚠️ TECHNICAL DEBT: This creates coupling between occupation state
-        (Ocupado_Por column managed by OccupationService) and state machine state
-        (managed by StateService). Ideally, state machine state should be
-        determinable from state-specific columns only.
+        Hydrate ARM/SOLD for a request that releases the occupation (PAUSAR/COMPLETAR).
 
-        Future Refactoring (v4.0): Add Estado_ARM column (enum: PENDIENTE/EN_PROGRESO/
-        PAUSADO/COMPLETADO) that is updated by state machine callbacks. This would
-        eliminate the coupling and make hydration deterministic.
-
-        Args:
-            spool: Spool model with current state
+        Hydration runs before Ocupado_Por is cleared, so the operation not being
+        worked is hydrated as it will read after the write (otherwise Ocupado_Por
+        without Soldador/Armador would hydrate it to en_progreso).
 
         Returns:
-            ARMStateMachine instance hydrated to current state
+            (arm_state, sold_state)
         """
-        machine = ARMStateMachine(
-            tag_spool=spool.tag_spool,
-            sheets_repo=self.sheets_repo,
-            metadata_repo=self.metadata_repo
+        released = spool.model_copy(update={"ocupado_por": None})
+        arm_state = transition_engine.hydrate(
+            transition_engine.ARM, spool if operacion == ActionType.ARM else released
         )
+        sold_state = transition_engine.hydrate(
+            transition_engine.SOLD, spool if operacion == ActionType.SOLD else released
+        )
+        return arm_state, sold_state
 
-        # CRITICAL: Activate initial state FIRST (required by python-statemachine 2.5.0)
-        # Then manually override current_state to hydrate from Sheets
-        await machine.activate_initial_state()
-
-        # Hydrate to match Sheets reality
-        if spool.fecha_armado:
-            # ARM is completed
-            machine.current_state = machine.completado
-            logger.debug(f"ARM hydrated to COMPLETADO for {spool.tag_spool}")
-        elif spool.armador:
-            # ARM initiated - check if paused or in progress
-            if spool.ocupado_por is None or spool.ocupado_por == "":
-                # Paused: Worker assigned but no current occupation
-                machine.current_state = machine.pausado
-                logger.debug(f"ARM hydrated to PAUSADO for {spool.tag_spool}")
-            else:
-                # In progress: Worker assigned and occupied
-                machine.current_state = machine.en_progreso
-                logger.debug(f"ARM hydrated to EN_PROGRESO for {spool.tag_spool}")
-        elif spool.ocupado_por and spool.ocupado_por != "":
-            # EDGE CASE: Ocupado_Por is set but Armador is not
-            # This indicates a partially-failed TOMAR operation where:
-            # 1. OccupationService.tomar() wrote Ocupado_Por successfully
-            # 2. State machine callback failed to write Armador (exception/crash/timeout)
-            # 3. Rollback failed or was incomplete, leaving spool in inconsistent state
-            #
-            # Hydrate to EN_PROGRESO to allow PAUSAR to recover from this state.
-            # PAUSAR will clear Ocupado_Por and release the lock, returning spool to clean PENDIENTE.
-            machine.current_state = machine.en_progreso
-            logger.warning(
-                f"⚠️ INCONSISTENT STATE DETECTED: {spool.tag_spool} has "
-                f"Ocupado_Por='{spool.ocupado_por}' but Armador=None. "
-                f"Hydrating to EN_PROGRESO to allow recovery via PAUSAR. "
-                f"This indicates a previous TOMAR operation failed mid-execution."
-            )
-        else:
-            # ARM is pending (initial state)
-            logger.debug(f"ARM hydrated to PENDIENTE for {spool.tag_spool}")
-
-        return machine
-
-    async def _hydrate_sold_machine(self, spool) -> SOLDStateMachine:
+    def _tomar_transition(
+        self,
+        write_set: transition_engine.WriteSet,
+        spool,
+        machine: str,
+        state: str,
+        worker_column: str,
+        worker_nombre: str
+    ) -> str:
         """
-        Create SOLD state machine and set it to match Sheets state.
-
-        Hydration logic (same pattern as ARM):
-        - If Fecha_Soldadura exists → COMPLETADO state
-        - Else if Soldador exists AND Ocupado_Por is null → PAUSADO state
-        - Else if Soldador exists AND Ocupado_Por exists → EN_PROGRESO state
-        - Else → PENDIENTE state (initial)
+        Evaluate the TOMAR transition of one operation into `write_set`.
 
-        ⚠️ TECHNICAL DEBT: Same coupling issue as ARM hydration. See _hydrate_arm_machine()
-        docstring for details and future refactoring plan.
-
-        Args:
-            spool: Spool model with current state
+        pausado → reanudar, pendiente → iniciar. en_progreso (Ocupado_Por set but
+        no worker column, from a previous partial TOMAR) only completes the worker
+        column, since iniciar is not allowed from en_progreso.
 
         Returns:
-            SOLDStateMachine instance hydrated to current state
-        """
-        machine = SOLDStateMachine(
-            tag_spool=spool.tag_spool,
-            sheets_repo=self.sheets_repo,
-            metadata_repo=self.metadata_repo
-        )
+            Target state ID
 
-        # CRITICAL: Activate initial state FIRST (required by python-statemachine 2.5.0)
-        # Then manually override current_state to hydrate from Sheets
-        await machine.activate_initial_state()
-
-        # Hydrate to match Sheets reality
-        if spool.fecha_soldadura:
-            # SOLD is completed
-            machine.current_state = machine.completado
-            logger.debug(f"SOLD hydrated to COMPLETADO for {spool.tag_spool}")
-        elif spool.soldador:
-            # SOLD initiated - check if paused or in progress
-            if spool.ocupado_por is None or spool.ocupado_por == "":
-                # Paused: Worker assigned but no current occupation
-                machine.current_state = machine.pausado
-                logger.debug(f"SOLD hydrated to PAUSADO for {spool.tag_spool}")
-            else:
-                # In progress: Worker assigned and occupied
-                machine.current_state = machine.en_progreso
-                logger.debug(f"SOLD hydrated to EN_PROGRESO for {spool.tag_spool}")
-        elif spool.ocupado_por and spool.ocupado_por != "":
-            # EDGE CASE: Ocupado_Por is set but Soldador is not
-            # This indicates a partially-failed TOMAR operation where:
-            # 1. OccupationService.tomar() wrote Ocupado_Por successfully
-            # 2. State machine callback failed to write Soldador (exception/crash/timeout)
-            # 3. Rollback failed or was incomplete, leaving spool in inconsistent state
-            #
-            # Hydrate to EN_PROGRESO to allow PAUSAR to recover from this state.
-            # PAUSAR will clear Ocupado_Por and release the lock, returning spool to clean PENDIENTE.
-            machine.current_state = machine.en_progreso
+        Raises:
+            InvalidStateTransitionError: If the operation is already completed
+            DependenciasNoSatisfechasError: If SOLD iniciar runs without ARM initiated
+        """
+        tag_spool = spool.tag_spool
+
+        if state == "pausado":
+            # Resume paused work
+            target = write_set.add(transition_engine.fire(
+                machine, spool, "reanudar", state=state, worker_nombre=worker_nombre
+            )).target
+            logger.info(f"{machine} state: pausado → en_progreso for {tag_spool} (resumed by {worker_nombre})")
+            return target
+
+        if state == "pendiente":
+            # Start new work (SOLD validates ARM dependency)
+            target = write_set.add(transition_engine.fire(
+                machine, spool, "iniciar", state=state,
+                worker_nombre=worker_nombre, fecha_operacion=date.today()
+            )).target
+            logger.info(f"{machine} state: pendiente → en_progreso for {tag_spool} (started by {worker_nombre})")
+            return target
+
+        if state == "en_progreso":
             logger.warning(
-                f"⚠️ INCONSISTENT STATE DETECTED: {spool.tag_spool} has "
-                f"Ocupado_Por='{spool.ocupado_por}' but Soldador=None. "
-                f"Hydrating to EN_PROGRESO to allow recovery via PAUSAR. "
-                f"This indicates a previous TOMAR operation failed mid-execution."
+                f"{machine} already en_progreso for {tag_spool} (Ocupado_Por set, {worker_column}=None). "
+                f"Writing {worker_column} to complete state."
             )
-        else:
-            # SOLD is pending (initial state)
-            logger.debug(f"SOLD hydrated to PENDIENTE for {spool.tag_spool}")
-
-        return machine
+            write_set.set(worker_column, worker_nombre)
+            return state
 
-    def _update_estado_detalle(
-        self,
-        tag_spool: str,
-        ocupado_por: Optional[str],
-        arm_state: str,
-        sold_state: str,
-        operacion_actual: Optional[str] = None
-    ):
-        """
-        Update Estado_Detalle column with formatted display string.
-
-        Args:
-            tag_spool: Spool identifier
-            ocupado_por: Worker name occupying spool (None if available)
-            arm_state: ARM state ID (pendiente/en_progreso/completado)
-            sold_state: SOLD state ID (pendiente/en_progreso/completado)
-            operacion_actual: Current operation being worked (ARM/SOLD)
-        """
-        # Build display string
-        estado_detalle = self.estado_builder.build(
-            ocupado_por=ocupado_por,
-            arm_state=arm_state,
-            sold_state=sold_state,
-            operacion_actual=operacion_actual
-        )
+        if state == "completado":
+            # Cannot restart completed work
+            raise InvalidStateTransitionError(
+                f"Cannot TOMAR {machine} - operation already completed",
+                tag_spool=tag_spool,
+                current_state=state,
+                attempted_transition="iniciar"
+            )
 
-        # Find row for this spool
-        tag_col_letter = self.sheets_repo.get_tag_spool_column_letter(config.HOJA_OPERACIONES_NOMBRE)
-        row_num = self.sheets_repo.find_row_by_column_value(
-            sheet_name=config.HOJA_OPERACIONES_NOMBRE,
-            column_letter=tag_col_letter,
-            value=tag_spool
+        # Unknown state - should never happen
+        logger.error(f"Unknown {machine} state '{state}' for {tag_spool}")
+        raise InvalidStateTransitionError(
+            f"Unknown {machine} state '{state}'",
+            tag_spool=tag_spool,
+            current_state=state,
+            attempted_transition="iniciar"
         )
 
-        if row_num:
-            # Update Estado_Detalle column
-            self.sheets_repo.update_cell_by_column_name(
-                sheet_name=config.HOJA_OPERACIONES_NOMBRE,
-                row=row_num,
-                column_name="Estado_Detalle",
-                value=estado_detalle
-            )
-            logger.debug(f"Estado_Detalle updated for {tag_spool}: {estado_detalle}")
-        else:
-            logger.warning(f"Could not find row for {tag_spool} to update Estado_Detalle")
-
     async def trigger_metrologia_transition(self, tag_spool: str) -> Optional[str]:
         """
         Trigger automatic transition to metrología queue when all work is complete.
 
         Flow:
         1. Fetch current spool state from Sheets
-        2. Load metrología state machine
+        2. Hydrate metrología state
         3. Check if already in metrología queue (PENDIENTE_METROLOGIA)
         4. Trigger transition to PENDIENTE_METROLOGIA state
         5. Update Estado_Detalle to "En Cola Metrología"
@@ -628,20 +396,8 @@ class StateService:
             if not spool:
                 raise SpoolNoEncontradoError(tag_spool)
 
-            # Step 2: Load metrología state machine
-            from backend.domain.state_machines.metrologia_machine import MetrologiaStateMachine
-
-            metrologia_machine = MetrologiaStateMachine(
-                tag_spool=tag_spool,
-                sheets_repo=self.sheets_repo,
-                metadata_repo=self.metadata_repo
-            )
-
-            # Activate initial state
-            await metrologia_machine.activate_initial_state()
-
-            # Step 3: Check current state
-            current_state = metrologia_machine.get_state_id()
+            # Step 2-3: Hydrate metrología state
+            current_state = transition_engine.hydrate(transition_engine.METROLOGIA, spool)
 
             if current_state != "pendiente":
                 logger.warning(
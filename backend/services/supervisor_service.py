@@ -153,6 +153,20 @@ class SupervisorService:
         """Endpoint de debug: lee eventos con timestamp >= since."""
         return self.repo.get_audit_events_since(since)
 
+    def get_audit_page(
+        self,
+        since: datetime,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[AuditEvent], Optional[str]]:
+        """
+        Versión paginada de get_audit_since para la UI del supervisor.
+
+        Returns:
+            (events, next_cursor). Un cursor inválido lanza ValueError (→ 400).
+        """
+        return self.repo.get_audit_page(since, limit=limit, cursor=cursor)
+
     def record_legacy_snapshot(self, snapshot: LegacySnapshot) -> bool:
         """
         Persiste un snapshot crudo de localStorage (Capa 0 de migración).
@@ -14,11 +14,18 @@ from tenacity import (
     before_sleep_log
 )
 
+from backend.core.sheets_instrumentation import record_sheets_retry
 from backend.exceptions import SheetsConnectionError
 from backend.repositories.sheets_repository import SheetsRepository
 
 
 logger = logging.getLogger(__name__)
+_log_retry = before_sleep_log(logger, logging.WARNING)
+
+
+def _before_retry_sleep(retry_state) -> None:
+    record_sheets_retry()
+    _log_retry(retry_state)
 
 
 class VersionDetectionService:
@@ -47,7 +54,7 @@ class VersionDetectionService:
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),  # 2s, 4s, 10s (capped)
         retry=retry_if_exception_type((SheetsConnectionError, TimeoutError)),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
+        before_sleep=_before_retry_sleep,
         reraise=False  # Don't reraise - we default to v3.0 on failure
     )
     async def detect_version(self, tag_spool: str) -> Dict[str, any]:
@@ -7,6 +7,7 @@ Responsabilidades:
 - Filtrar trabajadores inactivos
 - Integrar roles desde hoja Roles (v2.0)
 """
+import hashlib
 import logging
 from typing import Optional
 
@@ -61,7 +62,7 @@ class WorkerService:
         else:
             self.role_service = role_service
 
-    def _get_all_workers(self) -> list[Worker]:
+    def _get_all_workers(self, use_cache: bool = True) -> list[Worker]:
         """
         Obtiene todos los trabajadores desde Google Sheets.
 
@@ -73,6 +74,10 @@ class WorkerService:
         de Pydantic `model_copy(roles=...)` en cada request — el cuello
         principal observado en el batch-status del home con 200 spools.
 
+        Args:
+            use_cache: False para reconstruir la lista aunque siga cacheada
+                       (refresher de fondo, ver `refresh_workers`)
+
         Returns:
             Lista de objetos Worker parseados (activos e inactivos) con roles array
 
@@ -81,7 +86,7 @@ class WorkerService:
         """
         # T-136 D1: parsed-list cache (TTL 300s)
         cache = get_cache()
-        cached = cache.get(_WORKERS_CACHE_KEY)
+        cached = cache.get(_WORKERS_CACHE_KEY) if use_cache else None
         if cached is not None:
             logger.debug(
                 f"Worker list cache hit ({len(cached)} workers, skipping Sheets parse)"
@@ -138,9 +143,33 @@ class WorkerService:
 
         # T-136 D1: cache the parsed list. Subsequent requests within
         # the TTL window skip the parse + model_copy loop entirely.
-        cache.set(_WORKERS_CACHE_KEY, workers, ttl_seconds=_WORKERS_CACHE_TTL_SECONDS)
+        digest = hashlib.blake2b(
+            repr([w.model_dump() for w in workers]).encode(), digest_size=16
+        ).hexdigest()
+        cache.set(_WORKERS_CACHE_KEY, workers, ttl_seconds=_WORKERS_CACHE_TTL_SECONDS, digest=digest)
         return workers
 
+    def refresh_workers(self) -> list[Worker]:
+        """
+        Relee Trabajadores y Roles y reemplaza la lista cacheada.
+
+        La llama el refresher de fondo (backend/core/snapshot_refresher.py)
+        antes de que venza el TTL, así los requests no pagan la lectura de
+        Roles (que no pasa por el cache de `read_worksheet`). Si el contenido
+        no cambió, `list_version` tampoco.
+        """
+        return self._get_all_workers(use_cache=False)
+
+    def list_version(self) -> int:
+        """
+        Versión de la lista de trabajadores parseada (para ETags).
+
+        Carga la lista si no está cacheada; un re-parse con el mismo
+        contenido no cambia la versión.
+        """
+        self._get_all_workers()
+        return get_cache().version(_WORKERS_CACHE_KEY)
+
     def get_all_active_workers(self) -> list[Worker]:
         """
         Obtiene todos los trabajadores activos del sistema.
@@ -7,6 +7,10 @@ para optimizar el acceso a datos que cambian poco frecuentemente.
 from datetime import datetime, timedelta
 from typing import Optional, Any
 import logging
+import threading
+
+from backend.core.sheets_instrumentation import record_cache_lookup
+from backend.core.shared_store import get_shared_store
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +25,7 @@ class SimpleCache:
     - Expiración automática al leer
     - Invalidación manual por key
     - Limpieza completa
+    - Versión monotónica por key (ETags de endpoints de lectura)
 
     Uso:
         cache = SimpleCache()
@@ -28,11 +33,38 @@ class SimpleCache:
         value = cache.get("key")  # None si expiró o no existe
         cache.invalidate("key")   # Invalida manualmente
         cache.clear()             # Limpia todo el cache
+        cache.version("key")      # Cambia con cada invalidación o valor nuevo
+
+    Versiones: `version(key)` avanza con cada `invalidate` (una escritura
+    cambió los datos) y con cada `set` cuyo `digest` difiera del anterior.
+    Un re-fetch tras expirar el TTL con el mismo contenido (mismo digest)
+    NO cambia la versión, así los ETags derivados siguen siendo válidos.
+
+    Multi-proceso: con `shared` (backend/core/shared_store.py) cada
+    `invalidate` avanza además una generación compartida por key, y cada
+    `get`/`version` la compara con la generación con la que se guardó la
+    entrada local: si otro worker escribió, la entrada se descarta y la
+    versión local avanza.
+
+    Threads: `set`, `set_if_version`, `invalidate` y `clear` toman un lock,
+    así un lector de fondo (SnapshotRefresher) no puede guardar filas leídas
+    antes de una escritura que ya invalidó la key (`set_if_version`).
     """
 
-    def __init__(self):
-        """Inicializa el cache vacío."""
+    def __init__(self, shared=None):
+        """
+        Inicializa el cache vacío.
+
+        Args:
+            shared: SharedStore para invalidar entre procesos (None = solo local)
+        """
+        self.shared = shared
+        self._lock = threading.RLock()
         self._cache: dict[str, tuple[Any, datetime]] = {}
+        self._versions: dict[str, int] = {}
+        self._digests: dict[str, str] = {}
+        # key -> generación compartida con la que se guardó la entrada local
+        self._generations: dict[str, int] = {}
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -52,21 +84,31 @@ class SimpleCache:
             >>> cache.get("nonexistent")
             None
         """
+        self._sync(key)
         if key in self._cache:
             value, expiration = self._cache[key]
 
             # Verificar si ha expirado
             if datetime.now() < expiration:
                 logger.debug(f"✅ Cache hit: {key}")
+                record_cache_lookup(hit=True, key=key)
                 return value
             else:
                 # Expiró, remover del cache
                 del self._cache[key]
                 logger.debug(f"⚠️  Cache expired: {key}")
 
+        record_cache_lookup(hit=False, key=key)
         return None
 
-    def set(self, key: str, value: Any, ttl_seconds: int):
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int,
+        digest: Optional[str] = None,
+        generation: Optional[int] = None,
+    ):
         """
         Guarda valor en cache con TTL especificado.
 
@@ -74,16 +116,57 @@ class SimpleCache:
             key: Clave para identificar el valor
             value: Valor a cachear (cualquier tipo)
             ttl_seconds: Tiempo de vida en segundos
+            digest: Hash del contenido; si coincide con el del valor anterior
+                    la versión de la key no cambia (sin digest siempre avanza)
+            generation: Generación compartida tomada ANTES de leer el valor
+                    (`generation(key)`); si otro proceso invalidó la key
+                    mientras tanto, el valor se descarta en el próximo `get`
 
         Example:
             >>> cache = SimpleCache()
             >>> cache.set("workers", [worker1, worker2], ttl_seconds=300)
             >>> cache.set("spools", [spool1, spool2], ttl_seconds=60)
         """
-        expiration = datetime.now() + timedelta(seconds=ttl_seconds)
-        self._cache[key] = (value, expiration)
+        with self._lock:
+            self._sync(key)
+            expiration = datetime.now() + timedelta(seconds=ttl_seconds)
+            self._cache[key] = (value, expiration)
+            if self.shared is not None:
+                self._generations[key] = generation if generation is not None else self.shared.generation(key)
+            if digest is None or digest != self._digests.get(key):
+                self._bump(key)
+            if digest is None:
+                self._digests.pop(key, None)
+            else:
+                self._digests[key] = digest
         logger.debug(f"💾 Cache set: {key} (TTL: {ttl_seconds}s, expires: {expiration.strftime('%H:%M:%S')})")
 
+    def set_if_version(
+        self,
+        key: str,
+        expected_version: int,
+        value: Any,
+        ttl_seconds: int,
+        digest: Optional[str] = None,
+        generation: Optional[int] = None,
+    ) -> Optional[int]:
+        """
+        `set` solo si la versión de la key sigue siendo `expected_version`.
+
+        La versión se toma ANTES de leer el valor de Sheets: si una escritura
+        invalidó la key durante la lectura, el valor puede ser previo a la
+        escritura y no se guarda (si no quedaría vigente todo el TTL).
+
+        Returns:
+            La versión tras guardar, o None si la key cambió (no se guardó)
+        """
+        with self._lock:
+            if self.version(key) != expected_version:
+                logger.debug(f"⚠️  Cache set skipped: {key} changed while reading")
+                return None
+            self.set(key, value, ttl_seconds, digest=digest, generation=generation)
+            return self._versions.get(key, 0)
+
     def invalidate(self, key: str):
         """
         Invalida cache manualmente (ej: después de actualizar datos).
@@ -97,8 +180,13 @@ class SimpleCache:
             >>> # ... actualizar datos en Sheets ...
             >>> cache.invalidate("data")  # Fuerza re-lectura en próximo get
         """
-        if key in self._cache:
-            del self._cache[key]
+        # Aunque la entrada ya haya expirado, los datos cambiaron
+        with self._lock:
+            self._bump(key)
+            if self.shared is not None:
+                self._generations[key] = self.shared.bump(key)
+            removed = self._cache.pop(key, None) is not None
+        if removed:
             logger.info(f"🗑️  Cache invalidated: {key}")
         else:
             logger.debug(f"⚠️  Cache invalidate: key '{key}' not found (already expired or never set)")
@@ -114,13 +202,58 @@ class SimpleCache:
             >>> cache.clear()
             >>> cache.get("key1")  # None
         """
-        count = len(self._cache)
-        self._cache.clear()
+        with self._lock:
+            count = len(self._cache)
+            self._cache.clear()
+            for key in list(self._versions):
+                self._bump(key)
+                if self.shared is not None:
+                    self._generations[key] = self.shared.bump(key)
+            self._digests.clear()
         logger.info(f"🧹 Cache cleared ({count} entries removed)")
 
+    def version(self, key: str) -> int:
+        """
+        Versión actual de una key (0 si nunca se guardó ni invalidó).
+
+        Example:
+            >>> cache = SimpleCache()
+            >>> cache.set("rows", [[1]], ttl_seconds=60, digest="a")
+            >>> cache.version("rows")
+            1
+            >>> cache.set("rows", [[1]], ttl_seconds=60, digest="a")
+            >>> cache.version("rows")  # mismo contenido
+            1
+        """
+        self._sync(key)
+        return self._versions.get(key, 0)
+
+    def generation(self, key: str) -> Optional[int]:
+        """Generación compartida de la key (None sin store compartido)."""
+        if self.shared is None:
+            return None
+        return self.shared.generation(key)
+
+    def _bump(self, key: str) -> None:
+        self._versions[key] = self._versions.get(key, 0) + 1
+
+    def _sync(self, key: str) -> None:
+        """Aplica invalidaciones de otros procesos a la key."""
+        if self.shared is None:
+            return
+        generation = self.shared.generation(key)
+        seen = self._generations.get(key)
+        if seen is None:
+            self._generations[key] = generation
+        elif seen != generation:
+            self._generations[key] = generation
+            self._bump(key)
+            if self._cache.pop(key, None) is not None:
+                logger.info(f"🗑️  Cache invalidated by another worker: {key}")
+
 
 # Singleton global para uso en toda la aplicación
-_cache = SimpleCache()
+_cache = SimpleCache(shared=get_shared_store())
 
 
 def get_cache() -> SimpleCache:
@@ -0,0 +1,222 @@
+"""
+Compresión de respuestas HTTP con negociación brotli/gzip.
+
+Las listas de spools, batch-status y /api/v4/uniones/{tag}/todas viajan por
+el Wi-Fi de planta hacia las tablets; JSON repetitivo comprime ~10x.
+
+- `negotiate_encoding`: elige "br" o "gzip" según Accept-Encoding (q-values).
+- `compress`: compresión de un body completo (usada por el cache de bodies
+  pre-serializados, ver backend/utils/response_cache.py, que guarda la
+  variante comprimida por snapshot y no recomprime payloads idénticos).
+- `CompressionMiddleware`: middleware ASGI para el resto de las respuestas.
+  Bodies bajo `config.COMPRESSION_MIN_BYTES` salen sin comprimir; respuestas
+  en streaming se comprimen chunk a chunk con flush (no se bufferean
+  completas). Se omiten text/event-stream (SSE), 204/304 y respuestas que
+  ya traen Content-Encoding (ej: bodies pre-comprimidos del cache).
+
+Una respuesta comprimida lleva su ETag como débil (`W/"..."`, ver
+`weaken_etag`): las variantes br, gzip e identity comparten el ETag del
+endpoint y un ETag fuerte promete bytes idénticos entre ellas.
+"""
+import zlib
+from typing import Optional
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Calidad para respuestas dinámicas: brotli 4 comprime mejor que gzip 6 y es
+# igual de rápido; calidades altas (9-11) son para assets estáticos
+BROTLI_QUALITY = 4
+GZIP_LEVEL = 6
+
+# Preferencia del servidor cuando el cliente acepta ambas con igual q
+_PREFERENCE = ("br", "gzip")
+
+# Content-types que no vale la pena comprimir o que deben fluir sin buffer
+_SKIP_CONTENT_TYPES = ("text/event-stream", "image/", "video/", "audio/", "application/zip")
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Elige la codificación para un header Accept-Encoding.
+
+    Returns:
+        "br", "gzip" o None (sin compresión)
+
+    Example:
+        >>> negotiate_encoding("gzip, deflate, br")
+        'br'
+        >>> negotiate_encoding("br;q=0, gzip")
+        'gzip'
+    """
+    if not accept_encoding:
+        return None
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[coding] = q
+
+    best, best_q = None, 0.0
+    for coding in _PREFERENCE:
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(coding: str, data: bytes) -> bytes:
+    """Comprime un body completo con la codificación negociada."""
+    if coding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    compressor = _gzip_compressor()
+    return compressor.compress(data) + compressor.flush()
+
+
+def _gzip_compressor():
+    # wbits=31: formato gzip (header + trailer), no deflate crudo
+    return zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+
+class _StreamCompressor:
+    """Compresor incremental con flush por chunk (streaming sin buffer)."""
+
+    def __init__(self, coding: str):
+        self._brotli = brotli.Compressor(quality=BROTLI_QUALITY) if coding == "br" else None
+        self._gzip = None if coding == "br" else _gzip_compressor()
+
+    def chunk(self, data: bytes) -> bytes:
+        if self._brotli is not None:
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._gzip.compress(data) + self._gzip.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        if self._brotli is not None:
+            return self._brotli.process(data) + self._brotli.finish()
+        return self._gzip.compress(data) + self._gzip.flush()
+
+
+def add_vary_accept_encoding(headers: MutableHeaders) -> None:
+    vary = headers.get("vary")
+    if not vary:
+        headers["Vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding"
+
+
+def weaken_etag(headers: MutableHeaders) -> None:
+    """
+    Pasa a débil el ETag de una respuesta que sale comprimida.
+
+    `etag_matches` compara en forma débil, así que If-None-Match con
+    `W/"..."` sigue dando 304 contra el ETag fuerte del endpoint.
+    """
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+class CompressionMiddleware:
+    """
+    Middleware ASGI de compresión brotli/gzip con umbral de tamaño.
+
+    Usage:
+        app.add_middleware(CompressionMiddleware, minimum_size=1024)
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        coding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingResponder(send, coding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    """Intercepta los mensajes de una respuesta y los comprime."""
+
+    def __init__(self, send: Send, coding: str, minimum_size: int):
+        self._send = send
+        self._coding = coding
+        self._minimum_size = minimum_size
+        self._start: Optional[Message] = None
+        self._passthrough = False
+        self._buffer = bytearray()
+        self._compressor: Optional[_StreamCompressor] = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            self._passthrough = not self._eligible(message)
+            if self._passthrough:
+                await self._send(message)
+            return
+
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._compressor is not None:
+            data = self._compressor.chunk(body) if more_body else self._compressor.finish(body)
+            await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+            return
+
+        self._buffer.extend(body)
+        if len(self._buffer) < self._minimum_size:
+            if more_body:
+                return  # aún no se sabe si supera el umbral
+            await self._send_uncompressed()
+            return
+
+        await self._start_compressed(more_body)
+
+    def _eligible(self, message: Message) -> bool:
+        if message["status"] < 200 or message["status"] in (204, 304):
+            return False
+        headers = Headers(raw=message["headers"])
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        return not any(content_type.startswith(skip) for skip in _SKIP_CONTENT_TYPES)
+
+    async def _send_uncompressed(self) -> None:
+        add_vary_accept_encoding(MutableHeaders(raw=self._start["headers"]))
+        await self._send(self._start)
+        await self._send({"type": "http.response.body", "body": bytes(self._buffer)})
+
+    async def _start_compressed(self, more_body: bool) -> None:
+        headers = MutableHeaders(raw=self._start["headers"])
+        headers["Content-Encoding"] = self._coding
+        add_vary_accept_encoding(headers)
+        weaken_etag(headers)
+        self._compressor = _StreamCompressor(self._coding)
+        buffered = bytes(self._buffer)
+        self._buffer.clear()
+        if more_body:
+            # Streaming: el largo final es desconocido
+            del headers["content-length"]
+            data = self._compressor.chunk(buffered)
+        else:
+            data = self._compressor.finish(buffered)
+            headers["Content-Length"] = str(len(data))
+        await self._send(self._start)
+        await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
@@ -0,0 +1,58 @@
+"""
+ETags fuertes derivados de versiones de snapshot (ver SimpleCache.version).
+
+Las tablets consultan por polling /api/spools/iniciar, /api/spools/ocupados,
+/api/workers, /api/spools/batch-status y /api/dashboard/occupied. Si las
+hojas de las que depende el endpoint no cambiaron, el ETag es el mismo y el
+endpoint responde 304 sin recalcular ni serializar el body.
+
+Usage:
+    etag = snapshot_etag("iniciar", operacion, sheets_repo.snapshot_version("Operaciones"))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+"""
+import hashlib
+import uuid
+from typing import Optional
+
+from fastapi import Response
+
+# Las versiones son contadores en memoria: el boot id evita que un ETag
+# emitido antes de un reinicio coincida con uno nuevo
+_BOOT_ID = uuid.uuid4().hex
+
+# El cliente siempre revalida (el navegador envía If-None-Match solo)
+_CACHE_CONTROL = "no-cache"
+
+
+def snapshot_etag(*parts) -> str:
+    """ETag fuerte a partir de versiones de snapshot y parámetros del request."""
+    raw = "\x1f".join([_BOOT_ID, *(str(part) for part in parts)])
+    return f'"{hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Comparación débil de If-None-Match (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    """Respuesta 304 sin body."""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL})
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Agrega ETag y Cache-Control a una respuesta 200."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _CACHE_CONTROL
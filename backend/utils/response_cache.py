@@ -0,0 +1,145 @@
+"""
+Cache de bodies JSON ya serializados para endpoints de lista calientes.
+
+Aun con Operaciones cacheado, cada GET /api/spools/iniciar o /api/workers
+validaba cientos de modelos Pydantic (response_model) y los pasaba por
+`jsonable_encoder` + `json.dumps`. Los bodies se guardan aquí como bytes,
+indexados por el ETag del endpoint (ver backend/utils/etag.py), que ya
+incluye endpoint, parámetros y versión del snapshot: mientras el snapshot
+no cambie, requests idénticos devuelven los mismos bytes sin serializar.
+
+Serialización: `model.__pydantic_serializer__.to_json` (pydantic-core, en
+Rust) produce el mismo JSON compacto que el encoder de FastAPI, sin pasar
+por dicts intermedios.
+
+Cada entrada guarda además sus variantes comprimidas (brotli/gzip,
+`CachedBody.variant`), calculadas una vez por snapshot: la respuesta
+negocia Accept-Encoding y envía la variante ya comprimida (con el ETag
+como débil, `W/`), y CompressionMiddleware la deja pasar (trae
+Content-Encoding).
+
+Usage:
+    cache = get_response_cache()
+    cached = cache.get(etag)
+    if cached is None:
+        cached = cache.put(etag, SpoolListResponse(...))
+    return cached_json_response(cached, etag)
+"""
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from fastapi import Response
+from pydantic import BaseModel
+from starlette.datastructures import Headers
+from starlette.types import Receive, Scope, Send
+
+from backend.config import config
+from backend.core import metrics
+from backend.utils.compression import add_vary_accept_encoding, compress, negotiate_encoding, weaken_etag
+from backend.utils.etag import set_etag
+
+logger = logging.getLogger(__name__)
+
+
+class CachedBody:
+    """Body JSON serializado de una respuesta, con variantes comprimidas."""
+
+    __slots__ = ("body", "_variants", "_lock")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self._variants: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def variant(self, coding: str, compress: Callable[[bytes], bytes]) -> bytes:
+        """
+        Body comprimido con `coding` (ej: "gzip"), calculado una sola vez.
+
+        Args:
+            coding: Nombre del Content-Encoding
+            compress: Función que comprime el body
+        """
+        with self._lock:
+            encoded = self._variants.get(coding)
+            if encoded is None:
+                encoded = compress(self.body)
+                self._variants[coding] = encoded
+            return encoded
+
+
+class ResponseBytesCache:
+    """LRU acotado de CachedBody por clave (ETag del endpoint)."""
+
+    def __init__(self, max_entries: int = 64):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedBody]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedBody]:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+        metrics.CACHE_LOOKUPS.inc(key="response", result="hit" if cached is not None else "miss")
+        return cached
+
+    def put(self, key: str, model: BaseModel) -> CachedBody:
+        """Serializa `model` y lo guarda bajo `key`."""
+        cached = CachedBody(encode_model(model))
+        with self._lock:
+            self._entries[key] = cached
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                # Las claves de snapshots viejos quedan al fondo y salen solas
+                self._entries.popitem(last=False)
+        logger.debug(f"ResponseBytesCache: stored {len(cached.body)} bytes")
+        return cached
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def encode_model(model: BaseModel) -> bytes:
+    """JSON compacto de un modelo (mismo resultado que el encoder de FastAPI)."""
+    return model.__pydantic_serializer__.to_json(model)
+
+
+class CachedJSONResponse(Response):
+    """Respuesta con un CachedBody; negocia la variante comprimida al enviarse."""
+
+    media_type = "application/json"
+
+    def __init__(self, cached: CachedBody, etag: str):
+        super().__init__(content=cached.body)
+        self._cached = cached
+        set_etag(self, etag)
+        add_vary_accept_encoding(self.headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        coding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if coding is not None and len(self._cached.body) >= config.COMPRESSION_MIN_BYTES:
+            self.body = self._cached.variant(coding, lambda body: compress(coding, body))
+            self.headers["Content-Encoding"] = coding
+            self.headers["Content-Length"] = str(len(self.body))
+            weaken_etag(self.headers)
+        await super().__call__(scope, receive, send)
+
+
+def cached_json_response(cached: CachedBody, etag: str) -> Response:
+    """Respuesta 200 con el body cacheado y su ETag."""
+    return CachedJSONResponse(cached, etag)
+
+
+# Singleton global para uso en toda la aplicación
+_response_cache = ResponseBytesCache()
+
+
+def get_response_cache() -> ResponseBytesCache:
+    """Obtiene instancia global del cache de respuestas (singleton pattern)."""
+    return _response_cache
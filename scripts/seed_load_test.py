@@ -21,6 +21,11 @@ OUTPUT:
 
 DETERMINISM:
     random.seed(42). Same dataset every run.
+
+OFFLINE:
+    `build_dataset()` / `build_worker_rows()` are import-safe (no .env, no
+    network) and also seed the in-memory fake backend
+    (backend/repositories/fake_gspread.py, SHEETS_BACKEND=fake).
 """
 from __future__ import annotations
 
@@ -33,19 +38,23 @@ import sys
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
-# --- env loading ---
+import gspread  # noqa: E402
+from google.oauth2.service_account import Credentials  # noqa: E402
+
+# --- env loading (only when run as a script; see load_env) ---
 REPO_ROOT = Path(__file__).resolve().parent.parent
 ENV_PATH = REPO_ROOT / ".env.local"
-if not ENV_PATH.exists():
-    print(f"FATAL: .env.local not found at {ENV_PATH}", file=sys.stderr)
-    sys.exit(2)
 
-from dotenv import load_dotenv  # noqa: E402
 
-load_dotenv(ENV_PATH)
+def load_env() -> None:
+    if not ENV_PATH.exists():
+        print(f"FATAL: .env.local not found at {ENV_PATH}", file=sys.stderr)
+        sys.exit(2)
+
+    from dotenv import load_dotenv
+
+    load_dotenv(ENV_PATH)
 
-import gspread  # noqa: E402
-from google.oauth2.service_account import Credentials  # noqa: E402
 
 # ---------------------------------------------------------------------------
 # Hard safety: PROD blocklist
@@ -493,6 +502,68 @@ def build_spool(seq: int, estado: str) -> tuple[list, list[list], list[list]]:
     return op_row, union_rows, [md_row]
 
 
+# ---------------------------------------------------------------------------
+# Dataset
+# ---------------------------------------------------------------------------
+TRABAJADORES_HEADERS = ["Id", "Nombre", "Apellido", "Rol", "Activo"]
+ROLES_HEADERS = ["Id", "Rol", "Activo"]
+
+
+def scaled_distribution(total_spools: int) -> list[tuple[str, int]]:
+    """DISTRIBUTION scaled to `total_spools`; rounding leftovers go to LIBRE."""
+    scaled = [(estado, n * total_spools // TOTAL_SPOOLS) for estado, n in DISTRIBUTION]
+    leftover = total_spools - sum(n for _, n in scaled)
+    estado, n = scaled[0]
+    scaled[0] = (estado, n + leftover)
+    return scaled
+
+
+def build_dataset(
+    seed: int = 42, total_spools: int = TOTAL_SPOOLS
+) -> tuple[list[list], list[list], list[list]]:
+    """
+    Deterministic (operaciones_rows, uniones_rows, metadata_rows), no headers.
+
+    Resets the RNG and the union/metadata id counters, so every call returns
+    the same rows (timestamps aside: they are relative to now). With
+    `total_spools` != 200 the state mix keeps DISTRIBUTION's proportions
+    (offline benchmarks at 1k-50k rows).
+    """
+    global _union_id_counter, _metadata_id_counter
+    random.seed(seed)
+    _union_id_counter = 1
+    _metadata_id_counter = 1
+
+    op_rows: list[list] = []
+    union_rows: list[list] = []
+    metadata_rows: list[list] = []
+    seq = 1
+    for estado, n in scaled_distribution(total_spools):
+        for _ in range(n):
+            op, unions, metas = build_spool(seq, estado)
+            op_rows.append(op)
+            union_rows.extend(unions)
+            metadata_rows.extend(metas)
+            seq += 1
+    return op_rows, union_rows, metadata_rows
+
+
+def build_worker_rows() -> tuple[list[list], list[list]]:
+    """
+    (trabajadores_rows, roles_rows), no headers, for the hardcoded worker pool.
+
+    Staging already has these workers; only the offline fake backend needs them.
+    """
+    pools = [(ARMADORES, "Armador"), (SOLDADORES, "Soldador"), (METROLOGOS, "Metrologia")]
+    trabajadores: list[list] = []
+    roles: list[list] = []
+    for pool, rol in pools:
+        for w in pool:
+            trabajadores.append([w["id"], w["nombre"], w["apellido"], rol, "TRUE"])
+            roles.append([w["id"], rol, "TRUE"])
+    return trabajadores, roles
+
+
 # ---------------------------------------------------------------------------
 # Sheets I/O
 # ---------------------------------------------------------------------------
@@ -601,6 +672,7 @@ def main() -> int:
     )
     args = parser.parse_args()
 
+    load_env()
     sheet_id = os.getenv("GOOGLE_SHEET_ID")
 
     print("=" * 70)
@@ -633,22 +705,13 @@ def main() -> int:
     print()
 
     # Generate dataset (deterministic)
-    random.seed(42)
     print("Generating synthetic dataset (seed=42)...")
-    op_rows: list[list] = []
-    union_rows: list[list] = []
-    metadata_rows: list[list] = []
+    op_rows, union_rows, metadata_rows = build_dataset(seed=42)
 
-    seq = 1
     counts: dict[str, int] = {}
-    for estado, n in DISTRIBUTION:
-        for _ in range(n):
-            op, unions, metas = build_spool(seq, estado)
-            op_rows.append(op)
-            union_rows.extend(unions)
-            metadata_rows.extend(metas)
-            counts[estado] = counts.get(estado, 0) + 1
-            seq += 1
+    for md in metadata_rows:
+        estado = json.loads(md[9])["estado_objetivo"]
+        counts[estado] = counts.get(estado, 0) + 1
 
     print(f"  ✓ Generated {len(op_rows)} spools, {len(union_rows)} unions, "
           f"{len(metadata_rows)} metadata events")
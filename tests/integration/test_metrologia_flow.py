@@ -380,24 +380,25 @@ async def test_t112_three_consecutive_rechazados_reach_bloqueado(
     Estado_Detalle that was written by the previous rejection. The reparación leg
     (TOMAR/CANCELAR) is mocked away because it preserves Estado_Detalle and is
     covered by separate tests in test_reparacion_service.py — what matters here is
-    that Metrología's own callback now reads + increments + persists the cycle,
+    that Metrología's own transition now reads + increments + persists the cycle,
     which was the dead branch before T-112.
     """
-    mock_sheets_repo.get_spool_by_tag.return_value = ready_spool
-
-    # Simulate Sheets persistence: get_cell_value returns whatever was written last.
-    written_estados = [""]  # Initial state: no cycle info
+    # Simulate Sheets persistence: the spool record carries whatever was written last.
+    written_estados = [None]  # Initial state: no cycle info
 
-    def fake_get_cell_value(**kwargs):
-        return written_estados[-1]
+    def fake_get_spool_by_tag(tag_spool):
+        return ready_spool.model_copy(update={"estado_detalle": written_estados[-1]})
 
     def fake_batch_update(**kwargs):
         for update in kwargs.get("updates", []):
             if update["column_name"] == "Estado_Detalle":
                 written_estados.append(update["value"])
 
-    mock_sheets_repo.get_cell_value.side_effect = fake_get_cell_value
+    mock_sheets_repo.get_spool_by_tag.side_effect = fake_get_spool_by_tag
     mock_sheets_repo.batch_update_by_column_name.side_effect = fake_batch_update
+    # Without the reparación leg Estado_Detalle still says RECHAZADO, which the
+    # re-inspection validation would reject
+    metrologia_service.validation_service = Mock(spec=ValidationService)
 
     # Rejection 1
     await metrologia_service.completar(
@@ -0,0 +1,390 @@
+"""
+Harness for the end-to-end benchmark suite (test_e2e_benchmarks.py).
+
+Drives the real FastAPI app in-process (TestClient) against the in-memory
+gspread backend (backend/repositories/fake_gspread.py) seeded with the
+scripts/seed_load_test.py dataset scaled to 1k/10k/50k Operaciones rows.
+
+Per scenario it records latency percentiles (tests/performance/conftest.py),
+Sheets API calls per request (FakeGspreadClient.calls) and peak RSS, and
+compares them with the stored baseline (baselines/e2e_benchmarks.json).
+
+Environment:
+    ZEUES_BENCH_SIZES      Comma-separated sheet sizes to run (default "1000")
+    BENCH_UPDATE_BASELINE  "1" rewrites the baseline with this run's results
+    BENCH_P95_TOLERANCE    Allowed p95 growth over baseline (default 0.5 = +50%)
+    BENCH_TIMING_GATES     "1" also gates p95 latency and RSS growth. Off by
+                           default: the baseline timings come from one
+                           machine, so on CI only the deterministic Sheets
+                           calls/request are compared
+"""
+import json
+import os
+import resource
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from backend.config import config
+from backend.core import dependency
+from backend.core.column_map_cache import ColumnMapCache
+from backend.core.occupancy_view import OccupancyView
+from backend.core.worker_ledger import WorkerLedger
+from backend.main import app
+from backend.repositories.fake_gspread import FakeGspreadClient
+from backend.services.filters.eligibility import EligibilityIndex
+from backend.utils.cache import get_cache
+from backend.utils.response_cache import get_response_cache
+from scripts import seed_load_test as seed_data
+from tests.performance.conftest import calculate_performance_percentiles
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "e2e_benchmarks.json"
+BENCH_SHEET_ID = "bench-sheet"
+
+# Spools extra (LIBRE) con muchas uniones para FINALIZAR; uno por iteración
+# porque FINALIZAR completa el spool. 20 es el máximo de Union.n_union
+WIDE_SPOOL_UNIONS = (10, 20)
+WIDE_SPOOLS_PER_WIDTH = 10
+
+# Holgura absoluta sobre el p95 de baseline: a escala de milisegundos el
+# ruido del runner domina cualquier porcentaje
+P95_SLACK_SECONDS = 0.010
+# Crecimiento de RSS permitido sobre baseline (relativo + absoluto)
+RSS_TOLERANCE = 0.25
+RSS_SLACK_MB = 16.0
+
+
+def bench_sizes() -> list[int]:
+    raw = os.getenv("ZEUES_BENCH_SIZES", "1000")
+    return [int(size) for size in raw.split(",") if size.strip()]
+
+
+def p95_tolerance() -> float:
+    return float(os.getenv("BENCH_P95_TOLERANCE", "0.5"))
+
+
+def timing_gates_enabled() -> bool:
+    return os.getenv("BENCH_TIMING_GATES") == "1"
+
+
+def update_baseline_requested() -> bool:
+    return os.getenv("BENCH_UPDATE_BASELINE") == "1"
+
+
+def _proc_status_mb(field_name: str) -> Optional[float]:
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith(field_name + ":"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def current_rss_mb() -> float:
+    rss = _proc_status_mb("VmRSS")
+    return rss if rss is not None else peak_rss_mb()
+
+
+def peak_rss_mb() -> float:
+    """RSS pico del proceso (VmHWM en Linux; si no, ru_maxrss)."""
+    peak = _proc_status_mb("VmHWM")
+    if peak is not None:
+        return peak
+    # ru_maxrss: KB en Linux, bytes en macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def reset_peak_rss() -> None:
+    """
+    Reinicia el RSS pico (Linux: escribir "5" en /proc/self/clear_refs).
+
+    Sin esto el pico sería el de toda la sesión de pytest, no el del escenario.
+    Donde no está disponible, el pico queda acumulado (solo informativo).
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+    except OSError:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Dataset
+# ---------------------------------------------------------------------------
+
+@dataclass
+class BenchDataset:
+    """Dataset escalado y los tags/workers que usan los escenarios."""
+
+    size: int
+    client: FakeGspreadClient
+    libre_tags: list[str]
+    all_tags: list[str]
+    wide_tags: dict[int, list[str]]
+    unions_rows: int
+
+
+def _col(headers: list[str], name: str) -> int:
+    return headers.index(name)
+
+
+def build_bench_dataset(size: int, seed: int = 42) -> BenchDataset:
+    """
+    Dataset de `size` spools con un OT distinto por spool.
+
+    El seed de load test usa OT="9999" para todo; los IDs de unión son
+    OT+N_UNION y disponibles/FINALIZAR buscan por OT, así que aquí cada
+    spool recibe su propio OT. Se agregan spools LIBRE con 10 y 20 uniones
+    (WIDE_SPOOL_UNIONS) para los escenarios de FINALIZAR.
+    """
+    op_rows, union_rows, metadata_rows = seed_data.build_dataset(seed=seed, total_spools=size)
+
+    op_headers = seed_data.OPERACIONES_HEADERS
+    union_headers = seed_data.UNIONES_HEADERS
+    op_tag, op_ot = _col(op_headers, "TAG_SPOOL"), _col(op_headers, "OT")
+    op_ocupado = _col(op_headers, "Ocupado_Por")
+    op_total = _col(op_headers, "Total_Uniones")
+    u_id, u_ot = _col(union_headers, "ID"), _col(union_headers, "OT")
+    u_n, u_tag = _col(union_headers, "N_UNION"), _col(union_headers, "TAG_SPOOL")
+
+    ot_by_tag: dict[str, str] = {}
+    libre_tags: list[str] = []
+    for index, row in enumerate(op_rows, start=1):
+        ot = f"B{index:06d}"
+        row[op_ot] = ot
+        ot_by_tag[row[op_tag]] = ot
+        if not row[op_ocupado] and not row[op_headers.index("Armador")]:
+            libre_tags.append(row[op_tag])
+    for row in union_rows:
+        row[u_ot] = ot_by_tag[row[u_tag]]
+
+    template = next(r for r in op_rows if r[op_tag] == libre_tags[0])
+    union_template = next(r for r in union_rows if r[u_tag] == libre_tags[0])
+    next_union_id = len(union_rows) + 1
+    wide_tags: dict[int, list[str]] = {}
+    for n_unions in WIDE_SPOOL_UNIONS:
+        wide_tags[n_unions] = []
+        for copy in range(WIDE_SPOOLS_PER_WIDTH):
+            tag = f"MK-BENCH-WIDE-{n_unions:03d}-{copy:02d}"
+            ot = f"W{n_unions:03d}{copy:03d}"
+            row = list(template)
+            row[op_headers.index("id")] = str(len(op_rows) + 1)
+            row[op_tag], row[op_ot], row[op_total] = tag, ot, n_unions
+            op_rows.append(row)
+            for n_union in range(1, n_unions + 1):
+                union = [""] * len(union_headers)
+                union[:6] = union_template[:6]
+                union[u_id] = f"U{next_union_id:07d}"
+                union[u_ot], union[u_n], union[u_tag] = ot, n_union, tag
+                union[union_headers.index("version")] = union_template[union_headers.index("version")]
+                union_rows.append(union)
+                next_union_id += 1
+            wide_tags[n_unions].append(tag)
+
+    trabajadores, roles = seed_data.build_worker_rows()
+    client = FakeGspreadClient()
+    client.add_spreadsheet(BENCH_SHEET_ID, f"ZEUES BENCH {size} (fake)", {
+        "Operaciones": [op_headers] + op_rows,
+        "Uniones": [union_headers] + union_rows,
+        "Metadata": [seed_data.METADATA_HEADERS] + metadata_rows,
+        "Trabajadores": [seed_data.TRABAJADORES_HEADERS] + trabajadores,
+        "Roles": [seed_data.ROLES_HEADERS] + roles,
+    })
+    return BenchDataset(
+        size=size,
+        client=client,
+        libre_tags=libre_tags,
+        all_tags=[row[op_tag] for row in op_rows],
+        wide_tags=wide_tags,
+        unions_rows=len(union_rows),
+    )
+
+
+def reset_process_caches() -> None:
+    """Vacía caches de proceso (snapshots, bodies, vistas) entre datasets."""
+    get_cache().clear()
+    get_response_cache().clear()
+    ColumnMapCache.clear_all()
+    for view in (OccupancyView, EligibilityIndex, WorkerLedger):
+        view.clear_all()
+
+
+class BenchApp:
+    """
+    App FastAPI conectada al dataset fake (context manager).
+
+    Usage:
+        with BenchApp(dataset) as bench:
+            bench.client.get("/api/workers")
+    """
+
+    def __init__(self, dataset: BenchDataset):
+        self.dataset = dataset
+        self.client = TestClient(app)
+        self._config_patch = patch.object(config, "GOOGLE_SHEET_ID", BENCH_SHEET_ID)
+
+    def __enter__(self) -> "BenchApp":
+        # Overrides dejados por otros tests apuntarían a mocks, no al dataset
+        self._overrides = dict(app.dependency_overrides)
+        app.dependency_overrides.clear()
+        self._config_patch.start()
+        dependency.reset_singletons()
+        reset_process_caches()
+        dependency.get_sheets_repository()._client = self.dataset.client
+        return self
+
+    def __exit__(self, *exc) -> None:
+        dependency.reset_singletons()
+        reset_process_caches()
+        self._config_patch.stop()
+        app.dependency_overrides.update(self._overrides)
+
+    @property
+    def sheets_calls(self) -> int:
+        calls = self.dataset.client.calls
+        return calls["read"] + calls["write"]
+
+
+# ---------------------------------------------------------------------------
+# Medición
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ScenarioResult:
+    """Resultado de un escenario a un tamaño de hoja."""
+
+    name: str
+    size: int
+    n: int
+    p50: float
+    p95: float
+    p99: float
+    sheets_calls_per_request: float
+    peak_rss_mb: float
+    rss_growth_mb: float
+    failures: list[str] = field(default_factory=list)
+
+    def to_baseline(self) -> dict:
+        data = asdict(self)
+        for key in ("failures", "name", "size"):
+            data.pop(key)
+        for key in ("p50", "p95", "p99"):
+            data[key] = round(data[key], 6)
+        for key in ("peak_rss_mb", "rss_growth_mb"):
+            data[key] = round(data[key], 1)
+        return data
+
+
+def run_scenario(
+    bench: BenchApp,
+    name: str,
+    request: Callable[[int], None],
+    iterations: int,
+    setup: Optional[Callable[[int], None]] = None,
+) -> ScenarioResult:
+    """
+    Ejecuta `request(i)` `iterations` veces midiendo latencia y llamadas a Sheets.
+
+    `setup(i)` corre antes de cada iteración, fuera de la medición (ej:
+    INICIAR previo a un FINALIZAR).
+    """
+    latencies: list[float] = []
+    calls = 0
+    reset_peak_rss()
+    rss_start = current_rss_mb()
+    for i in range(iterations):
+        if setup is not None:
+            setup(i)
+        before = bench.sheets_calls
+        t0 = time.perf_counter()
+        request(i)
+        latencies.append(time.perf_counter() - t0)
+        calls += bench.sheets_calls - before
+    stats = calculate_performance_percentiles(latencies)
+    return ScenarioResult(
+        name=name,
+        size=bench.dataset.size,
+        n=stats["n"],
+        p50=stats["p50"],
+        p95=stats["p95"],
+        p99=stats["p99"],
+        sheets_calls_per_request=calls / iterations,
+        peak_rss_mb=peak_rss_mb(),
+        rss_growth_mb=max(0.0, peak_rss_mb() - rss_start),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Baseline
+# ---------------------------------------------------------------------------
+
+def load_baseline() -> dict:
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text())
+
+
+def save_baseline(results: list[ScenarioResult]) -> None:
+    """Mezcla `results` en el baseline (otros tamaños se conservan)."""
+    baseline = load_baseline()
+    for result in results:
+        baseline.setdefault(str(result.size), {})[result.name] = result.to_baseline()
+    BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def compare_with_baseline(result: ScenarioResult, baseline: dict) -> list[str]:
+    """
+    Regresiones de `result` contra el baseline.
+
+    - Llamadas a Sheets: determinísticas, cualquier aumento es regresión.
+    - Solo con BENCH_TIMING_GATES=1 (dependen de la máquina):
+      - p95: puede crecer hasta BENCH_P95_TOLERANCE + P95_SLACK_SECONDS.
+      - RSS: el crecimiento durante el escenario puede subir hasta
+        RSS_TOLERANCE + RSS_SLACK_MB (el RSS absoluto depende de qué más
+        importó la sesión de pytest; se reporta pero no se compara).
+    """
+    reference = baseline.get(str(result.size), {}).get(result.name)
+    if reference is None:
+        return []
+    failures = []
+    if result.sheets_calls_per_request > reference["sheets_calls_per_request"] + 1e-9:
+        failures.append(
+            f"{result.name}@{result.size}: Sheets calls/request "
+            f"{result.sheets_calls_per_request:.2f} > baseline {reference['sheets_calls_per_request']:.2f}"
+        )
+    if not timing_gates_enabled():
+        return failures
+    p95_limit = reference["p95"] * (1 + p95_tolerance()) + P95_SLACK_SECONDS
+    if result.p95 > p95_limit:
+        failures.append(
+            f"{result.name}@{result.size}: p95 {result.p95 * 1000:.1f}ms > "
+            f"limit {p95_limit * 1000:.1f}ms (baseline {reference['p95'] * 1000:.1f}ms)"
+        )
+    rss_limit = reference["rss_growth_mb"] * (1 + RSS_TOLERANCE) + RSS_SLACK_MB
+    if result.rss_growth_mb > rss_limit:
+        failures.append(
+            f"{result.name}@{result.size}: RSS growth {result.rss_growth_mb:.1f}MB > "
+            f"limit {rss_limit:.1f}MB"
+        )
+    return failures
+
+
+def print_benchmark_table(results: list[ScenarioResult]) -> None:
+    print("\n" + "=" * 104)
+    print(f"{'scenario':<28}{'rows':>8}{'n':>5}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+          f"{'calls/req':>11}{'RSS MB':>9}{'+RSS MB':>9}")
+    print("-" * 104)
+    for r in results:
+        print(f"{r.name:<28}{r.size:>8}{r.n:>5}{r.p50 * 1000:>10.1f}{r.p95 * 1000:>10.1f}"
+              f"{r.p99 * 1000:>10.1f}{r.sheets_calls_per_request:>11.2f}{r.peak_rss_mb:>9.0f}"
+              f"{r.rss_growth_mb:>9.1f}")
+    print("=" * 104 + "\n")
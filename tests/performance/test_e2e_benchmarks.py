@@ -0,0 +1,152 @@
+"""
+End-to-end benchmarks with regression gates.
+
+The FastAPI app runs in-process against the in-memory Sheets backend
+(tests/performance/e2e_harness.py) at 1k/10k/50k Operaciones rows. For each
+scenario the run records p50/p95/p99 latency, Sheets API calls per request
+and RSS, and fails when it regresses against
+tests/performance/baselines/e2e_benchmarks.json.
+
+Sizes: ZEUES_BENCH_SIZES="1000,10000,50000" (default "1000" only).
+Timing gates: BENCH_TIMING_GATES=1 also fails on p95/RSS regressions; by
+default (CI) only Sheets calls per request are compared.
+Baseline refresh: BENCH_UPDATE_BASELINE=1 pytest tests/performance/test_e2e_benchmarks.py -s
+"""
+import pytest
+
+from backend.utils.response_cache import get_response_cache
+from tests.performance.e2e_harness import (
+    WIDE_SPOOL_UNIONS,
+    WIDE_SPOOLS_PER_WIDTH,
+    BenchApp,
+    build_bench_dataset,
+    bench_sizes,
+    compare_with_baseline,
+    load_baseline,
+    print_benchmark_table,
+    run_scenario,
+    save_baseline,
+    update_baseline_requested,
+)
+
+
+ITERATIONS = 20
+WORKER_ID = 93  # MR(93), armador del pool de seed_load_test
+OPERACIONES = ("ARM", "SOLD", "METROLOGIA", "REPARACION")
+
+
+def _ok(response) -> dict:
+    assert response.status_code == 200, response.text[:300]
+    return response.json()
+
+
+def _run_all_scenarios(bench: BenchApp) -> list:
+    client = bench.client
+    dataset = bench.dataset
+    libre = iter(dataset.libre_tags)
+    results = []
+
+    for operacion in OPERACIONES:
+        # Snapshot caliente, body sin cachear: costo de filtrar + serializar
+        results.append(run_scenario(
+            bench,
+            f"spools_iniciar_{operacion.lower()}",
+            lambda i, op=operacion: _ok(client.get("/api/spools/iniciar", params={"operacion": op})),
+            ITERATIONS,
+            setup=lambda i: get_response_cache().clear(),
+        ))
+
+    results.append(run_scenario(
+        bench,
+        "batch_status_100",
+        lambda i: _ok(client.post(
+            "/api/spools/batch-status",
+            json={"tags": dataset.all_tags[i * 10:i * 10 + 100]},
+        )),
+        ITERATIONS,
+    ))
+
+    iniciar_tags = [next(libre) for _ in range(ITERATIONS)]
+    results.append(run_scenario(
+        bench,
+        "iniciar",
+        lambda i: _ok(client.post("/api/v4/occupation/iniciar", json={
+            "tag_spool": iniciar_tags[i], "worker_id": WORKER_ID, "operacion": "ARM",
+        })),
+        ITERATIONS,
+    ))
+
+    for n_unions in WIDE_SPOOL_UNIONS:
+        tags = dataset.wide_tags[n_unions]
+        selected: dict[int, list[str]] = {}
+
+        def setup(i, tags=tags, selected=selected):
+            _ok(client.post("/api/v4/occupation/iniciar", json={
+                "tag_spool": tags[i], "worker_id": WORKER_ID, "operacion": "ARM",
+            }))
+            disponibles = _ok(client.get(
+                f"/api/v4/uniones/{tags[i]}/disponibles", params={"operacion": "ARM"}
+            ))
+            selected[i] = [union["id"] for union in disponibles["unions"]]
+
+        def finalizar(i, tags=tags, selected=selected, n_unions=n_unions):
+            body = _ok(client.post("/api/v4/occupation/finalizar", json={
+                "tag_spool": tags[i], "worker_id": WORKER_ID, "operacion": "ARM",
+                "selected_unions": selected[i],
+            }))
+            assert body["unions_processed"] == n_unions
+
+        results.append(run_scenario(
+            bench, f"finalizar_{n_unions}", finalizar, WIDE_SPOOLS_PER_WIDTH, setup=setup,
+        ))
+
+    results.append(run_scenario(
+        bench,
+        "registro",
+        lambda i: _ok(client.get(f"/api/registro/{WORKER_ID}")),
+        ITERATIONS,
+    ))
+
+    history_tags = dataset.all_tags[dataset.size // 2:]
+    results.append(run_scenario(
+        bench,
+        "history",
+        lambda i: _ok(client.get(f"/api/history/{history_tags[i]}")),
+        ITERATIONS,
+    ))
+
+    guardar_tags = [next(libre) for _ in range(ITERATIONS)]
+    results.append(run_scenario(
+        bench,
+        "guardar_uniones",
+        lambda i: _ok(client.post("/api/v4/uniones/guardar", json={
+            "tag_spool": guardar_tags[i],
+            "unions": [
+                {"n_union": n, "dn_union": 2.0, "tipo_union": "BW"} for n in range(1, 11)
+            ],
+        })),
+        ITERATIONS,
+    ))
+    return results
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("size", [1000, 10000, 50000])
+def test_e2e_benchmarks_against_baseline(size):
+    if size not in bench_sizes():
+        pytest.skip(f"{size} rows not in ZEUES_BENCH_SIZES")
+
+    dataset = build_bench_dataset(size)
+    with BenchApp(dataset) as bench:
+        results = _run_all_scenarios(bench)
+    print_benchmark_table(results)
+
+    if update_baseline_requested():
+        save_baseline(results)
+        return
+
+    baseline = load_baseline()
+    if str(size) not in baseline:
+        pytest.skip(f"No baseline for {size} rows (run with BENCH_UPDATE_BASELINE=1)")
+    failures = [failure for result in results for failure in compare_with_baseline(result, baseline)]
+    assert not failures, "Benchmark regressions:\n" + "\n".join(failures)
@@ -0,0 +1,93 @@
+"""
+Serialization cost of a 1,000-spool /api/spools/iniciar body:
+
+- FastAPI default path: jsonable_encoder + JSONResponse (json.dumps)
+- pydantic-core encoder (encode_model, used to fill the cache)
+- orjson over model_dump (only if installed; not a runtime dependency)
+- cached bytes: ResponseBytesCache hit + Response construction
+"""
+import time
+from datetime import date
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from backend.models.spool import Spool, SpoolListResponse
+from backend.utils.response_cache import (
+    ResponseBytesCache,
+    cached_json_response,
+    encode_model,
+)
+from tests.performance.conftest import (
+    calculate_performance_percentiles,
+    print_performance_report,
+)
+
+
+SPOOLS = 1000
+ITERATIONS = 30
+
+
+def _spool_list() -> SpoolListResponse:
+    spools = [
+        Spool(
+            tag_spool=f"MK-1335-CW-25238-{i:04d}",
+            ot=f"{i // 10:03d}",
+            nv=f"NV-{i % 40:03d}",
+            fecha_materiales=date(2025, 12, 30),
+            armador=None if i % 3 else "MR(93)",
+            ocupado_por=None,
+            total_uniones=i % 12,
+        )
+        for i in range(SPOOLS)
+    ]
+    return SpoolListResponse(spools=spools, total=len(spools), filtro_aplicado="ARM - Fecha_Materiales llena Y Armador vacío")
+
+
+def _measure(label: str, fn) -> dict:
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        t0 = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - t0)
+    stats = calculate_performance_percentiles(latencies)
+    print_performance_report(stats, time.perf_counter() - start, label)
+    return stats
+
+
+@pytest.mark.performance
+def test_cached_bytes_beat_per_request_serialization():
+    model = _spool_list()
+    cache = ResponseBytesCache()
+    etag = '"bench"'
+    cache.put(etag, model)
+
+    # El body cacheado es el mismo que produce FastAPI
+    assert encode_model(model) == JSONResponse(jsonable_encoder(model)).body
+
+    default = _measure(
+        f"FastAPI default encoder ({SPOOLS} spools)",
+        lambda: JSONResponse(jsonable_encoder(model)).body,
+    )
+    pydantic_core = _measure(
+        f"pydantic-core to_json ({SPOOLS} spools)",
+        lambda: encode_model(model),
+    )
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    if orjson is not None:
+        _measure(
+            f"orjson over model_dump ({SPOOLS} spools)",
+            lambda: orjson.dumps(model.model_dump(mode="json")),
+        )
+    cached = _measure(
+        f"cached bytes ({SPOOLS} spools)",
+        lambda: cached_json_response(cache.get(etag), etag).body,
+    )
+
+    assert pydantic_core["p50"] < default["p50"]
+    assert cached["p50"] * 20 < default["p50"]
@@ -0,0 +1,44 @@
+"""
+SSE fan-out latency: time from EventBus.publish (sync write path, threadpool)
+to delivery on every subscriber queue in the event loop.
+"""
+import asyncio
+import time
+
+import pytest
+
+from backend.core.event_bus import EventBus
+from tests.performance.conftest import (
+    calculate_performance_percentiles,
+    print_performance_report,
+)
+
+
+SUBSCRIBERS = 50
+EVENTS = 100
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_sse_fanout_latency_p95_under_50ms():
+    bus = EventBus(max_queue=EVENTS + 1)
+    subscriptions = [bus.subscribe() for _ in range(SUBSCRIBERS)]
+    loop = asyncio.get_running_loop()
+    latencies = []
+
+    start = time.perf_counter()
+    for i in range(EVENTS):
+        published_at = time.perf_counter()
+        # Writes run in FastAPI's threadpool: publish from a worker thread
+        await loop.run_in_executor(None, lambda i=i: bus.publish("TOMAR", f"SP-{i}"))
+        events = await asyncio.gather(*(s.get(timeout=1) for s in subscriptions))
+        latencies.append(time.perf_counter() - published_at)
+        assert all(e is not None and e.tag_spool == f"SP-{i}" for e in events)
+    duration = time.perf_counter() - start
+
+    stats = calculate_performance_percentiles(latencies)
+    print_performance_report(stats, duration, f"SSE fan-out ({SUBSCRIBERS} subscribers)")
+
+    assert stats["n"] == EVENTS
+    assert stats["p95"] < 0.05
+    assert bus.subscriber_count == SUBSCRIBERS
@@ -0,0 +1,92 @@
+"""
+Per-request cost of hydrating and firing a transition:
+
+- python-statemachine: ARMStateMachine + SOLDStateMachine construction,
+  activate_initial_state() and current_state override (as StateService did),
+  then an async `reanudar`
+- transition_engine: hydrate() of both operations + fire() over the Spool
+
+Callbacks run without a repository on both sides, so only the state
+machinery is measured (no Sheets writes).
+"""
+import asyncio
+import time
+from datetime import date
+
+import pytest
+
+from backend.models.spool import Spool
+from backend.services.state_machines import ARMStateMachine, SOLDStateMachine
+from backend.services.state_machines import transition_engine as engine
+from tests.performance.conftest import (
+    calculate_performance_percentiles,
+    print_performance_report,
+)
+
+
+ITERATIONS = 300
+
+SPOOL = Spool(
+    tag_spool="MK-1335-CW-25238-0001",
+    fecha_materiales=date(2025, 12, 30),
+    armador="MR(93)",  # ARM pausado, SOLD pendiente
+)
+
+
+async def _hydrate_reference(machine_cls, state: str):
+    machine = machine_cls(tag_spool=SPOOL.tag_spool, sheets_repo=None, metadata_repo=None)
+    await machine.activate_initial_state()
+    if state != "pendiente":
+        machine.current_state = getattr(machine, state)
+    return machine
+
+
+async def _reference_request() -> str:
+    arm = await _hydrate_reference(ARMStateMachine, "pausado")
+    await _hydrate_reference(SOLDStateMachine, "pendiente")
+    await arm.reanudar(worker_nombre="MR(93)")
+    return arm.get_state_id()
+
+
+def _engine_request() -> str:
+    arm_state = engine.hydrate(engine.ARM, SPOOL)
+    engine.hydrate(engine.SOLD, SPOOL)
+    return engine.fire(
+        engine.ARM, SPOOL, "reanudar", state=arm_state, worker_nombre="MR(93)"
+    ).target
+
+
+async def _measure_async(label: str, fn) -> dict:
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        t0 = time.perf_counter()
+        await fn()
+        latencies.append(time.perf_counter() - t0)
+    stats = calculate_performance_percentiles(latencies)
+    print_performance_report(stats, time.perf_counter() - start, label)
+    return stats
+
+
+def _measure(label: str, fn) -> dict:
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        t0 = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - t0)
+    stats = calculate_performance_percentiles(latencies)
+    print_performance_report(stats, time.perf_counter() - start, label)
+    return stats
+
+
+@pytest.mark.performance
+def test_transition_engine_beats_statemachine_hydration():
+    assert asyncio.run(_reference_request()) == _engine_request() == "en_progreso"
+
+    reference = asyncio.run(_measure_async(
+        "python-statemachine hydrate ARM+SOLD + reanudar", _reference_request
+    ))
+    table = _measure("transition_engine hydrate ARM+SOLD + reanudar", _engine_request)
+
+    assert table["p50"] * 10 < reference["p50"]
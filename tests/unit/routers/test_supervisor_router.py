@@ -245,6 +245,44 @@ def test_get_audit_parses_iso_8601_with_timezone(client, mock_service):
     assert received.year == 2026 and received.month == 5 and received.day == 8
 
 
+def test_get_audit_with_limit_returns_next_cursor(client, mock_service):
+    mock_service.get_audit_page.return_value = (
+        [
+            AuditEvent(
+                id="x",
+                session_id="s",
+                event_type=EventType.SESSION_START,
+                timestamp=SCL.localize(datetime(2026, 5, 8, 10, 0, 0)),
+            )
+        ],
+        "cursor-2",
+    )
+
+    resp = client.get(
+        "/api/supervisor/audit",
+        params={"since": "2026-05-08T00:00:00-04:00", "limit": 1},
+    )
+
+    assert resp.status_code == 200
+    assert resp.json()["next_cursor"] == "cursor-2"
+    assert mock_service.get_audit_page.call_args.kwargs == {
+        "limit": 1,
+        "cursor": None,
+    }
+    mock_service.get_audit_since.assert_not_called()
+
+
+def test_get_audit_invalid_cursor_returns_400(client, mock_service):
+    mock_service.get_audit_page.side_effect = ValueError("cursor inválido")
+
+    resp = client.get(
+        "/api/supervisor/audit",
+        params={"since": "2026-05-08T00:00:00-04:00", "cursor": "garbage"},
+    )
+
+    assert resp.status_code == 400
+
+
 def test_get_audit_missing_since_returns_422(client, mock_service):
     resp = client.get("/api/supervisor/audit")
     assert resp.status_code == 422
@@ -25,7 +25,7 @@ def mocks(monkeypatch):
     worker_service = MagicMock()
 
     # Default: row resolution succeeds at row 42.
-    sheets_repo.find_row_by_column_value.return_value = 42
+    sheets_repo.locate_row.return_value = 42
     sheets_repo._index_to_column_letter.return_value = "G"
 
     # Default worker exists.
@@ -61,20 +61,20 @@ def service(mocks):
 
 
 def test_get_nota_returns_empty_string_when_cell_blank(service, mocks):
-    mocks["sheets_repo"].get_cell_value.return_value = None
+    mocks["sheets_repo"].read_cell.return_value = None
     result = service.get_nota("MK-1923")
     assert result == ""
 
 
 def test_get_nota_returns_existing_content(service, mocks):
-    mocks["sheets_repo"].get_cell_value.return_value = "20260415: lanzada a producción"
+    mocks["sheets_repo"].read_cell.return_value = "20260415: lanzada a producción"
     result = service.get_nota("MK-1923")
     assert result == "20260415: lanzada a producción"
 
 
 def test_get_nota_raises_when_spool_missing(service, mocks):
     # _find_spool_row raises SpoolNoEncontradoError when the row lookup returns None.
-    mocks["sheets_repo"].find_row_by_column_value.return_value = None
+    mocks["sheets_repo"].locate_row.return_value = None
     with pytest.raises(SpoolNoEncontradoError):
         service.get_nota("DOES-NOT-EXIST")
 
@@ -83,7 +83,7 @@ def test_get_nota_raises_when_spool_missing(service, mocks):
 
 
 def test_append_creates_first_entry_with_yyyymmdd_prefix(service, mocks):
-    mocks["sheets_repo"].get_cell_value.return_value = None  # empty cell
+    mocks["sheets_repo"].read_cell.return_value = None  # empty cell
 
     result = service.append_nota(
         tag_spool="MK-1923", worker_id=93, texto="pendiente revisión QC"
@@ -100,7 +100,7 @@ def test_append_creates_first_entry_with_yyyymmdd_prefix(service, mocks):
 
 
 def test_append_preserves_existing_history(service, mocks):
-    mocks["sheets_repo"].get_cell_value.return_value = (
+    mocks["sheets_repo"].read_cell.return_value = (
         "20260415: lanzada a producción"
     )
 
@@ -116,7 +116,7 @@ def test_append_preserves_existing_history(service, mocks):
 
 
 def test_append_writes_audit_event(service, mocks):
-    mocks["sheets_repo"].get_cell_value.return_value = None
+    mocks["sheets_repo"].read_cell.return_value = None
 
     service.append_nota(tag_spool="MK-1923", worker_id=93, texto="nota")
 
@@ -146,7 +146,7 @@ def test_append_rejects_unknown_worker(service, mocks):
 
 def test_append_rejects_unknown_spool(service, mocks):
     # _find_spool_row raises SpoolNoEncontradoError when the row lookup returns None.
-    mocks["sheets_repo"].find_row_by_column_value.return_value = None
+    mocks["sheets_repo"].locate_row.return_value = None
     with pytest.raises(SpoolNoEncontradoError):
         service.append_nota(tag_spool="DOES-NOT-EXIST", worker_id=93, texto="nota")
 
@@ -155,7 +155,7 @@ def test_append_rejects_unknown_spool(service, mocks):
 
 
 def test_append_trims_whitespace_from_text(service, mocks):
-    mocks["sheets_repo"].get_cell_value.return_value = None
+    mocks["sheets_repo"].read_cell.return_value = None
     result = service.append_nota(
         tag_spool="MK-1923", worker_id=93, texto="  nota con espacios  "
     )
@@ -164,7 +164,7 @@ def test_append_trims_whitespace_from_text(service, mocks):
 
 def test_append_does_not_fail_user_write_if_audit_log_fails(service, mocks, caplog):
     """Audit trail errors are logged but don't block the user-facing write."""
-    mocks["sheets_repo"].get_cell_value.return_value = None
+    mocks["sheets_repo"].read_cell.return_value = None
     mocks["metadata_repo"].log_event.side_effect = RuntimeError("Sheets timeout")
 
     # Should not raise — note was written to the Sheet successfully
@@ -179,7 +179,7 @@ def test_append_does_not_fail_user_write_if_audit_log_fails(service, mocks, capl
 
 def test_append_allows_none_worker_and_records_anonimo(service, mocks):
     """When worker_id is None the note is still saved and the audit records ANONIMO."""
-    mocks["sheets_repo"].get_cell_value.return_value = None
+    mocks["sheets_repo"].read_cell.return_value = None
 
     result = service.append_nota(
         tag_spool="MK-1923", worker_id=None, texto="nota sin firma"
@@ -0,0 +1,101 @@
+"""
+Unit tests for the spool change feed (backend/core/change_feed.py) and
+GET /api/spools/changes.
+"""
+from unittest.mock import MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from backend.config import config
+from backend.core.change_feed import SpoolChangeFeed
+from backend.core.dependency import get_sheets_repository, get_worker_service
+from backend.core.snapshot_diff import SnapshotDiffer
+from backend.main import app
+from backend.repositories.fake_gspread import build_load_test_client
+from backend.repositories.sheets_repository import SheetsRepository
+from backend.utils.cache import get_cache
+
+SHEET = config.HOJA_OPERACIONES_NOMBRE
+HEADER = ["TAG_SPOOL", "OT", "Ocupado_Por"]
+
+
+def _feed_with_differ(capacity=8):
+    feed = SpoolChangeFeed(capacity=capacity)
+    differ = SnapshotDiffer({SHEET: "TAG_SPOOL", "Uniones": "ID"})
+    differ.subscribe(feed.record)
+    return feed, differ
+
+
+def test_changes_since_unions_tags_across_versions():
+    feed, differ = _feed_with_differ()
+    differ.observe(SHEET, [HEADER, ["SP-1", "1", ""], ["SP-2", "1", ""], ["SP-2", "2", ""]], version=1)
+    assert feed.changes_since(1, 1) == set()
+    assert feed.changes_since(0, 1) is None  # el feed no vio diffs todavía
+
+    differ.observe(SHEET, [HEADER, ["SP-1", "1", "MR(93)"], ["SP-2", "1", ""], ["SP-2", "2", "x"]], version=2)
+    differ.observe("Uniones", [["ID"], ["U-1"]], version=7)  # otra hoja: ignorada
+    differ.observe(SHEET, [HEADER, ["SP-1", "1", "MR(93)"], ["SP-2", "1", ""], ["SP-3", "3", ""]], version=3)
+    differ.observe(SHEET, [HEADER, ["SP-1", "1", "MR(93)"], ["SP-2", "1", ""], ["SP-3", "3", ""]], version=4)
+
+    assert feed.changes_since(1, 4) == {"SP-1", "SP-2", "SP-3"}  # "SP-2#2" -> "SP-2"
+    assert feed.changes_since(2, 4) == {"SP-2", "SP-3"}
+    assert feed.changes_since(3, 4) == set()
+    assert feed.changes_since(5, 4) is None      # versión del futuro (otro proceso)
+    assert feed.changes_since(1, 5) is None      # el feed aún no vio la versión vigente
+
+
+def test_overflow_and_header_change_force_full_resync():
+    feed, differ = _feed_with_differ(capacity=2)
+    differ.observe(SHEET, [HEADER, ["SP-1", "0", ""]], version=1)
+    for version in (2, 3, 4):
+        differ.observe(SHEET, [HEADER, ["SP-1", str(version), ""]], version=version)
+
+    assert feed.changes_since(1, 4) is None      # la entrada 1->2 salió del buffer
+    assert feed.changes_since(2, 4) == {"SP-1"}
+
+    differ.observe(SHEET, [HEADER + ["Nueva"], ["SP-1", "4", "", ""]], version=5)
+    assert feed.changes_since(4, 5) is None
+    differ.observe(SHEET, [HEADER + ["Nueva"], ["SP-1", "4", "", "x"]], version=6)
+    assert feed.changes_since(5, 6) == {"SP-1"}
+
+
+def test_endpoint_returns_changed_spools_and_tombstones():
+    repo = SheetsRepository(compatibility_mode="v3.0")
+    repo._client = build_load_test_client("fake-sheet")
+    worker_service = MagicMock()
+    worker_service.list_version.return_value = 1
+    worker_service.get_all_active_workers.return_value = []
+    cache_key = f"worksheet:{SHEET}"
+    get_cache().invalidate(cache_key)
+    app.dependency_overrides[get_sheets_repository] = lambda: repo
+    app.dependency_overrides[get_worker_service] = lambda: worker_service
+    try:
+        with patch.object(config, "GOOGLE_SHEET_ID", "fake-sheet"):
+            client = TestClient(app)
+            first = client.get("/api/spools/changes").json()
+            assert first["full_resync"] is True
+
+            cursor = {"since": first["version"], "epoch": first["epoch"]}
+            assert client.get("/api/spools/changes", params=cursor).json()["spools"] == []
+
+            worksheet = repo._client.open_by_key("fake-sheet").worksheet(SHEET)
+            rows = worksheet.get_all_values()
+            tag_col = rows[0].index("TAG_SPOOL") + 1
+            edited, renamed = rows[1][tag_col - 1], rows[2][tag_col - 1]
+            worksheet.update_cell(2, rows[0].index("Ocupado_Por") + 1, "MR(93)")
+            worksheet.update_cell(3, tag_col, f"{renamed}-NEW")
+            get_cache().invalidate(cache_key)
+
+            delta = client.get("/api/spools/changes", params=cursor).json()
+            assert delta["full_resync"] is False and delta["version"] > first["version"]
+            by_tag = {spool["tag_spool"]: spool for spool in delta["spools"]}
+            assert set(by_tag) == {edited, f"{renamed}-NEW"}
+            assert by_tag[edited]["ocupado_por"] == "MR(93)"
+            assert delta["removed"] == [renamed]
+
+            stale = client.get("/api/spools/changes", params={**cursor, "epoch": "otro"}).json()
+            assert stale["full_resync"] is True and stale["spools"] == []
+    finally:
+        app.dependency_overrides.pop(get_sheets_repository, None)
+        app.dependency_overrides.pop(get_worker_service, None)
+        get_cache().invalidate(cache_key)
@@ -0,0 +1,89 @@
+"""
+Unit tests for the change probe that renews expired worksheet snapshots
+without a full refetch (SheetsRepository.read_worksheet).
+"""
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from backend.config import config
+from backend.repositories.fake_gspread import build_load_test_client
+from backend.repositories.sheets_repository import SheetsRepository
+from backend.utils.cache import get_cache
+
+SHEET = config.HOJA_OPERACIONES_NOMBRE
+CACHE_KEY = f"worksheet:{SHEET}"
+
+
+def _expire_ttl():
+    """Vence el TTL del snapshot cacheado (como si pasaran 60s)."""
+    cache = get_cache()
+    value, _ = cache._cache[CACHE_KEY]
+    cache._cache[CACHE_KEY] = (value, datetime.now() - timedelta(seconds=1))
+
+
+@pytest.fixture
+def repo():
+    repo = SheetsRepository()
+    repo._client = build_load_test_client("fake-sheet")
+    repo._change_probe_enabled = True
+    get_cache().invalidate(CACHE_KEY)
+    with patch.object(config, "GOOGLE_SHEET_ID", "fake-sheet"):
+        yield repo
+    get_cache().invalidate(CACHE_KEY)
+
+
+def test_unchanged_spreadsheet_renews_snapshot_without_refetch(repo):
+    calls = repo._client.calls
+    rows = repo.read_worksheet(SHEET)
+    assert (calls["get_all_values"], calls["drive"]) == (1, 0)   # lectura en frío: sin sondeo
+
+    _expire_ttl()
+    rows = repo.read_worksheet(SHEET)   # sin token previo: sondea y relee
+    assert (calls["get_all_values"], calls["drive"]) == (2, 1)
+    version = repo.snapshot_version(SHEET)
+
+    _expire_ttl()
+    assert repo.read_worksheet(SHEET) is rows
+    assert (calls["get_all_values"], calls["drive"]) == (2, 2)
+    assert repo.snapshot_version(SHEET) == version
+    assert get_cache().get(CACHE_KEY) is rows       # lease extendido
+
+    # Edición externa (UI de Sheets): cambia modifiedTime → relectura completa
+    worksheet = repo._client.open_by_key("fake-sheet").worksheet(SHEET)
+    worksheet.update_cell(2, rows[0].index("Ocupado_Por") + 1, "MR(93)")
+    _expire_ttl()
+    fresh = repo.read_worksheet(SHEET)
+    assert calls["get_all_values"] == 3
+    assert fresh[1][rows[0].index("Ocupado_Por")] == "MR(93)"
+    assert repo.snapshot_version(SHEET) > version
+
+
+def test_invalidated_snapshot_is_refetched_without_probing(repo):
+    calls = repo._client.calls
+    repo.read_worksheet(SHEET)
+    _expire_ttl()
+    repo.read_worksheet(SHEET)
+    get_cache().invalidate(CACHE_KEY)   # escritura de la app
+
+    repo.read_worksheet(SHEET)
+    assert (calls["get_all_values"], calls["drive"]) == (3, 1)
+
+
+def test_probe_without_drive_permission_is_disabled(repo):
+    calls = repo._client.calls
+    repo.read_worksheet(SHEET)
+    _expire_ttl()
+    repo._client.fail_next(1, code=403)
+    repo.read_worksheet(SHEET)
+    assert not repo._change_probe_enabled and calls["get_all_values"] == 2
+
+    _expire_ttl()
+    repo.read_worksheet(SHEET)
+    assert (calls["get_all_values"], calls["drive"]) == (3, 0)
+
+
+def test_credentials_can_read_drive_metadata_of_the_shared_sheet():
+    # Con solo drive.file, files.get del libro (no creado por la SA) da 404
+    assert "https://www.googleapis.com/auth/drive.metadata.readonly" in config.get_scopes()
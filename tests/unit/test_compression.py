@@ -0,0 +1,126 @@
+"""
+Unit tests for brotli/gzip response compression (CompressionMiddleware + cached bodies).
+"""
+import gzip
+from unittest.mock import patch
+
+import brotli
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from backend.models.worker import Worker, WorkerListResponse
+from backend.utils.compression import CompressionMiddleware, compress, negotiate_encoding
+from backend.utils.etag import etag_matches
+from backend.utils.response_cache import ResponseBytesCache, cached_json_response
+
+
+BIG = "spool," * 400
+
+
+def _client(cache: ResponseBytesCache) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/big")
+    def big():
+        return PlainTextResponse(BIG)
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("ok")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse((BIG for _ in range(3)), media_type="text/plain")
+
+    @app.get("/sse")
+    def sse():
+        return StreamingResponse(iter([BIG]), media_type="text/event-stream")
+
+    @app.get("/cached")
+    def cached():
+        return cached_json_response(cache.get('"v1"'), '"v1"')
+
+    return TestClient(app)
+
+
+def _raw(client: TestClient, path: str, accept: str):
+    # Sin decodificación automática de httpx, para ver los bytes enviados
+    with client.stream("GET", path, headers={"Accept-Encoding": accept}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+def test_negotiate_encoding_prefers_brotli_and_honours_q():
+    assert negotiate_encoding("gzip, deflate, br") == "br"
+    assert negotiate_encoding("br;q=0, gzip") == "gzip"
+    assert negotiate_encoding("gzip;q=0.5, br;q=0.4") == "gzip"
+    assert negotiate_encoding("*") == "br"
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding(None) is None
+
+
+def test_large_body_is_compressed_small_body_is_not():
+    client = _client(ResponseBytesCache())
+
+    response, raw = _raw(client, "/big", "br")
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == len(raw)
+    assert brotli.decompress(raw).decode() == BIG
+
+    response, raw = _raw(client, "/big", "gzip")
+    assert gzip.decompress(raw).decode() == BIG
+
+    response, raw = _raw(client, "/small", "br")
+    assert "content-encoding" not in response.headers
+    assert raw == b"ok"
+
+
+def test_compressed_variants_carry_a_weak_etag():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/big")
+    def big():
+        return PlainTextResponse(BIG, headers={"ETag": '"v1"'})
+
+    client = TestClient(app)
+    assert _raw(client, "/big", "br")[0].headers["etag"] == 'W/"v1"'
+    assert _raw(client, "/big", "gzip")[0].headers["etag"] == 'W/"v1"'
+    assert _raw(client, "/big", "identity")[0].headers["etag"] == '"v1"'
+    assert etag_matches('W/"v1"', '"v1"')  # el 304 sigue funcionando
+
+
+def test_streaming_is_compressed_per_chunk_and_sse_passes_through():
+    client = _client(ResponseBytesCache())
+
+    response, raw = _raw(client, "/stream", "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(raw).decode() == BIG * 3
+
+    response, raw = _raw(client, "/sse", "br")
+    assert "content-encoding" not in response.headers
+    assert raw.decode() == BIG
+
+
+def test_cached_body_is_compressed_once_per_coding():
+    cache = ResponseBytesCache()
+    workers = [Worker(id=i, nombre=f"N{i}", apellido="Pérez", activo=True) for i in range(1, 60)]
+    body = cache.put('"v1"', WorkerListResponse(workers=workers, total=len(workers))).body
+    client = _client(cache)
+
+    with patch("backend.utils.response_cache.compress", wraps=compress) as spy:
+        first, raw_first = _raw(client, "/cached", "br")
+        second, raw_second = _raw(client, "/cached", "br")
+        identity, raw_identity = _raw(client, "/cached", "identity")
+
+    assert first.headers["content-encoding"] == "br"
+    assert first.headers["etag"] == 'W/"v1"'
+    assert brotli.decompress(raw_first) == body
+    assert raw_second == raw_first
+    assert spy.call_count == 1
+    assert raw_identity == body
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["etag"] == '"v1"'
@@ -0,0 +1,133 @@
+"""
+Unit tests for EligibilityIndex (FilterRegistry chains evaluated per Operaciones snapshot).
+"""
+from unittest.mock import patch
+
+import pytest
+
+from backend.services.filters import EligibilityIndex
+from backend.services.spool_service_v2 import SpoolServiceV2
+from backend.utils.normalize import normalize_column_name
+
+
+HEADER = [
+    "TAG_SPOOL", "OT", "NV", "Fecha_Materiales", "Fecha_Armado", "Armador",
+    "Fecha_Soldadura", "Soldador", "Fecha_QC_Metrologia", "Total_Uniones",
+    "Uniones_ARM_Completadas", "Uniones_SOLD_Completadas", "Pulgadas_ARM",
+    "Pulgadas_SOLD", "Ocupado_Por", "Fecha_Ocupacion", "Estado_Detalle",
+]
+COLUMN_MAP = {normalize_column_name(name): idx for idx, name in enumerate(HEADER)}
+
+
+def make_row(tag, materiales="", armado="", soldadura="", ocupado="", estado=""):
+    row = [""] * len(HEADER)
+    row[HEADER.index("TAG_SPOOL")] = tag
+    row[HEADER.index("Fecha_Materiales")] = materiales
+    row[HEADER.index("Fecha_Armado")] = armado
+    row[HEADER.index("Fecha_Soldadura")] = soldadura
+    row[HEADER.index("Ocupado_Por")] = ocupado
+    row[HEADER.index("Estado_Detalle")] = estado
+    return row
+
+
+class FakeSheetsRepo:
+    """Minimal SheetsRepository double with a swappable (initially cold) row cache."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.cached = None
+        self.reads = 0
+
+    def read_worksheet(self, sheet_name):
+        self.reads += 1
+        self.cached = self.rows
+        return self.rows
+
+    def peek_cached_worksheet(self, sheet_name):
+        return self.cached
+
+
+@pytest.fixture(autouse=True)
+def _clean_views():
+    EligibilityIndex.clear_all()
+    with patch(
+        "backend.core.column_map_cache.ColumnMapCache.get_or_build",
+        return_value=COLUMN_MAP,
+    ):
+        yield
+    EligibilityIndex.clear_all()
+
+
+@pytest.fixture
+def rows():
+    return [
+        HEADER,
+        make_row("SP-1", materiales="20-01-2026"),
+        make_row("SP-2", materiales="20-01-2026", ocupado="MR(93)"),
+        make_row("SP-3", materiales="20-01-2026", armado="21-01-2026"),
+        make_row("SP-4", estado="RECHAZADO (Ciclo 1/3)"),
+        make_row("SP-1", materiales="20-01-2026"),
+        make_row(""),
+    ]
+
+
+@pytest.fixture
+def service(rows):
+    repo = FakeSheetsRepo(rows)
+    return SpoolServiceV2(sheets_repository=repo)
+
+
+def tags(spools):
+    return [s.tag_spool for s in spools]
+
+
+def test_every_chain_served_from_one_build(service):
+    assert tags(service.get_spools_disponibles("ARM", "INICIAR")) == ["SP-1", "SP-3"]
+    assert tags(service.get_spools_disponibles("SOLD", "INICIAR")) == ["SP-3"]
+    assert tags(service.get_spools_disponibles("REPARACION", "INICIAR")) == ["SP-4"]
+    assert service.get_spools_disponibles("METROLOGIA", "INICIAR") == []
+    assert service.sheets_repository.reads == 1
+
+
+def test_filters_run_once_per_snapshot(service):
+    from backend.services.filters.common_filters import OcupacionFilter
+
+    with patch.object(OcupacionFilter, "apply", autospec=True,
+                      side_effect=OcupacionFilter.apply) as spy:
+        service.get_spools_disponibles("ARM", "INICIAR")
+        calls_after_build = spy.call_count
+        service.get_spools_disponibles("ARM", "INICIAR")
+
+    assert calls_after_build > 0
+    assert spy.call_count == calls_after_build
+
+
+def test_write_through_reevaluates_only_patched_row(service):
+    service.get_spools_disponibles("ARM", "INICIAR")
+    service.sheets_repository.cached = None  # the write invalidated the row cache
+
+    index = EligibilityIndex.for_repository(service.sheets_repository)
+    index.apply_cell_updates([
+        {"row": 2, "column_name": "Ocupado_Por", "value": "JP(94)"},
+        {"row": 3, "column_name": "Ocupado_Por", "value": ""},
+    ])
+
+    # SP-1 stays eligible through its duplicate (free) row 6
+    assert tags(service.get_spools_disponibles("ARM", "INICIAR")) == ["SP-2", "SP-3", "SP-1"]
+    assert service.sheets_repository.reads == 1
+
+
+def test_new_snapshot_rebuilds(service, rows):
+    service.get_spools_disponibles("ARM", "INICIAR")
+
+    fresh = [list(r) for r in rows]
+    fresh[4][HEADER.index("Fecha_Armado")] = "22-01-2026"
+    service.sheets_repository.cached = fresh
+
+    assert tags(service.get_spools_disponibles("SOLD", "INICIAR")) == ["SP-3", "SP-4"]
+    assert service.sheets_repository.reads == 1
+
+
+def test_unknown_combination_raises(service):
+    with pytest.raises(ValueError):
+        service.get_spools_disponibles("ARM", "PAUSAR")
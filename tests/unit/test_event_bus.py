@@ -0,0 +1,148 @@
+"""
+Unit tests for EventBus (in-process fan-out behind /api/sse/stream).
+"""
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from backend.core.event_bus import RESYNC_EVENT, BusEvent, EventBus, SubscriptionClosed
+from backend.routers.sse_router import _parse_last_event_id, format_sse
+
+
+@pytest.mark.asyncio
+async def test_publish_fans_out_to_every_subscriber():
+    bus = EventBus()
+    first = bus.subscribe()
+    second = bus.subscribe()
+
+    bus.publish("INICIAR", "SP-1", ocupado_por="MR(93)")
+
+    for subscription in (first, second):
+        event = await subscription.get(timeout=1)
+        assert event.type == "INICIAR"
+        assert event.tag_spool == "SP-1"
+        assert event.data == {"ocupado_por": "MR(93)"}
+    assert bus.subscriber_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_returns_none_on_timeout():
+    bus = EventBus()
+    subscription = bus.subscribe()
+
+    assert await subscription.get(timeout=0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_last_event_id_replays_missed_events():
+    bus = EventBus()
+    first, _, _ = [bus.publish("TOMAR", tag) for tag in ("SP-1", "SP-2", "SP-3")]
+
+    subscription = bus.subscribe(last_event_id=first.id)
+
+    replayed = [await subscription.get(timeout=1) for _ in range(2)]
+    assert [e.tag_spool for e in replayed] == ["SP-2", "SP-3"]
+    assert await subscription.get(timeout=0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_last_event_id_at_head_replays_nothing():
+    bus = EventBus()
+    last = bus.publish("TOMAR", "SP-1")
+
+    subscription = bus.subscribe(last_event_id=last.id)
+
+    assert await subscription.get(timeout=0.01) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("offset", [-2, 1])
+async def test_last_event_id_outside_history_sends_resync(offset):
+    bus = EventBus(history_size=2)
+    events = [bus.publish("TOMAR", f"SP-{i}") for i in range(4)]
+    # Historial = eventos 2 y 3: replay válido desde events[1].id en adelante
+    last_event_id = events[1].id + offset if offset < 0 else events[-1].id + offset
+
+    subscription = bus.subscribe(last_event_id=last_event_id)
+
+    event = await subscription.get(timeout=1)
+    assert event.type == RESYNC_EVENT
+    assert event.id == events[-1].id
+    assert await subscription.get(timeout=0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_id_from_previous_process_sends_resync():
+    previous = EventBus()
+    stale = [previous.publish("TOMAR", f"SP-{i}") for i in range(3)][-1]
+    time.sleep(0.001)
+
+    bus = EventBus()
+    assert bus.publish("TOMAR", "SP-9").id > stale.id
+    subscription = bus.subscribe(last_event_id=stale.id)
+
+    assert (await subscription.get(timeout=1)).type == RESYNC_EVENT
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_closed_without_blocking_publisher():
+    bus = EventBus(max_queue=2)
+    slow = bus.subscribe()
+
+    for i in range(5):
+        assert bus.publish("NOTA", f"SP-{i}") is not None
+
+    with pytest.raises(SubscriptionClosed):
+        await slow.get(timeout=1)
+    assert bus.subscriber_count == 0
+
+
+@pytest.mark.asyncio
+async def test_publish_from_worker_thread_reaches_loop():
+    bus = EventBus()
+    subscription = bus.subscribe()
+
+    thread = threading.Thread(target=bus.publish, args=("PAUSAR", "SP-9"))
+    thread.start()
+    thread.join()
+
+    event = await subscription.get(timeout=1)
+    assert event.tag_spool == "SP-9"
+
+
+@pytest.mark.asyncio
+async def test_closed_subscription_stops_receiving():
+    bus = EventBus()
+    subscription = bus.subscribe()
+    subscription.close()
+
+    bus.publish("TOMAR", "SP-1")
+
+    assert bus.subscriber_count == 0
+    assert await subscription.get(timeout=0.01) is None
+
+
+def test_format_sse_wire_format():
+    event = BusEvent(id=7, type="FINALIZAR", tag_spool="SP-1",
+                     data={"ocupado_por": None}, timestamp="t")
+
+    message = format_sse(event)
+
+    lines = message.split("\n")
+    assert lines[0] == "id: 7"
+    assert lines[1] == "event: FINALIZAR"
+    assert json.loads(lines[2][len("data: "):]) == {
+        "id": 7, "type": "FINALIZAR", "tag_spool": "SP-1",
+        "timestamp": "t", "ocupado_por": None,
+    }
+    assert message.endswith("\n\n")
+
+
+def test_parse_last_event_id():
+    assert _parse_last_event_id("42") == 42
+    assert _parse_last_event_id("") is None
+    assert _parse_last_event_id("abc") is None
+    assert _parse_last_event_id(None) is None
@@ -0,0 +1,130 @@
+"""
+Unit tests for the in-memory gspread stand-in (backend/repositories/fake_gspread.py).
+"""
+from unittest.mock import patch
+
+import gspread
+import pytest
+
+from backend.config import config
+from backend.repositories.fake_gspread import (
+    FakeGspreadClient,
+    FakeSheetsLimits,
+    build_load_test_client,
+)
+from backend.repositories.sheets_repository import SheetsRepository
+from backend.utils.cache import get_cache
+
+
+ROWS = [
+    ["TAG_SPOOL", "Total_Uniones", "Ocupado_Por", ""],
+    ["SP-1", 3, "MR(93)", ""],
+    ["SP-2", 1.0, "", ""],
+    ["SP-3", "", "", ""],
+]
+
+
+@pytest.fixture
+def worksheet():
+    client = FakeGspreadClient()
+    client.add_spreadsheet("sheet", "TEST", {"Operaciones": ROWS})
+    return client.open_by_key("sheet").worksheet("Operaciones")
+
+
+def test_reads_trim_pad_and_render(worksheet):
+    assert worksheet.get_all_values() == [
+        ["TAG_SPOOL", "Total_Uniones", "Ocupado_Por"],
+        ["SP-1", "3", "MR(93)"],
+        ["SP-2", "1", ""],
+        ["SP-3", "", ""],
+    ]
+    unformatted = worksheet.get_all_values(
+        value_render_option=gspread.utils.ValueRenderOption.unformatted
+    )
+    assert unformatted[1][1] == 3 and unformatted[2][1] == 1.0
+
+    assert worksheet.get("B2:C3") == [["3", "MR(93)"], ["1"]]
+    assert worksheet.get("Operaciones!C2") == [["MR(93)"]]
+    assert worksheet.batch_get(["A2", "A:A"]) == [[["SP-1"]], [["TAG_SPOOL"], ["SP-1"], ["SP-2"], ["SP-3"]]]
+    assert worksheet.row_values(2) == ["SP-1", "3", "MR(93)"]
+    assert worksheet.col_values(2) == ["Total_Uniones", "3", "1"]
+
+
+def test_writes_follow_value_input_option(worksheet):
+    worksheet.update("C3", [["JP(94)"]], value_input_option="USER_ENTERED")  # firma legacy
+    worksheet.batch_update([
+        {"range": "B4", "values": [["7"]]},
+        {"range": "D2:E2", "values": [["TRUE", "'007"]]},
+    ], value_input_option="USER_ENTERED")
+    worksheet.update(values=[["8"]], range_name="B2")  # RAW por default
+
+    values = worksheet.get_all_values(value_render_option="UNFORMATTED_VALUE")
+    assert values[2][2] == "JP(94)"
+    assert values[3][1] == 7
+    assert values[1][3:5] == [True, "007"]
+    assert values[1][1] == "8"
+    assert worksheet.col_count == 26
+
+
+def test_append_and_delete_rows(worksheet):
+    response = worksheet.append_rows([["SP-4", 2], ["SP-5", 0]], value_input_option="USER_ENTERED")
+    assert response["updates"]["updatedRange"] == "Operaciones!A5:B6"
+
+    response = worksheet.append_row(["SP-6"])
+    assert response["updates"]["updatedRange"] == "Operaciones!A7:A7"
+
+    worksheet.delete_rows(2, 3)
+    assert worksheet.col_values(1) == ["TAG_SPOOL", "SP-3", "SP-4", "SP-5", "SP-6"]
+
+    worksheet.batch_clear(["A3:B"])
+    assert worksheet.col_values(1) == ["TAG_SPOOL", "SP-3"]
+
+
+def test_quota_and_injected_errors_raise_api_error_429():
+    client = FakeGspreadClient(FakeSheetsLimits(reads_per_minute=2))
+    client.add_spreadsheet("sheet", "TEST", {"Operaciones": ROWS})
+    spreadsheet = client.open_by_key("sheet")  # 1 lectura
+    worksheet = spreadsheet.worksheet("Operaciones")  # 2 lecturas
+
+    with pytest.raises(gspread.exceptions.APIError) as exc:
+        worksheet.get_all_values()
+    assert exc.value.code == 429
+    assert "Quota exceeded" in str(exc.value)
+
+    worksheet.update("A2", [["X"]])  # escrituras sin cuota
+    client.fail_next(1)
+    with pytest.raises(gspread.exceptions.APIError):
+        worksheet.update("A2", [["Y"]])
+    assert client.calls["write"] == 1
+    assert client.calls["throttled"] == 2
+
+    with pytest.raises(gspread.exceptions.SpreadsheetNotFound):
+        FakeGspreadClient().open_by_key("missing")
+
+
+def test_load_test_dataset_through_sheets_repository():
+    client = build_load_test_client("fake-sheet")
+    repo = SheetsRepository()
+    repo._client = client
+    cache_key = f"worksheet:{config.HOJA_OPERACIONES_NOMBRE}"
+    get_cache().invalidate(cache_key)
+    try:
+        with patch.object(config, "GOOGLE_SHEET_ID", "fake-sheet"):
+            rows = repo.read_worksheet(config.HOJA_OPERACIONES_NOMBRE)
+            assert len(rows) == 201
+            assert rows[0][6] == "TAG_SPOOL"
+            assert rows[1][6].startswith("MK-9999-")
+
+            repo.batch_update_by_column_name(
+                config.HOJA_OPERACIONES_NOMBRE,
+                [{"row": 2, "column_name": "Ocupado_Por", "value": "MR(93)"}],
+            )
+            assert repo.read_worksheet(config.HOJA_OPERACIONES_NOMBRE)[1][66] == "MR(93)"
+    finally:
+        get_cache().invalidate(cache_key)
+
+    assert client.calls["get_all_values"] == 2
+    assert client.calls["batch_update"] == 1
+    # Mismo dataset en cada build (seed=42)
+    again = build_load_test_client("fake-sheet").open_by_key("fake-sheet")
+    assert again.worksheet("Operaciones").get("G2")[0][0] == rows[1][6]
@@ -0,0 +1,182 @@
+"""
+Unit tests for the Metadata write-behind outbox (backend/repositories/metadata_outbox.py).
+"""
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.models.enums import EventoTipo
+from backend.models.metadata import Accion, MetadataEvent
+from backend.repositories.fake_gspread import _api_error
+from backend.repositories.metadata_outbox import MetadataOutbox
+from backend.repositories.metadata_repository import MetadataRepository
+
+
+def _event(n: int, tag: str = "MK-OUTBOX-001") -> MetadataEvent:
+    return MetadataEvent(
+        id=f"evt-{n}",
+        evento_tipo=EventoTipo.INICIAR_ARM,
+        tag_spool=tag,
+        worker_id=93,
+        worker_nombre="MR(93)",
+        operacion="ARM",
+        accion=Accion.INICIAR,
+        fecha_operacion="02-02-2026",
+    )
+
+
+def _rows(events):
+    return [event.to_sheets_row() for event in events]
+
+
+def test_enqueue_journals_and_flush_writes_chunks_then_compacts(tmp_path):
+    path = tmp_path / "outbox.jsonl"
+    written = []
+    outbox = MetadataOutbox(str(path), write_rows=written.append, chunk_size=2, flush_interval=60)
+    events = [_event(n) for n in range(3)]
+    outbox.enqueue(events, _rows(events))
+
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["event"]["id"] for line in lines] == ["evt-0", "evt-1", "evt-2"]
+    assert [event.id for event in outbox.pending_events()] == ["evt-0", "evt-1", "evt-2"]
+
+    assert outbox.flush() == 2
+    assert outbox.flush() == 1
+    assert outbox.flush() == 0
+    assert [[row[0] for row in chunk] for chunk in written] == [["evt-0", "evt-1"], ["evt-2"]]
+    assert outbox.pending_count() == 0
+    assert path.read_text() == ""  # compactado: sin pendientes
+    outbox.close()
+
+
+def test_failed_flush_keeps_events_pending(tmp_path):
+    outbox = MetadataOutbox(str(tmp_path / "outbox.jsonl"), write_rows=MagicMock(side_effect=RuntimeError("429")),
+                            flush_interval=60)
+    outbox.enqueue([_event(1)], _rows([_event(1)]))
+    with pytest.raises(RuntimeError):
+        outbox.flush()
+    assert outbox.pending_count() == 1
+    outbox.close()
+
+
+def test_retry_after_write_that_landed_then_raised_does_not_duplicate(tmp_path):
+    sheet = []
+
+    def write_then_timeout(rows):
+        sheet.extend(row[0] for row in rows)
+        raise TimeoutError("read timed out")
+
+    outbox = MetadataOutbox(str(tmp_path / "outbox.jsonl"), write_rows=write_then_timeout,
+                            existing_ids=lambda: set(sheet), flush_interval=60)
+    events = [_event(n) for n in range(2)]
+    outbox.enqueue(events, _rows(events))
+    with pytest.raises(TimeoutError):
+        outbox.flush()
+    assert outbox.pending_count() == 2
+
+    assert outbox.flush() == 2  # ambos ya estaban en la hoja: solo ack
+    assert sheet == ["evt-0", "evt-1"]
+    assert outbox.pending_count() == 0
+    outbox.close()
+
+
+def test_row_rejected_by_sheets_is_dead_lettered_and_queue_drains(tmp_path):
+    path = tmp_path / "outbox.jsonl"
+    sheet = []
+
+    def write_rows(rows):
+        if any(row[0] == "evt-2" for row in rows):
+            raise _api_error(400, "Invalid value at 'data.values'", "INVALID_ARGUMENT")
+        sheet.extend(row[0] for row in rows)
+
+    outbox = MetadataOutbox(str(path), write_rows=write_rows, flush_interval=60)
+    events = [_event(n) for n in range(4)]
+    outbox.enqueue(events, _rows(events))
+
+    assert outbox.flush() == 4
+    assert sorted(sheet) == ["evt-0", "evt-1", "evt-3"]
+    assert outbox.pending_count() == 0
+    dead = [json.loads(line) for line in (tmp_path / "outbox.jsonl.dead").read_text().splitlines()]
+    assert [record["event"]["id"] for record in dead] == ["evt-2"]
+    assert "Invalid value" in dead[0]["error"]
+    outbox.close()
+
+
+def test_quota_error_is_retried_not_dead_lettered(tmp_path):
+    outbox = MetadataOutbox(str(tmp_path / "outbox.jsonl"),
+                            write_rows=MagicMock(side_effect=_api_error(429, "Quota exceeded", "RESOURCE_EXHAUSTED")),
+                            flush_interval=60)
+    outbox.enqueue([_event(1)], _rows([_event(1)]))
+    with pytest.raises(Exception):
+        outbox.flush()
+    assert outbox.pending_count() == 1
+    assert not (tmp_path / "outbox.jsonl.dead").exists()
+    outbox.close()
+
+
+def test_recovery_replays_unacked_events_and_skips_ids_already_in_sheet(tmp_path):
+    path = tmp_path / "outbox.jsonl"
+    first = MetadataOutbox(str(path), write_rows=MagicMock(), flush_interval=60)
+    events = [_event(n) for n in range(3)]
+    first.enqueue(events, _rows(events))
+    first.close()  # "crash" sin flush
+    with open(path, "a") as journal:
+        journal.write('{"ack": ["evt-0"]}\n{"event": {"id": "trunc')  # ack + línea truncada
+
+    written = []
+    recovered = MetadataOutbox(str(path), write_rows=written.append, existing_ids=lambda: {"evt-1"},
+                               flush_interval=60)
+    assert [event.id for event in recovered.pending_events()] == ["evt-1", "evt-2"]
+    assert recovered.flush() == 2
+    assert [row[0] for row in written[0]] == ["evt-2"]  # evt-1 ya estaba en Metadata
+    recovered.close()
+
+
+def test_repository_enqueues_and_reads_its_own_pending_writes(tmp_path):
+    worksheet = MagicMock()
+    worksheet.get_all_values.return_value = [["ID"]]
+    sheets_repo = MagicMock()
+    sheets_repo._get_spreadsheet.return_value.worksheet.return_value = worksheet
+
+    repo = MetadataRepository(sheets_repo, use_outbox=False)
+    repo._get_column_map = lambda: {"tagspool": 3}
+    outbox = MetadataOutbox(str(tmp_path / "outbox.jsonl"), write_rows=repo.append_rows, flush_interval=0.01)
+    repo._outbox = outbox
+
+    repo.append_event(_event(1))
+    repo.batch_log_events([_event(2), _event(3, tag="MK-OTHER")])
+    worksheet.append_row.assert_not_called()
+    assert [event.id for event in repo.get_events_by_spool("MK-OUTBOX-001")] == ["evt-1", "evt-2"]
+
+    outbox.stop(timeout=5)
+    assert outbox.pending_count() == 0
+    written = [row[0] for call in worksheet.append_rows.call_args_list for row in call.args[0]]
+    assert written == ["evt-1", "evt-2", "evt-3"]
+    assert worksheet.append_rows.call_count == 1  # coalescidos en un solo append_rows
+    outbox.close()
+
+
+def test_event_flushed_during_sheet_read_is_still_visible(tmp_path):
+    worksheet = MagicMock()
+    sheets_repo = MagicMock()
+    sheets_repo._get_spreadsheet.return_value.worksheet.return_value = worksheet
+    repo = MetadataRepository(sheets_repo, use_outbox=False)
+    repo._get_column_map = lambda: {"tagspool": 3}
+    outbox = MetadataOutbox(str(tmp_path / "outbox.jsonl"), write_rows=MagicMock(), flush_interval=60)
+    repo._outbox = outbox
+    repo.append_event(_event(1))
+
+    def read_then_flush():
+        # La hoja se leyó antes del append; el flusher confirma antes de que
+        # el lector consulte los pendientes
+        outbox.flush()
+        return [["ID"]]
+
+    worksheet.get_all_values.side_effect = read_then_flush
+    assert [event.id for event in repo.get_events_by_spool("MK-OUTBOX-001")] == ["evt-1"]
+    assert outbox.pending_count() == 0
+
+    repo.append_event(_event(2))
+    assert repo.get_latest_events(["MK-OUTBOX-001"])["MK-OUTBOX-001"].id == "evt-2"
+    outbox.close()
@@ -0,0 +1,130 @@
+"""
+Unit tests for the Prometheus-style metrics registry (backend/core/metrics.py).
+"""
+import asyncio
+import time
+
+import gspread
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.config import config
+from backend.core import metrics
+from backend.core.metrics import MetricsMiddleware, MetricsRegistry, watch_event_loop_lag
+from backend.core.quota_governor import QuotaGovernor, QuotaPriority
+from backend.core.sheets_instrumentation import record_sheets_retry
+from backend.repositories.fake_gspread import build_load_test_client
+from backend.repositories.sheets_repository import SheetsRepository
+from backend.routers import metrics_router
+from backend.utils.cache import get_cache
+
+
+def test_registry_renders_prometheus_text_format():
+    registry = MetricsRegistry()
+    calls = registry.counter("app_calls_total", "Calls.", ("sheet",))
+    latency = registry.histogram("app_latency_seconds", "Latency.", ("op",), buckets=(0.1, 1.0))
+    depth = registry.gauge("app_depth", "Depth.")
+
+    calls.inc(sheet='Op"er\\aciones')
+    calls.inc(2, sheet='Op"er\\aciones')
+    latency.observe(0.05, op="get")
+    latency.observe(0.1, op="get")   # límite inclusivo
+    latency.observe(3.0, op="get")
+    depth.set(4)
+
+    text = registry.render()
+    assert "# TYPE app_calls_total counter" in text
+    assert 'app_calls_total{sheet="Op\\"er\\\\aciones"} 3' in text
+    assert 'app_latency_seconds_bucket{op="get",le="0.1"} 2' in text
+    assert 'app_latency_seconds_bucket{op="get",le="1"} 2' in text
+    assert 'app_latency_seconds_bucket{op="get",le="+Inf"} 3' in text
+    assert 'app_latency_seconds_sum{op="get"} 3.15' in text
+    assert 'app_latency_seconds_count{op="get"} 3' in text
+    assert "app_depth 4" in text
+    assert text.endswith("\n")
+
+    assert registry.counter("app_calls_total", "Calls.", ("sheet",)) is calls
+    with pytest.raises(ValueError):
+        registry.gauge("app_calls_total", "Calls.")
+    with pytest.raises(ValueError):
+        calls.inc(op="get")
+
+
+def test_route_latency_uses_route_template_and_endpoint_serves_text():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router.router, prefix="/api")
+
+    @app.get("/items/{tag}")
+    async def item(tag: str):
+        return {"tag": tag}
+
+    client = TestClient(app)
+    before = metrics.HTTP_REQUEST_DURATION.count(method="GET", route="/items/{tag}", status="200")
+    client.get("/items/MK-1")
+    client.get("/items/MK-2")
+    client.get("/nope")
+
+    assert metrics.HTTP_REQUEST_DURATION.count(method="GET", route="/items/{tag}", status="200") == before + 2
+    assert metrics.HTTP_REQUEST_DURATION.count(method="GET", route="unmatched", status="404") >= 1
+
+    response = client.get("/api/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'route="/items/{tag}"' in response.text
+    assert "MK-1" not in response.text
+
+
+def test_sheets_calls_cache_rebuilds_and_429s_are_counted():
+    repo = SheetsRepository()
+    repo._client = build_load_test_client("fake-sheet")
+    sheet = config.HOJA_OPERACIONES_NOMBRE
+    cache_key = f"worksheet:{sheet}"
+    get_cache().invalidate(cache_key)
+
+    reads = metrics.SHEETS_CALL_DURATION.count(operation="get_all_values", kind="read", sheet=sheet)
+    hits = metrics.CACHE_LOOKUPS.value(key=cache_key, result="hit")
+    throttled = metrics.SHEETS_THROTTLED.value(kind="read")
+    retries = metrics.SHEETS_RETRIES.value()
+    try:
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(config, "GOOGLE_SHEET_ID", "fake-sheet")
+            repo.read_worksheet(sheet)
+            repo.read_worksheet(sheet)  # cache hit
+            repo._client.fail_next(1)
+            with pytest.raises(gspread.exceptions.APIError):
+                repo._client.open_by_key("fake-sheet")
+            record_sheets_retry()
+    finally:
+        get_cache().invalidate(cache_key)
+
+    assert metrics.SHEETS_CALL_DURATION.count(operation="get_all_values", kind="read", sheet=sheet) == reads + 1
+    assert metrics.CACHE_LOOKUPS.value(key=cache_key, result="hit") == hits + 1
+    assert metrics.SHEETS_THROTTLED.value(kind="read") == throttled + 1
+    assert metrics.SHEETS_RETRIES.value() == retries + 1
+    assert metrics.COLUMN_MAP_REBUILDS.value(sheet=sheet) >= 1
+
+
+def test_quota_waits_and_event_loop_lag_are_observed():
+    governor = QuotaGovernor(reads_per_minute=10, writes_per_minute=0, max_wait=0.01)
+    waits = metrics.QUOTA_WAIT.count(kind="read", priority="BACKGROUND")
+    overflows = metrics.QUOTA_OVERFLOWS.value(kind="read")
+    governor._buckets["read"].tokens = 0
+    governor.acquire("read", QuotaPriority.BACKGROUND)
+    assert metrics.QUOTA_WAIT.count(kind="read", priority="BACKGROUND") == waits + 1
+    assert metrics.QUOTA_OVERFLOWS.value(kind="read") == overflows + 1
+    assert metrics.QUOTA_QUEUE_DEPTH.value(kind="read") == 0
+
+    async def run():
+        samples = metrics.EVENT_LOOP_LAG.count()
+        task = asyncio.create_task(watch_event_loop_lag(0.01))
+        await asyncio.sleep(0.005)
+        time.sleep(0.05)  # bloquea el loop
+        await asyncio.sleep(0.03)
+        task.cancel()
+        return samples
+
+    samples = asyncio.run(run())
+    assert metrics.EVENT_LOOP_LAG.count() > samples
+    assert metrics.EVENT_LOOP_LAG_LAST.value() >= 0
@@ -4,7 +4,7 @@ Unit tests for MetrologiaService.
 Tests instant completion workflow with APROBADO/RECHAZADO outcomes.
 """
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from datetime import date
 
 from backend.services.metrologia_service import MetrologiaService
@@ -21,12 +21,10 @@ from backend.exceptions import (
 
 @pytest.fixture
 def mock_sheets_repo():
-    """Mock SheetsRepository (MetrologiaService uses state machine -> batch_update_by_column_name)."""
+    """Mock SheetsRepository (MetrologiaService writes transition cells via batch_update_by_column_name)."""
     repo = Mock()
     repo.find_row_by_column_value = Mock(return_value=10)
     repo.batch_update_by_column_name = Mock()
-    # T-112: state machine reads Estado_Detalle to extract current cycle on RECHAZADO
-    repo.get_cell_value = Mock(return_value="")
     return repo
 
 
@@ -254,15 +252,18 @@ async def test_completar_continues_on_metadata_failure(metrologia_service, mock_
 async def test_t112_cycle_counter_passed_to_state_machine(
     validation_service, mock_sheets_repo, mock_metadata_repo, ready_spool
 ):
-    """T-112: MetrologiaService must inject cycle_counter into MetrologiaStateMachine.
+    """T-112: MetrologiaService must evaluate RECHAZADO with its injected cycle_counter.
 
     Before fix, factory and constructor did not pass cycle_counter, so the
-    on_enter_rechazado callback fell back to the static "METROLOGIA RECHAZADO -
+    rechazado callback fell back to the static "METROLOGIA RECHAZADO -
     Pendiente reparación" string and never incremented the cycle. This test
     locks in the injection.
     """
     mock_sheets_repo.get_spool_by_tag = Mock(return_value=ready_spool)
     cycle_counter_mock = Mock(spec=CycleCounterService)
+    cycle_counter_mock.extract_cycle_count.return_value = 0
+    cycle_counter_mock.increment_cycle.return_value = 1
+    cycle_counter_mock.build_rechazado_estado.return_value = "RECHAZADO (Ciclo 1/3) - Pendiente reparación"
 
     service = MetrologiaService(
         validation_service=validation_service,
@@ -271,23 +272,15 @@ async def test_t112_cycle_counter_passed_to_state_machine(
         cycle_counter=cycle_counter_mock
     )
 
-    with patch("backend.services.metrologia_service.MetrologiaStateMachine") as sm_cls:
-        # Provide a no-op state machine instance so completar() doesn't crash
-        sm_instance = Mock()
-        sm_cls.return_value = sm_instance
-
-        await service.completar(
-            tag_spool="TEST-001",
-            worker_id=95,
-            worker_nombre="CP(95)",
-            resultado="RECHAZADO"
-        )
+    await service.completar(
+        tag_spool="TEST-001",
+        worker_id=95,
+        worker_nombre="CP(95)",
+        resultado="RECHAZADO"
+    )
 
-        sm_cls.assert_called_once()
-        kwargs = sm_cls.call_args.kwargs
-        assert kwargs["cycle_counter"] is cycle_counter_mock, (
-            "MetrologiaStateMachine must receive cycle_counter from MetrologiaService"
-        )
+    cycle_counter_mock.increment_cycle.assert_called_once_with(0)
+    cycle_counter_mock.build_rechazado_estado.assert_called_once_with(1)
 
 
 @pytest.mark.asyncio
@@ -298,8 +291,7 @@ async def test_t112_first_rechazado_writes_ciclo_1(
 
     Before fix, the cycle was never written because cycle_counter was None.
     """
-    mock_sheets_repo.get_spool_by_tag = Mock(return_value=ready_spool)
-    mock_sheets_repo.get_cell_value = Mock(return_value="")  # No prior cycle
+    mock_sheets_repo.get_spool_by_tag = Mock(return_value=ready_spool)  # No prior cycle
 
     await metrologia_service.completar(
         tag_spool="TEST-001",
@@ -322,13 +314,13 @@ async def test_t112_third_rechazado_transitions_to_bloqueado(
 ):
     """T-112: Third RECHAZADO transitions Estado_Detalle to BLOQUEADO.
 
-    Simulates the state Sheets has after 2 prior rejections by returning
-    'Ciclo 2/3' from get_cell_value. The third rejection should yield BLOQUEADO.
+    Simulates the state Sheets has after 2 prior rejections: Estado_Detalle
+    holds 'Ciclo 2/3'. The third rejection should yield BLOQUEADO.
     """
-    mock_sheets_repo.get_spool_by_tag = Mock(return_value=ready_spool)
-    mock_sheets_repo.get_cell_value = Mock(
-        return_value="RECHAZADO (Ciclo 2/3) - Pendiente reparación"
+    spool = ready_spool.model_copy(
+        update={"estado_detalle": "PENDIENTE_METROLOGIA (Ciclo 2/3)"}
     )
+    mock_sheets_repo.get_spool_by_tag = Mock(return_value=spool)
 
     await metrologia_service.completar(
         tag_spool="TEST-001",
@@ -350,7 +342,7 @@ async def test_t112_aprobado_resets_cycle(
 ):
     """T-112: APROBADO resets cycle counter (consecutive rejections broken).
 
-    With cycle_counter injected, on_enter_aprobado now calls reset_cycle()
+    With cycle_counter injected, aprobar now calls reset_cycle()
     instead of falling back to the static "METROLOGIA APROBADO ✓" string.
     """
     mock_sheets_repo.get_spool_by_tag = Mock(return_value=ready_spool)
@@ -0,0 +1,140 @@
+"""
+Unit tests for OccupancyView (materialized occupied-spools set over Operaciones).
+"""
+from unittest.mock import Mock, patch
+
+import pytest
+
+from backend.config import config
+from backend.core.occupancy_view import OccupancyView
+from backend.repositories.sheets_repository import SheetsRepository
+from backend.utils.cache import get_cache
+
+
+HEADER = ["TAG_SPOOL", "OT", "Ocupado_Por", "Fecha_Ocupacion", "Estado_Detalle"]
+COLUMN_MAP = {"tagspool": 0, "ot": 1, "ocupadopor": 2, "fechaocupacion": 3, "estadodetalle": 4}
+
+
+class FakeSheetsRepo:
+    """Minimal SheetsRepository double with a swappable (initially cold) row cache."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.cached = None
+        self.reads = 0
+
+    def read_worksheet(self, sheet_name):
+        self.reads += 1
+        self.cached = self.rows
+        return self.rows
+
+    def peek_cached_worksheet(self, sheet_name):
+        return self.cached
+
+
+@pytest.fixture(autouse=True)
+def _clean_views():
+    OccupancyView.clear_all()
+    with patch(
+        "backend.core.column_map_cache.ColumnMapCache.get_or_build",
+        return_value=COLUMN_MAP,
+    ):
+        yield
+    OccupancyView.clear_all()
+
+
+@pytest.fixture
+def rows():
+    return [
+        HEADER,
+        ["SP-1", "001", "MR(93)", "20-01-2026 08:00:00", "ARM: En Progreso"],
+        ["SP-2", "001", "", "", ""],
+        ["SP-3", "002", " JP(94) ", "20-01-2026 09:00:00", ""],
+        ["SP-4", "002", "MR(93)", "20-01-2026 10:00:00", "SOLD: En Progreso"],
+        ["SP-5", "003"],
+    ]
+
+
+def test_occupied_lists_only_occupied_rows(rows):
+    repo = FakeSheetsRepo(rows)
+    occupied = OccupancyView.for_repository(repo).occupied()
+
+    assert [(o.row, o.tag_spool, o.ocupado_por) for o in occupied] == [
+        (2, "SP-1", "MR(93)"), (4, "SP-3", "JP(94)"), (5, "SP-4", "MR(93)"),
+    ]
+
+
+def test_worker_and_tag_lookups_share_one_build(rows):
+    repo = FakeSheetsRepo(rows)
+    view = OccupancyView.for_repository(repo)
+
+    assert view.rows_occupied_by(93) == [2, 5]
+    assert view.rows_occupied_by(95) == []
+    assert view.occupant_of("SP-3").ocupado_por == "JP(94)"
+    assert view.occupant_of("SP-2") is None
+    assert repo.reads == 1
+
+
+def test_cell_updates_patch_view_without_rereading(rows):
+    repo = FakeSheetsRepo(rows)
+    view = OccupancyView.for_repository(repo)
+    view.occupied()
+    repo.cached = None  # the write invalidated the row cache
+
+    view.apply_cell_updates([
+        {"row": 3, "column_name": "Ocupado_Por", "value": "AB(95)"},
+        {"row": 3, "column_name": "Fecha_Ocupacion", "value": "21-01-2026 08:00:00"},
+        {"row": 2, "column_name": "Ocupado_Por", "value": ""},
+        {"row": 2, "column_name": "Armador", "value": "MR(93)"},
+    ])
+
+    assert view.rows_occupied_by(95) == [3]
+    assert view.rows_occupied_by(93) == [5]
+    assert view.occupant_of("SP-1") is None
+    assert repo.reads == 1
+
+
+def test_new_snapshot_rebuilds_view(rows):
+    repo = FakeSheetsRepo(rows)
+    view = OccupancyView.for_repository(repo)
+    view.occupied()
+
+    fresh = [list(r) for r in rows]
+    fresh[2][2] = "MR(93)"
+    repo.cached = fresh
+
+    assert view.rows_occupied_by(93) == [2, 3, 5]
+
+
+def test_update_outside_snapshot_invalidates(rows):
+    repo = FakeSheetsRepo(rows)
+    view = OccupancyView.for_repository(repo)
+    view.occupied()
+    repo.cached = None
+
+    view.apply_cell_updates([{"row": 99, "column_name": "Ocupado_Por", "value": "MR(93)"}])
+    view.occupied()
+
+    assert repo.reads == 2
+
+
+def test_sheets_repository_column_writes_patch_view(rows):
+    repo = SheetsRepository()
+    worksheet = Mock()
+    repo._get_spreadsheet = Mock(return_value=Mock(worksheet=Mock(return_value=worksheet)))
+    cache_key = f"worksheet:{config.HOJA_OPERACIONES_NOMBRE}"
+    get_cache().set(cache_key, rows, ttl_seconds=60)
+    try:
+        view = OccupancyView.for_repository(repo)
+        assert view.rows_occupied_by(94) == [4]
+
+        repo.batch_update_by_column_name(
+            config.HOJA_OPERACIONES_NOMBRE,
+            [{"row": 4, "column_name": "Ocupado_Por", "value": ""}],
+        )
+
+        worksheet.batch_update.assert_called_once()
+        assert get_cache().get(cache_key) is None
+        assert view.rows_occupied_by(94) == []
+    finally:
+        get_cache().invalidate(cache_key)
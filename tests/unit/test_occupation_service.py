@@ -15,6 +15,7 @@ Reference:
 import pytest
 from unittest.mock import AsyncMock, MagicMock, call
 from datetime import date
+from pydantic import ValidationError
 
 # Skip marker for tests that require Redis (deprecated in single-user mode)
 skip_redis = pytest.mark.skip(reason="Test requires Redis locks/SSE (deprecated in single-user mode)")
@@ -636,3 +637,107 @@ async def test_finalizar_logs_batch_and_granular_metadata(
     assert result.success is True
     assert result.unions_processed == 3
     assert result.action_taken in ["PAUSAR", "COMPLETAR"]
+
+
+# ---------------------------------------------------------------------------
+# Bulk batch_tomar: 1 read + 1 batchUpdate + 1 batch_log_events
+# ---------------------------------------------------------------------------
+
+BULK_HEADER = ["TAG_SPOOL", "Fecha_Materiales", "Ocupado_Por", "Fecha_Ocupacion", "Estado_Detalle"]
+BULK_COLUMN_MAP = {"tagspool": 0, "fechamateriales": 1, "ocupadopor": 2,
+                   "fechaocupacion": 3, "estadodetalle": 4}
+
+
+@pytest.fixture
+def bulk_service(mock_metadata_repository, mock_conflict_service):
+    from unittest.mock import patch
+
+    sheets = MagicMock()
+    sheets.read_worksheet.return_value = [
+        BULK_HEADER,
+        ["TAG-OK-1", "20-01-2026", "", "", ""],
+        ["TAG-BUSY", "20-01-2026", "JP(94)", "20-01-2026 08:00:00", ""],
+        ["TAG-NO-MAT", "", "", "", ""],
+        ["TAG-OK-2", "20-01-2026", "DISPONIBLE", "", ""],
+    ]
+    service = OccupationService(
+        sheets_repository=sheets,
+        metadata_repository=mock_metadata_repository,
+        conflict_service=mock_conflict_service
+    )
+    with patch(
+        "backend.core.column_map_cache.ColumnMapCache.get_or_build",
+        return_value=BULK_COLUMN_MAP,
+    ):
+        yield service
+
+
+@pytest.mark.asyncio
+async def test_batch_tomar_bulk_uses_one_read_one_write_one_append(
+    bulk_service,
+    mock_metadata_repository,
+    mock_conflict_service
+):
+    request = BatchTomarRequest(
+        tag_spools=["TAG-OK-1", "TAG-BUSY", "TAG-MISSING", "TAG-NO-MAT", "TAG-OK-2"],
+        worker_id=93,
+        worker_nombre="MR(93)",
+        operacion="ARM"
+    )
+
+    response = await bulk_service.batch_tomar(request)
+
+    sheets = bulk_service.sheets_repository
+    assert sheets.read_worksheet.call_count == 1
+    sheets.batch_update_by_column_name.assert_called_once()
+    mock_metadata_repository.batch_log_events.assert_called_once()
+    mock_metadata_repository.log_event.assert_not_called()
+    mock_conflict_service.update_with_retry.assert_not_called()
+
+    updates = sheets.batch_update_by_column_name.call_args.kwargs["updates"]
+    assert {(u["row"], u["column_name"]) for u in updates} == {
+        (row, col)
+        for row in (2, 5)
+        for col in ("Ocupado_Por", "Fecha_Ocupacion", "Estado_Detalle")
+    }
+    events = mock_metadata_repository.batch_log_events.call_args.args[0]
+    assert [e.tag_spool for e in events] == ["TAG-OK-1", "TAG-OK-2"]
+    assert all(e.evento_tipo.value == "TOMAR_SPOOL" for e in events)
+
+    assert (response.total, response.succeeded, response.failed) == (5, 2, 3)
+    assert [d.tag_spool for d in response.details] == request.tag_spools
+    assert [d.success for d in response.details] == [True, False, False, False, True]
+    assert "ya ocupado" in response.details[1].message
+    assert "no encontrado" in response.details[2].message
+
+
+@pytest.mark.asyncio
+async def test_batch_tomar_bulk_write_failure_fails_every_valid_spool(
+    bulk_service,
+    mock_metadata_repository
+):
+    bulk_service.sheets_repository.batch_update_by_column_name.side_effect = Exception("429")
+    request = BatchTomarRequest(
+        tag_spools=["TAG-OK-1", "TAG-OK-2", "TAG-BUSY"],
+        worker_id=93,
+        worker_nombre="MR(93)",
+        operacion="SOLD"
+    )
+
+    response = await bulk_service.batch_tomar(request)
+
+    assert (response.succeeded, response.failed) == (0, 3)
+    assert "429" in response.details[0].message
+    mock_metadata_repository.batch_log_events.assert_not_called()
+
+
+@pytest.mark.parametrize("operacion", ["METROLOGIA", "REPARACION"])
+def test_batch_tomar_rejects_operations_outside_arm_sold(operacion):
+    # El Estado_Detalle fijo del batch pisaría "RECHAZADO (Ciclo N/3)"
+    with pytest.raises(ValidationError, match="ARM o SOLD"):
+        BatchTomarRequest(
+            tag_spools=["TAG-OK-1"],
+            worker_id=93,
+            worker_nombre="MR(93)",
+            operacion=operacion
+        )
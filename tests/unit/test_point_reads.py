@@ -0,0 +1,74 @@
+"""
+Unit tests for single-range reads (SheetsRepository.read_cell / locate_row).
+
+Without a cached Operaciones snapshot only the A1 range is fetched, never
+the whole sheet; any write to the sheet makes the short point cache stale.
+"""
+from unittest.mock import patch
+
+import pytest
+
+from backend.config import config
+from backend.repositories.fake_gspread import build_load_test_client
+from backend.repositories.sheets_repository import SheetsRepository
+from backend.utils.cache import get_cache
+
+SHEET = config.HOJA_OPERACIONES_NOMBRE
+CACHE_KEY = f"worksheet:{SHEET}"
+
+
+@pytest.fixture
+def repo():
+    repo = SheetsRepository(compatibility_mode="v3.0")
+    repo._client = build_load_test_client("fake-sheet")
+    with patch.object(config, "GOOGLE_SHEET_ID", "fake-sheet"):
+        rows = repo.read_worksheet(SHEET)        # column map + fila de referencia
+        get_cache().invalidate(CACHE_KEY)        # sin snapshot vigente
+        repo._client.reset_calls()
+        yield repo, rows
+    get_cache().invalidate(CACHE_KEY)
+
+
+def test_read_cell_fetches_only_the_cell_and_caches_it(repo):
+    repo, rows = repo
+    calls = repo._client.calls
+    tag = rows[1][rows[0].index("TAG_SPOOL")]
+
+    assert repo.read_cell(SHEET, 2, "TAG_SPOOL") == tag
+    assert repo.read_cell(SHEET, 2, "TAG_SPOOL") == tag
+    assert (calls["get"], calls["get_all_values"]) == (1, 0)
+
+    assert repo.read_cell(SHEET, 2, "Columna_Inexistente") is None
+    assert repo.read_cell(SHEET, len(rows) + 5, "TAG_SPOOL") is None
+
+
+def test_write_makes_point_cache_stale(repo):
+    repo, _ = repo
+    calls = repo._client.calls
+    assert repo.get_ocupado_por(SHEET, 2) is None
+
+    repo.update_cell_by_column_name(SHEET, 2, "Ocupado_Por", "MR(93)")
+    assert repo.get_ocupado_por(SHEET, 2) == "MR(93)"
+    assert (calls["get"], calls["get_all_values"]) == (2, 0)
+
+
+def test_locate_row_reads_only_the_key_column(repo):
+    repo, rows = repo
+    calls = repo._client.calls
+    tag_index = rows[0].index("TAG_SPOOL")
+    letter = repo._index_to_column_letter(tag_index)
+
+    assert repo.locate_row(SHEET, letter, rows[5][tag_index]) == 6
+    assert repo.locate_row(SHEET, letter, "NO-EXISTE") is None
+    assert (calls["get"], calls["get_all_values"]) == (1, 0)
+
+
+def test_snapshot_is_used_when_cached(repo):
+    repo, rows = repo
+    calls = repo._client.calls
+    repo.read_worksheet(SHEET)
+    tag_index = rows[0].index("TAG_SPOOL")
+
+    assert repo.read_cell(SHEET, 3, "TAG_SPOOL") == rows[2][tag_index]
+    assert repo.locate_row(SHEET, repo._index_to_column_letter(tag_index), rows[2][tag_index]) == 3
+    assert (calls["get"], calls["get_all_values"]) == (0, 1)
@@ -0,0 +1,186 @@
+"""
+Unit tests for the Sheets quota governor (backend/core/quota_governor.py).
+"""
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from backend.core.quota_governor import (
+    GovernedHTTPClient,
+    QuotaGovernor,
+    QuotaPriority,
+    classify_request,
+    current_priority,
+    run_in_worker_loop,
+    sheets_priority,
+)
+
+
+def test_tokens_within_capacity_do_not_wait_then_refill_paces_callers():
+    # 600/min = 10 tokens/s; capacidad 600 → se vacía a mano
+    governor = QuotaGovernor(reads_per_minute=600, writes_per_minute=0, max_wait=5)
+    assert governor.acquire("read") == 0.0
+    assert governor.acquire("write") == 0.0  # escrituras sin límite
+
+    governor._buckets["read"].tokens = 0
+    waited = governor.acquire("read")
+    assert 0.05 < waited < 0.5
+
+    snapshot = governor.snapshot()
+    assert snapshot["write"] == {"enabled": False}
+    assert snapshot["read"]["acquired"]["INTERACTIVE"] == 2
+    assert snapshot["read"]["waits"] == 1
+    assert snapshot["read"]["max_queue_depth"] == 1
+
+
+def test_background_cannot_spend_the_reserve():
+    governor = QuotaGovernor(reads_per_minute=10, writes_per_minute=10, max_wait=0.05)
+    # Reserva 20% de 10 → BACKGROUND usa 8 tokens, el resto queda para confirmaciones
+    for _ in range(8):
+        assert governor.acquire("read", QuotaPriority.BACKGROUND) < 0.01
+    governor.acquire("read", QuotaPriority.BACKGROUND)  # espera y sale por overflow
+    assert governor.acquire("read", QuotaPriority.USER_WRITE) < 0.01
+
+    read = governor.snapshot()["read"]
+    assert read["overflows"] == 1
+    assert read["acquired"] == {"USER_WRITE": 1, "INTERACTIVE": 0, "BACKGROUND": 9}
+
+
+def test_user_writes_jump_the_queue():
+    governor = QuotaGovernor(reads_per_minute=0, writes_per_minute=120, max_wait=5)
+    governor._buckets["write"].tokens = 0
+    order = []
+
+    def caller(priority):
+        governor.acquire("write", priority)
+        order.append(priority)
+
+    background = [threading.Thread(target=caller, args=(QuotaPriority.BACKGROUND,)) for _ in range(2)]
+    for thread in background:
+        thread.start()
+    time.sleep(0.05)  # los BACKGROUND ya están en cola
+    user = threading.Thread(target=caller, args=(QuotaPriority.USER_WRITE,))
+    user.start()
+    for thread in background + [user]:
+        thread.join(timeout=10)
+
+    assert order[0] == QuotaPriority.USER_WRITE
+    assert governor.snapshot()["write"]["max_queue_depth"] == 3
+
+
+def test_priority_defaults_and_fastapi_dependency():
+    assert current_priority("write") == QuotaPriority.USER_WRITE
+    assert current_priority("read") == QuotaPriority.INTERACTIVE
+
+    app = FastAPI()
+
+    @app.get("/poll", dependencies=[Depends(sheets_priority(QuotaPriority.BACKGROUND))])
+    async def poll():
+        return {"priority": current_priority("read").name}
+
+    @app.get("/poll-sync", dependencies=[Depends(sheets_priority(QuotaPriority.BACKGROUND))])
+    def poll_sync():
+        return {"priority": current_priority("read").name}
+
+    client = TestClient(app)
+    assert client.get("/poll").json() == {"priority": "BACKGROUND"}
+    # La prioridad llega también a los endpoints `def` (threadpool)
+    assert client.get("/poll-sync").json() == {"priority": "BACKGROUND"}
+    assert current_priority("read") == QuotaPriority.INTERACTIVE
+
+
+@pytest.mark.asyncio
+async def test_throttled_request_does_not_block_a_concurrent_one():
+    governor = QuotaGovernor(reads_per_minute=1, writes_per_minute=0, max_wait=1.0)
+    governor.acquire("read")  # bucket vacío: la próxima lectura espera max_wait
+    app = FastAPI()
+
+    @app.get("/poll", dependencies=[Depends(sheets_priority(QuotaPriority.BACKGROUND))])
+    def poll():
+        return {"waited": governor.acquire("read")}
+
+    @app.get("/confirm")
+    async def confirm():
+        return {"waited": governor.acquire("read")}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        throttled = asyncio.create_task(client.get("/poll"))
+        await asyncio.sleep(0.1)  # /poll ya está esperando token en el threadpool
+
+        start = time.monotonic()
+        assert (await client.get("/confirm")).json() == {"waited": 0.0}
+        assert time.monotonic() - start < 0.5
+        assert not throttled.done()
+
+        assert (await throttled).json()["waited"] >= 0.9
+
+    read = governor.snapshot()["read"]
+    assert read["overflows"] == 2  # el del event loop sale sin esperar
+    assert read["waits"] == 1
+
+
+def test_polling_routes_run_in_threadpool():
+    from backend.routers.dashboard_router import get_occupied_spools
+    from backend.routers.spool_status_router import batch_spool_status, get_spool_changes
+
+    for route in (get_occupied_spools, batch_spool_status, get_spool_changes):
+        assert not asyncio.iscoroutinefunction(route)
+
+
+def test_service_coroutines_queue_in_worker_loop():
+    governor = QuotaGovernor(reads_per_minute=0, writes_per_minute=600, max_wait=5)
+    governor._buckets["write"].tokens = 0
+    app = FastAPI()
+
+    async def service_write():
+        await asyncio.sleep(0)
+        return governor.acquire("write")
+
+    @app.post("/iniciar", dependencies=[Depends(sheets_priority(QuotaPriority.USER_WRITE))])
+    def iniciar():
+        return {"waited": run_in_worker_loop(service_write())}
+
+    waited = TestClient(app).post("/iniciar").json()["waited"]
+
+    write = governor.snapshot()["write"]
+    assert waited > 0.05  # hizo cola en vez de salir por overflow
+    assert write["overflows"] == 0
+    assert write["acquired"]["USER_WRITE"] == 1
+
+
+def test_sheets_routes_run_off_the_event_loop():
+    from backend.routers import actions, metrologia, occupation_v4, supervisor_router, union_router
+
+    for route in (
+        occupation_v4.iniciar_v4,
+        union_router.finalizar_v4,
+        union_router.guardar_uniones,
+        union_router.get_disponibles,
+        actions.tomar_reparacion,
+        metrologia.completar_metrologia,
+        supervisor_router.add_to_list,
+    ):
+        assert not asyncio.iscoroutinefunction(route)
+
+
+def test_governed_http_client_classifies_and_acquires():
+    assert classify_request("GET", "https://sheets.googleapis.com/v4/spreadsheets/x/values/A1") == "read"
+    assert classify_request("POST", "https://sheets.googleapis.com/v4/spreadsheets/x/values:batchGetByDataFilter") == "read"
+    assert classify_request("POST", "https://sheets.googleapis.com/v4/spreadsheets/x/values:batchUpdate") == "write"
+    assert classify_request("PUT", "https://sheets.googleapis.com/v4/spreadsheets/x/values/A1") == "write"
+
+    governor = MagicMock()
+    session = MagicMock()
+    session.request.return_value.ok = True
+    client = GovernedHTTPClient(auth=MagicMock(), session=session)
+    with patch("backend.core.quota_governor.get_quota_governor", return_value=governor):
+        client.request("post", "https://sheets.googleapis.com/v4/spreadsheets/x:batchUpdate", json={})
+    governor.acquire.assert_called_once_with("write")
+    session.request.assert_called_once()
@@ -5,7 +5,7 @@ Tests reparación orchestration with cycle tracking, SSE events, and state machi
 """
 
 import pytest
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import Mock
 from datetime import date
 import json
 
@@ -125,14 +125,7 @@ async def test_tomar_extracts_cycle_count(reparacion_service, mock_sheets_repo,
 
     mock_sheets_repo.get_spool_by_tag.return_value = rechazado_spool
 
-    # Mock state machine behavior
-    with patch("backend.services.reparacion_service.REPARACIONStateMachine") as MockStateMachine:
-        mock_machine = AsyncMock()
-        mock_machine.current_state.id = "en_reparacion"
-        mock_machine.get_state_id.return_value = "en_reparacion"
-        MockStateMachine.return_value = mock_machine
-
-        result = await reparacion_service.tomar_reparacion(tag_spool, worker_id, worker_nombre)
+    result = await reparacion_service.tomar_reparacion(tag_spool, worker_id, worker_nombre)
 
     # Verify cycle counter called
     mock_cycle_counter.extract_cycle_count.assert_called_once_with(rechazado_spool.estado_detalle)
@@ -173,13 +166,7 @@ async def test_pausar_clears_occupation(
     # pausar_reparacion calls build_reparacion_estado("reparacion_pausada", cycle)
     mock_cycle_counter.build_reparacion_estado.return_value = "REPARACION_PAUSADA (Ciclo 1/3)"
 
-    with patch("backend.services.reparacion_service.REPARACIONStateMachine") as MockStateMachine:
-        mock_machine = AsyncMock()
-        mock_machine.current_state.id = "reparacion_pausada"
-        mock_machine.get_state_id.return_value = "reparacion_pausada"
-        MockStateMachine.return_value = mock_machine
-
-        result = await reparacion_service.pausar_reparacion(tag_spool, worker_id)
+    result = await reparacion_service.pausar_reparacion(tag_spool, worker_id)
 
     assert result["success"] is True
     assert "REPARACION_PAUSADA" in result["estado_detalle"]
@@ -199,13 +186,7 @@ async def test_completar_sets_pendiente_metrologia(reparacion_service, mock_shee
 
     mock_sheets_repo.get_spool_by_tag.return_value = en_reparacion_spool
 
-    with patch("backend.services.reparacion_service.REPARACIONStateMachine") as MockStateMachine:
-        mock_machine = AsyncMock()
-        mock_machine.current_state.id = "pendiente_metrologia"
-        mock_machine.get_state_id.return_value = "pendiente_metrologia"
-        MockStateMachine.return_value = mock_machine
-
-        result = await reparacion_service.completar_reparacion(tag_spool, worker_id, worker_nombre)
+    result = await reparacion_service.completar_reparacion(tag_spool, worker_id, worker_nombre)
 
     assert result["success"] is True
     assert result["estado_detalle"] == "PENDIENTE_METROLOGIA"
@@ -224,13 +205,7 @@ async def test_cancelar_returns_to_rechazado(reparacion_service, mock_sheets_rep
 
     mock_sheets_repo.get_spool_by_tag.return_value = en_reparacion_spool
 
-    with patch("backend.services.reparacion_service.REPARACIONStateMachine") as MockStateMachine:
-        mock_machine = AsyncMock()
-        mock_machine.current_state.id = "rechazado"
-        mock_machine.get_state_id.return_value = "rechazado"
-        MockStateMachine.return_value = mock_machine
-
-        result = await reparacion_service.cancelar_reparacion(tag_spool, worker_id)
+    result = await reparacion_service.cancelar_reparacion(tag_spool, worker_id)
 
     assert result["success"] is True
     # Verify build_rechazado_estado called to construct estado_detalle
@@ -251,13 +226,7 @@ async def test_metadata_includes_cycle_info(reparacion_service, mock_sheets_repo
 
     mock_sheets_repo.get_spool_by_tag.return_value = rechazado_spool
 
-    with patch("backend.services.reparacion_service.REPARACIONStateMachine") as MockStateMachine:
-        mock_machine = AsyncMock()
-        mock_machine.current_state.id = "en_reparacion"
-        mock_machine.get_state_id = Mock(return_value="en_reparacion")
-        MockStateMachine.return_value = mock_machine
-
-        result = await reparacion_service.tomar_reparacion(tag_spool, worker_id, worker_nome)
+    result = await reparacion_service.tomar_reparacion(tag_spool, worker_id, worker_nome)
 
     # Verify metadata logged with cycle info via log_event(**event)
     mock_metadata_repo.log_event.assert_called_once()
@@ -278,13 +247,7 @@ async def test_metadata_logging_failure_does_not_block(reparacion_service, mock_
     mock_sheets_repo.get_spool_by_tag.return_value = rechazado_spool
     mock_metadata_repo.log_event.side_effect = Exception("Sheets API error")
 
-    with patch("backend.services.reparacion_service.REPARACIONStateMachine") as MockStateMachine:
-        mock_machine = AsyncMock()
-        mock_machine.current_state.id = "en_reparacion"
-        mock_machine.get_state_id.return_value = "en_reparacion"
-        MockStateMachine.return_value = mock_machine
-
-        # Should NOT raise exception despite metadata failure
-        result = await reparacion_service.tomar_reparacion(tag_spool, worker_id, worker_nombre)
+    # Should NOT raise exception despite metadata failure
+    result = await reparacion_service.tomar_reparacion(tag_spool, worker_id, worker_nombre)
 
     assert result["success"] is True
@@ -0,0 +1,68 @@
+"""
+Unit tests for ResponseBytesCache (pre-serialized JSON bodies keyed by ETag).
+"""
+import gzip
+from unittest.mock import Mock
+
+from fastapi.testclient import TestClient
+
+from backend.core.dependency import get_worker_service
+from backend.main import app
+from backend.models.worker import Worker, WorkerListResponse
+from backend.utils.response_cache import ResponseBytesCache, get_response_cache
+
+
+def _workers() -> WorkerListResponse:
+    workers = [Worker(id=93, nombre="Mauricio", apellido="Rodríguez", activo=True)]
+    return WorkerListResponse(workers=workers, total=1)
+
+
+def test_put_serializes_once_and_evicts_oldest():
+    cache = ResponseBytesCache(max_entries=2)
+    cached = cache.put('"v1"', _workers())
+
+    assert cached.body.startswith(b'{"workers":[{"id":93')
+    assert "Rodríguez".encode() in cached.body  # sin escapes \\u
+    assert cache.get('"v1"') is cached
+
+    cache.put('"v2"', _workers())
+    cache.get('"v1"')  # v1 pasa a ser el más reciente
+    cache.put('"v3"', _workers())
+
+    assert cache.get('"v2"') is None
+    assert cache.get('"v1"') is cached
+    assert len(cache) == 2
+
+
+def test_variant_is_compressed_once():
+    cached = ResponseBytesCache().put('"v1"', _workers())
+    compress = Mock(side_effect=gzip.compress)
+
+    first = cached.variant("gzip", compress)
+    second = cached.variant("gzip", compress)
+
+    assert first is second
+    assert gzip.decompress(first) == cached.body
+    compress.assert_called_once()
+
+
+def test_workers_endpoint_serves_cached_bytes():
+    service = Mock()
+    service.list_version.return_value = 7
+    service.get_all_active_workers.return_value = _workers().workers
+    app.dependency_overrides[get_worker_service] = lambda: service
+    get_response_cache().clear()
+    try:
+        client = TestClient(app)
+        first = client.get("/api/workers")
+        second = client.get("/api/workers")
+    finally:
+        app.dependency_overrides.clear()
+        get_response_cache().clear()
+
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content
+    assert first.json()["total"] == 1
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.headers["content-type"] == "application/json"
+    service.get_all_active_workers.assert_called_once()
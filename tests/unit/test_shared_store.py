@@ -0,0 +1,107 @@
+"""
+Unit tests for the cross-process shared store (backend/core/shared_store.py):
+invalidations, published worksheet snapshots and the shared quota bucket.
+
+Each "worker" gets its own SharedStore instance (its own mmaps) over the
+same directory, like separate uvicorn processes.
+"""
+import os
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from backend.config import config
+from backend.core.quota_governor import QuotaGovernor
+from backend.core.shared_store import SharedStore
+from backend.repositories.fake_gspread import build_load_test_client
+from backend.repositories.metadata_outbox import _lock_journal
+from backend.repositories.sheets_repository import SheetsRepository
+from backend.utils.cache import SimpleCache
+
+SHEET = config.HOJA_OPERACIONES_NOMBRE
+CACHE_KEY = f"worksheet:{SHEET}"
+
+
+def _worker_repo(path, client) -> SheetsRepository:
+    repo = SheetsRepository(compatibility_mode="v3.0")
+    repo._cache = SimpleCache(shared=SharedStore(str(path)))
+    repo._shared = repo._cache.shared
+    repo._client = client
+    repo._change_probe_enabled = False
+    return repo
+
+
+def test_invalidation_reaches_other_caches(tmp_path):
+    a = SimpleCache(shared=SharedStore(str(tmp_path)))
+    b = SimpleCache(shared=SharedStore(str(tmp_path)))
+    a.set("k", "a", ttl_seconds=60, digest="x")
+    b.set("k", "b", ttl_seconds=60, digest="x")
+    version = b.version("k")
+
+    a.invalidate("k")
+    assert b.get("k") is None
+    assert b.version("k") > version
+
+    # Valor leído antes de una invalidación ajena: se descarta al leerlo
+    generation = b.generation("k")
+    a.invalidate("k")
+    b.set("k", "stale", ttl_seconds=60, generation=generation)
+    assert b.get("k") is None
+
+
+def test_workers_share_published_snapshots(tmp_path):
+    client = build_load_test_client("fake-sheet")
+    calls = client.calls
+    with patch.object(config, "GOOGLE_SHEET_ID", "fake-sheet"):
+        worker_a = _worker_repo(tmp_path, client)
+        worker_b = _worker_repo(tmp_path, client)
+
+        rows_a = worker_a.read_worksheet(SHEET)
+        rows_b = worker_b.read_worksheet(SHEET)
+        assert calls["get_all_values"] == 1
+        assert rows_b == rows_a
+
+        # TTL local vencido, mismo snapshot publicado: se reusan las filas
+        value, _ = worker_b._cache._cache[CACHE_KEY]
+        worker_b._cache._cache[CACHE_KEY] = (value, datetime.now() - timedelta(seconds=1))
+        assert worker_b.read_worksheet(SHEET) is rows_b
+
+        # Escritura en el worker A: B deja de ver su snapshot y relee
+        version_b = worker_b.peek_snapshot_version(SHEET)
+        worksheet = client.open_by_key("fake-sheet").worksheet(SHEET)
+        column = rows_a[0].index("Ocupado_Por")
+        worksheet.update_cell(2, column + 1, "MR(93)")
+        worker_a._cache.invalidate(CACHE_KEY)
+
+        assert worker_b.peek_cached_worksheet(SHEET) is None
+        assert worker_b.peek_snapshot_version(SHEET) > version_b
+        assert worker_b.read_worksheet(SHEET)[1][column] == "MR(93)"
+        assert worker_a.read_worksheet(SHEET)[1][column] == "MR(93)"
+        assert calls["get_all_values"] == 2
+
+
+def test_quota_bucket_is_shared(tmp_path):
+    clock = lambda: 1000.0  # noqa: E731
+    governors = [
+        QuotaGovernor(2, 2, max_wait=0.0, clock=clock, shared=SharedStore(str(tmp_path)))
+        for _ in range(2)
+    ]
+    governors[0].acquire("read")
+    governors[1].acquire("read")
+    governors[0].acquire("read")  # bucket común vacío: overflow
+
+    assert governors[0].snapshot()["read"]["overflows"] == 1
+    assert governors[1].snapshot()["read"]["overflows"] == 0
+    assert governors[1].snapshot()["read"]["tokens"] == 0
+
+
+def test_outbox_journal_has_a_single_owner(tmp_path):
+    path = str(tmp_path / "outbox.jsonl")
+    fd = _lock_journal(path)
+    try:
+        assert fd is not None
+        assert _lock_journal(path) is None
+    finally:
+        os.close(fd)
+    other = _lock_journal(path)
+    assert other is not None
+    os.close(other)
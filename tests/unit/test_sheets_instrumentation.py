@@ -0,0 +1,105 @@
+"""
+Unit tests for per-request Sheets call accounting (backend/core/sheets_instrumentation.py).
+"""
+import logging
+from unittest.mock import MagicMock, patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.config import config
+from backend.core.quota_governor import GovernedHTTPClient, QuotaGovernor
+from backend.core.sheets_instrumentation import (
+    SheetsInstrumentationMiddleware,
+    describe_request,
+    record_sheets_retry,
+    sheet_of_range,
+    sheets_instrumentation,
+)
+from backend.repositories.fake_gspread import build_load_test_client
+from backend.repositories.sheets_repository import SheetsRepository
+from backend.utils.cache import get_cache
+
+API = "https://sheets.googleapis.com/v4/spreadsheets/SHEET"
+
+
+def test_describe_request_maps_sheets_endpoints():
+    assert describe_request("GET", f"{API}/values/%27Operaciones%27%21A1%3AB2") == (
+        "values.get", "'Operaciones'!A1:B2"
+    )
+    assert describe_request("POST", f"{API}/values/Metadata%21A1%3AK1:append") == (
+        "values.append", "Metadata!A1:K1"
+    )
+    assert describe_request(
+        "POST", f"{API}/values:batchUpdate",
+        json={"data": [{"range": "Uniones!A2"}, {"range": "Uniones!B2"}]},
+    ) == ("values.batchUpdate", "Uniones!A2,Uniones!B2")
+    assert describe_request("GET", f"{API}/values:batchGet", params={"ranges": ["Roles!A:C"]}) == (
+        "values.batchGet", "Roles!A:C"
+    )
+    assert describe_request("GET", API) == ("spreadsheets.get", None)
+    assert sheet_of_range("'Operaciones'!A1:B2,Uniones!A1") == "Operaciones"
+    assert sheet_of_range("Roles") == "Roles"
+
+
+def test_repository_calls_cache_and_retries_are_recorded():
+    repo = SheetsRepository()
+    repo._client = build_load_test_client("fake-sheet")
+    cache_key = f"worksheet:{config.HOJA_OPERACIONES_NOMBRE}"
+    get_cache().invalidate(cache_key)
+    try:
+        with patch.object(config, "GOOGLE_SHEET_ID", "fake-sheet"), sheets_instrumentation() as stats:
+            repo.read_worksheet(config.HOJA_OPERACIONES_NOMBRE)
+            repo.read_worksheet(config.HOJA_OPERACIONES_NOMBRE)  # cache hit
+            record_sheets_retry()
+    finally:
+        get_cache().invalidate(cache_key)
+
+    assert stats.operations()["get_all_values:Operaciones"] == 1
+    assert stats.reads == stats.api_calls and stats.writes == 0
+    assert stats.cache_hits >= 1 and stats.cache_misses >= 1
+    assert stats.retries == 1
+    assert 'desc="hit=' in stats.server_timing()
+
+    # Fuera del contexto no se registra nada
+    recorded = stats.api_calls
+    repo._client.open_by_key("fake-sheet")
+    assert stats.api_calls == recorded
+
+
+def test_governed_http_client_records_range_bytes_and_quota_wait():
+    session = MagicMock()
+    session.request.return_value.ok = True
+    session.request.return_value.content = b'{"values": [["MR(93)"]]}'
+    client = GovernedHTTPClient(auth=MagicMock(), session=session)
+    governor = QuotaGovernor(reads_per_minute=0, writes_per_minute=0)
+
+    with patch("backend.core.quota_governor.get_quota_governor", return_value=governor), \
+            sheets_instrumentation() as stats:
+        client.request("get", f"{API}/values/Operaciones%21BO2", params={"valueRenderOption": "FORMATTED_VALUE"})
+
+    [call] = stats.calls
+    assert (call.operation, call.kind, call.sheet, call.range) == ("values.get", "read", "Operaciones", "Operaciones!BO2")
+    assert call.bytes == len(session.request.return_value.content)
+    assert call.quota_wait == 0.0
+
+
+def test_middleware_adds_server_timing_and_logs_summary(caplog):
+    def build(sample_rate):
+        app = FastAPI()
+        app.add_middleware(SheetsInstrumentationMiddleware, sample_rate=sample_rate)
+
+        @app.get("/ping")
+        def ping():  # sync: corre en el threadpool, el contexto se propaga igual
+            record_sheets_retry()
+            return {"ok": True}
+
+        return TestClient(app)
+
+    with caplog.at_level(logging.INFO, logger="backend.core.sheets_instrumentation"):
+        response = build(1.0).get("/ping")
+    assert response.headers["server-timing"].startswith('sheets;dur=0.0;desc="0 calls (0r/0w)"')
+    assert "retries=1" in response.headers["server-timing"]
+    assert any("[sheets] GET /ping -> 200" in record.message for record in caplog.records)
+
+    assert "server-timing" not in build(0.0).get("/ping").headers
@@ -0,0 +1,141 @@
+"""
+Unit tests for row-level snapshot diffing (backend/core/snapshot_diff.py)
+and incremental SnapshotView updates.
+"""
+from unittest.mock import patch
+
+import pytest
+
+from backend.config import config
+from backend.core.occupancy_view import OccupancyView
+from backend.core.snapshot_diff import SnapshotDiffer, build_row_snapshot, diff_snapshots
+from backend.repositories.fake_gspread import build_load_test_client
+from backend.repositories.sheets_repository import SheetsRepository
+from backend.utils.cache import get_cache
+
+
+HEADER = ["TAG_SPOOL", "OT", "Ocupado_Por", "Fecha_Ocupacion", "Estado_Detalle"]
+COLUMN_MAP = {"tagspool": 0, "ot": 1, "ocupadopor": 2, "fechaocupacion": 3, "estadodetalle": 4}
+
+
+def test_diff_reports_added_removed_changed_and_moved_rows():
+    old = build_row_snapshot([
+        HEADER,
+        ["SP-1", "001", ""],
+        ["SP-2", "001", ""],
+        ["SP-2", "002", ""],   # TAG repetido → "SP-2#2"
+        ["", "", ""],          # sin clave → "@5"
+    ], "TAG_SPOOL")
+    new = build_row_snapshot([
+        HEADER,
+        ["SP-1", "001", "MR(93)"],
+        ["SP-2", "001", ""],
+        ["SP-2", "002", ""],
+        ["SP-9", "009", ""],
+    ], "TAG_SPOOL")
+
+    diff = diff_snapshots("Operaciones", old, new, version=7)
+    assert (diff.changed, diff.added, diff.removed, diff.moved) == (
+        {"SP-1": 2}, {"SP-9": 5}, {"@5": 5}, {}
+    )
+    assert diff.positions_stable and not diff.is_empty
+    assert diff.touched_rows() == {2, 5} and diff.removed_rows() == {5}
+
+    shifted = build_row_snapshot([HEADER, ["SP-0", "", ""]] + new.source[1:], "TAG_SPOOL")
+    moved = diff_snapshots("Operaciones", new, shifted)
+    assert moved.added == {"SP-0": 2} and moved.moved["SP-1"] == (2, 3)
+    assert not moved.positions_stable
+
+
+def test_differ_skips_first_snapshot_and_reuses_hashes_for_same_digest():
+    differ = SnapshotDiffer({"Operaciones": "TAG_SPOOL"})
+    seen = []
+    differ.subscribe(seen.append)
+    rows = [HEADER, ["SP-1", "001", ""]]
+
+    assert differ.observe("Operaciones", rows, version=1, digest="a") is None
+    assert differ.observe("Roles", rows) is None
+    same = differ.observe("Operaciones", [list(r) for r in rows], version=1, digest="a")
+    assert same.is_empty and differ.latest("Operaciones") is same
+    assert seen == [same]
+
+
+def test_repository_diffs_refetches_of_tracked_sheets():
+    repo = SheetsRepository()
+    repo._client = build_load_test_client("fake-sheet")
+    sheet = config.HOJA_OPERACIONES_NOMBRE
+    cache_key = f"worksheet:{sheet}"
+    get_cache().invalidate(cache_key)
+    try:
+        with patch.object(config, "GOOGLE_SHEET_ID", "fake-sheet"):
+            rows = repo.read_worksheet(sheet)
+            assert repo.snapshot_diff(sheet) is None
+
+            worksheet = repo._client.open_by_key("fake-sheet").worksheet(sheet)
+            tag = rows[1][rows[0].index("TAG_SPOOL")]
+            worksheet.update_cell(2, rows[0].index("Ocupado_Por") + 1, "MR(93)")
+            get_cache().invalidate(cache_key)
+            repo.read_worksheet(sheet)
+    finally:
+        get_cache().invalidate(cache_key)
+
+    diff = repo.snapshot_diff(sheet)
+    assert diff.changed == {tag: 2}
+    assert not (diff.added or diff.removed or diff.moved)
+
+
+class DiffingRepo:
+    """SheetsRepository double: swappable row cache + SnapshotDiffer."""
+
+    def __init__(self, rows):
+        self.cached = None
+        self.differ = SnapshotDiffer({config.HOJA_OPERACIONES_NOMBRE: "TAG_SPOOL"})
+        self.publish(rows)
+
+    def publish(self, rows):
+        self.rows = rows
+        self.differ.observe(config.HOJA_OPERACIONES_NOMBRE, rows)
+
+    def read_worksheet(self, sheet_name):
+        self.cached = self.rows
+        return self.rows
+
+    def peek_cached_worksheet(self, sheet_name):
+        return self.cached
+
+    def snapshot_diff(self, sheet_name):
+        return self.differ.latest(sheet_name)
+
+
+@pytest.fixture
+def _column_map():
+    OccupancyView.clear_all()
+    with patch("backend.core.column_map_cache.ColumnMapCache.get_or_build", return_value=COLUMN_MAP):
+        yield
+    OccupancyView.clear_all()
+
+
+def test_view_applies_diff_instead_of_rebuilding(_column_map):
+    rows = [HEADER, ["SP-1", "001", "MR(93)", "", ""], ["SP-2", "001", "", "", ""], ["SP-3", "002", "", "", ""]]
+    repo = DiffingRepo(rows)
+    view = OccupancyView.for_repository(repo)
+    assert view.rows_occupied_by(93) == [2]
+
+    # Escritura de la app parcheada en la vista (fila 4) + edición externa (fila 3)
+    view.apply_cell_updates([{"row": 4, "column_name": "Ocupado_Por", "value": "JP(94)"}])
+    new_rows = [list(row) for row in rows]
+    new_rows[2][2] = "MR(93)"
+    new_rows[3][2] = "JP(94)"
+    repo.publish(new_rows)
+    repo.cached = new_rows
+
+    with patch.object(OccupancyView, "_rebuild_locked", side_effect=AssertionError("rebuilt")):
+        assert view.rows_occupied_by(93) == [2, 3]
+        assert view.occupant_of("SP-3").ocupado_por == "JP(94)"
+
+    # Fila insertada al medio: posiciones cambian → reconstrucción completa
+    shifted = [HEADER, ["SP-0", "000", "CP(95)", "", ""]] + new_rows[1:]
+    repo.publish(shifted)
+    repo.cached = shifted
+    assert view.rows_occupied_by(93) == [3, 4]
+    assert view.occupant_of("SP-0").row == 2
@@ -0,0 +1,117 @@
+"""
+Unit tests for snapshot-versioned ETags (SimpleCache.version + backend/utils/etag.py).
+"""
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.config import config
+from backend.core.dependency import get_sheets_repository
+from backend.core.occupancy_view import OccupancyView
+from backend.main import app
+from backend.repositories.sheets_repository import SheetsRepository
+from backend.utils.cache import SimpleCache, get_cache
+from backend.utils.etag import etag_matches, snapshot_etag
+
+
+HEADER = ["TAG_SPOOL", "Ocupado_Por", "Fecha_Ocupacion", "Estado_Detalle"]
+COLUMN_MAP = {"tagspool": 0, "ocupadopor": 1, "fechaocupacion": 2, "estadodetalle": 3}
+CACHE_KEY = f"worksheet:{config.HOJA_OPERACIONES_NOMBRE}"
+
+
+def test_version_ignores_identical_refetch():
+    cache = SimpleCache()
+    cache.set("rows", [[1]], ttl_seconds=60, digest="a")
+    cache.set("rows", [[1]], ttl_seconds=60, digest="a")
+    assert cache.version("rows") == 1
+
+    cache.set("rows", [[2]], ttl_seconds=60, digest="b")
+    assert cache.version("rows") == 2
+
+
+def test_version_bumps_on_invalidate_and_clear():
+    cache = SimpleCache()
+    assert cache.version("rows") == 0
+
+    cache.invalidate("rows")  # nunca cacheada: igual cambió en Sheets
+    assert cache.version("rows") == 1
+
+    cache.set("rows", [[1]], ttl_seconds=60, digest="a")
+    cache.clear()
+    assert cache.version("rows") == 3
+
+    # Tras clear, el mismo contenido es una versión nueva
+    cache.set("rows", [[1]], ttl_seconds=60, digest="a")
+    assert cache.version("rows") == 4
+
+
+def test_set_if_version_skips_values_read_before_an_invalidation():
+    cache = SimpleCache()
+    before = cache.version("rows")
+    cache.invalidate("rows")  # escritura durante la lectura
+
+    assert cache.set_if_version("rows", before, [[1]], ttl_seconds=60, digest="a") is None
+    assert cache.get("rows") is None
+    assert cache.set_if_version("rows", cache.version("rows"), [[2]], ttl_seconds=60, digest="b") == 2
+    assert cache.get("rows") == [[2]]
+
+
+def test_etag_matches_list_weak_and_wildcard():
+    etag = snapshot_etag("workers", 3)
+    assert etag != snapshot_etag("workers", 4)
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
+
+
+@pytest.fixture
+def dashboard_client():
+    OccupancyView.clear_all()
+    repo = SheetsRepository()
+    repo._get_spreadsheet = Mock(return_value=Mock(worksheet=Mock(return_value=Mock())))
+    get_cache().set(CACHE_KEY, [
+        HEADER,
+        ["SP-1", "MR(93)", "20-01-2026 08:00:00", "ARM: En Progreso"],
+        ["SP-2", "", "", ""],
+    ], ttl_seconds=60)
+    app.dependency_overrides[get_sheets_repository] = lambda: repo
+    with patch(
+        "backend.core.column_map_cache.ColumnMapCache.get_or_build",
+        return_value=COLUMN_MAP,
+    ):
+        yield TestClient(app), repo
+    app.dependency_overrides.clear()
+    get_cache().invalidate(CACHE_KEY)
+    OccupancyView.clear_all()
+
+
+def test_dashboard_returns_304_until_a_write(dashboard_client):
+    client, repo = dashboard_client
+
+    first = client.get("/api/dashboard/occupied")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert [s["tag_spool"] for s in first.json()] == ["SP-1"]
+
+    cached = client.get("/api/dashboard/occupied", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+
+    repo.batch_update_by_column_name(
+        config.HOJA_OPERACIONES_NOMBRE,
+        [{"row": 3, "column_name": "Ocupado_Por", "value": "JP(94)"}],
+    )
+    get_cache().set(CACHE_KEY, [
+        HEADER,
+        ["SP-1", "MR(93)", "20-01-2026 08:00:00", "ARM: En Progreso"],
+        ["SP-2", "JP(94)", "", ""],
+    ], ttl_seconds=60)
+
+    fresh = client.get("/api/dashboard/occupied", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["ETag"] != etag
+    assert sorted(s["tag_spool"] for s in fresh.json()) == ["SP-1", "SP-2"]
@@ -0,0 +1,120 @@
+"""
+Unit tests for the background snapshot refresher (backend/core/snapshot_refresher.py).
+"""
+from unittest.mock import patch
+
+from backend.config import config
+from backend.core.quota_governor import QuotaPriority, current_priority
+from backend.core.snapshot_refresher import RefreshJob, SnapshotRefresher, build_default_jobs
+from backend.repositories.fake_gspread import build_load_test_client
+from backend.repositories.sheets_repository import SheetsRepository
+from backend.utils.cache import get_cache
+
+SHEET = config.HOJA_OPERACIONES_NOMBRE
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_schedule_backoff_and_quota_pressure():
+    clock = _Clock()
+    quota = {"left": 1.0}
+    failures = {"left": 2}
+    priorities = []
+
+    def flaky():
+        priorities.append(current_priority("read"))
+        if failures["left"]:
+            failures["left"] -= 1
+            raise RuntimeError("429")
+
+    fast = RefreshJob("fast", interval=20, refresh=lambda: None)
+    slow = RefreshJob("slow", interval=120, refresh=flaky)
+    refresher = SnapshotRefresher([fast, slow], quota_left=lambda: quota["left"], clock=clock)
+
+    assert refresher.run_due() == ["fast", "slow"]       # arranque: todo vencido
+    assert priorities == [QuotaPriority.BACKGROUND]
+    assert slow.next_due == 4                             # backoff 2 * 2^1
+
+    clock.now = 4
+    assert refresher.run_due() == ["slow"]
+    assert slow.next_due == 12                            # backoff 2 * 2^2
+    clock.now = 12
+    assert refresher.run_due() == ["slow"]
+    assert (slow.failures, slow.next_due) == (0, 132)
+
+    quota["left"] = 0.05                                  # cuota casi agotada
+    clock.now = 20
+    assert refresher.run_due() == ["fast"]
+    assert fast.next_due == 20 + 20 * 4
+
+
+def test_invalidated_sheet_is_refreshed_after_min_gap():
+    repo = SheetsRepository()
+    repo._client = build_load_test_client("fake-sheet")
+    repo._change_probe_enabled = True
+    calls = repo._client.calls
+    cache_key = f"worksheet:{SHEET}"
+    get_cache().invalidate(cache_key)
+    clock = _Clock()
+    try:
+        with patch.object(config, "GOOGLE_SHEET_ID", "fake-sheet"):
+            job = build_default_jobs(repo)[0]
+            refresher = SnapshotRefresher([job], quota_left=lambda: None, clock=clock)
+            assert refresher.run_due() == [SHEET]
+            rows = repo.read_worksheet(SHEET)
+            assert calls["get_all_values"] == 1
+
+            # Refresh programado con el libro sin cambios: solo sondeo a Drive
+            clock.now = job.interval
+            assert refresher.run_due() == [SHEET]
+            assert (calls["get_all_values"], calls["drive"]) == (1, 2)   # el refresh en frío también sondeó
+            assert repo.read_worksheet(SHEET) is rows
+
+            # Una escritura invalida la hoja: se relee tras MIN_GAP, no al vencer el período
+            get_cache().invalidate(cache_key)
+            clock.now += 1
+            assert refresher.run_due() == []
+            clock.now += 2
+            assert refresher.run_due() == [SHEET]
+            assert calls["get_all_values"] == 2
+            assert repo.peek_cached_worksheet(SHEET) is not None
+            clock.now += 3
+            assert refresher.run_due() == []
+    finally:
+        get_cache().invalidate(cache_key)
+
+
+def test_write_during_refresh_read_is_not_cached():
+    repo = SheetsRepository(compatibility_mode="v3.0")
+    repo._client = build_load_test_client("fake-sheet")
+    cache_key = f"worksheet:{SHEET}"
+    try:
+        with patch.object(config, "GOOGLE_SHEET_ID", "fake-sheet"):
+            header = repo.read_worksheet(SHEET)[0]
+            worksheet = repo._get_spreadsheet().worksheet(SHEET)
+            get_all_values = worksheet.get_all_values
+
+            def read_then_write(*args, **kwargs):
+                # El refresher ya tiene las filas cuando un request escribe
+                rows = get_all_values(*args, **kwargs)
+                repo.batch_update_by_column_name(
+                    SHEET, [{"row": 2, "column_name": "Ocupado_Por", "value": "MR(93)"}]
+                )
+                return rows
+
+            job = build_default_jobs(repo)[0]
+            with patch.object(worksheet, "get_all_values", side_effect=read_then_write):
+                job.refresh()
+
+            # Las filas previas a la escritura no quedan en cache y el job relee
+            assert repo.peek_cached_worksheet(SHEET) is None
+            assert job.is_stale()
+            assert repo.read_worksheet(SHEET)[1][header.index("Ocupado_Por")] == "MR(93)"
+    finally:
+        get_cache().invalidate(cache_key)
@@ -0,0 +1,113 @@
+"""
+Unit tests for StateService write batching.
+
+Each TOMAR/PAUSAR/COMPLETAR must reach Sheets as a single
+ConflictService.update_with_retry call: the transition cells (Armador,
+Fecha_Armado, ...), Estado_Detalle and Ocupado_Por/Fecha_Ocupacion together.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from datetime import date
+
+from backend.services.occupation_service import OccupationService
+from backend.services.state_service import StateService
+from backend.models.occupation import TomarRequest, PausarRequest, CompletarRequest
+from backend.models.enums import ActionType
+from backend.models.spool import Spool
+from backend.exceptions import DependenciasNoSatisfechasError, InvalidStateTransitionError
+
+
+def _state_service(spool: Spool):
+    sheets_repo = MagicMock()
+    sheets_repo.get_spool_by_tag = MagicMock(return_value=spool)
+    conflict_service = MagicMock()
+    conflict_service.update_with_retry = AsyncMock(return_value="1")
+    occupation_service = OccupationService(
+        sheets_repository=sheets_repo,
+        metadata_repository=MagicMock(),
+        conflict_service=conflict_service
+    )
+    service = StateService(occupation_service, sheets_repo, MagicMock())
+    return service, sheets_repo, conflict_service
+
+
+def _single_batch(sheets_repo, conflict_service) -> dict:
+    conflict_service.update_with_retry.assert_awaited_once()
+    sheets_repo.update_cell_by_column_name.assert_not_called()
+    sheets_repo.batch_update_by_column_name.assert_not_called()
+    return conflict_service.update_with_retry.call_args.kwargs["updates"]
+
+
+@pytest.mark.asyncio
+async def test_tomar_writes_transition_and_estado_in_one_batch():
+    spool = Spool(tag_spool="TAG-001", fecha_materiales=date(2026, 1, 20))
+    service, sheets_repo, conflict_service = _state_service(spool)
+
+    await service.tomar(TomarRequest(
+        tag_spool="TAG-001", worker_id=93, worker_nombre="MR(93)", operacion=ActionType.ARM
+    ))
+
+    updates = _single_batch(sheets_repo, conflict_service)
+    assert updates["Ocupado_Por"] == "MR(93)"
+    assert updates["Armador"] == "MR(93)"
+    assert updates["Estado_Detalle"] == "MR(93) trabajando ARM (ARM en progreso, SOLD pendiente)"
+
+
+@pytest.mark.asyncio
+async def test_tomar_sold_without_arm_writes_nothing():
+    spool = Spool(tag_spool="TAG-001", fecha_materiales=date(2026, 1, 20))
+    service, _, conflict_service = _state_service(spool)
+
+    with pytest.raises(DependenciasNoSatisfechasError):
+        await service.tomar(TomarRequest(
+            tag_spool="TAG-001", worker_id=94, worker_nombre="JP(94)", operacion=ActionType.SOLD
+        ))
+    conflict_service.update_with_retry.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_pausar_writes_estado_with_occupation_release():
+    spool = Spool(
+        tag_spool="TAG-001", fecha_materiales=date(2026, 1, 20),
+        armador="MR(93)", ocupado_por="MR(93)"
+    )
+    service, sheets_repo, conflict_service = _state_service(spool)
+
+    await service.pausar(PausarRequest(
+        tag_spool="TAG-001", worker_id=93, worker_nombre="MR(93)", operacion=ActionType.ARM
+    ))
+
+    updates = _single_batch(sheets_repo, conflict_service)
+    assert (updates["Ocupado_Por"], updates["Fecha_Ocupacion"]) == ("", "")
+    assert updates["Estado_Detalle"] == "Disponible - ARM pausado, SOLD pendiente"
+
+
+@pytest.mark.asyncio
+async def test_completar_hydrates_before_write():
+    spool = Spool(
+        tag_spool="TAG-001", fecha_materiales=date(2026, 1, 20),
+        armador="MR(93)", ocupado_por="MR(93)"
+    )
+    service, sheets_repo, conflict_service = _state_service(spool)
+
+    await service.completar(CompletarRequest(
+        tag_spool="TAG-001", worker_id=93, worker_nombre="MR(93)",
+        operacion=ActionType.ARM, fecha_operacion=date(2026, 2, 3)
+    ))
+
+    updates = _single_batch(sheets_repo, conflict_service)
+    assert updates["Fecha_Armado"] == "03-02-2026"
+    assert updates["Ocupado_Por"] == ""
+    assert updates["Estado_Detalle"] == "Disponible - ARM completado, SOLD pendiente"
+
+
+@pytest.mark.asyncio
+async def test_pausar_rejects_non_en_progreso_without_writing():
+    spool = Spool(tag_spool="TAG-001", fecha_materiales=date(2026, 1, 20), armador="MR(93)")
+    service, _, conflict_service = _state_service(spool)
+
+    with pytest.raises(InvalidStateTransitionError):
+        await service.pausar(PausarRequest(
+            tag_spool="TAG-001", worker_id=93, worker_nombre="MR(93)", operacion=ActionType.ARM
+        ))
+    conflict_service.update_with_retry.assert_not_awaited()
@@ -426,72 +426,12 @@ def test_logging_failure_returns_error(estado_detalle_service, mock_sheets_repo,
 # ============================================================================
 
 
-def test_batch_check_returns_only_overrides(estado_detalle_service, mock_sheets_repo, mock_metadata_repo):
-    """Should return only spools with detected overrides in batch check."""
-    tag_spools = ["BATCH-001", "BATCH-002", "BATCH-003"]
-
-    # Mock BATCH-001: has override
-    override_spool = Spool(
-        tag_spool="BATCH-001",
-        fecha_materiales=date(2026, 1, 20),
-        fecha_armado=date(2026, 1, 22),
-        fecha_soldadura=date(2026, 1, 25),
-        fecha_qc_metrologia=date(2026, 1, 27),
-        armador="MR(93)",
-        soldador="JP(94)",
-        ocupado_por=None,
-        fecha_ocupacion=None,
-        estado_detalle="RECHAZADO (Ciclo 2/3) - Pendiente reparación",
-        version=16
-    )
-
-    # Mock BATCH-002: normal transition
-    normal_spool = Spool(
-        tag_spool="BATCH-002",
-        fecha_materiales=date(2026, 1, 20),
-        fecha_armado=date(2026, 1, 22),
-        fecha_soldadura=date(2026, 1, 25),
-        fecha_qc_metrologia=date(2026, 1, 27),
-        armador="MR(93)",
-        soldador="JP(94)",
-        ocupado_por="CP(95)",
-        fecha_ocupacion="28/01/2026",
-        estado_detalle="EN_REPARACION (Ciclo 1/3) - CP(95)",
-        version=10
-    )
-
-    # Mock BATCH-003: no events
-    no_events_spool = Spool(
-        tag_spool="BATCH-003",
-        fecha_materiales=date(2026, 1, 20),
-        fecha_armado=date(2026, 1, 22),
-        fecha_soldadura=date(2026, 1, 25),
-        fecha_qc_metrologia=None,
-        armador="MR(93)",
-        soldador="JP(94)",
-        ocupado_por=None,
-        fecha_ocupacion=None,
-        estado_detalle="RECHAZADO (Ciclo 1/3) - Pendiente reparación",
-        version=8
-    )
-
-    def get_spool_side_effect(tag):
-        if tag == "BATCH-001":
-            return override_spool
-        elif tag == "BATCH-002":
-            return normal_spool
-        elif tag == "BATCH-003":
-            return no_events_spool
-        return None
-
-    mock_sheets_repo.get_spool_by_tag.side_effect = get_spool_side_effect
-
-    # Mock events
-    bloqueado_event = MetadataEvent(
-        id="batch-event-1",
+def _bloqueado_event(tag_spool: str, event_id: str) -> MetadataEvent:
+    return MetadataEvent(
+        id=event_id,
         timestamp=datetime(2026, 1, 27, 15, 0, 0),
         evento_tipo=EventoTipo.CANCELAR_METROLOGIA,
-        tag_spool="BATCH-001",
+        tag_spool=tag_spool,
         worker_id=91,
         worker_nombre="Supervisor(91)",
         operacion="METROLOGIA",
@@ -500,6 +440,18 @@ def test_batch_check_returns_only_overrides(estado_detalle_service, mock_sheets_
         metadata_json=json.dumps({"estado_detalle": "BLOQUEADO - Contactar supervisor"})
     )
 
+
+def test_batch_check_returns_only_overrides(estado_detalle_service, mock_sheets_repo, mock_metadata_repo):
+    """Should return only spools with detected overrides in batch check."""
+    tag_spools = ["BATCH-001", "BATCH-002", "BATCH-003", "BATCH-404"]
+
+    # Current Estado_Detalle from one Operaciones snapshot (BATCH-404 not in sheet)
+    mock_sheets_repo.get_estado_detalle_by_tag.return_value = {
+        "BATCH-001": "RECHAZADO (Ciclo 2/3) - Pendiente reparación",   # override
+        "BATCH-002": "EN_REPARACION (Ciclo 1/3) - CP(95)",             # normal transition
+        "BATCH-003": "RECHAZADO (Ciclo 1/3) - Pendiente reparación",   # no events
+    }
+
     normal_event = MetadataEvent(
         id="batch-event-2",
         timestamp=datetime(2026, 1, 28, 10, 0, 0),
@@ -512,17 +464,11 @@ def test_batch_check_returns_only_overrides(estado_detalle_service, mock_sheets_
         fecha_operacion="28-01-2026",
         metadata_json=json.dumps({"estado_detalle": "RECHAZADO (Ciclo 1/3)"})
     )
-
-    def get_events_side_effect(tag):
-        if tag == "BATCH-001":
-            return [bloqueado_event]
-        elif tag == "BATCH-002":
-            return [normal_event]
-        elif tag == "BATCH-003":
-            return []
-        return []
-
-    mock_metadata_repo.get_events_by_spool.side_effect = get_events_side_effect
+    # Last event per tag from one Metadata pass
+    mock_metadata_repo.get_latest_events.return_value = {
+        "BATCH-001": _bloqueado_event("BATCH-001", "batch-event-1"),
+        "BATCH-002": normal_event,
+    }
 
     # Batch check
     overrides = estado_detalle_service.check_spools_for_overrides(tag_spools)
@@ -531,3 +477,48 @@ def test_batch_check_returns_only_overrides(estado_detalle_service, mock_sheets_
     assert len(overrides) == 1
     assert overrides[0]["detected"] is True
     assert overrides[0]["tag_spool"] == "BATCH-001"
+
+    # One read per sheet, no per-spool lookups
+    mock_sheets_repo.get_estado_detalle_by_tag.assert_called_once_with(tag_spools)
+    mock_metadata_repo.get_latest_events.assert_called_once_with(tag_spools)
+    mock_sheets_repo.get_spool_by_tag.assert_not_called()
+    mock_metadata_repo.get_events_by_spool.assert_not_called()
+
+
+def test_batch_check_logs_all_overrides_in_one_append(estado_detalle_service, mock_sheets_repo, mock_metadata_repo):
+    """Every SUPERVISOR_OVERRIDE of the batch goes to Metadata in a single batch append."""
+    tags = [f"OVR-{i:03d}" for i in range(5)]
+    mock_sheets_repo.get_estado_detalle_by_tag.return_value = {
+        tag: "RECHAZADO (Ciclo 2/3) - Pendiente reparación" for tag in tags
+    }
+    mock_metadata_repo.get_latest_events.return_value = {
+        tag: _bloqueado_event(tag, f"event-{tag}") for tag in tags
+    }
+
+    overrides = estado_detalle_service.check_spools_for_overrides(tags)
+
+    mock_metadata_repo.batch_log_events.assert_called_once()
+    mock_metadata_repo.log_event.assert_not_called()
+    events = mock_metadata_repo.batch_log_events.call_args[0][0]
+    assert [event.tag_spool for event in events] == tags
+    assert {event.evento_tipo for event in events} == {EventoTipo.SUPERVISOR_OVERRIDE}
+    assert all(event.worker_id == 0 and event.worker_nombre == "SYSTEM" for event in events)
+    assert json.loads(events[0].metadata_json)["override_type"] == "BLOQUEADO_TO_RECHAZADO"
+    assert [override["event_id"] for override in overrides] == [event.id for event in events]
+
+
+def test_batch_check_logging_failure_returns_detections(estado_detalle_service, mock_sheets_repo, mock_metadata_repo):
+    """Detections are returned even if the batch append fails."""
+    mock_sheets_repo.get_estado_detalle_by_tag.return_value = {
+        "OVR-001": "RECHAZADO (Ciclo 2/3) - Pendiente reparación"
+    }
+    mock_metadata_repo.get_latest_events.return_value = {
+        "OVR-001": _bloqueado_event("OVR-001", "event-1")
+    }
+    mock_metadata_repo.batch_log_events.side_effect = Exception("Sheets API error")
+
+    overrides = estado_detalle_service.check_spools_for_overrides(["OVR-001"])
+
+    assert len(overrides) == 1
+    assert overrides[0]["event_id"] is None
+    assert "error" in overrides[0]
@@ -22,6 +22,7 @@ from backend.models.supervisor import (
     TrackedSpool,
 )
 from backend.repositories.supervisor_repository import SupervisorRepository
+from backend.utils.cache import get_cache
 
 
 # ─── Fixtures ─────────────────────────────────────────────────────────────────
@@ -50,6 +51,16 @@ def mock_sheets_repo():
         ws.col_values.return_value = ["TAG_SPOOL"]  # solo header
         ws.get_all_values.return_value = [["TAG_SPOOL"]]
 
+    # Lista: la lectura de columna A y delete_rows operan sobre las mismas
+    # filas que sirve get_all_values (los tests las reemplazan por return_value)
+    lista = worksheets[config.HOJA_AUDIT_LISTA_NOMBRE]
+
+    def col_values(col: int):
+        return [row[col - 1] if row else "" for row in lista.get_all_values.return_value]
+
+    lista.col_values.side_effect = col_values
+    lista.delete_rows.side_effect = lambda row: lista.get_all_values.return_value.pop(row - 1)
+
     # Stash worksheets so tests can configure them
     sheets_repo._worksheets_for_test = worksheets
     return sheets_repo
@@ -57,7 +68,9 @@ def mock_sheets_repo():
 
 @pytest.fixture
 def repo(mock_sheets_repo):
-    return SupervisorRepository(sheets_repo=mock_sheets_repo)
+    SupervisorRepository.clear_caches()
+    yield SupervisorRepository(sheets_repo=mock_sheets_repo)
+    SupervisorRepository.clear_caches()
 
 
 def _ws_lista(repo: SupervisorRepository) -> MagicMock:
@@ -72,13 +85,23 @@ def _ws_snapshots(repo: SupervisorRepository) -> MagicMock:
     return repo.sheets_repo._worksheets_for_test[config.HOJA_AUDIT_SNAPSHOTS_NOMBRE]
 
 
+LISTA_HEADER = ["TAG_SPOOL", "Added_At", "Updated_At", "Notes"]
+
+
+def _lista_rows(*tags: str) -> list[list[str]]:
+    """Contenido de la tab Lista (header + una fila válida por tag)."""
+    return [LISTA_HEADER] + [
+        [tag, "08-05-2026 09:00:00", "08-05-2026 09:00:00", ""] for tag in tags
+    ]
+
+
 # ─── upsert_tracked_spool ────────────────────────────────────────────────────
 
 
 def test_upsert_inserts_when_tag_absent(repo):
     """Sin filas previas → append_row. Sin update_call."""
     ws = _ws_lista(repo)
-    ws.col_values.return_value = ["TAG_SPOOL"]  # nadie
+    ws.get_all_values.return_value = _lista_rows()  # nadie
 
     spool = TrackedSpool(tag_spool="MK-NEW")
     repo.upsert_tracked_spool(spool)
@@ -90,7 +113,7 @@ def test_upsert_inserts_when_tag_absent(repo):
 def test_upsert_updates_when_tag_present(repo):
     """Tag ya existe en fila 4 → update A4:D4, sin append."""
     ws = _ws_lista(repo)
-    ws.col_values.return_value = ["TAG_SPOOL", "MK-A", "MK-B", "MK-TARGET"]
+    ws.get_all_values.return_value = _lista_rows("MK-A", "MK-B", "MK-TARGET")
     # → "MK-TARGET" está en row index 4 (1-indexed: header en 1, MK-A 2, MK-B 3, MK-TARGET 4)
 
     spool = TrackedSpool(tag_spool="MK-TARGET")
@@ -115,7 +138,7 @@ def test_upsert_returns_the_spool(repo):
 def test_remove_no_op_when_tag_absent(repo):
     """Tag no existe → False, no delete_rows."""
     ws = _ws_lista(repo)
-    ws.col_values.return_value = ["TAG_SPOOL", "MK-A", "MK-B"]
+    ws.get_all_values.return_value = _lista_rows("MK-A", "MK-B")
 
     deleted = repo.remove_tracked_spool("MK-MISSING")
 
@@ -126,7 +149,7 @@ def test_remove_no_op_when_tag_absent(repo):
 def test_remove_deletes_existing_row(repo):
     """Tag en fila 3 → delete_rows(3), True."""
     ws = _ws_lista(repo)
-    ws.col_values.return_value = ["TAG_SPOOL", "MK-A", "MK-TARGET", "MK-C"]
+    ws.get_all_values.return_value = _lista_rows("MK-A", "MK-TARGET", "MK-C")
 
     deleted = repo.remove_tracked_spool("MK-TARGET")
 
@@ -134,6 +157,84 @@ def test_remove_deletes_existing_row(repo):
     ws.delete_rows.assert_called_once_with(3)
 
 
+def test_lista_mutations_reuse_index_without_rereading(repo):
+    """Una sola lectura de Lista; upsert/remove posteriores solo escriben."""
+    ws = _ws_lista(repo)
+    ws.get_all_values.return_value = _lista_rows("MK-A", "MK-B", "MK-C")
+    ws.append_row.return_value = {"updates": {"updatedRange": "Lista!A4:D4"}}
+
+    repo.remove_tracked_spool("MK-A")           # borra fila 2 → B=2, C=3
+    repo.upsert_tracked_spool(TrackedSpool(tag_spool="MK-C"))
+    repo.upsert_tracked_spool(TrackedSpool(tag_spool="MK-D"))  # append fila 4
+
+    ws.get_all_values.assert_called_once()
+    ws.col_values.assert_called_once_with(1)  # solo antes del append de MK-D
+    ws.get.assert_not_called()
+    ws.delete_rows.assert_called_once_with(2)
+    assert ws.update.call_args.kwargs["range_name"] == "A3:D3"
+    assert repo.find_tracked_row("MK-D") == 4
+    assert [s.tag_spool for s in repo.list_tracked_spools()] == [
+        "MK-B", "MK-C", "MK-D",
+    ]
+
+
+def test_lista_index_dropped_when_append_lands_elsewhere(repo):
+    """append_row en una fila inesperada → el índice se recarga."""
+    ws = _ws_lista(repo)
+    ws.get_all_values.return_value = _lista_rows("MK-A")
+    ws.append_row.return_value = {"updates": {"updatedRange": "Lista!A9:D9"}}
+
+    repo.upsert_tracked_spool(TrackedSpool(tag_spool="MK-NEW"))
+    ws.get_all_values.return_value = _lista_rows("MK-A", "MK-X", "MK-NEW")
+    row = repo.find_tracked_row("MK-NEW")
+
+    assert ws.get_all_values.call_count == 2
+    assert row == 4
+
+
+def test_write_from_another_worker_reloads_index(repo):
+    """Otro worker agregó una tag: su invalidación (generación compartida) recarga el índice."""
+    ws = _ws_lista(repo)
+    ws.get_all_values.return_value = _lista_rows("MK-A")
+    assert [s.tag_spool for s in repo.list_tracked_spools()] == ["MK-A"]
+
+    ws.get_all_values.return_value = _lista_rows("MK-A", "MK-B")
+    get_cache().invalidate(f"lista:{config.GOOGLE_AUDIT_SHEET_ID}")
+
+    assert [s.tag_spool for s in repo.list_tracked_spools()] == ["MK-A", "MK-B"]
+    repo.upsert_tracked_spool(TrackedSpool(tag_spool="MK-B"))
+    assert ws.update.call_args.kwargs["range_name"] == "A3:D3"
+    ws.append_row.assert_not_called()
+
+
+def test_upsert_never_appends_a_tag_already_in_the_sheet(repo):
+    """Índice viejo sin la tag (agregada por fuera): la columna A lo detecta, no se duplica."""
+    ws = _ws_lista(repo)
+    ws.get_all_values.return_value = _lista_rows("MK-A")
+    assert repo.find_tracked_row("MK-NEW") is None
+
+    ws.get_all_values.return_value = _lista_rows("MK-A", "MK-NEW")
+    repo.upsert_tracked_spool(TrackedSpool(tag_spool="MK-NEW"))
+
+    ws.append_row.assert_not_called()
+    assert ws.update.call_args.kwargs["range_name"] == "A3:D3"
+    assert ws.get_all_values.call_count == 2
+
+
+def test_remove_finds_tag_missing_from_stale_index(repo):
+    """remove no devuelve False mientras la fila sigue en la hoja."""
+    ws = _ws_lista(repo)
+    ws.get_all_values.return_value = _lista_rows("MK-A")
+    assert repo.find_tracked_row("MK-B") is None
+
+    ws.get_all_values.return_value = _lista_rows("MK-A", "MK-B")
+    assert repo.remove_tracked_spool("MK-B") is True
+    ws.delete_rows.assert_called_once_with(3)
+
+    assert repo.remove_tracked_spool("MK-B") is False
+    ws.delete_rows.assert_called_once()
+
+
 # ─── append_audit_events ─────────────────────────────────────────────────────
 
 
@@ -275,6 +376,86 @@ def test_get_audit_since_filters_by_timestamp(repo):
     assert ids == ["e2", "e3"]
 
 
+AUDIT_HEADER = [
+    "ID", "Timestamp", "Session_ID", "Event_Type",
+    "TAG_SPOOL", "Modal", "Route", "Payload_JSON",
+]
+
+
+def _audit_row(event_id: str, ts: str) -> list[str]:
+    return [event_id, ts, "s", "MODAL_OPEN", "", "", "", ""]
+
+
+def test_get_audit_since_reads_only_new_tail(repo):
+    """Segunda consulta pide solo desde la última fila consumida (ancla)."""
+    ws = _ws_audit(repo)
+    ws.get_all_values.return_value = [
+        AUDIT_HEADER,
+        _audit_row("e1", "08-05-2026 09:00:00"),
+        _audit_row("e2", "08-05-2026 10:00:00"),
+    ]
+    cutoff = pytz.timezone("America/Santiago").localize(datetime(2026, 5, 8))
+    assert [e.id for e in repo.get_audit_events_since(cutoff)] == ["e1", "e2"]
+
+    # Fila 3 (e2) es el ancla; e3 llegó después pero con timestamp anterior.
+    ws.get_values.return_value = [
+        _audit_row("e2", "08-05-2026 10:00:00"),
+        _audit_row("e3", "08-05-2026 09:30:00"),
+    ]
+    events = repo.get_audit_events_since(cutoff)
+
+    ws.get_all_values.assert_called_once()
+    ws.get_values.assert_called_once_with("A3:H")
+    assert [e.id for e in events] == ["e1", "e3", "e2"]
+
+
+def test_get_audit_since_rebuilds_when_anchor_moves(repo):
+    """Si la fila ancla ya no tiene el mismo ID, se relee la hoja completa."""
+    ws = _ws_audit(repo)
+    ws.get_all_values.return_value = [
+        AUDIT_HEADER,
+        _audit_row("e1", "08-05-2026 09:00:00"),
+        _audit_row("e2", "08-05-2026 10:00:00"),
+    ]
+    cutoff = pytz.timezone("America/Santiago").localize(datetime(2026, 5, 8))
+    repo.get_audit_events_since(cutoff)
+
+    # Alguien borró e1 a mano: la fila 3 ahora está vacía.
+    ws.get_values.return_value = [[]]
+    ws.get_all_values.return_value = [
+        AUDIT_HEADER,
+        _audit_row("e2", "08-05-2026 10:00:00"),
+    ]
+    events = repo.get_audit_events_since(cutoff)
+
+    assert ws.get_all_values.call_count == 2
+    assert [e.id for e in events] == ["e2"]
+
+
+def test_get_audit_page_paginates_with_cursor(repo):
+    ws = _ws_audit(repo)
+    ws.get_all_values.return_value = [AUDIT_HEADER] + [
+        _audit_row(f"e{i}", f"08-05-2026 09:0{i}:00") for i in range(5)
+    ]
+    ws.get_values.side_effect = lambda rng: [_audit_row("e4", "08-05-2026 09:04:00")]
+    cutoff = pytz.timezone("America/Santiago").localize(datetime(2026, 5, 8))
+
+    page1, cursor = repo.get_audit_page(cutoff, limit=2)
+    page2, cursor = repo.get_audit_page(cutoff, limit=2, cursor=cursor)
+    page3, cursor = repo.get_audit_page(cutoff, limit=2, cursor=cursor)
+
+    assert [e.id for e in page1] == ["e0", "e1"]
+    assert [e.id for e in page2] == ["e2", "e3"]
+    assert [e.id for e in page3] == ["e4"]
+    assert cursor is None
+
+
+def test_get_audit_page_rejects_invalid_cursor(repo):
+    cutoff = pytz.timezone("America/Santiago").localize(datetime(2026, 5, 8))
+    with pytest.raises(ValueError):
+        repo.get_audit_page(cutoff, limit=10, cursor="no-es-un-cursor")
+
+
 # ─── validate_schema ─────────────────────────────────────────────────────────
 
 
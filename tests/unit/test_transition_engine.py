@@ -0,0 +1,188 @@
+"""
+Unit tests for the table-driven transition engine
+(backend/services/state_machines/transition_engine.py).
+
+The python-statemachine classes are the reference: the engine must expose
+the same states and transitions and emit the same cell writes their
+on_enter_* callbacks perform.
+"""
+from datetime import date
+from unittest.mock import Mock
+
+import pytest
+
+from backend.domain.state_machines.metrologia_machine import MetrologiaStateMachine
+from backend.exceptions import DependenciasNoSatisfechasError, InvalidStateTransitionError
+from backend.models.spool import Spool
+from backend.services.cycle_counter_service import CycleCounterService
+from backend.services.state_machines import (
+    ARMStateMachine,
+    REPARACIONStateMachine,
+    SOLDStateMachine,
+)
+from backend.services.state_machines import transition_engine as engine
+
+REFERENCE = {
+    engine.ARM: ARMStateMachine,
+    engine.SOLD: SOLDStateMachine,
+    engine.REPARACION: REPARACIONStateMachine,
+    engine.METROLOGIA: MetrologiaStateMachine,
+}
+FECHA = date(2026, 2, 3)
+
+
+def _spool(**fields) -> Spool:
+    return Spool(tag_spool="TEST-001", fecha_materiales=date(2026, 1, 20), **fields)
+
+
+def _recording_repo(spool: Spool) -> tuple[Mock, list]:
+    writes = []
+    repo = Mock()
+    repo.find_row_by_column_value.return_value = 10
+    repo.get_cell_value.return_value = spool.estado_detalle
+    repo.get_spool_by_tag.return_value = spool
+    repo.update_cell_by_column_name.side_effect = lambda **kw: writes.append(
+        {"column_name": kw["column_name"], "value": kw["value"]}
+    )
+    repo.batch_update_by_column_name.side_effect = lambda **kw: writes.extend(
+        {"column_name": u["column_name"], "value": u["value"]} for u in kw["updates"]
+    )
+    return repo, writes
+
+
+async def _reference_writes(machine: str, spool: Spool, state: str, event: str, **kwargs) -> list:
+    repo, writes = _recording_repo(spool)
+    counter = CycleCounterService()
+    if machine == engine.METROLOGIA:
+        reference = MetrologiaStateMachine(spool.tag_spool, repo, Mock(), cycle_counter=counter)
+        getattr(reference, event)(**kwargs)
+    elif machine == engine.REPARACION:
+        reference = REPARACIONStateMachine(spool.tag_spool, repo, Mock(), cycle_counter=counter, start_value=state)
+        await reference.activate_initial_state()
+        # Activar el estado de partida corre su on_enter_*: no es parte de la transición
+        writes.clear()
+        await getattr(reference, event)(**kwargs)
+    else:
+        reference = REFERENCE[machine](spool.tag_spool, repo, Mock())
+        await reference.activate_initial_state()
+        reference.current_state = getattr(reference, state)
+        await getattr(reference, event)(**kwargs)
+    return writes
+
+
+@pytest.mark.parametrize("machine", sorted(REFERENCE))
+def test_tables_match_reference_machines(machine):
+    reference = REFERENCE[machine]
+    spec = engine.MACHINES[machine]
+    assert set(spec.states) == {state.id for state in reference.states}
+    assert spec.initial == reference.initial_state.id
+    expected = {
+        (transition.source.id, str(event)): transition.target.id
+        for state in reference.states
+        for transition in state.transitions
+        for event in transition.events
+    }
+    assert spec.transitions == expected
+
+
+ARM_SOLD_CASES = [
+    ("pendiente", "iniciar", {"worker_nombre": "MR(93)", "fecha_operacion": FECHA}),
+    ("pausado", "reanudar", {"worker_nombre": "MR(93)"}),
+    ("en_progreso", "pausar", {}),
+    ("en_progreso", "completar", {"worker_nombre": "MR(93)", "fecha_operacion": FECHA}),
+    ("en_progreso", "cancelar", {}),
+    ("pausado", "cancelar", {}),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("machine", [engine.ARM, engine.SOLD])
+@pytest.mark.parametrize("state,event,kwargs", ARM_SOLD_CASES)
+async def test_operation_writes_match_callbacks(machine, state, event, kwargs):
+    spool = _spool(armador="MR(93)", ocupado_por="MR(93)")
+    result = engine.fire(machine, spool, event, state=state, **kwargs)
+    assert result.source == state
+    assert result.writes == await _reference_writes(machine, spool, state, event, **kwargs)
+
+
+REPARACION_CASES = [
+    ("rechazado", "tomar", "RECHAZADO (Ciclo 2/3) - Pendiente reparación", {"worker_nombre": "CP(95)"}),
+    ("reparacion_pausada", "tomar", "REPARACION_PAUSADA (Ciclo 1/3)", {"worker_nombre": "CP(95)"}),
+    ("en_reparacion", "pausar", "EN_REPARACION (Ciclo 1/3) - Ocupado: CP(95)", {}),
+    ("en_reparacion", "completar", "EN_REPARACION (Ciclo 2/3) - Ocupado: CP(95)", {}),
+    ("en_reparacion", "cancelar", "EN_REPARACION (Ciclo 2/3) - Ocupado: CP(95)", {}),
+    ("reparacion_pausada", "cancelar", "REPARACION_PAUSADA (Ciclo 1/3)", {}),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("state,event,estado,kwargs", REPARACION_CASES)
+async def test_reparacion_writes_match_callbacks(state, event, estado, kwargs):
+    spool = _spool(estado_detalle=estado)
+    result = engine.fire(
+        engine.REPARACION, spool, event, state=state, cycle_counter=CycleCounterService(), **kwargs
+    )
+    expected = await _reference_writes(engine.REPARACION, spool, state, event, **kwargs)
+    assert result.writes == expected
+    assert engine.hydrate(engine.REPARACION, spool) == state
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("event,estado", [
+    ("aprobar", "PENDIENTE_METROLOGIA"),
+    ("rechazar", "PENDIENTE_METROLOGIA"),
+    ("rechazar", "PENDIENTE_METROLOGIA (Ciclo 2/3)"),
+])
+async def test_metrologia_writes_match_callbacks(event, estado):
+    spool = _spool(estado_detalle=estado)
+    result = engine.fire(
+        engine.METROLOGIA, spool, event, fecha_operacion=FECHA, cycle_counter=CycleCounterService()
+    )
+    expected = await _reference_writes(engine.METROLOGIA, spool, "pendiente", event, fecha_operacion=FECHA)
+    assert result.writes == expected
+
+
+@pytest.mark.parametrize("fields,expected", [
+    ({"fecha_armado": FECHA, "armador": "MR(93)"}, "completado"),
+    ({"armador": "MR(93)", "ocupado_por": "MR(93)"}, "en_progreso"),
+    ({"armador": "MR(93)"}, "pausado"),
+    ({"ocupado_por": "MR(93)"}, "en_progreso"),
+    ({}, "pendiente"),
+])
+def test_hydrate_operation_from_columns(fields, expected):
+    assert engine.hydrate(engine.ARM, _spool(**fields)) == expected
+    sold_fields = {
+        {"fecha_armado": "fecha_soldadura", "armador": "soldador"}.get(key, key): value
+        for key, value in fields.items()
+    }
+    assert engine.hydrate(engine.SOLD, _spool(**sold_fields)) == expected
+
+
+def test_sold_iniciar_requires_arm():
+    with pytest.raises(DependenciasNoSatisfechasError):
+        engine.fire(engine.SOLD, _spool(), "iniciar", worker_nombre="JP(94)")
+
+    result = engine.fire(engine.SOLD, _spool(armador="MR(93)"), "iniciar", worker_nombre="JP(94)")
+    assert (result.target, result.value("Soldador")) == ("en_progreso", "JP(94)")
+
+
+def test_transition_not_in_table_is_rejected():
+    with pytest.raises(InvalidStateTransitionError) as excinfo:
+        engine.fire(engine.ARM, _spool(fecha_armado=FECHA), "iniciar", worker_nombre="MR(93)")
+    assert excinfo.value.data["current_state"] == "completado"
+
+
+def test_apply_writes_is_one_batch_update():
+    repo = Mock()
+    repo.find_row_by_column_value.return_value = 10
+    result = engine.fire(engine.ARM, _spool(), "iniciar", worker_nombre="MR(93)")
+
+    assert engine.apply_writes(repo, "TEST-001", result.writes) is True
+    repo.batch_update_by_column_name.assert_called_once()
+    assert repo.batch_update_by_column_name.call_args.kwargs["updates"] == [
+        {"row": 10, "column_name": "Armador", "value": "MR(93)"}
+    ]
+    repo.update_cell_by_column_name.assert_not_called()
+
+    repo.find_row_by_column_value.return_value = None
+    assert engine.apply_writes(repo, "TEST-001", result.writes) is False
@@ -0,0 +1,176 @@
+"""
+Unit tests for WorkerLedger (per-worker daily production index for Mi Registro).
+"""
+from datetime import date, datetime
+from unittest.mock import Mock
+
+import pytest
+
+from backend.core.column_map_cache import ColumnMapCache
+from backend.core.worker_ledger import WorkerLedger
+from backend.repositories.union_repository import UnionRepository
+
+
+HEADER = [
+    "ID", "OT", "TAG_SPOOL", "N_UNION", "DN_UNION", "TIPO_UNION",
+    "ARM_FECHA_INICIO", "ARM_FECHA_FIN", "ARM_WORKER",
+    "SOL_FECHA_INICIO", "SOL_FECHA_FIN", "SOL_WORKER",
+    "NDT_UNION", "R_NDT_UNION", "NDT_FECHA", "NDT_STATUS", "version",
+]
+
+
+def _row(n, tag="OT-1", dn="4", arm=("", "", ""), sol=("", "", "")):
+    return [f"001+{n}", "001", tag, str(n), dn, "BW", *arm, *sol, "", "", "", "", "v1"]
+
+
+class FakeSheetsRepo:
+    """Minimal SheetsRepository double with a swappable row cache."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.cached = rows
+        self.reads = 0
+
+    def read_worksheet(self, sheet_name):
+        self.reads += 1
+        self.cached = self.rows
+        return self.rows
+
+    def peek_cached_worksheet(self, sheet_name):
+        return self.cached
+
+
+@pytest.fixture(autouse=True)
+def _clean_caches():
+    ColumnMapCache.clear_all()
+    WorkerLedger.clear_all()
+    yield
+    ColumnMapCache.clear_all()
+    WorkerLedger.clear_all()
+
+
+@pytest.fixture
+def rows():
+    return [
+        HEADER,
+        _row(1, arm=("20-01-2026 08:00:00", "20-01-2026 09:00:00", "MR(93)")),
+        _row(2, dn="6", arm=("20-01-2026 08:00:00", "21-01-2026 10:00:00", "MR(93)"),
+             sol=("21-01-2026 11:00:00", "21-01-2026 12:00:00", "Rodriguez(93)")),
+        _row(3, arm=("21-01-2026 08:00:00", "", "MR(93)")),
+        _row(4, tag="OT-2", arm=("21-01-2026 08:00:00", "21-01-2026 09:00:00", "JP(94)")),
+    ]
+
+
+def test_records_by_date_include_in_progress_work(rows):
+    repo = FakeSheetsRepo(rows)
+    records = WorkerLedger.for_repository(repo).get_records(93, "21-01-2026")
+
+    assert [(r["n_union"], r["operacion"]) for r in records] == [
+        (2, "ARM"), (2, "SOLD"), (3, "ARM"),
+    ]
+    assert records[2]["fecha_fin"] is None
+
+
+def test_records_without_date_return_everything_in_row_order(rows):
+    repo = FakeSheetsRepo(rows)
+    records = WorkerLedger.for_repository(repo).get_records(93)
+
+    assert [(r["n_union"], r["operacion"]) for r in records] == [
+        (1, "ARM"), (2, "ARM"), (2, "SOLD"), (3, "ARM"),
+    ]
+
+
+def test_excel_serial_dates_are_bucketed_by_day(rows):
+    rows[1][7] = 46042.375  # 20-01-2026 09:00
+    repo = FakeSheetsRepo(rows)
+
+    records = WorkerLedger.for_repository(repo).get_records(93, "20-01-2026")
+
+    assert [r["n_union"] for r in records] == [1, 3]
+
+
+def test_ledger_is_built_once_per_snapshot(rows):
+    repo = FakeSheetsRepo(rows)
+    ledger = WorkerLedger.for_repository(repo)
+
+    ledger.get_records(93, "21-01-2026")
+    ledger.get_records(94, "21-01-2026")
+    ledger.pd_total(93, "21-01-2026")
+
+    assert repo.reads == 1
+
+
+def test_new_snapshot_rebuilds_ledger(rows):
+    repo = FakeSheetsRepo(rows)
+    ledger = WorkerLedger.for_repository(repo)
+    assert ledger.get_records(95) == []
+
+    repo.cached = rows + [_row(5, arm=("", "22-01-2026 09:00:00", "AB(95)"))]
+
+    assert [r["n_union"] for r in ledger.get_records(95)] == [5]
+
+
+def test_pd_totals_and_range_queries(rows):
+    repo = FakeSheetsRepo(rows)
+    ledger = WorkerLedger.for_repository(repo)
+
+    assert ledger.pd_total(93, "21-01-2026") == 12.0
+    assert ledger.pd_total(93, "20-01-2026") == 4.0
+
+    by_day = ledger.get_records_between(93, date(2026, 1, 20), date(2026, 1, 21))
+    assert list(by_day) == ["20-01-2026", "21-01-2026"]
+    assert len(by_day["21-01-2026"]) == 2
+
+
+def test_apply_row_updates_patches_without_rereading(rows):
+    repo = FakeSheetsRepo(rows)
+    ledger = WorkerLedger.for_repository(repo)
+    ledger.get_records(93)
+
+    # Row 4 (union 3): finish ARM, then SOLD by the same worker. The write
+    # invalidated the row cache; the ledger keeps serving patched data.
+    repo.cached = None
+    ledger.apply_row_updates(rows, {4: {7: "21-01-2026 09:30:00"}})
+    ledger.apply_row_updates(rows, {4: {9: "21-01-2026 10:00:00", 10: "21-01-2026 11:00:00", 11: "MR(93)"}})
+
+    records = ledger.get_records(93, "21-01-2026")
+    assert [(r["n_union"], r["operacion"]) for r in records] == [
+        (2, "ARM"), (2, "SOLD"), (3, "ARM"), (3, "SOLD"),
+    ]
+    assert ledger.pd_total(93, "21-01-2026") == 20.0
+    assert repo.reads == 1
+
+
+def test_invalidate_forces_rebuild(rows):
+    repo = FakeSheetsRepo(rows)
+    ledger = WorkerLedger.for_repository(repo)
+    ledger.get_records(93)
+
+    repo.cached = None
+    ledger.invalidate()
+    ledger.get_records(93)
+
+    assert repo.reads == 2
+
+
+def test_union_repository_full_write_patches_ledger(rows):
+    repo = FakeSheetsRepo(rows)
+    worksheet = Mock()
+    repo._get_worksheet = Mock(return_value=worksheet)
+    union_repo = UnionRepository(sheets_repo=repo)
+    union_repo._get_worksheet = Mock(return_value=worksheet)
+
+    assert [r["n_union"] for r in union_repo.get_by_worker_id(94, "22-01-2026")] == []
+
+    union_repo.batch_update_sold_full(
+        tag_spool="OT-1",
+        union_ids=["001+1"],
+        worker="JP(94)",
+        timestamp_inicio=datetime(2026, 1, 22, 8, 0),
+        timestamp_fin=datetime(2026, 1, 22, 9, 0),
+    )
+    repo.cached = None
+
+    records = union_repo.get_by_worker_id(94, "22-01-2026")
+    assert [(r["n_union"], r["operacion"]) for r in records] == [(1, "SOLD")]
+    assert repo.reads == 2  # initial build + the write's own snapshot read
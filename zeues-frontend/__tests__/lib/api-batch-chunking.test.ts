@@ -40,6 +40,12 @@ describe('batchGetStatus chunking', () => {
     fetchMock = jest.fn(async (_url: RequestInfo | URL, init?: RequestInit) => {
       const body = JSON.parse(String(init?.body ?? '{}')) as { tags?: string[] };
       const tags = body.tags ?? [];
+      const etag = `W/"${tags.join(',')}"`;
+      const headers = { get: (name: string) => (name === 'ETag' ? etag : null) };
+      const sentEtag = (init?.headers as Record<string, string> | undefined)?.['If-None-Match'];
+      if (sentEtag === etag) {
+        return { ok: false, status: 304, statusText: 'Not Modified', headers } as unknown as Response;
+      }
       // Backend mock: respect the 100-tag cap, return one card per tag.
       if (tags.length > BATCH_STATUS_CHUNK_SIZE) {
         return {
@@ -53,6 +59,7 @@ describe('batchGetStatus chunking', () => {
         ok: true,
         status: 200,
         statusText: 'OK',
+        headers,
         json: async () => ({
           spools: tags.map((t) => minimalCard(t)),
           total: tags.length,
@@ -109,4 +116,24 @@ describe('batchGetStatus chunking', () => {
     expect(sentChunkSizes.every((n) => n <= BATCH_STATUS_CHUNK_SIZE)).toBe(true);
     expect(sentChunkSizes.reduce((a, b) => a + b, 0)).toBe(137);
   });
+
+  it('revalidates each chunk with its last ETag, keeping one entry per chunk index', async () => {
+    const sentEtags = () =>
+      fetchMock.mock.calls.map(
+        (call) => ((call[1] as RequestInit).headers as Record<string, string>)['If-None-Match']
+      );
+    const listA = Array.from({ length: 150 }, (_, i) => `A-${i}`);
+    const listB = Array.from({ length: 150 }, (_, i) => `B-${i}`);
+
+    await batchGetStatus(listA);
+    const polled = await batchGetStatus(listA);
+    expect(polled.spools.map((r) => r.tag_spool)).toEqual(listA);
+    expect(sentEtags().slice(2).every(Boolean)).toBe(true);
+
+    // Otra lista reemplaza las entradas por índice: volver a A ya no tiene ETag
+    await batchGetStatus(listB);
+    fetchMock.mockClear();
+    await batchGetStatus(listA);
+    expect(sentEtags()).toEqual([undefined, undefined]);
+  });
 });
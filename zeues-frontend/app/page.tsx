@@ -35,6 +35,7 @@ import {
   pausarReparacion,
   completarReparacion,
   iniciarSpool,
+  subscribeSpoolChanges,
 } from '@/lib/api';
 import { classifyApiError } from '@/lib/error-classifier';
 import { pushAuditEvent } from '@/lib/audit-buffer';
@@ -178,6 +179,31 @@ function HomePage() {
     };
   }, [modalStack.stack.length, enqueue]);
 
+  // ── Real-time updates (SSE) ─────────────────────────────────────────────────
+  // Refresh only the affected card when the backend publishes a change. The
+  // 30s poller above stays as a fallback if the stream drops.
+  const trackedTagsRef = useRef<Set<string>>(new Set());
+  useEffect(() => {
+    trackedTagsRef.current = new Set(spools.map((s) => s.tag_spool));
+  }, [spools]);
+  const refreshSingleRef = useRef(refreshSingle);
+  useEffect(() => {
+    refreshSingleRef.current = refreshSingle;
+  }, [refreshSingle]);
+  useEffect(() => {
+    return subscribeSpoolChanges((event) => {
+      if (event.type === 'RESYNC') {
+        // Missed events can't be replayed — reload every card
+        refreshAllRef.current().catch(() => {});
+        return;
+      }
+      if (!trackedTagsRef.current.has(event.tag_spool)) return;
+      refreshSingleRef.current(event.tag_spool).catch(() => {
+        // Spool may have been removed — ignore refresh errors
+      });
+    });
+  }, []);
+
   // ── Audit instrumentation: MODAL_OPEN / MODAL_CLOSE ─────────────────────────
   // Single observer pattern. Avoids instrumenting 30+ modalStack.push/pop/clear
   // callsites. Snapshots the tag at OPEN time so MODAL_CLOSE keeps the right
@@ -34,11 +34,13 @@ import type { SpoolCardData, Worker } from './types';
 import {
   getSpoolStatus,
   batchGetStatus,
+  getSpoolChanges,
   getSupervisorList,
   addSupervisorList,
   removeSupervisorList,
   postSupervisorLegacySnapshot,
   type BatchStatusError,
+  type SpoolChangesCursor,
 } from './api';
 import { loadPersistedSpools, STORAGE_KEY } from './local-storage';
 import { getSessionId, pushAuditEvent } from './audit-buffer';
@@ -360,17 +362,42 @@ export function SpoolListProvider({ children }: { children: React.ReactNode }) {
     [ensureMigrated]
   );
 
-  // refreshAll: re-fetch full card data for all currently-tracked tags.
+  // Cursor del delta-sync (/api/spools/changes): versión del snapshot de
+  // Operaciones que reflejan las cards en pantalla.
+  const changesCursorRef = useRef<SpoolChangesCursor | null>(null);
+
+  // refreshAll: bring all currently-tracked cards up to date.
   // Does NOT re-fetch the supervisor Lista — relies on optimistic state for that.
   //
-  // B-002: returns the per-tag errors from batch-status so the poller in
-  // page.tsx can surface them as toasts. Empty array on success / no errors.
+  // Delta-sync: asks /api/spools/changes for the spools changed since the
+  // cursor and patches only those cards (tombstoned tags are dropped, as
+  // batch-status would omit them). On `full_resync` (first poll, old cursor,
+  // backend restart) it falls back to re-fetching every card. The cursor is
+  // taken before the full fetch, so changes in between are re-delivered.
+  //
+  // B-002: returns the per-tag errors so the poller in page.tsx can surface
+  // them as toasts. Empty array on success / no errors.
   const refreshAll = useCallback(async (): Promise<BatchStatusError[]> => {
     const tags = spoolsRef.current.map((s) => s.tag_spool);
     if (tags.length === 0) return [];
-    const { spools: fresh, errors } = await batchGetStatus(tags);
-    dispatch({ type: 'SET_SPOOLS', spools: fresh });
-    return errors;
+
+    const changes = await getSpoolChanges(changesCursorRef.current);
+    if (changes.full_resync) {
+      const { spools: fresh, errors } = await batchGetStatus(tags);
+      dispatch({ type: 'SET_SPOOLS', spools: fresh });
+      changesCursorRef.current = { version: changes.version, epoch: changes.epoch };
+      return errors;
+    }
+
+    const tracked = new Set(tags);
+    for (const spool of changes.spools) {
+      if (tracked.has(spool.tag_spool)) dispatch({ type: 'UPDATE_SPOOL', spool });
+    }
+    for (const tag of changes.removed) {
+      if (tracked.has(tag)) dispatch({ type: 'REMOVE_SPOOL', tag });
+    }
+    changesCursorRef.current = { version: changes.version, epoch: changes.epoch };
+    return changes.errors.filter((e) => tracked.has(e.tag_spool));
   }, []);
 
   const refreshSingle = useCallback(async (tag: string) => {
@@ -384,7 +411,7 @@ export function SpoolListProvider({ children }: { children: React.ReactNode }) {
   // stuck on "Libre" until the 30s poller fires. We derive the new card
   // locally from inputs the caller already has — backend's _derive_estado
   // rule #5 says ocupado_por set → estado_trabajo = EN_PROGRESO. The poller
-  // reconciles any divergence within 30 s.
+  // reconciles any divergence within 30 s (full refetch, see refreshAll).
   const applyIniciarOptimistic = useCallback(
     (tag: string, worker: Worker, operacion: 'ARM' | 'SOLD') => {
       const prev = spoolsRef.current.find((s) => s.tag_spool === tag);
@@ -403,6 +430,9 @@ export function SpoolListProvider({ children }: { children: React.ReactNode }) {
         estado_trabajo: 'EN_PROGRESO',
       };
       dispatch({ type: 'UPDATE_SPOOL', spool: next });
+      // Local state no longer matches any server version: full refetch on
+      // the next poll, so a failed write cannot leave the card stale.
+      changesCursorRef.current = null;
     },
     [],
   );
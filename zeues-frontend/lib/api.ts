@@ -540,6 +540,13 @@ export interface BatchGetStatusResult {
   errors: BatchStatusError[];
 }
 
+// Última respuesta por índice de chunk (body JSON + ETag + datos). El backend
+// responde 304 a If-None-Match mientras Operaciones y Trabajadores no cambien,
+// así el polling de la lista de spools no re-descarga ni re-parsea el mismo
+// body. Una entrada por índice: si la lista cambia, el chunk la reemplaza y
+// el map no crece más que la cantidad de chunks.
+const batchStatusEtags = new Map<number, { body: string; etag: string; data: BatchGetStatusResult }>();
+
 export async function batchGetStatus(tags: string[]): Promise<BatchGetStatusResult> {
   if (tags.length === 0) return { spools: [], errors: [] };
 
@@ -549,23 +556,42 @@ export async function batchGetStatus(tags: string[]): Promise<BatchGetStatusResu
   }
 
   const responses = await Promise.all(
-    chunks.map(async (chunk) => {
+    chunks.map(async (chunk, index) => {
+      const body = JSON.stringify({ tags: chunk });
+      const entry = batchStatusEtags.get(index);
+      const cached = entry?.body === body ? entry : undefined;
+      const headers: Record<string, string> = { 'Content-Type': 'application/json' };
+      if (cached) headers['If-None-Match'] = cached.etag;
+
       const res = await fetch(`${API_URL}/api/spools/batch-status`, {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ tags: chunk }),
+        headers,
+        body,
       });
+      if (res.status === 304 && cached) {
+        return cached.data;
+      }
       const data = await handleResponse<{
         spools: SpoolCardData[];
         total: number;
         errors?: BatchStatusError[];
       }>(res);
-      return {
+      const result = {
         spools: data.spools,
         errors: data.errors ?? [],
       };
+      const etag = res.headers.get('ETag');
+      if (etag) {
+        batchStatusEtags.set(index, { body, etag, data: result });
+      } else {
+        batchStatusEtags.delete(index);
+      }
+      return result;
     })
   );
+  for (const index of Array.from(batchStatusEtags.keys())) {
+    if (index >= chunks.length) batchStatusEtags.delete(index);
+  }
 
   return {
     spools: responses.flatMap((r) => r.spools),
@@ -573,6 +599,45 @@ export async function batchGetStatus(tags: string[]): Promise<BatchGetStatusResu
   };
 }
 
+/**
+ * GET /api/spools/changes?since=<version>&epoch=<epoch>
+ * Delta-sync: spools cuyas filas cambiaron desde la versión que tiene el cliente.
+ *
+ * - `full_resync: true` → la versión es muy antigua (o de otro proceso del
+ *   backend): el cliente debe re-descargar sus spools con batchGetStatus.
+ * - `removed` → tombstones (TAGs que ya no existen en Operaciones).
+ *
+ * El cliente guarda `version` + `epoch` de cada respuesta como cursor.
+ *
+ * @param cursor - Cursor de la respuesta anterior (null en la primera llamada)
+ * @returns Promise<SpoolChangesResult>
+ * @throws ApiError si falla la request (network / 5xx)
+ */
+export interface SpoolChangesCursor {
+  version: number;
+  epoch: string;
+}
+
+export interface SpoolChangesResult extends SpoolChangesCursor {
+  full_resync: boolean;
+  spools: SpoolCardData[];
+  removed: string[];
+  errors: BatchStatusError[];
+}
+
+export async function getSpoolChanges(
+  cursor: SpoolChangesCursor | null
+): Promise<SpoolChangesResult> {
+  const params = cursor
+    ? `?since=${cursor.version}&epoch=${encodeURIComponent(cursor.epoch)}`
+    : '';
+  const res = await fetch(`${API_URL}/api/spools/changes${params}`, {
+    method: 'GET',
+    headers: { 'Content-Type': 'application/json' },
+  });
+  return handleResponse<SpoolChangesResult>(res);
+}
+
 // ==========================================
 // v4.0 UNION-LEVEL API FUNCTIONS (Phase 12)
 // ==========================================
@@ -1186,3 +1251,54 @@ export async function postSupervisorLegacySnapshot(
     throw error;
   }
 }
+
+/**
+ * Evento del stream SSE: un cambio exitoso en Operaciones (ocupación,
+ * estado, metrología, reparación o notas).
+ */
+export interface SpoolChangeEvent {
+  id: number;
+  type: string;
+  tag_spool: string;
+  timestamp: string;
+  ocupado_por?: string | null;
+  estado_detalle?: string | null;
+  [key: string]: unknown;
+}
+
+const SPOOL_CHANGE_EVENT_TYPES = [
+  'TOMAR', 'PAUSAR', 'COMPLETAR', 'INICIAR', 'FINALIZAR', 'METROLOGIA',
+  'TOMAR_REPARACION', 'PAUSAR_REPARACION', 'COMPLETAR_REPARACION',
+  'CANCELAR_REPARACION', 'NOTA', 'RESYNC',
+];
+
+/**
+ * GET /api/sse/stream
+ * Suscribe a los cambios de spools en tiempo real (EventSource).
+ *
+ * EventSource reconecta solo y reenvía Last-Event-ID, así el backend
+ * repite los eventos perdidos durante la desconexión. Si ya no puede
+ * (historial desbordado o backend reiniciado) envía un evento RESYNC
+ * (tag_spool vacío): hay que recargar todos los spools. Con varios workers
+ * de uvicorn el backend no monta el stream (404) y queda solo el polling.
+ *
+ * @returns función para cerrar la suscripción
+ */
+export function subscribeSpoolChanges(
+  onEvent: (event: SpoolChangeEvent) => void
+): () => void {
+  if (typeof EventSource === 'undefined') return () => {};
+
+  const source = new EventSource(`${API_URL}/api/sse/stream`);
+  const handler = (message: MessageEvent) => {
+    try {
+      onEvent(JSON.parse(message.data) as SpoolChangeEvent);
+    } catch (error) {
+      console.error('subscribeSpoolChanges parse error:', error);
+    }
+  };
+  for (const type of SPOOL_CHANGE_EVENT_TYPES) {
+    source.addEventListener(type, handler as EventListener);
+  }
+  return () => source.close();
+}